@@ -0,0 +1,100 @@
+"""
+Сравнение чтения одних и тех же данных из CSV и из файла Arrow IPC
+(ArrowReader): записи и агрегация над буферами колонок.
+
+Требуется pyarrow. Запуск:
+    python -m benchmarks.bench_arrow
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.arrow import ArrowReader, import_pyarrow
+from src.calculator import GDPCalculator, HashAggregator
+from src.reader import CSVReader
+
+COLUMNS = (
+    "country",
+    "year",
+    "gdp",
+    "gdp_growth",
+    "inflation",
+    "unemployment",
+    "population",
+    "continent",
+)
+
+
+def generate_rows(rows: int) -> list[tuple]:
+    """Создает строки со случайными данными."""
+    rng = random.Random(0)
+    return [
+        (
+            f"Country {rng.randrange(200)}",
+            1950 + i % 70,
+            round(rng.uniform(1, 20000), 2),
+            1.0,
+            2.0,
+            5.0,
+            rng.randrange(1, 10**6),
+            f"Continent {rng.randrange(6)}",
+        )
+        for i in range(rows)
+    ]
+
+
+def write_inputs(directory: Path, rows: list[tuple]) -> tuple[str, str]:
+    """Записывает строки в CSV и в файл Arrow IPC."""
+    pa = import_pyarrow()
+    csv_path = directory / "data.csv"
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write(",".join(COLUMNS) + "\n")
+        f.writelines(",".join(map(str, row)) + "\n" for row in rows)
+
+    arrow_path = directory / "data.arrow"
+    columns = zip(*rows, strict=True)
+    table = pa.table(
+        {name: list(column) for name, column in zip(COLUMNS, columns, strict=True)}
+    )
+    with pa.OSFile(str(arrow_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=65_536)
+    return str(csv_path), str(arrow_path)
+
+
+def records_aggregate(reader: CSVReader | ArrowReader, path: str) -> int:
+    """Агрегация записей, созданных читателем."""
+    spec = GDPCalculator.spec
+    aggregator = HashAggregator(spec)
+    aggregator.consume(reader.iter_records([path], spec.columns))
+    return aggregator.group_count
+
+
+def buffers_aggregate(path: str) -> int:
+    """Агрегация прямо над колонками файла Arrow."""
+    groups = ArrowReader().aggregate([path], GDPCalculator.spec)
+    assert groups is not None, "Arrow aggregation was not pushed down"
+    return len(groups)
+
+
+def main() -> None:
+    """Печатает время агрегации среднего ВВП по CSV и по Arrow."""
+    rows = 400_000
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, arrow_path = write_inputs(Path(directory), generate_rows(rows))
+        print(f"{rows} rows")
+        for name, run in (
+            ("csv records", lambda: records_aggregate(CSVReader(), csv_path)),
+            ("arrow records", lambda: records_aggregate(ArrowReader(), arrow_path)),
+            ("arrow buffers", lambda: buffers_aggregate(arrow_path)),
+        ):
+            start = time.perf_counter()
+            groups = run()
+            elapsed = time.perf_counter() - start
+            print(f"{name:>14}: {elapsed:7.2f} s ({groups} groups)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Сравнение ответа на average-gdp за диапазон лет по базе SQLite (GROUP BY
+по записям) и по кубу агрегатов (префиксные суммы по годам):
+250 стран x 100 лет x 4 копии записей.
+
+Запуск:
+    python -m benchmarks.bench_cube
+"""
+
+import csv
+import random
+import tempfile
+import time
+from dataclasses import astuple, fields
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from src.analyzer import Analyzer
+from src.cube import CubeReader, build_cube, save_cube
+from src.filters import RowFilter
+from src.models import EconomicRecord
+from src.reader import DataReader
+from src.storage import SQLiteReader, SQLiteStorage
+
+COUNTRIES = 250
+YEARS = 100
+# Число записей на ячейку (например, несколько выпусков данных)
+COPIES = 4
+# Диапазоны лет запросов
+RANGES = [(1950, 1959), (1930, 2010), (2000, 2019)]
+
+
+def generate_records() -> list[EconomicRecord]:
+    """Записи всех стран за все годы."""
+    rng = random.Random(0)
+    return [
+        EconomicRecord(
+            country=f"Country {c:03d}",
+            year=1920 + y,
+            gdp=rng.uniform(1, 20000),
+            gdp_growth=rng.uniform(-5, 10),
+            inflation=rng.uniform(0, 20),
+            unemployment=rng.uniform(0, 25),
+            population=rng.randrange(1, 10**6),
+            continent=f"Continent {c % 6}",
+        )
+        for c in range(COUNTRIES)
+        for y in range(YEARS)
+        for _ in range(COPIES)
+    ]
+
+
+def measure(run: Callable[[], Any]) -> float:
+    """Время выполнения (с)."""
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def average_gdp(reader: DataReader, path: str) -> list[Any]:
+    """Отчет average-gdp по одному источнику."""
+    return Analyzer(reader=reader).compute([path], "average-gdp")
+
+
+def main() -> None:
+    """Печатает время построения куба и ответов на запросы."""
+    records = generate_records()
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "data.csv")
+        db_path = str(Path(tmp) / "economy.sqlite")
+        cube_path = str(Path(tmp) / "economy.cube")
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(field.name for field in fields(EconomicRecord))
+            writer.writerows(astuple(record) for record in records)
+        SQLiteStorage(db_path).ingest([csv_path])
+
+        elapsed = measure(
+            lambda: save_cube(build_cube(SQLiteReader(), [db_path]), cube_path)
+        )
+        print(
+            f"{len(records)} records; cube built in {elapsed:.2f} s, "
+            f"{Path(cube_path).stat().st_size / 2**10:.0f} KB"
+        )
+
+        for year_from, year_to in RANGES:
+            row_filter = RowFilter(year_from=year_from, year_to=year_to)
+            readers: list[tuple[str, DataReader, str]] = [
+                ("sqlite", SQLiteReader(row_filter), db_path),
+                ("cube", CubeReader(row_filter), cube_path),
+            ]
+            for name, reader, path in readers:
+                elapsed = measure(partial(average_gdp, reader, path))
+                print(f"{year_from}-{year_to} {name:>6}: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Сравнение скользящих средних за один проход (moving_averages)
+с наивным пересчетом каждого окна.
+
+Запуск:
+    python -m benchmarks.bench_growth
+"""
+
+import math
+import random
+import timeit
+from functools import partial
+
+from src.calculator import moving_averages
+
+
+def naive_moving_averages(
+    years: list[int], values: list[float], window: int
+) -> list[tuple[int, float]]:
+    """Для каждого года заново просматривает весь ряд (O(n^2))."""
+    result = []
+    first_year = years[0]
+    for i, year in enumerate(years):
+        if year - first_year < window - 1:
+            continue
+        if i + 1 < len(years) and years[i + 1] == year:
+            continue
+        in_window = [
+            v for y, v in zip(years, values, strict=True) if year - window < y <= year
+        ]
+        result.append((year, sum(in_window) / len(in_window)))
+    return result
+
+
+def main() -> None:
+    """Печатает время обоих вариантов для разных длин рядов."""
+    rng = random.Random(0)
+    window = 5
+    print(f"{'years':>8} {'sliding, ms':>12} {'naive, ms':>12} {'speedup':>8}")
+    for length in (50, 200, 1_000, 5_000):
+        years = list(range(1900, 1900 + length))
+        values = [rng.uniform(100, 10_000) for _ in years]
+        sliding_result = moving_averages(years, values, window)
+        naive_result = naive_moving_averages(years, values, window)
+        assert [y for y, _ in sliding_result] == [y for y, _ in naive_result]
+        assert all(
+            math.isclose(a, b, rel_tol=1e-9)
+            for (_, a), (_, b) in zip(sliding_result, naive_result, strict=True)
+        )
+
+        runs = 20
+        sliding = timeit.timeit(
+            partial(moving_averages, years, values, window), number=runs
+        )
+        naive = timeit.timeit(
+            partial(naive_moving_averages, years, values, window), number=runs
+        )
+        print(
+            f"{length:>8} {sliding / runs * 1000:>12.3f} "
+            f"{naive / runs * 1000:>12.3f} {naive / sliding:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Сравнение передачи результатов рабочих процессов: записи через pickle
+и колонки в разделяемой памяти (ParallelCSVReader).
+
+Запуск:
+    python -m benchmarks.bench_parallel
+"""
+
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.calculator import GDPCalculator, HashAggregator
+from src.models import EconomicRecord
+from src.parallel import ParallelCSVReader
+from src.reader import CSVReader
+
+HEADER = "country,year,gdp,gdp_growth,inflation,unemployment,population,continent\n"
+
+
+def write_files(directory: Path, files: int, rows: int) -> list[str]:
+    """Создает CSV файлы со случайными данными."""
+    rng = random.Random(0)
+    paths = []
+    for i in range(files):
+        path = directory / f"part-{i}.csv"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(HEADER)
+            for j in range(rows):
+                f.write(
+                    f"Country {rng.randrange(200)},{1950 + j % 70},"
+                    f"{rng.uniform(1, 20000):.2f},1.0,2.0,5.0,"
+                    f"{rng.randrange(1, 10**6)},Continent {rng.randrange(6)}\n"
+                )
+        paths.append(str(path))
+    return paths
+
+
+def read_records(file_path: str) -> list[EconomicRecord]:
+    """Задача рабочего процесса: записи возвращаются через pickle."""
+    return list(CSVReader().read_file(file_path, GDPCalculator.spec.columns))
+
+
+def pickled_aggregate(paths: list[str], workers: int) -> int:
+    """Параллельное чтение с передачей записей родителю."""
+    aggregator = HashAggregator(GDPCalculator.spec)
+    with ProcessPoolExecutor(workers) as executor:
+        for records in executor.map(read_records, paths):
+            aggregator.consume(records)
+    return aggregator.group_count
+
+
+def shared_aggregate(paths: list[str], workers: int) -> int:
+    """Параллельное чтение с передачей колонок в разделяемой памяти."""
+    groups = ParallelCSVReader(workers=workers).aggregate(paths, GDPCalculator.spec)
+    return len(groups or [])
+
+
+def sequential_aggregate(paths: list[str]) -> int:
+    """Последовательное чтение в одном процессе."""
+    aggregator = HashAggregator(GDPCalculator.spec)
+    aggregator.consume(CSVReader().iter_records(paths, GDPCalculator.spec.columns))
+    return aggregator.group_count
+
+
+def main() -> None:
+    """Печатает время агрегации среднего ВВП тремя способами."""
+    workers = 4
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_files(Path(directory), files=8, rows=50_000)
+        print(f"{len(paths)} files x 50000 rows, {workers} workers")
+        for name, run in (
+            ("sequential", lambda: sequential_aggregate(paths)),
+            ("pickled records", lambda: pickled_aggregate(paths, workers)),
+            ("shared memory", lambda: shared_aggregate(paths, workers)),
+        ):
+            start = time.perf_counter()
+            groups = run()
+            elapsed = time.perf_counter() - start
+            print(f"{name:>16}: {elapsed:7.2f} s ({groups} groups)")
+
+
+if __name__ == "__main__":
+    main()
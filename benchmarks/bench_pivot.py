@@ -0,0 +1,107 @@
+"""
+Сравнение сводной таблицы на плотных массивах (PivotCalculator) со
+сборкой через вложенные словари: 250 стран x 100 лет x 5 показателей.
+
+Запуск:
+    python -m benchmarks.bench_pivot
+"""
+
+import random
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable
+
+from src.calculator import NUMERIC_COLUMNS, PivotCalculator
+from src.models import EconomicRecord
+
+COUNTRIES = 250
+YEARS = 100
+# Доля отсутствующих ячеек
+MISSING = 0.1
+# Число повторов каждой ячейки (одна страна и год в нескольких файлах)
+COPIES = 2
+
+INDICATORS = [name for name in NUMERIC_COLUMNS if name != "year"]
+
+
+def generate_records() -> list[EconomicRecord]:
+    """Записи в случайном порядке с пропусками и повторами ячеек."""
+    rng = random.Random(0)
+    records = [
+        EconomicRecord(
+            country=f"Country {c:03d}",
+            year=1920 + y,
+            gdp=rng.uniform(1, 20000),
+            gdp_growth=rng.uniform(-5, 10),
+            inflation=rng.uniform(0, 20),
+            unemployment=rng.uniform(0, 25),
+            population=rng.randrange(1, 10**6),
+            continent="Continent",
+        )
+        for c in range(COUNTRIES)
+        for y in range(YEARS)
+        if rng.random() >= MISSING
+        for _ in range(COPIES)
+    ]
+    rng.shuffle(records)
+    return records
+
+
+def dict_pivot(records: list[EconomicRecord]) -> list[list[list[Any]]]:
+    """Наивная сводная таблица: словари списков значений по ячейкам."""
+    cells: dict[str, dict[tuple[str, int], list[float]]] = {
+        name: defaultdict(list) for name in INDICATORS
+    }
+    for record in records:
+        for name in INDICATORS:
+            cells[name][(record.country, record.year)].append(getattr(record, name))
+    countries = sorted({record.country for record in records})
+    years = sorted({record.year for record in records})
+    tables = []
+    for name in INDICATORS:
+        table = cells[name]
+        tables.append(
+            [
+                [
+                    (
+                        sum(table[(c, y)]) / len(table[(c, y)])
+                        if (c, y) in table
+                        else None
+                    )
+                    for y in years
+                ]
+                for c in countries
+            ]
+        )
+    return tables
+
+
+def measure(run: Callable[[], Any]) -> tuple[float, float]:
+    """Время выполнения (с) и пик выделенной памяти (МБ)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Печатает время и пик памяти построения сводных таблиц."""
+    records = generate_records()
+    print(
+        f"{COUNTRIES} countries x {YEARS} years x {len(INDICATORS)} indicators, "
+        f"{len(records)} records"
+    )
+    for name, run in (
+        ("nested dicts", lambda: dict_pivot(records)),
+        ("dense arrays", lambda: PivotCalculator(INDICATORS).calculate(records)),
+    ):
+        elapsed, peak = measure(run)
+        print(f"{name:>13}: {elapsed:6.2f} s, peak {peak:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,66 @@
 Примеры запуска:
     python main.py --files data2023.csv data2024.csv --report average-gdp
     python main.py --files *.csv --report average-gdp
+    python main.py ingest --db economy.sqlite --files *.csv
+    python main.py --db economy.sqlite --report average-gdp
+    python main.py ingest --output-dir dataset/ --files *.csv
+    python main.py --dataset dataset/ --report average-gdp --year-from 2020
+    python main.py --files data.arrow --report average-gdp --arrow-output out.arrow
+    python main.py --files archive/*.csv --report average-gdp --deadline 5 --progress
+    python main.py worker --port 8765
+    python main.py --files *.csv --report average-gdp --remote-workers node1:8765 node2:8765
+    python main.py --files *.csv --report pivot --indicators gdp inflation --csv-output pivot.csv
+    python main.py --files *.csv --report correlation --indicators gdp_growth inflation
+    python main.py --db economy.sqlite --report outliers --jump-ratio 100
+    python main.py diff --old data2023.csv --new data2023_reissued.csv
+    python main.py --files *.csv --report coverage
+    python main.py --files *.csv --report average-gdp --common-years
+    python main.py ingest --db economy.sqlite --files *.csv --cube economy.cube
+    python main.py --cube economy.cube --report average-gdp --year-from 2010
     python main.py --list-reports
 """
 
 import argparse
 import logging
 import sys
+from typing import Any, Iterable
 
 from src.analyzer import Analyzer
+from src.arrow import ArrowReader, write_arrow
+from src.cache import ResultCache
+from src.calculator import NUMERIC_COLUMNS
+from src.cube import CubeReader, build_cube, save_cube
+from src.diff import VALUE_FIELDS, diff_snapshots, render_diff, write_diff_csv
+from src.discovery import DEFAULT_INCLUDE, discover_files, read_manifest
+from src.distributed import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    DistributedReader,
+    WorkerError,
+    WorkerServer,
+)
+from src.filters import RowFilter
+from src.formats import (
+    ARROW_FORMAT,
+    CSV_FORMAT,
+    FORMATS,
+    JSONL_FORMAT,
+    MultiFormatReader,
+)
+from src.jsonl import JSONLReader
+from src.online import DEFAULT_PROGRESS_INTERVAL
+from src.parallel import ParallelCSVReader
+from src.partitions import (
+    DEFAULT_PARTITION_BY,
+    PARTITION_KEYS,
+    PartitionedReader,
+    write_dataset,
+)
+from src.reader import CSVReader, DataReader, FileReader
+from src.storage import SQLiteReader, SQLiteStorage
+from src.utils.validators import ValidationError
 
 logging.basicConfig(
     level=logging.CRITICAL,
@@ -24,6 +76,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Доля выборки для --approx без --sample
+DEFAULT_SAMPLE_FRACTION = 0.1
+
 
 def setup_argparse() -> argparse.ArgumentParser:
     """
@@ -39,16 +94,51 @@ def setup_argparse() -> argparse.ArgumentParser:
 Examples:
   %(prog)s --files data2023.csv --report average-gdp
   %(prog)s --files *.csv --report average-gdp
+  %(prog)s --files data2023.csv feed.jsonl --report average-gdp
+  zcat data.csv.gz | %(prog)s --files - --report average-gdp
+  %(prog)s --files *.csv --report average-gdp --year-from 2010 --continents Europe
+  %(prog)s --input-dir archive/ --include "*.csv" --exclude "tmp/*" --report average-gdp
+  %(prog)s --manifest inputs.txt --report average-gdp
+  %(prog)s --files *.csv --report aggregate --group-by continent --agg mean:gdp,sum:population
+  %(prog)s --files *.csv --report descriptive-stats --indicator inflation
+  %(prog)s --files *.csv --report growth --window 5 --start-year 2000 --end-year 2020
+  %(prog)s --files archive/*.csv --report average-gdp --sample 0.05
+  %(prog)s ingest --db economy.sqlite --files *.csv
+  %(prog)s --db economy.sqlite --report average-gdp --continents Europe
+  %(prog)s ingest --output-dir dataset/ --files *.csv
+  %(prog)s --dataset dataset/ --report average-gdp --year-from 2020
+  %(prog)s --files firms.csv --report aggregate --agg sum:gdp --max-memory 256
+  %(prog)s --files archive/*.csv --report average-gdp --workers 4
   %(prog)s --list-reports
         """,
     )
 
-    # Основные аргументы
-    parser.add_argument(
+    # Основные аргументы: CSV файлы или база, созданная командой ingest
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--files",
         nargs="+",
-        required=True,
-        help="CSV files with economic data (country,year,gdp,gdp_growth,inflation,unemployment,population,continent)",
+        help="CSV, JSON Lines or Arrow IPC files with economic data (country,year,gdp,gdp_growth,inflation,unemployment,population,continent); "
+        "'-' reads standard input, named pipes are supported",
+    )
+    add_discovery_arguments(parser, source)
+    add_format_argument(parser)
+    source.add_argument(
+        "--db",
+        help="SQLite database created by the 'ingest' command",
+    )
+    source.add_argument(
+        "--dataset",
+        metavar="DIR",
+        help="Partitioned dataset (DIR/year=2023/continent=Europe/*.csv); "
+        "partitions excluded by the filters are not read",
+    )
+    source.add_argument(
+        "--cube",
+        metavar="PATH",
+        help="Aggregate cube created by 'ingest --cube'; answers aggregate "
+        "reports (average-gdp, aggregate) for any --year-from/--year-to "
+        "without reading records",
     )
 
     parser.add_argument(
@@ -57,6 +147,157 @@ Examples:
         help="Type of report to generate (use --list-reports to see available)",
     )
 
+    # Фильтры, применяемые при чтении файлов
+    filters = parser.add_argument_group("filters")
+    filters.add_argument(
+        "--year-from",
+        type=int,
+        help="Only include rows with year >= YEAR_FROM",
+    )
+    filters.add_argument(
+        "--year-to",
+        type=int,
+        help="Only include rows with year <= YEAR_TO",
+    )
+    filters.add_argument(
+        "--countries",
+        nargs="+",
+        metavar="COUNTRY",
+        help="Only include rows for the given countries",
+    )
+    filters.add_argument(
+        "--continents",
+        nargs="+",
+        metavar="CONTINENT",
+        help="Only include rows for the given continents",
+    )
+    filters.add_argument(
+        "--zone-maps",
+        action="store_true",
+        help="Maintain *.zonemap.json sidecar files and skip files "
+        "that cannot match the filters",
+    )
+
+    # Приближенный режим
+    approx = parser.add_argument_group("approximate mode")
+    approx.add_argument(
+        "--sample",
+        type=float,
+        metavar="FRACTION",
+        help="Parse only a random FRACTION of rows of each CSV or JSON Lines "
+        "file and report estimates with 95%% confidence intervals",
+    )
+    approx.add_argument(
+        "--approx",
+        action="store_true",
+        help=f"Shortcut for --sample {DEFAULT_SAMPLE_FRACTION}",
+    )
+    approx.add_argument(
+        "--sample-seed",
+        type=int,
+        help="Random seed for reproducible samples",
+    )
+
+    # Параметры отчетов
+    report_params = parser.add_argument_group("report parameters")
+    report_params.add_argument(
+        "--group-by",
+        nargs="+",
+        metavar="KEY",
+        help="Group keys for the aggregate report (country, continent, year)",
+    )
+    report_params.add_argument(
+        "--agg",
+        metavar="FUNC:COLUMN,...",
+        help="Aggregates for the aggregate report, e.g. mean:gdp,sum:population "
+        "(functions: sum, mean, min, max, count, last)",
+    )
+
+    report_params.add_argument(
+        "--indicator",
+        choices=NUMERIC_COLUMNS,
+        help="Numeric column analysed by indicator reports (default: gdp)",
+    )
+
+    report_params.add_argument(
+        "--indicators",
+        nargs="+",
+        choices=NUMERIC_COLUMNS,
+        metavar="COLUMN",
+        help="Numeric columns of the pivot report (default: --indicator or gdp), "
+        "the correlation report (default: gdp, gdp_growth, inflation, "
+        "unemployment) and the outliers report (default: all but year)",
+    )
+    report_params.add_argument(
+        "--common-years",
+        action="store_true",
+        help="Average GDP report: average only over years covered by every country",
+    )
+    report_params.add_argument(
+        "--z-threshold",
+        type=float,
+        help="Outliers report: |z-score| threshold (default: 3.0); since "
+        "|z| <= (n - 1) / sqrt(n), countries with fewer observations than "
+        "needed to exceed it (11 for 3.0) are not checked",
+    )
+    report_params.add_argument(
+        "--mad-threshold",
+        type=float,
+        help="Outliers report: |robust z-score| threshold based on median "
+        "and MAD (default: 3.5)",
+    )
+    report_params.add_argument(
+        "--jump-ratio",
+        type=float,
+        help="Outliers report: year-over-year ratio flagged for gdp and "
+        "population (default: 10)",
+    )
+    report_params.add_argument(
+        "--jump-points",
+        type=float,
+        help="Outliers report: year-over-year change in percentage points "
+        "flagged for rate indicators (default: 25)",
+    )
+    report_params.add_argument(
+        "--overall",
+        action="store_true",
+        help="Correlation report: only the matrix over all countries",
+    )
+
+    report_params.add_argument(
+        "--window",
+        type=int,
+        help="Moving average window in years for the growth report (default: 3)",
+    )
+    report_params.add_argument(
+        "--start-year",
+        type=int,
+        help="First year of the CAGR period (default: first year of each country)",
+    )
+    report_params.add_argument(
+        "--end-year",
+        type=int,
+        help="Last year of the CAGR period (default: last year of each country)",
+    )
+
+    # Кеширование результатов
+    cache = parser.add_argument_group("result cache")
+    cache.add_argument(
+        "--cache-dir",
+        help="Directory of the on-disk result cache (disabled by default)",
+    )
+    cache.add_argument(
+        "--cache-ttl",
+        type=float,
+        metavar="SECONDS",
+        help="Maximum age of cached results",
+    )
+    cache.add_argument(
+        "--cache-hash-content",
+        action="store_true",
+        help="Include a SHA-256 of each input file in the cache key",
+    )
+
     # Полезные дополнительные аргументы
     parser.add_argument(
         "--list-reports",
@@ -64,11 +305,614 @@ Examples:
         help="Show all available reports and exit",
     )
 
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        metavar="MB",
+        help="Memory budget for aggregation; groups beyond it are spilled "
+        "to temporary files",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Parse CSV files in N worker processes; parsed columns are "
+        "handed back through shared memory",
+    )
+
+    # Онлайн-агрегация
+    online = parser.add_argument_group("online aggregation")
+    online.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Stop reading after SECONDS and print the best-so-far report "
+        "flagged as PARTIAL (aggregate reports only)",
+    )
+    online.add_argument(
+        "--progress",
+        type=float,
+        nargs="?",
+        const=DEFAULT_PROGRESS_INTERVAL,
+        metavar="SECONDS",
+        help="Print the current estimated report to stderr every SECONDS "
+        f"while reading (default: {DEFAULT_PROGRESS_INTERVAL:g})",
+    )
+
+    # Распределенный режим
+    distributed = parser.add_argument_group("distributed mode")
+    distributed.add_argument(
+        "--remote-workers",
+        nargs="+",
+        metavar="HOST:PORT",
+        help="Send files to workers started with 'main.py worker'; "
+        "aggregate reports merge partial results from the workers",
+    )
+    distributed.add_argument(
+        "--worker-retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help="Retries of a file on other workers when a worker fails "
+        f"(default: {DEFAULT_RETRIES})",
+    )
+    distributed.add_argument(
+        "--worker-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        metavar="SECONDS",
+        help=f"Time to wait for a worker response (default: {DEFAULT_TIMEOUT:g})",
+    )
+
+    parser.add_argument(
+        "--csv-output",
+        metavar="PATH",
+        help="Write the report data as CSV instead of printing the report "
+        "('-' writes to standard output)",
+    )
+
+    parser.add_argument(
+        "--arrow-output",
+        metavar="PATH",
+        help="Write the report rows to an Arrow IPC (Feather v2) file "
+        "instead of printing the report (requires pyarrow)",
+    )
+
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Validate all columns, not only those required by the report",
+    )
+
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+
+    return parser
+
+
+def add_discovery_arguments(
+    parser: argparse.ArgumentParser, source: argparse._MutuallyExclusiveGroup
+) -> None:
+    """
+    Добавляет аргументы поиска входных файлов (--input-dir, --manifest).
+
+    Args:
+        parser: Парсер команды.
+        source: Группа взаимоисключающих источников данных.
+    """
+    source.add_argument(
+        "--input-dir",
+        metavar="DIR",
+        help="Directory scanned (recursively) for input files",
+    )
+    source.add_argument(
+        "--manifest",
+        metavar="FILE",
+        help="File listing input paths, one per line ('#' starts a comment)",
+    )
+
+    discovery = parser.add_argument_group("directory discovery")
+    discovery.add_argument(
+        "--include",
+        nargs="+",
+        metavar="PATTERN",
+        default=list(DEFAULT_INCLUDE),
+        help="Glob patterns of files to read from --input-dir (default: *.csv)",
+    )
+    discovery.add_argument(
+        "--exclude",
+        nargs="+",
+        metavar="PATTERN",
+        default=[],
+        help="Glob patterns of files and directories to skip",
+    )
+    discovery.add_argument(
+        "--no-recursive",
+        action="store_true",
+        help="Do not descend into subdirectories of --input-dir",
+    )
+    discovery.add_argument(
+        "--sort-files",
+        action="store_true",
+        help="Read --input-dir files in name order; each directory is listed "
+        "in full before its first file is read (default: directory order)",
+    )
+
+
+def add_format_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Добавляет аргумент выбора формата входных файлов (--format).
+
+    Args:
+        parser: Парсер команды.
+    """
+    parser.add_argument(
+        "--format",
+        choices=("auto", *FORMATS),
+        default="auto",
+        help="Input format; 'auto' (default) detects CSV, JSON Lines or "
+        "Arrow IPC per file by extension or content",
+    )
+
+
+def build_file_reader(
+    file_format: str,
+    csv_reader: CSVReader,
+    jsonl_reader: JSONLReader,
+    arrow_reader: ArrowReader,
+) -> FileReader:
+    """
+    Выбирает читатель файлов для формата из --format.
+
+    Args:
+        file_format: 'auto', 'csv', 'jsonl' или 'arrow'.
+        csv_reader: Читатель CSV.
+        jsonl_reader: Читатель JSON Lines.
+        arrow_reader: Читатель Arrow IPC.
+
+    Returns:
+        FileReader: Читатель формата или MultiFormatReader для 'auto'.
+    """
+    if file_format == CSV_FORMAT:
+        return csv_reader
+    if file_format == JSONL_FORMAT:
+        return jsonl_reader
+    if file_format == ARROW_FORMAT:
+        return arrow_reader
+    return MultiFormatReader(
+        {
+            CSV_FORMAT: csv_reader,
+            JSONL_FORMAT: jsonl_reader,
+            ARROW_FORMAT: arrow_reader,
+        }
+    )
+
+
+def build_input_paths(parsed_args: argparse.Namespace) -> Iterable[str]:
+    """
+    Возвращает входные файлы из --files, --input-dir или --manifest.
+
+    Файлы каталога и манифеста выдаются потоком, по мере обнаружения.
+
+    Args:
+        parsed_args: Разобранные аргументы.
+
+    Returns:
+        Iterable[str]: Пути к входным файлам.
+    """
+    if parsed_args.input_dir:
+        return discover_files(
+            parsed_args.input_dir,
+            include=parsed_args.include,
+            exclude=parsed_args.exclude,
+            recursive=not parsed_args.no_recursive,
+            sort=parsed_args.sort_files,
+        )
+    if parsed_args.manifest:
+        return read_manifest(parsed_args.manifest)
+    files: list[str] = parsed_args.files
+    return files
+
+
+def setup_ingest_argparse() -> argparse.ArgumentParser:
+    """
+    Настройка парсера команды ingest (загрузка CSV в SQLite).
+
+    Returns:
+        argparse.ArgumentParser: Настроенный парсер.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py ingest",
+        description="Load validated CSV files into a SQLite database "
+        "or a partitioned dataset directory",
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--db",
+        help="SQLite database file (created if missing)",
+    )
+    target.add_argument(
+        "--output-dir",
+        metavar="DIR",
+        help="Root of a partitioned dataset (DIR/year=.../continent=.../*.csv)",
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--files",
+        nargs="+",
+        help="CSV, JSON Lines or Arrow IPC files with economic data ('-' reads standard input)",
+    )
+    add_discovery_arguments(parser, source)
+    add_format_argument(parser)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10_000,
+        help="Rows per executemany batch (default: 10000)",
+    )
+    parser.add_argument(
+        "--cube",
+        metavar="PATH",
+        help="Also materialize an aggregate cube (country/continent x year) "
+        "of the whole target at PATH",
+    )
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        metavar="COLUMN",
+        choices=PARTITION_KEYS,
+        default=list(DEFAULT_PARTITION_BY),
+        help="Partition columns for --output-dir (default: year continent)",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    return parser
+
+
+def ingest_main(args: list[str]) -> int:
+    """
+    Команда ingest: загружает CSV файлы в базу SQLite или в набор данных,
+    разбитый по каталогам.
+
+    Args:
+        args: Аргументы команды (без слова 'ingest').
+
+    Returns:
+        int: Код возврата (0 - успех, 1 - ошибка).
+    """
+    parsed_args = setup_ingest_argparse().parse_args(args)
+    if parsed_args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    target = parsed_args.db or parsed_args.output_dir
+    reader = build_file_reader(
+        parsed_args.format,
+        CSVReader(strict=True),
+        JSONLReader(strict=True),
+        ArrowReader(strict=True),
+    )
+    try:
+        if parsed_args.db:
+            total = SQLiteStorage(parsed_args.db).ingest(
+                build_input_paths(parsed_args),
+                reader=reader,
+                batch_size=parsed_args.batch_size,
+            )
+        else:
+            total = write_dataset(
+                build_input_paths(parsed_args),
+                parsed_args.output_dir,
+                partition_by=parsed_args.partition_by,
+                reader=reader,
+            )
+        print(f"Ingested {total} records into {target}")
+
+        # Куб строится по всему содержимому цели, включая ранее загруженное
+        if parsed_args.cube:
+            cube_reader: DataReader = (
+                SQLiteReader()
+                if parsed_args.db
+                else PartitionedReader(CSVReader(strict=True))
+            )
+            cube = build_cube(cube_reader, [target])
+            save_cube(cube, parsed_args.cube)
+            print(
+                f"Wrote aggregate cube ({len(cube.countries.keys)} countries, "
+                f"{cube.first_year}-{cube.last_year}) to {parsed_args.cube}"
+            )
+    except FileNotFoundError as e:
+        logger.error(f"File error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except (ValidationError, ValueError) as e:
+        logger.error(f"Ingest error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def setup_diff_argparse() -> argparse.ArgumentParser:
+    """
+    Настройка парсера команды diff (сравнение двух снимков данных).
+
+    Returns:
+        argparse.ArgumentParser: Настроенный парсер.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py diff",
+        description="Report (country, year) rows added, removed or changed "
+        "between two snapshots of the data",
+    )
+    parser.add_argument(
+        "--old",
+        nargs="+",
+        required=True,
+        metavar="FILE",
+        help="Files of the previous snapshot ('-' reads standard input)",
+    )
+    parser.add_argument(
+        "--new",
+        nargs="+",
+        required=True,
+        metavar="FILE",
+        help="Files of the new snapshot ('-' reads standard input)",
+    )
+    add_format_argument(parser)
+    parser.add_argument(
+        "--fields",
+        nargs="+",
+        choices=VALUE_FIELDS,
+        metavar="FIELD",
+        help="Fields to compare (default: all but country and year)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.0,
+        help="Ignore float changes up to this absolute value (default: 0)",
+    )
+    parser.add_argument(
+        "--csv-output",
+        metavar="PATH",
+        help="Write one CSV row per differing field to PATH ('-' for stdout)",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    return parser
+
+
+def diff_main(args: list[str]) -> int:
+    """
+    Команда diff: сравнивает два снимка данных по ключу (страна, год).
+
+    Args:
+        args: Аргументы команды (без слова 'diff').
+
+    Returns:
+        int: Код возврата (0 - успех, 1 - ошибка).
+    """
+    parsed_args = setup_diff_argparse().parse_args(args)
+    if parsed_args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    reader = build_file_reader(
+        parsed_args.format,
+        CSVReader(strict=True),
+        JSONLReader(strict=True),
+        ArrowReader(strict=True),
+    )
+    try:
+        if (parsed_args.old + parsed_args.new).count("-") > 1:
+            raise ValueError("Standard input ('-') can only be read once")
+        diff = diff_snapshots(
+            parsed_args.old,
+            parsed_args.new,
+            reader,
+            compare=parsed_args.fields,
+            tolerance=parsed_args.tolerance,
+        )
+        if parsed_args.csv_output == "-":
+            write_diff_csv(diff, sys.stdout)
+        elif parsed_args.csv_output:
+            with open(parsed_args.csv_output, "w", encoding="utf-8", newline="") as f:
+                write_diff_csv(diff, f)
+            print(f"{diff.summary}. Wrote the diff to {parsed_args.csv_output}")
+        else:
+            print(render_diff(diff))
+    except FileNotFoundError as e:
+        logger.error(f"File error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except (ValidationError, ValueError) as e:
+        logger.error(f"Diff error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
 
+def setup_worker_argparse() -> argparse.ArgumentParser:
+    """
+    Настройка парсера команды worker (рабочий узел распределенного режима).
+
+    Returns:
+        argparse.ArgumentParser: Настроенный парсер.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py worker",
+        description="Serve file reading and partial aggregation tasks "
+        "for a coordinator started with --remote-workers. The protocol is "
+        "unauthenticated: anyone who can connect can read files available "
+        "to the worker, so expose it only on trusted networks.",
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help="Address to listen on; pass e.g. 0.0.0.0 to accept remote "
+        "coordinators (unauthenticated, trusted networks only) "
+        f"(default: {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Port to listen on; 0 picks a free port (default: {DEFAULT_PORT})",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     return parser
 
 
+def worker_main(args: list[str]) -> int:
+    """
+    Команда worker: принимает задачи координатора до прерывания (Ctrl+C).
+
+    Args:
+        args: Аргументы команды (без слова 'worker').
+
+    Returns:
+        int: Код возврата (0 - успех, 1 - ошибка).
+    """
+    parsed_args = setup_worker_argparse().parse_args(args)
+    logging.getLogger().setLevel(logging.DEBUG if parsed_args.debug else logging.INFO)
+
+    try:
+        server = WorkerServer(parsed_args.host, parsed_args.port)
+    except OSError as e:
+        logger.error(f"Cannot start worker: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    with server:
+        print(f"Worker listening on {server.address}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def build_reader(parsed_args: argparse.Namespace) -> DataReader:
+    """
+    Создает читатель для выбранного источника данных.
+
+    Args:
+        parsed_args: Разобранные аргументы.
+
+    Returns:
+        DataReader: SQLiteReader для --db, PartitionedReader для --dataset,
+            CubeReader для --cube, ParallelCSVReader для --workers, DistributedReader для
+            --remote-workers, иначе читатель формата (см. build_file_reader).
+    """
+    row_filter = build_row_filter(parsed_args)
+    sample_fraction = parsed_args.sample
+    if sample_fraction is None and parsed_args.approx:
+        sample_fraction = DEFAULT_SAMPLE_FRACTION
+
+    stored = parsed_args.db or parsed_args.dataset or parsed_args.cube
+    if parsed_args.workers is not None and stored:
+        raise ValueError("--workers is only supported for CSV files")
+    if parsed_args.remote_workers:
+        if stored or parsed_args.workers is not None:
+            raise ValueError(
+                "--remote-workers cannot be combined with --db, --dataset, "
+                "--cube or --workers"
+            )
+        if sample_fraction is not None or parsed_args.zone_maps:
+            raise ValueError(
+                "Sampling and zone maps are not supported with --remote-workers"
+            )
+        return DistributedReader(
+            parsed_args.remote_workers,
+            row_filter=row_filter,
+            strict=parsed_args.strict,
+            file_format=parsed_args.format,
+            timeout=parsed_args.worker_timeout,
+            retries=parsed_args.worker_retries,
+        )
+    if sample_fraction is not None and (
+        parsed_args.db or parsed_args.cube or parsed_args.format == ARROW_FORMAT
+    ):
+        raise ValueError("Sampling is only supported for CSV and JSON Lines input")
+    if parsed_args.db:
+        return SQLiteReader(row_filter=row_filter)
+    if parsed_args.cube:
+        return CubeReader(row_filter=row_filter)
+    reader = CSVReader(
+        row_filter=row_filter,
+        zone_maps=parsed_args.zone_maps,
+        strict=parsed_args.strict,
+        sample_fraction=sample_fraction,
+        sample_seed=parsed_args.sample_seed,
+    )
+    if parsed_args.dataset:
+        return PartitionedReader(reader, include=parsed_args.include)
+
+    file_reader = build_file_reader(
+        parsed_args.format,
+        reader,
+        JSONLReader(
+            row_filter=row_filter,
+            strict=parsed_args.strict,
+            sample_fraction=sample_fraction,
+            sample_seed=parsed_args.sample_seed,
+        ),
+        ArrowReader(row_filter=row_filter, strict=parsed_args.strict),
+    )
+    if parsed_args.workers is not None:
+        return ParallelCSVReader(file_reader, workers=parsed_args.workers)
+    return file_reader
+
+
+def build_row_filter(parsed_args: argparse.Namespace) -> RowFilter | None:
+    """
+    Создает фильтр строк из аргументов командной строки.
+
+    Args:
+        parsed_args: Разобранные аргументы.
+
+    Returns:
+        RowFilter | None: Фильтр или None, если ограничения не заданы.
+    """
+    row_filter = RowFilter.create(
+        year_from=parsed_args.year_from,
+        year_to=parsed_args.year_to,
+        countries=parsed_args.countries,
+        continents=parsed_args.continents,
+    )
+    return None if row_filter.is_empty else row_filter
+
+
+def build_report_params(parsed_args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Собирает параметры отчета из аргументов командной строки.
+
+    Args:
+        parsed_args: Разобранные аргументы.
+
+    Returns:
+        dict[str, Any]: Заданные параметры (не указанные опускаются).
+    """
+    params = {
+        "group_by": parsed_args.group_by,
+        "aggregates": parsed_args.agg,
+        "indicator": parsed_args.indicator,
+        "indicators": parsed_args.indicators,
+        "by_country": False if parsed_args.overall else None,
+        "common_years": parsed_args.common_years or None,
+        "z_threshold": parsed_args.z_threshold,
+        "mad_threshold": parsed_args.mad_threshold,
+        "jump_ratio": parsed_args.jump_ratio,
+        "jump_points": parsed_args.jump_points,
+        "window": parsed_args.window,
+        "start_year": parsed_args.start_year,
+        "end_year": parsed_args.end_year,
+        "approx": parsed_args.approx or parsed_args.sample is not None,
+        "max_memory": (
+            parsed_args.max_memory * 1024 * 1024
+            if parsed_args.max_memory is not None
+            else None
+        ),
+    }
+    return {name: value for name, value in params.items() if value is not None}
+
+
 def main(args: list[str] | None = None) -> int:
     """
     Основная функция скрипта.
@@ -79,8 +923,16 @@ def main(args: list[str] | None = None) -> int:
     Returns:
         int: Код возврата (0 - успех, 1 - ошибка).
     """
+    argv = sys.argv[1:] if args is None else args
+    if argv and argv[0] == "ingest":
+        return ingest_main(argv[1:])
+    if argv and argv[0] == "worker":
+        return worker_main(argv[1:])
+    if argv and argv[0] == "diff":
+        return diff_main(argv[1:])
+
     parser = setup_argparse()
-    parsed_args: argparse.Namespace = parser.parse_args(args)
+    parsed_args: argparse.Namespace = parser.parse_args(argv)
 
     # Настройка уровня логирования
     if parsed_args.debug:
@@ -88,7 +940,17 @@ def main(args: list[str] | None = None) -> int:
         logger.debug("Debug logging enabled")
 
     try:
-        analyzer = Analyzer()
+        reader = build_reader(parsed_args)
+        result_cache = (
+            ResultCache(
+                cache_dir=parsed_args.cache_dir,
+                ttl=parsed_args.cache_ttl,
+                hash_content=parsed_args.cache_hash_content,
+            )
+            if parsed_args.cache_dir
+            else None
+        )
+        analyzer = Analyzer(reader=reader, cache=result_cache)
 
         # Отдельный режим для --list-reports
         if parsed_args.list_reports:
@@ -100,10 +962,80 @@ def main(args: list[str] | None = None) -> int:
             return 0
 
         # Основной режим анализа
-        logger.info(f"Starting analysis with files: {parsed_args.files}")
+        if parsed_args.db or parsed_args.dataset or parsed_args.cube:
+            sources: Iterable[str] = [
+                parsed_args.db or parsed_args.dataset or parsed_args.cube
+            ]
+        elif parsed_args.remote_workers:
+            # Агрегация на узлах выполняется по списку файлов
+            sources = list(build_input_paths(parsed_args))
+        else:
+            sources = build_input_paths(parsed_args)
+        source = (
+            parsed_args.db
+            or parsed_args.dataset
+            or parsed_args.cube
+            or parsed_args.input_dir
+            or parsed_args.manifest
+            or parsed_args.files
+        )
+        logger.info(f"Starting analysis with input: {source}")
         logger.info(f"Report type: {parsed_args.report}")
 
-        result = analyzer.analyze(parsed_args.files, parsed_args.report)
+        if parsed_args.deadline is not None or parsed_args.progress is not None:
+            if parsed_args.arrow_output or parsed_args.csv_output:
+                raise ValueError(
+                    "--arrow-output and --csv-output cannot be combined with "
+                    "--deadline or --progress"
+                )
+            print(
+                analyzer.analyze_online(
+                    sources,
+                    parsed_args.report,
+                    build_report_params(parsed_args),
+                    deadline=parsed_args.deadline,
+                    progress_interval=parsed_args.progress,
+                    on_progress=(
+                        (lambda report: print(report, file=sys.stderr, flush=True))
+                        if parsed_args.progress is not None
+                        else None
+                    ),
+                )
+            )
+            return 0
+
+        if parsed_args.arrow_output and parsed_args.csv_output:
+            raise ValueError("Use only one of --arrow-output and --csv-output")
+
+        if parsed_args.csv_output == "-":
+            analyzer.write_csv(
+                sources,
+                parsed_args.report,
+                build_report_params(parsed_args),
+                sys.stdout,
+            )
+            return 0
+        if parsed_args.csv_output:
+            with open(parsed_args.csv_output, "w", encoding="utf-8", newline="") as f:
+                analyzer.write_csv(
+                    sources, parsed_args.report, build_report_params(parsed_args), f
+                )
+            print(f"Wrote the {parsed_args.report} report to {parsed_args.csv_output}")
+            return 0
+
+        if parsed_args.arrow_output:
+            table = analyzer.compute_table(
+                sources, parsed_args.report, build_report_params(parsed_args)
+            )
+            write_arrow(table, parsed_args.arrow_output)
+            print(f"Wrote {len(table)} rows to {parsed_args.arrow_output}")
+            return 0
+
+        result = analyzer.analyze(
+            sources,
+            parsed_args.report,
+            build_report_params(parsed_args),
+        )
 
         # Вывод результата в консоль
         print(result)
@@ -120,6 +1052,16 @@ def main(args: list[str] | None = None) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+    except ImportError as e:
+        logger.error(f"Missing dependency: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    except WorkerError as e:
+        logger.error(f"Worker error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         print(f"Unexpected error: {e}", file=sys.stderr)
@@ -1,8 +1,17 @@
 import logging
+from typing import Any, Callable, Collection, Iterable, Mapping, Sequence, TextIO
 
-from src.calculator import GDPCalculator, StatisticsCalculator
-from src.reader import CSVReader
-from src.reports.base import ReportFactory
+from src.cache import ResultCache, make_cache_key
+from src.calculator import (
+    AggregateCalculator,
+    CorrelationCalculator,
+    StatisticsCalculator,
+    StreamingCalculator,
+)
+from src.columnar import ColumnarTable
+from src.online import OnlineAggregation, OnlineSnapshot
+from src.reader import CSVReader, DataReader, is_stream
+from src.reports.base import Report, ReportFactory
 
 logger = logging.getLogger(__name__)
 
@@ -18,37 +27,56 @@ class Analyzer:
         >>> analyzer = Analyzer()
         >>> result = analyzer.analyze(["data.csv"], "average-gdp")
         >>> print(result)
+
+    Для встраивания в сервисы без форматирования таблиц:
+        >>> statistics = analyzer.compute(["data.csv"], "average-gdp")
+        >>> table = analyzer.compute_table(["data.csv"], "average-gdp")
+        >>> gdp = table.to_numpy()["average_gdp"]
     """
 
     def __init__(
         self,
-        reader: CSVReader | None = None,
-        calculator: StatisticsCalculator | None = None,
+        reader: DataReader | None = None,
+        calculator: StatisticsCalculator[Any] | None = None,
+        cache: ResultCache | None = None,
     ):
         """
         Инициализация анализатора.
 
         Args:
-            reader: Читатель CSV файлов (создается по умолчанию).
-            calculator: Калькулятор статистик (создается по умолчанию).
+            reader: Читатель данных (по умолчанию CSVReader).
+            calculator: Калькулятор статистик. По умолчанию калькулятор
+                выбирается отчетом (Report.create_calculator).
+            cache: Кеш результатов (None - без кеширования).
         """
         self.reader = reader or CSVReader()
-        self.calculator = calculator or GDPCalculator()
-        logger.debug(f"Initialized Analyzer with {type(self.calculator).__name__}")
+        self.calculator = calculator
+        self.cache = cache
+        logger.debug(
+            f"Initialized Analyzer with {type(self.calculator).__name__}"
+            if self.calculator
+            else "Initialized Analyzer with report-provided calculators"
+        )
 
-    def analyze(self, file_paths: list[str], report_type: str) -> str:
+    def analyze(
+        self,
+        file_paths: Iterable[str],
+        report_type: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> str:
         """
         Выполняет полный цикл анализа данных.
 
         Этапы:
-        1. Чтение данных из CSV файлов.
-        2. Расчет статистик по странам.
-        3. Генерация отчета.
-        4. Возврат отформатированного результата.
+        1. Выбор отчета и калькулятора.
+        2. Чтение данных из CSV файлов.
+        3. Расчет статистик.
+        4. Генерация отчета.
 
         Args:
-            file_paths: Список путей к CSV файлам.
+            file_paths: Пути к входным файлам (список или поток путей).
             report_type: Тип отчета (например, 'average-gdp').
+            params: Параметры отчета (например, group_by и aggregates).
 
         Returns:
             str: Готовый к выводу в консоль отчет.
@@ -58,19 +86,164 @@ class Analyzer:
             ValidationError: При ошибках валидации данных.
             ValueError: Если указан неизвестный тип отчета.
         """
-        logger.info(
-            f"Starting analysis with {len(file_paths)} file(s), report: {report_type}"
+        report = self._create_report(report_type)
+        statistics = self._statistics(report, file_paths, report_type, params)
+
+        # Шаг 4: Генерация отчета
+        result = report.generate(statistics)
+        logger.info(f"Report '{report_type}' generated successfully")
+
+        return result
+
+    def analyze_online(
+        self,
+        file_paths: Iterable[str],
+        report_type: str,
+        params: Mapping[str, Any] | None = None,
+        deadline: float | None = None,
+        progress_interval: float | None = None,
+        on_progress: Callable[[str], None] | None = None,
+    ) -> str:
+        """
+        Формирует отчет в режиме онлайн-агрегации.
+
+        Во время чтения on_progress получает текущий отчет (с числом
+        обработанных строк), а по истечении дедлайна чтение прекращается
+        и возвращается отчет по прочитанным данным с пометкой PARTIAL.
+        Поддерживаются отчеты с агрегирующим калькулятором; результаты
+        не кешируются.
+
+        Args:
+            file_paths: Пути к входным файлам (список или поток путей).
+            report_type: Тип отчета (например, 'average-gdp').
+            params: Параметры отчета.
+            deadline: Бюджет времени на чтение (секунды).
+            progress_interval: Интервал промежуточных отчетов (секунды).
+            on_progress: Получатель промежуточных отчетов.
+
+        Returns:
+            str: Отчет со строкой состояния (COMPLETE или PARTIAL).
+
+        Raises:
+            ValueError: Если отчет не поддерживает онлайн-агрегацию.
+        """
+        report = self._create_report(report_type)
+        calculator = self._create_calculator(report, report_type, params)
+        if not isinstance(calculator, AggregateCalculator):
+            raise ValueError(
+                f"Report '{report_type}' does not support online aggregation"
+            )
+
+        def render(snapshot: OnlineSnapshot[Any]) -> str:
+            return f"{snapshot.summary}\n{report.generate(snapshot.statistics)}"
+
+        online: OnlineAggregation[Any] = OnlineAggregation(
+            calculator,
+            deadline=deadline,
+            progress_interval=progress_interval,
+            on_progress=(
+                (lambda snapshot: on_progress(render(snapshot)))
+                if on_progress is not None
+                else None
+            ),
         )
+        snapshot = online.run(
+            self.reader.iter_records(file_paths, calculator.required_columns)
+        )
+        logger.info(f"Report '{report_type}' generated from {snapshot.rows} records")
+        return render(snapshot)
 
-        # Шаг 1: Чтение данных
-        records = self.reader.read(file_paths)
-        logger.info(f"Loaded {len(records)} records total")
+    def compute(
+        self,
+        file_paths: Iterable[str],
+        report_type: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> list[Any]:
+        """
+        Рассчитывает данные отчета без форматирования.
+
+        Args:
+            file_paths: Пути к входным файлам (список или поток путей).
+            report_type: Тип отчета (например, 'average-gdp').
+            params: Параметры отчета.
+
+        Returns:
+            list: DTO калькулятора отчета (например, list[CountryStatistics]).
+
+        Raises:
+            FileNotFoundError: Если один из файлов не существует.
+            ValidationError: При ошибках валидации данных.
+            ValueError: Если указан неизвестный тип отчета.
+        """
+        report = self._create_report(report_type)
+        return self._statistics(report, file_paths, report_type, params)
+
+    def compute_table(
+        self,
+        file_paths: Iterable[str],
+        report_type: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> ColumnarTable:
+        """
+        Рассчитывает данные отчета в колоночном виде.
+
+        Returns:
+            ColumnarTable: Колонка на каждое поле DTO; числовые колонки
+            поддерживают протокол буфера и экспорт в NumPy без копирования.
+        """
+        return ColumnarTable.from_results(self.compute(file_paths, report_type, params))
+
+    def write_csv(
+        self,
+        file_paths: Iterable[str],
+        report_type: str,
+        params: Mapping[str, Any] | None,
+        file: TextIO,
+    ) -> int:
+        """
+        Рассчитывает данные отчета и записывает их в CSV (Report.write_csv).
+
+        Args:
+            file_paths: Пути к входным файлам (список или поток путей).
+            report_type: Тип отчета.
+            params: Параметры отчета.
+            file: Открытый текстовый файл (newline='').
+
+        Returns:
+            int: Число DTO отчета.
+        """
+        report = self._create_report(report_type)
+        statistics = self._statistics(report, file_paths, report_type, params)
+        report.write_csv(statistics, file)
+        logger.info(f"Report '{report_type}' written as CSV")
+        return len(statistics)
 
-        # Шаг 2: Расчет статистик
-        statistics = self.calculator.calculate(records)
-        logger.info(f"Calculated statistics for {len(statistics)} countries")
+    def load_table(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> ColumnarTable:
+        """
+        Загружает записи в колоночную таблицу без расчета статистик.
+
+        Args:
+            file_paths: Пути к входным файлам (список или поток путей).
+            columns: Колонки таблицы (по умолчанию все).
+
+        Returns:
+            ColumnarTable: Загруженный набор данных.
+        """
+        table = ColumnarTable.from_records(
+            self.reader.iter_records(file_paths, columns), columns
+        )
+        logger.info(f"Loaded {len(table)} records into a columnar table")
+        return table
+
+    def _create_report(self, report_type: str) -> Report[Any]:
+        """
+        Создает отчет по имени.
 
-        # Шаг 3: Создание отчета
+        Raises:
+            ValueError: Если указан неизвестный тип отчета.
+        """
         report = ReportFactory.create(report_type)
         if report is None:
             available = ReportFactory.list_reports()
@@ -78,12 +251,140 @@ class Analyzer:
                 f"Unknown report type: '{report_type}'. "
                 f"Available reports: {list(available.keys())}"
             )
+        return report
 
-        # Шаг 4: Генерация отчета
-        result = report.generate(statistics)
-        logger.info(f"Report '{report_type}' generated successfully")
+    def _create_calculator(
+        self,
+        report: Report[Any],
+        report_type: str,
+        params: Mapping[str, Any] | None,
+    ) -> StatisticsCalculator[Any]:
+        """
+        Создает калькулятор отчета (или возвращает заданный явно).
 
-        return result
+        Raises:
+            ValueError: Если входные данные - выборка (params['approx']),
+                а отчет не умеет оценивать по ней результат.
+        """
+        params = params or {}
+        if params.get("approx") and not report.supports_sampling:
+            estimators = [
+                name
+                for name in ReportFactory.list_reports()
+                if (candidate := ReportFactory.create(name)) is not None
+                and candidate.supports_sampling
+            ]
+            raise ValueError(
+                f"Report '{report_type}' cannot be computed from a sample "
+                f"(--sample/--approx). Reports with estimates: {estimators}"
+            )
+        return self.calculator or report.create_calculator(params)
+
+    def _statistics(
+        self,
+        report: Report[Any],
+        file_paths: Iterable[str],
+        report_type: str,
+        params: Mapping[str, Any] | None,
+    ) -> list[Any]:
+        """
+        Выбирает калькулятор и рассчитывает статистику (или берет ее из кеша).
+        """
+        logger.info(f"Starting analysis, report: {report_type}")
+        calculator = self._create_calculator(report, report_type, params)
+
+        # Чтение данных и расчет статистик (или результат из кеша)
+        cache_key = None
+        statistics = None
+        # Ключ кеша требует полного списка файлов; потоки (stdin, каналы)
+        # читаются однократно и не кешируются, каталоги наборов данных
+        # представлены отпечатками файлов, которые откроет читатель
+        if self.cache is not None:
+            file_paths = list(file_paths)
+        if self.cache is not None and not any(map(is_stream, file_paths)):
+            cache_key = make_cache_key(
+                report=report_type,
+                params=dict(params or {}),
+                calculator=calculator,
+                reader=type(self.reader).__qualname__,
+                reader_options=self.reader.options,
+                files=self.cache.fingerprints(self.reader.source_files(file_paths)),
+            )
+            statistics = self.cache.get(cache_key)
+
+        if statistics is None:
+            statistics = self._compute(file_paths, calculator)
+            if self.cache is not None and cache_key is not None:
+                self.cache.put(cache_key, statistics)
+        return statistics
+
+    def _compute(
+        self, file_paths: Iterable[str], calculator: StatisticsCalculator[Any]
+    ) -> list[Any]:
+        """
+        Читает данные и рассчитывает статистику.
+
+        Args:
+            file_paths: Пути к входным файлам (список или поток путей).
+            calculator: Калькулятор статистик.
+
+        Returns:
+            list: Результат калькулятора.
+        """
+        # Агрегация на стороне источника (например, GROUP BY в SQLite);
+        # поток путей передается читателю без построения списка
+        if isinstance(calculator, AggregateCalculator):
+            groups = (
+                self.reader.aggregate(
+                    file_paths, calculator.spec, calculator.memory_limit
+                )
+                if isinstance(file_paths, Sequence)
+                else None
+            )
+            if groups is not None:
+                logger.info(f"Aggregated {len(groups)} groups in the data source")
+                statistics = calculator.finalize(groups)
+                logger.info(f"Calculated {len(statistics)} statistics rows")
+                return statistics
+
+            # Записи передаются агрегатору потоком, без промежуточного списка
+            statistics = calculator.calculate(
+                self.reader.iter_records(file_paths, calculator.required_columns)
+            )
+            logger.info(f"Calculated {len(statistics)} statistics rows")
+            return statistics
+
+        if isinstance(calculator, CorrelationCalculator):
+            # Накопители моментов по файлам сливаются на стороне источника
+            # (рабочие узлы) или заполняются потоком записей
+            moments = (
+                self.reader.comoments(file_paths, calculator.indicators)
+                if isinstance(file_paths, Sequence)
+                else None
+            )
+            if moments is None:
+                moments = calculator.accumulate(
+                    self.reader.iter_records(file_paths, calculator.required_columns)
+                )
+            statistics = calculator.finalize(moments)
+            logger.info(f"Calculated {len(statistics)} statistics rows")
+            return statistics
+
+        if isinstance(calculator, StreamingCalculator):
+            # Однопроходный калькулятор получает записи потоком
+            statistics = calculator.calculate(
+                self.reader.iter_records(file_paths, calculator.required_columns)
+            )
+            logger.info(f"Calculated {len(statistics)} statistics rows")
+            return statistics
+
+        # Чтение только колонок, нужных калькулятору
+        records = self.reader.read(file_paths, calculator.required_columns)
+        logger.info(f"Loaded {len(records)} records total")
+
+        statistics = calculator.calculate(records)
+        logger.info(f"Calculated {len(statistics)} statistics rows")
+        return statistics
 
     @staticmethod
     def get_available_reports() -> dict:
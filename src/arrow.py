@@ -0,0 +1,401 @@
+import logging
+import sys
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Collection, Iterable, Iterator, Mapping, Sequence
+
+from src.calculator import AggregateSpec, HashAggregator, create_aggregator
+from src.columnar import ColumnarTable
+from src.filters import RowFilter
+from src.models import EconomicRecord, GroupStatistics, RecordBatch
+from src.reader import STDIN_PATH, FileReader, iter_paths
+from src.utils.converters import FIELD_DEFAULTS, FIELD_PARSERS
+from src.utils.validators import EconomicDataValidator, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Сигнатура файла Arrow IPC (Feather v2) и маркер начала сообщения потока
+ARROW_FILE_MAGIC = b"ARROW1"
+ARROW_STREAM_MAGIC = b"\xff\xff\xff\xff"
+
+_RECORD_FIELDS = tuple(FIELD_DEFAULTS)
+
+_STRING_COLUMNS = frozenset({"country", "continent"})
+_INTEGER_COLUMNS = frozenset({"year", "population"})
+
+# Границы значений, которые проверяет EconomicDataValidator
+_MIN_VALUES: dict[str, float] = {
+    "year": 1900,
+    "gdp": 0,
+    "unemployment": 0,
+    "population": 1,
+}
+_MAX_VALUES: dict[str, float] = {"year": 2100}
+
+# Типы array.array для буферов числовых колонок Arrow
+_BUFFER_TYPECODES = {"int64": "q", "double": "d", "int32": "i"}
+
+
+def import_pyarrow() -> Any:
+    """
+    Импортирует pyarrow (необязательная зависимость).
+
+    Returns:
+        module: Модуль pyarrow с загруженными pyarrow.ipc и pyarrow.compute.
+
+    Raises:
+        ImportError: Если pyarrow не установлен.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute  # noqa: F401
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow IPC files; install it with "
+            "'pip install pyarrow'"
+        ) from e
+    return pa
+
+
+def _open_batches(pa: Any, file_path: str) -> Iterator[Any]:
+    """
+    Открывает файл Arrow IPC и выдает его пакеты записей.
+
+    Файлы отображаются в память (memory_map), поэтому буферы колонок
+    ссылаются на страницы файла без копирования. Поддерживаются формат
+    файла (Feather v2) и потоковый формат. Поток на стандартном вводе
+    читается по сообщениям; файловому формату нужен произвольный доступ,
+    поэтому такой файл со стандартного ввода загружается в память.
+    """
+    if file_path == STDIN_PATH:
+        stdin = sys.stdin.buffer
+        peek = getattr(stdin, "peek", None)
+        head = peek(len(ARROW_FILE_MAGIC)) if peek else b""
+        if head.startswith(ARROW_FILE_MAGIC):
+            reader = pa.ipc.open_file(pa.py_buffer(stdin.read()))
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+        else:
+            yield from pa.ipc.open_stream(stdin)
+        return
+
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    with pa.memory_map(file_path, "r") as source:
+        if source.read(len(ARROW_FILE_MAGIC)) == ARROW_FILE_MAGIC:
+            source.seek(0)
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+        else:
+            source.seek(0)
+            yield from pa.ipc.open_stream(source)
+
+
+def buffer_view(array: Any) -> Sequence[Any]:
+    """
+    Возвращает значения числовой колонки Arrow без копирования.
+
+    Колонки int64, int32 и float64 без пропусков представляются
+    memoryview над буфером данных; остальные - списком Python.
+
+    Args:
+        array: Массив pyarrow.
+
+    Returns:
+        Sequence: memoryview или список значений.
+    """
+    typecode = _BUFFER_TYPECODES.get(str(array.type))
+    if typecode is None or array.null_count:
+        values: list[Any] = array.to_pylist()
+        return values
+    itemsize = array.type.bit_width // 8
+    start = array.offset * itemsize
+    data = memoryview(array.buffers()[1]).cast("B")
+    view: Sequence[Any] = data[start : start + len(array) * itemsize].cast(
+        typecode  # type: ignore[call-overload]
+    )
+    return view
+
+
+class ArrowReader(FileReader):
+    """
+    Читатель файлов Arrow IPC / Feather v2 (требуется pyarrow).
+
+    Колонки читаются из отображенного в память файла. Проверки
+    EconomicDataValidator выполняются над колонками целиком (типы,
+    пропуски, диапазоны) функциями pyarrow.compute, без разбора строк.
+    Агрегация (aggregate) работает прямо над буферами колонок.
+    """
+
+    def __init__(
+        self,
+        validator: EconomicDataValidator | None = None,
+        row_filter: RowFilter | None = None,
+        strict: bool = False,
+    ):
+        """Инициализация читателя.
+
+        Args:
+            validator: Валидатор (используется список обязательных колонок).
+            row_filter: Фильтр строк, применяемый до проверки значений.
+            strict: Проверять все колонки, даже если запрошена только
+                часть из них.
+        """
+        self.validator = validator or EconomicDataValidator()
+        self.row_filter = row_filter
+        self.strict = strict
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return {"row_filter": self.row_filter, "strict": self.strict}
+
+    def _normalize(self, pa: Any, name: str, array: Any, file_path: str) -> Any:
+        """
+        Приводит колонку к типу поля EconomicRecord.
+
+        Числовые колонки нужного типа не копируются; строки очищаются
+        от пробелов, как в EconomicDataConverter.
+        """
+        if pa.types.is_dictionary(array.type):
+            array = array.dictionary_decode()
+        if name in _STRING_COLUMNS:
+            if not (
+                pa.types.is_string(array.type) or pa.types.is_large_string(array.type)
+            ):
+                raise ValidationError(
+                    f"{file_path}: Column '{name}' must be a string, got {array.type}"
+                )
+            return pa.compute.utf8_trim_whitespace(array)
+
+        target = pa.int64() if name in _INTEGER_COLUMNS else pa.float64()
+        try:
+            return pa.compute.cast(array, target)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValidationError(
+                f"{file_path}: Invalid {name} format - expected {target}, "
+                f"got {array.type}"
+            ) from e
+
+    def _validate(self, pa: Any, name: str, array: Any, file_path: str) -> None:
+        """Проверяет колонку по правилам EconomicDataValidator."""
+        if array.null_count:
+            raise ValidationError(
+                f"{file_path}: Missing or empty value for column '{name}' "
+                f"({array.null_count} rows)"
+            )
+        if not len(array):
+            return
+        if name in _STRING_COLUMNS:
+            if pa.compute.min(pa.compute.utf8_length(array)).as_py() == 0:
+                raise ValidationError(
+                    f"{file_path}: Missing or empty value for column '{name}'"
+                )
+            return
+
+        bounds = pa.compute.min_max(array)
+        low, high = bounds["min"].as_py(), bounds["max"].as_py()
+        if name in _MIN_VALUES and low < _MIN_VALUES[name]:
+            raise ValidationError(
+                f"{file_path}: {name.capitalize()} must be >= {_MIN_VALUES[name]}, "
+                f"got {low}"
+            )
+        if name in _MAX_VALUES and high > _MAX_VALUES[name]:
+            raise ValidationError(
+                f"{file_path}: {name.capitalize()} must be <= {_MAX_VALUES[name]}, "
+                f"got {high}"
+            )
+
+    def _filter_mask(self, pa: Any, row_filter: RowFilter, columns: Any) -> Any:
+        """Строит маску строк, проходящих фильтр."""
+        pc = pa.compute
+        conditions = []
+        if row_filter.year_from is not None:
+            conditions.append(pc.greater_equal(columns["year"], row_filter.year_from))
+        if row_filter.year_to is not None:
+            conditions.append(pc.less_equal(columns["year"], row_filter.year_to))
+        for name, values in (
+            ("country", row_filter.countries),
+            ("continent", row_filter.continents),
+        ):
+            if values is not None:
+                value_set = pa.array(sorted(values), pa.string())
+                conditions.append(pc.is_in(columns[name], value_set=value_set))
+        mask = conditions[0]
+        for condition in conditions[1:]:
+            mask = pc.and_(mask, condition)
+        return mask
+
+    def iter_columns(
+        self,
+        file_path: str,
+        columns: Collection[str] | None = None,
+        partition: Mapping[str, str] | None = None,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Выдает проверенные колонки файла по пакетам записей.
+
+        Args:
+            file_path: Путь к файлу Arrow IPC ('-' - поток на stdin).
+            columns: Проекция колонок (игнорируется в строгом режиме).
+            partition: Значения колонок, общие для всех строк файла.
+
+        Yields:
+            tuple: Число строк и словарь {колонка: массив pyarrow}.
+
+        Raises:
+            ImportError: Если pyarrow не установлен.
+            FileNotFoundError: Если файл не существует.
+            ValidationError: При отсутствии колонок или невалидных значениях.
+        """
+        pa = import_pyarrow()
+        partition = dict(partition or {})
+        projection = None if self.strict or columns is None else frozenset(columns)
+        checked = frozenset(
+            self.validator.REQUIRED_COLUMNS if projection is None else projection
+        )
+
+        row_filter = self.row_filter
+        if row_filter is not None and partition:
+            row_filter = row_filter.without(partition.keys())
+        if row_filter is not None and row_filter.is_empty:
+            row_filter = None
+        filter_columns = row_filter.columns if row_filter is not None else frozenset()
+
+        logger.debug(f"Reading file: {file_path}")
+        for batch in _open_batches(pa, file_path):
+            names = {name.strip().lower(): name for name in batch.schema.names}
+            needed = (checked | filter_columns) - partition.keys()
+            missing = needed - names.keys()
+            if missing:
+                raise ValidationError(
+                    f"{file_path}: Missing required columns: "
+                    f"{', '.join(sorted(missing))}"
+                )
+
+            # Фильтр применяется до проверки значений, как у CSVReader
+            data = {
+                name: self._normalize(pa, name, batch.column(names[name]), file_path)
+                for name in filter_columns
+            }
+            num_rows = batch.num_rows
+            if row_filter is not None:
+                mask = self._filter_mask(pa, row_filter, data)
+                batch = batch.filter(mask)
+                data = {name: array.filter(mask) for name, array in data.items()}
+                num_rows = batch.num_rows
+
+            for name in checked - partition.keys():
+                if name not in data:
+                    data[name] = self._normalize(
+                        pa, name, batch.column(names[name]), file_path
+                    )
+                self._validate(pa, name, data[name], file_path)
+            for name, value in partition.items():
+                if name in checked:
+                    data[name] = pa.array(
+                        repeat(FIELD_PARSERS[name](value), num_rows),
+                        pa.string() if name in _STRING_COLUMNS else None,
+                    )
+            yield num_rows, {name: data[name] for name in checked}
+
+    def read_file(
+        self,
+        file_path: str,
+        columns: Collection[str] | None = None,
+        partition: Mapping[str, str] | None = None,
+    ) -> Iterator[EconomicRecord]:
+        """Читает один файл Arrow IPC и возвращает генератор записей.
+
+        Args:
+            file_path: Путь к файлу.
+            columns: Проекция колонок; остальные поля записи получают
+                значения по умолчанию.
+            partition: Значения колонок, общие для всех строк файла.
+
+        Yields:
+            EconomicRecord: Объект с экономическими данными.
+        """
+        for num_rows, data in self.iter_columns(file_path, columns, partition):
+            iterables: list[Iterable[Any]] = [
+                (
+                    (
+                        buffer_view(data[name])
+                        if name not in _STRING_COLUMNS
+                        else data[name].to_pylist()
+                    )
+                    if name in data
+                    else repeat(FIELD_DEFAULTS[name], num_rows)
+                )
+                for name in _RECORD_FIELDS
+            ]
+            yield from map(EconomicRecord, *iterables)
+
+    def aggregate(
+        self,
+        file_paths: Sequence[str],
+        spec: AggregateSpec,
+        memory_limit: int | None = None,
+    ) -> list[GroupStatistics] | None:
+        """
+        Агрегирует файлы прямо над колонками Arrow.
+
+        Числовые колонки передаются агрегатору как memoryview над буферами
+        файла, строковые ключи - кодами словаря (dictionary_encode);
+        ключи декодируются при слиянии пакетов.
+
+        Args:
+            file_paths: Пути к файлам Arrow IPC.
+            spec: Спецификация агрегации.
+            memory_limit: Лимит памяти сливаемых групп в байтах; при
+                превышении группы выгружаются на диск (None - без лимита).
+
+        Returns:
+            list[GroupStatistics]: Результаты по группам.
+        """
+        result = create_aggregator(spec, memory_limit)
+        for file_path in iter_paths(file_paths):
+            rows = 0
+            for num_rows, data in self.iter_columns(file_path, spec.columns):
+                batch_columns: dict[str, Sequence[Any]] = {}
+                dictionaries: dict[str, list[Any]] = {}
+                for name, array in data.items():
+                    if name in _STRING_COLUMNS:
+                        encoded = array.dictionary_encode()
+                        batch_columns[name] = buffer_view(encoded.indices)
+                        dictionaries[name] = encoded.dictionary.to_pylist()
+                    else:
+                        batch_columns[name] = buffer_view(array)
+
+                local = HashAggregator(spec)
+                local.update(RecordBatch(columns=batch_columns, num_rows=num_rows))
+                for key, count, values in local.partials():
+                    decoded = tuple(
+                        dictionaries[name][value] if name in dictionaries else value
+                        for name, value in zip(spec.group_by, key, strict=True)
+                    )
+                    result.merge_partial(decoded, count, values)
+                rows += num_rows
+            logger.info(f"Aggregated {rows} records from {file_path}")
+        return result.results()
+
+
+def write_arrow(table: ColumnarTable, path: str | Path) -> None:
+    """
+    Записывает таблицу результатов в файл Arrow IPC (Feather v2).
+
+    Args:
+        table: Таблица результатов (например, Analyzer.compute_table).
+        path: Путь к файлу.
+
+    Raises:
+        ImportError: Если pyarrow не установлен.
+    """
+    pa = import_pyarrow()
+    arrow_table = table.to_arrow()
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+    logger.info(f"Wrote {arrow_table.num_rows} rows to {path}")
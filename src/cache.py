@@ -0,0 +1,249 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Размер блока при хешировании содержимого файла
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Суффикс файлов дискового кеша
+_CACHE_FILE_SUFFIX = ".pkl"
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Отпечаток входного файла: путь, размер, время изменения и хеш."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str | None = None
+
+
+def fingerprint_file(file_path: str, hash_content: bool = False) -> FileFingerprint:
+    """
+    Снимает отпечаток файла.
+
+    Args:
+        file_path: Путь к файлу.
+        hash_content: Дополнительно хешировать содержимое (SHA-256).
+
+    Returns:
+        FileFingerprint: Отпечаток файла.
+
+    Raises:
+        FileNotFoundError: Если файл не существует.
+    """
+    path = Path(file_path).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+    digest = None
+    if hash_content:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+    return FileFingerprint(
+        path=str(path), size=stat.st_size, mtime_ns=stat.st_mtime_ns, digest=digest
+    )
+
+
+def _canonical(value: Any) -> Any:
+    """Приводит значение к виду, однозначно сериализуемому в JSON."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": type(value).__qualname__,
+            **{
+                f.name: _canonical(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+            },
+        }
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items())}
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    # Объекты без явного представления: различаются по типу и атрибутам
+    if hasattr(value, "__dict__"):
+        return {"__type__": type(value).__qualname__, **_canonical(vars(value))}
+    return repr(value)
+
+
+def make_cache_key(**parts: Any) -> str:
+    """
+    Строит ключ кеша из произвольных частей (отчет, параметры, отпечатки).
+
+    Returns:
+        str: Шестнадцатеричный SHA-256 канонического JSON представления.
+    """
+    payload = json.dumps(_canonical(parts), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Кеш результатов анализа.
+
+    Состоит из LRU кеша в памяти процесса и необязательного дискового
+    хранилища (по файлу на ключ). Записи вытесняются по времени жизни (ttl)
+    и по количеству (max_entries для памяти, max_disk_entries для диска).
+    Счетчики hits и misses учитывают оба уровня.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl: float | None = None,
+        cache_dir: str | Path | None = None,
+        max_disk_entries: int = 1024,
+        hash_content: bool = False,
+    ):
+        """
+        Args:
+            max_entries: Максимальное число записей в памяти.
+            ttl: Время жизни записи в секундах (None - без ограничения).
+            cache_dir: Каталог дискового кеша (None - только память).
+            max_disk_entries: Максимальное число файлов в дисковом кеше.
+            hash_content: Учитывать в отпечатках хеш содержимого файлов.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_disk_entries = max_disk_entries
+        self.hash_content = hash_content
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def fingerprints(self, file_paths: Iterable[str]) -> list[FileFingerprint]:
+        """
+        Снимает отпечатки входных файлов с учетом настроек кеша.
+
+        Каталоги передаются уже раскрытыми в файлы данных
+        (см. DataReader.source_files).
+        """
+        return [fingerprint_file(path, self.hash_content) for path in file_paths]
+
+    def _expired(self, created_at: float) -> bool:
+        """Проверяет, истекло ли время жизни записи."""
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def _disk_path(self, key: str) -> Path:
+        """Путь к файлу записи в дисковом кеше."""
+        assert self.cache_dir is not None
+        return self.cache_dir / f"{key}{_CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Any | None:
+        """
+        Возвращает сохраненный результат.
+
+        Args:
+            key: Ключ, построенный make_cache_key.
+
+        Returns:
+            Any | None: Результат или None при промахе.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if not self._expired(created_at):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                logger.debug(f"Cache hit (memory): {key[:12]}")
+                return value
+            del self._entries[key]
+
+        if self.cache_dir is not None:
+            value = self._load_from_disk(key)
+            if value is not None:
+                self.hits += 1
+                logger.debug(f"Cache hit (disk): {key[:12]}")
+                return value
+
+        self.misses += 1
+        logger.debug(f"Cache miss: {key[:12]}")
+        return None
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Сохраняет результат в памяти и (если задан каталог) на диске.
+
+        Args:
+            key: Ключ, построенный make_cache_key.
+            value: Сохраняемый результат (должен поддерживать pickle).
+        """
+        self._remember(key, time.time(), value)
+        if self.cache_dir is not None:
+            self._save_to_disk(key, value)
+
+    def clear(self) -> None:
+        """Очищает кеш в памяти и на диске."""
+        self._entries.clear()
+        if self.cache_dir is not None and self.cache_dir.is_dir():
+            for path in self.cache_dir.glob(f"*{_CACHE_FILE_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, created_at: float, value: Any) -> None:
+        """Добавляет запись в LRU кеш с вытеснением самой старой."""
+        self._entries[key] = (created_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load_from_disk(self, key: str) -> Any | None:
+        """Читает запись с диска; устаревшие и поврежденные удаляются."""
+        path = self._disk_path(key)
+        try:
+            created_at = path.stat().st_mtime
+            if self._expired(created_at):
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        self._remember(key, created_at, value)
+        return value
+
+    def _save_to_disk(self, key: str, value: Any) -> None:
+        """Записывает результат на диск и вытесняет старые файлы."""
+        assert self.cache_dir is not None
+        path = self._disk_path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+            return
+
+        files = sorted(
+            self.cache_dir.glob(f"*{_CACHE_FILE_SUFFIX}"),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for stale in files[: max(0, len(files) - self.max_disk_entries)]:
+            stale.unlink(missing_ok=True)
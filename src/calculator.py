@@ -1,17 +1,80 @@
 import logging
+import math
+import pickle
+import tempfile
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from array import array
+from dataclasses import dataclass, fields
+from itertools import islice
+from operator import attrgetter
+from statistics import NormalDist
+from typing import (
+    IO,
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
 
-from src.models import CountryStatistics, EconomicRecord
+from src.models import (
+    CorrelationMatrix,
+    CountryGrowth,
+    CountryStatistics,
+    DescriptiveStatistics,
+    EconomicRecord,
+    GroupStatistics,
+    Outlier,
+    PivotTable,
+    RecordBatch,
+    YearCoverage,
+)
+from src.utils.accumulators import (
+    CoMoments,
+    QuantileAccumulator,
+    RunningStats,
+    YearSet,
+    exact_quantile,
+)
 
 logger = logging.getLogger(__name__)
 
+# Все колонки исходных данных
+ALL_COLUMNS = frozenset(field.name for field in fields(EconomicRecord))
 
-class StatisticsCalculator(ABC):
+# Колонки, по которым допускается группировка
+GROUP_KEYS = ("country", "continent", "year")
+
+# Числовые колонки, доступные для агрегации
+NUMERIC_COLUMNS = (
+    "year",
+    "gdp",
+    "gdp_growth",
+    "inflation",
+    "unemployment",
+    "population",
+)
+
+# Поддерживаемые агрегатные функции
+AGGREGATE_FUNCTIONS = ("sum", "mean", "min", "max", "count", "last")
+
+# Число записей в одном колоночном пакете
+DEFAULT_BATCH_SIZE = 4096
+
+StatsT = TypeVar("StatsT")
+
+
+class StatisticsCalculator(ABC, Generic[StatsT]):
     """Абстрактный базовый класс для калькуляторов статистик."""
 
+    # Колонки, которые калькулятор читает из записей. Читатель проверяет
+    # и преобразует только их (проекция колонок)
+    required_columns: frozenset[str] = ALL_COLUMNS
+
     @abstractmethod
-    def calculate(self, records: list[EconomicRecord]) -> list[CountryStatistics]:
+    def calculate(self, records: list[EconomicRecord]) -> list[StatsT]:
         """
         Рассчитывает статистику на основе экономических данных.
 
@@ -19,54 +82,673 @@ class StatisticsCalculator(ABC):
             records: Список экономических записей.
 
         Returns:
-            list[CountryStatistics]: Список статистик по странам.
+            list: Список статистик (по странам, группам и т.д.).
         """
         pass
 
 
-class GDPCalculator(StatisticsCalculator):
+class StreamingCalculator(StatisticsCalculator[StatsT]):
     """
-    Калькулятор среднего ВВП по странам.
-    Вычисляет среднее арифметическое GDP по всем годам для каждой страны.
+    Калькулятор, которому записи передаются потоком за один проход,
+    без промежуточного списка.
     """
 
-    def calculate(self, records: list[EconomicRecord]) -> list[CountryStatistics]:
+    @abstractmethod
+    def calculate(self, records: Iterable[EconomicRecord]) -> list[StatsT]:
         """
-        Вычисляет средний ВВП для всех стран.
+        Рассчитывает статистику по потоку записей.
 
         Args:
-            records: Список экономических записей.
+            records: Экономические записи (список или поток).
 
         Returns:
-            list[CountryStatistics]: Отсортированный по убыванию ВВП список.
+            list: Список статистик.
         """
-        if not records:
+        pass
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """Агрегатная функция над числовой колонкой (например, mean:gdp)."""
+
+    func: str
+    column: str
+
+    def __post_init__(self) -> None:
+        """Проверка имени функции и колонки."""
+        if self.func not in AGGREGATE_FUNCTIONS:
+            raise ValueError(
+                f"Unknown aggregate function: '{self.func}'. "
+                f"Available: {list(AGGREGATE_FUNCTIONS)}"
+            )
+        if self.column not in NUMERIC_COLUMNS:
+            raise ValueError(
+                f"Cannot aggregate column '{self.column}'. "
+                f"Numeric columns: {list(NUMERIC_COLUMNS)}"
+            )
+
+    @property
+    def label(self) -> str:
+        """Имя результата агрегации, например 'mean_gdp'."""
+        return f"{self.func}_{self.column}"
+
+    @classmethod
+    def parse(cls, text: str) -> "Aggregate":
+        """
+        Разбирает агрегат из строки вида 'FUNC:COLUMN'.
+
+        Raises:
+            ValueError: При неверном формате, функции или колонке.
+        """
+        func, sep, column = text.partition(":")
+        if not sep:
+            raise ValueError(f"Invalid aggregate '{text}', expected FUNC:COLUMN")
+        return cls(func=func.strip().lower(), column=column.strip().lower())
+
+
+@dataclass(frozen=True)
+class AggregateSpec:
+    """Декларативное описание агрегации: ключи группировки и агрегаты."""
+
+    group_by: tuple[str, ...]
+    aggregates: tuple[Aggregate, ...]
+
+    def __post_init__(self) -> None:
+        """Проверка ключей группировки и списка агрегатов."""
+        if not self.group_by:
+            raise ValueError("At least one group key is required")
+        unknown = [key for key in self.group_by if key not in GROUP_KEYS]
+        if unknown:
+            raise ValueError(
+                f"Cannot group by {unknown}. Available keys: {list(GROUP_KEYS)}"
+            )
+        if len(set(self.group_by)) != len(self.group_by):
+            raise ValueError(f"Duplicate group keys: {list(self.group_by)}")
+        if not self.aggregates:
+            raise ValueError("At least one aggregate is required")
+
+    @property
+    def columns(self) -> frozenset[str]:
+        """Колонки, которые нужно прочитать для выполнения агрегации."""
+        return frozenset(self.group_by) | {agg.column for agg in self.aggregates}
+
+    @classmethod
+    def parse(
+        cls, group_by: Sequence[str], aggregates: str | Sequence[str]
+    ) -> "AggregateSpec":
+        """
+        Создает спецификацию из аргументов командной строки.
+
+        Args:
+            group_by: Ключи группировки, например ['continent'].
+            aggregates: Агрегаты строкой 'mean:gdp,sum:population' или списком.
+
+        Returns:
+            AggregateSpec: Проверенная спецификация.
+        """
+        items = aggregates.split(",") if isinstance(aggregates, str) else aggregates
+        return cls(
+            group_by=tuple(key.strip().lower() for key in group_by),
+            aggregates=tuple(Aggregate.parse(item) for item in items if item.strip()),
+        )
+
+
+# Примерная стоимость одной группы хеш-таблицы в байтах: запись словаря
+# и список групп, кортеж ключа и элементы списков состояний
+_GROUP_BASE_BYTES = 160
+_GROUP_KEY_BYTES = 64
+_GROUP_STATE_BYTES = 32
+
+# Число разделов, между которыми распределяются группы при выгрузке на диск
+DEFAULT_SPILL_PARTITIONS = 16
+
+# Глубина рекурсивного деления разделов, не помещающихся в лимит
+MAX_SPILL_DEPTH = 4
+
+# Частичное состояние группы: ключ, число строк и значения состояний
+PartialGroup = tuple[tuple[Any, ...], int, tuple[float, ...]]
+
+# Состояния, которые нужны каждой агрегатной функции
+_STATE_KINDS: dict[str, tuple[str, ...]] = {
+    "sum": ("sum",),
+    "mean": ("sum",),
+    "min": ("min",),
+    "max": ("max",),
+    "count": (),
+    "last": ("last",),
+}
+
+_STATE_INITIAL: dict[str, float] = {
+    "sum": 0.0,
+    "min": math.inf,
+    "max": -math.inf,
+    "last": math.nan,
+}
+
+
+def iter_batches(
+    records: Iterable[EconomicRecord],
+    columns: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[RecordBatch]:
+    """
+    Разбивает поток записей на колоночные пакеты.
+
+    Args:
+        records: Записи.
+        columns: Колонки, попадающие в пакеты.
+        batch_size: Максимальное число записей в пакете.
+
+    Yields:
+        RecordBatch: Очередной пакет.
+    """
+    columns = tuple(columns)
+    iterator = iter(records)
+    while chunk := list(islice(iterator, batch_size)):
+        yield RecordBatch.from_records(chunk, columns)
+
+
+class HashAggregator:
+    """
+    Движок хеш-агрегации.
+
+    Выполняет все агрегаты спецификации за один проход по колоночным пакетам.
+    Состояния хранятся по колонкам (список значений на каждый вид состояния),
+    поэтому обновление агрегата - это плотный цикл по одной колонке пакета.
+    Агрегаты над одной колонкой разделяют состояние (mean и sum используют
+    одну сумму, count - общий счетчик строк группы).
+    """
+
+    def __init__(self, spec: AggregateSpec):
+        """
+        Args:
+            spec: Спецификация агрегации.
+        """
+        self.spec = spec
+        self.rows = 0
+        self._groups: dict[tuple[Any, ...], int] = {}
+        self._keys: list[tuple[Any, ...]] = []
+        self._counts: list[int] = []
+        self._states: dict[tuple[str, str], list[float]] = {}
+        for agg in spec.aggregates:
+            for kind in _STATE_KINDS[agg.func]:
+                self._states.setdefault((kind, agg.column), [])
+
+    @property
+    def group_count(self) -> int:
+        """Число групп, накопленных в хеш-таблице."""
+        return len(self._keys)
+
+    def _add_group(self, key: tuple[Any, ...]) -> int:
+        """Добавляет новую группу и возвращает ее индекс."""
+        gid = len(self._keys)
+        self._groups[key] = gid
+        self._keys.append(key)
+        self._counts.append(0)
+        for (kind, _column), state in self._states.items():
+            state.append(_STATE_INITIAL[kind])
+        return gid
+
+    def update(self, batch: RecordBatch) -> None:
+        """
+        Учитывает один колоночный пакет.
+
+        Args:
+            batch: Пакет, содержащий ключи группировки и агрегируемые колонки.
+        """
+        groups = self._groups
+        gids = []
+        for key in zip(
+            *(batch.columns[name] for name in self.spec.group_by), strict=True
+        ):
+            gid = groups.get(key)
+            if gid is None:
+                gid = self._add_group(key)
+            gids.append(gid)
+
+        counts = self._counts
+        for gid in gids:
+            counts[gid] += 1
+
+        for (kind, column), state in self._states.items():
+            values = batch.columns[column]
+            if kind == "sum":
+                for gid, value in zip(gids, values, strict=True):
+                    state[gid] += value
+            elif kind == "min":
+                for gid, value in zip(gids, values, strict=True):
+                    if value < state[gid]:
+                        state[gid] = value
+            elif kind == "max":
+                for gid, value in zip(gids, values, strict=True):
+                    if value > state[gid]:
+                        state[gid] = value
+            else:
+                for gid, value in zip(gids, values, strict=True):
+                    state[gid] = value
+
+        self.rows += batch.num_rows
+
+    def consume(
+        self,
+        records: Iterable[EconomicRecord],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        Учитывает поток записей, разбивая его на колоночные пакеты.
+
+        Args:
+            records: Записи.
+            batch_size: Размер пакета.
+        """
+        for batch in iter_batches(records, self.spec.columns, batch_size):
+            self.update(batch)
+
+    def results(self) -> list[GroupStatistics]:
+        """
+        Возвращает результаты агрегации в порядке появления групп.
+
+        Returns:
+            list[GroupStatistics]: По одному элементу на группу.
+        """
+        results = []
+        for gid, key in enumerate(self._keys):
+            count = self._counts[gid]
+            values: dict[str, float] = {}
+            for agg in self.spec.aggregates:
+                if agg.func == "count":
+                    values[agg.label] = count
+                elif agg.func == "mean":
+                    values[agg.label] = self._states[("sum", agg.column)][gid] / count
+                else:
+                    values[agg.label] = self._states[(agg.func, agg.column)][gid]
+            results.append(
+                GroupStatistics(
+                    key=dict(zip(self.spec.group_by, key, strict=True)), values=values
+                )
+            )
+        return results
+
+    def partials(self) -> Iterator[PartialGroup]:
+        """
+        Возвращает частичные состояния групп для слияния с другим агрегатором.
+
+        Yields:
+            PartialGroup: Ключ, число строк и значения состояний группы.
+        """
+        states = list(self._states.values())
+        for gid, key in enumerate(self._keys):
+            yield key, self._counts[gid], tuple(state[gid] for state in states)
+
+    def merge_partial(
+        self, key: tuple[Any, ...], count: int, values: Sequence[float]
+    ) -> None:
+        """
+        Сливает частичное состояние группы, полученное из partials().
+
+        Args:
+            key: Ключ группы.
+            count: Число строк группы.
+            values: Значения состояний в порядке partials().
+        """
+        gid = self._groups.get(key)
+        if gid is None:
+            gid = self._add_group(key)
+        self._counts[gid] += count
+        self.rows += count
+
+        for ((kind, _column), state), value in zip(
+            self._states.items(), values, strict=True
+        ):
+            if kind == "sum":
+                state[gid] += value
+            elif kind == "min":
+                if value < state[gid]:
+                    state[gid] = value
+            elif kind == "max":
+                if value > state[gid]:
+                    state[gid] = value
+            else:
+                # 'last': более позднее состояние заменяет предыдущее
+                state[gid] = value
+
+    def merge(self, other: "HashAggregator") -> None:
+        """Добавляет группы другого агрегатора с той же спецификацией."""
+        for partial in other.partials():
+            self.merge_partial(*partial)
+
+
+def estimate_group_bytes(spec: AggregateSpec) -> int:
+    """
+    Оценивает память, занимаемую одной группой в HashAggregator.
+
+    Args:
+        spec: Спецификация агрегации.
+
+    Returns:
+        int: Примерный размер группы в байтах.
+    """
+    states = {
+        (kind, agg.column) for agg in spec.aggregates for kind in _STATE_KINDS[agg.func]
+    }
+    return (
+        _GROUP_BASE_BYTES
+        + _GROUP_KEY_BYTES * len(spec.group_by)
+        + _GROUP_STATE_BYTES * len(states)
+    )
+
+
+class SpillingAggregator:
+    """
+    Хеш-агрегация с ограниченным числом групп в памяти.
+
+    Пока групп не больше max_groups, работает как HashAggregator. При
+    превышении частичные состояния распределяются по хешу ключа между
+    временными файлами-разделами, и хеш-таблица очищается. В results()
+    разделы сливаются по одному; раздел, который сам не помещается
+    в лимит, делится повторно с другой солью хеша.
+
+    Порядок групп в результате не совпадает с порядком их появления.
+    """
+
+    def __init__(
+        self,
+        spec: AggregateSpec,
+        max_groups: int,
+        partitions: int = DEFAULT_SPILL_PARTITIONS,
+        spill_dir: str | None = None,
+        depth: int = 0,
+    ):
+        """
+        Args:
+            spec: Спецификация агрегации.
+            max_groups: Максимальное число групп в памяти.
+            partitions: Число разделов при выгрузке на диск.
+            spill_dir: Каталог временных файлов (по умолчанию системный).
+            depth: Уровень рекурсивного деления (задает соль хеша).
+        """
+        if max_groups < 1:
+            raise ValueError(f"max_groups must be >= 1, got {max_groups}")
+        if partitions < 2:
+            raise ValueError(f"partitions must be >= 2, got {partitions}")
+        self.spec = spec
+        self.max_groups = max_groups
+        self.partitions = partitions
+        self.spill_dir = spill_dir
+        self.depth = depth
+        self.spills = 0
+        self._rows_spilled = 0
+        self._memory = HashAggregator(spec)
+        self._files: list[IO[bytes]] | None = None
+
+    @property
+    def rows(self) -> int:
+        """Число учтенных строк (включая выгруженные на диск)."""
+        return self._rows_spilled + self._memory.rows
+
+    @property
+    def group_count(self) -> int:
+        """Число групп, находящихся в памяти."""
+        return self._memory.group_count
+
+    def update(self, batch: RecordBatch) -> None:
+        """Учитывает один колоночный пакет."""
+        self._memory.update(batch)
+        if self._memory.group_count > self.max_groups:
+            self._spill()
+
+    def consume(
+        self,
+        records: Iterable[EconomicRecord],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Учитывает поток записей, разбивая его на колоночные пакеты."""
+        for batch in iter_batches(records, self.spec.columns, batch_size):
+            self.update(batch)
+
+    def merge_partial(
+        self, key: tuple[Any, ...], count: int, values: Sequence[float]
+    ) -> None:
+        """Сливает частичное состояние группы (см. HashAggregator.partials)."""
+        self._memory.merge_partial(key, count, values)
+        if self._memory.group_count > self.max_groups:
+            self._spill()
+
+    def _spill(self) -> None:
+        """Выгружает группы из памяти в разделы на диске."""
+        if self._files is None:
+            self._files = [
+                tempfile.TemporaryFile(dir=self.spill_dir)
+                for _ in range(self.partitions)
+            ]
+        buckets: list[list[PartialGroup]] = [[] for _ in range(self.partitions)]
+        for partial in self._memory.partials():
+            buckets[hash((self.depth, partial[0])) % self.partitions].append(partial)
+        for file, bucket in zip(self._files, buckets, strict=True):
+            if bucket:
+                pickle.dump(bucket, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.spills += 1
+        logger.debug(
+            f"Spilled {self._memory.group_count} groups to disk "
+            f"(depth {self.depth}, spill #{self.spills})"
+        )
+        self._rows_spilled += self._memory.rows
+        self._memory = HashAggregator(self.spec)
+
+    def _merge_partition(self, file: IO[bytes]) -> list[GroupStatistics]:
+        """Сливает один раздел и возвращает его группы."""
+        merged: HashAggregator | SpillingAggregator
+        if self.depth + 1 < MAX_SPILL_DEPTH:
+            merged = SpillingAggregator(
+                self.spec,
+                self.max_groups,
+                self.partitions,
+                self.spill_dir,
+                self.depth + 1,
+            )
+        else:
+            merged = HashAggregator(self.spec)
+
+        file.seek(0)
+        while True:
+            try:
+                chunk: list[PartialGroup] = pickle.load(file)
+            except EOFError:
+                break
+            for partial in chunk:
+                merged.merge_partial(*partial)
+        return merged.results()
+
+    def results(self) -> list[GroupStatistics]:
+        """
+        Возвращает результаты агрегации.
+
+        Returns:
+            list[GroupStatistics]: По одному элементу на группу.
+        """
+        if self._files is None:
+            return self._memory.results()
+
+        self._spill()
+        files, self._files = self._files, None
+        results: list[GroupStatistics] = []
+        for file in files:
+            with file:
+                results.extend(self._merge_partition(file))
+        logger.info(
+            f"Merged {len(results)} groups from {self.partitions} spill partitions"
+        )
+        return results
+
+
+def create_aggregator(
+    spec: AggregateSpec, memory_limit: int | None = None
+) -> HashAggregator | SpillingAggregator:
+    """
+    Создает агрегатор с учетом лимита памяти.
+
+    Args:
+        spec: Спецификация агрегации.
+        memory_limit: Лимит памяти хеш-таблицы в байтах. При превышении
+            группы выгружаются во временные файлы (None - без лимита).
+
+    Returns:
+        HashAggregator | SpillingAggregator: Агрегатор для спецификации.
+    """
+    if memory_limit is None:
+        return HashAggregator(spec)
+    max_groups = max(1, memory_limit // estimate_group_bytes(spec))
+    logger.debug(f"Aggregation limited to {max_groups} in-memory groups")
+    return SpillingAggregator(spec, max_groups)
+
+
+class AggregateCalculator(StatisticsCalculator[StatsT]):
+    """
+    Базовый класс калькуляторов, построенных на движке HashAggregator.
+    Наследник задает спецификацию и преобразует группы в итоговые DTO.
+    """
+
+    spec: AggregateSpec
+
+    def __init__(
+        self, spec: AggregateSpec | None = None, memory_limit: int | None = None
+    ):
+        """
+        Args:
+            spec: Спецификация агрегации (по умолчанию - атрибут класса).
+            memory_limit: Лимит памяти хеш-таблицы в байтах. При превышении
+                группы выгружаются во временные файлы (None - без лимита).
+        """
+        if spec is not None:
+            self.spec = spec
+        if memory_limit is not None and memory_limit <= 0:
+            raise ValueError(f"memory_limit must be positive, got {memory_limit}")
+        self.required_columns = self.spec.columns
+        self.memory_limit = memory_limit
+
+    def create_aggregator(self) -> HashAggregator | SpillingAggregator:
+        """
+        Создает агрегатор с учетом лимита памяти.
+
+        Returns:
+            HashAggregator | SpillingAggregator: Агрегатор для спецификации.
+        """
+        return create_aggregator(self.spec, self.memory_limit)
+
+    def calculate(self, records: Iterable[EconomicRecord]) -> list[StatsT]:
+        """
+        Выполняет агрегацию записей и формирует результат.
+
+        Args:
+            records: Экономические записи (список или поток).
+
+        Returns:
+            list: Результат finalize для накопленных групп.
+        """
+        aggregator = self.create_aggregator()
+        aggregator.consume(records)
+        if aggregator.rows == 0:
             logger.warning("No records provided for calculation")
             return []
+        return self.finalize(aggregator.results())
 
-        # Агрегация данных по странам
-        country_stats: dict[str, dict[str, float]] = defaultdict(
-            lambda: {"total_gdp": 0.0, "count": 0}
-        )
+    @abstractmethod
+    def finalize(self, groups: list[GroupStatistics]) -> list[StatsT]:
+        """
+        Преобразует результаты агрегации в итоговые DTO.
 
-        for record in records:
-            stats = country_stats[record.country]
-            stats["total_gdp"] += record.gdp
-            stats["count"] += 1
+        Args:
+            groups: Результаты агрегации по группам.
+
+        Returns:
+            list: Итоговая статистика.
+        """
+        pass
+
+
+class GroupByCalculator(AggregateCalculator[GroupStatistics]):
+    """
+    Калькулятор произвольной группировки (--group-by / --agg).
+    Результаты упорядочены по ключам группировки.
+    """
+
+    spec = AggregateSpec(group_by=("country",), aggregates=(Aggregate("mean", "gdp"),))
+
+    def finalize(self, groups: list[GroupStatistics]) -> list[GroupStatistics]:
+        """Сортирует группы по значениям ключей."""
+        result = sorted(groups, key=lambda group: tuple(group.key.values()))
+        logger.info(f"Calculated aggregates for {len(result)} groups")
+        return result
+
+
+class GDPCalculator(AggregateCalculator[CountryStatistics]):
+    """
+    Калькулятор среднего ВВП по странам.
+    Вычисляет среднее арифметическое GDP по всем годам для каждой страны.
+
+    С common_years=True средние считаются только по годам, для которых
+    есть данные всех стран: записи группируются по стране и году в том же
+    проходе, годы каждой страны собираются в битовую маску (YearSet),
+    а общие годы - пересечение масок.
+    """
+
+    spec = AggregateSpec(
+        group_by=("country",),
+        aggregates=(Aggregate("mean", "gdp"), Aggregate("count", "gdp")),
+    )
+
+    # Спецификация для средних по общим годам
+    common_years_spec = AggregateSpec(
+        group_by=("country", "year"),
+        aggregates=(Aggregate("sum", "gdp"), Aggregate("count", "gdp")),
+    )
+
+    def __init__(
+        self,
+        spec: AggregateSpec | None = None,
+        memory_limit: int | None = None,
+        common_years: bool = False,
+    ):
+        """
+        Args:
+            spec: Спецификация агрегации (по умолчанию - атрибут класса).
+            memory_limit: Лимит памяти хеш-таблицы в байтах.
+            common_years: Усреднять только по годам, общим для всех стран.
+        """
+        if common_years and spec is None:
+            spec = self.common_years_spec
+        super().__init__(spec, memory_limit)
+        self.common_years = common_years
+
+    def finalize(self, groups: list[GroupStatistics]) -> list[CountryStatistics]:
+        """
+        Формирует средний ВВП для всех стран.
+
+        Args:
+            groups: Результаты агрегации по странам (или по стране и году
+                при common_years).
+
+        Returns:
+            list[CountryStatistics]: Отсортированный по убыванию ВВП список.
+        """
+        if self.common_years:
+            return self._finalize_common_years(groups)
 
-        # Формирование результатов
         statistics = []
-        for country, data in country_stats.items():
-            avg_gdp = data["total_gdp"] / data["count"]
+        for group in groups:
+            country = group.key["country"]
+            avg_gdp = group.values["mean_gdp"]
+            years_count = int(group.values["count_gdp"])
             statistics.append(
                 CountryStatistics(
                     country=country,
                     average_gdp=avg_gdp,
-                    years_count=int(data["count"]),
+                    years_count=years_count,
                 )
             )
             logger.debug(
-                f"Country: {country}, Avg GDP: {avg_gdp:.2f}, Years: {data['count']}"
+                f"Country: {country}, Avg GDP: {avg_gdp:.2f}, Years: {years_count}"
             )
 
         # Сортировка по убыванию среднего ВВП
@@ -79,14 +761,870 @@ class GDPCalculator(StatisticsCalculator):
         logger.info(f"Calculated statistics for {len(result)} countries")
         return result
 
+    def _finalize_common_years(
+        self, groups: list[GroupStatistics]
+    ) -> list[CountryStatistics]:
+        """
+        Средний ВВП по годам, общим для всех стран.
+
+        Args:
+            groups: Суммы и количества ВВП по стране и году.
+
+        Returns:
+            list[CountryStatistics]: Отсортированный по убыванию ВВП список
+            (пустой, если общих лет нет).
+        """
+        years: dict[str, YearSet] = {}
+        for group in groups:
+            years.setdefault(group.key["country"], YearSet()).add(group.key["year"])
+        common: YearSet | None = None
+        for country_years in years.values():
+            common = (
+                country_years if common is None else common.intersection(country_years)
+            )
+        if not common:
+            logger.warning("No years are covered by all countries")
+            return []
+        logger.info(f"Common years: {common.first}-{common.last} ({len(common)} years)")
+
+        totals: dict[str, list[float]] = {}
+        for group in groups:
+            if group.key["year"] in common:
+                total = totals.setdefault(group.key["country"], [0.0, 0])
+                total[0] += group.values["sum_gdp"]
+                total[1] += group.values["count_gdp"]
+        result = sorted(
+            (
+                CountryStatistics(
+                    country=country, average_gdp=gdp / count, years_count=int(count)
+                )
+                for country, (gdp, count) in totals.items()
+            ),
+            key=lambda x: x.average_gdp,
+            reverse=True,
+        )
+        logger.info(f"Calculated statistics for {len(result)} countries")
+        return result
+
+
+class ApproximateGDPCalculator(StatisticsCalculator[CountryStatistics]):
+    """
+    Оценка среднего ВВП по странам по выборке записей.
+
+    Среднее и дисперсия выборки накапливаются потоково (Уэлфорд);
+    для каждой страны дополнительно вычисляется полуширина нормального
+    доверительного интервала z * s / sqrt(n). Формула предполагает
+    независимые наблюдения, поэтому читатель выбирает строки по одной
+    (sample_lines), а не блоками. Для стран с одной записью в выборке
+    интервал не определен (NaN).
+    """
+
+    required_columns = frozenset({"country", "gdp"})
+
+    def __init__(self, confidence: float = 0.95):
+        """
+        Args:
+            confidence: Доверительная вероятность интервала.
+
+        Raises:
+            ValueError: Если вероятность вне интервала (0, 1).
+        """
+        if not 0 < confidence < 1:
+            raise ValueError(f"Confidence must be in (0, 1), got {confidence}")
+        self.confidence = confidence
+
+    def calculate(self, records: Iterable[EconomicRecord]) -> list[CountryStatistics]:
+        """
+        Оценивает средний ВВП стран с доверительными интервалами.
+
+        Args:
+            records: Записи (как правило, выборка).
+
+        Returns:
+            list[CountryStatistics]: Оценки по убыванию среднего ВВП;
+            years_count - число записей страны в выборке.
+        """
+        groups: dict[str, RunningStats] = {}
+        for record in records:
+            stats = groups.get(record.country)
+            if stats is None:
+                stats = groups[record.country] = RunningStats()
+            stats.add(record.gdp)
+
+        if not groups:
+            logger.warning("No records provided for calculation")
+            return []
+
+        z = NormalDist().inv_cdf((1 + self.confidence) / 2)
+        result = sorted(
+            (
+                CountryStatistics(
+                    country=country,
+                    average_gdp=stats.mean,
+                    years_count=stats.count,
+                    margin=(
+                        z * stats.stddev / math.sqrt(stats.count)
+                        if stats.count > 1
+                        else math.nan
+                    ),
+                )
+                for country, stats in groups.items()
+            ),
+            key=lambda x: x.average_gdp,
+            reverse=True,
+        )
+        logger.info(f"Estimated average GDP for {len(result)} countries")
+        return result
+
+
+class DescriptiveStatisticsCalculator(StreamingCalculator[DescriptiveStatistics]):
+    """
+    Калькулятор описательной статистики показателя по странам.
+
+    За один потоковый проход считает количество, среднее, стандартное
+    отклонение (Уэлфорд), минимум, максимум, медиану и 90-й перцентиль.
+    Квантили малых групп вычисляются точно, больших - по скетчу
+    с ограниченной памятью.
+    """
+
+    def __init__(self, indicator: str = "gdp", exact_limit: int = 1024):
+        """
+        Args:
+            indicator: Числовая колонка, по которой считается статистика.
+            exact_limit: Размер группы, до которого квантили точные.
+
+        Raises:
+            ValueError: Если колонка не числовая.
+        """
+        if indicator not in NUMERIC_COLUMNS:
+            raise ValueError(
+                f"Unknown indicator: '{indicator}'. "
+                f"Numeric columns: {list(NUMERIC_COLUMNS)}"
+            )
+        self.indicator = indicator
+        self.exact_limit = exact_limit
+        self.required_columns = frozenset({"country", indicator})
+
+    def calculate(
+        self, records: Iterable[EconomicRecord]
+    ) -> list[DescriptiveStatistics]:
+        """
+        Вычисляет описательную статистику для всех стран.
+
+        Args:
+            records: Экономические записи (список или поток).
+
+        Returns:
+            list[DescriptiveStatistics]: Статистика, упорядоченная по стране.
+        """
+        groups: dict[str, tuple[RunningStats, QuantileAccumulator]] = {}
+        get_value = attrgetter(self.indicator)
+
+        for record in records:
+            group = groups.get(record.country)
+            if group is None:
+                group = groups[record.country] = (
+                    RunningStats(),
+                    QuantileAccumulator(self.exact_limit),
+                )
+            value = get_value(record)
+            group[0].add(value)
+            group[1].add(value)
+
+        if not groups:
+            logger.warning("No records provided for calculation")
+            return []
+
+        result = [
+            DescriptiveStatistics(
+                country=country,
+                indicator=self.indicator,
+                count=stats.count,
+                mean=stats.mean,
+                stddev=stats.stddev,
+                min=stats.min,
+                max=stats.max,
+                median=quantiles.quantile(0.5),
+                p90=quantiles.quantile(0.9),
+                approximate=not quantiles.is_exact,
+            )
+            for country, (stats, quantiles) in sorted(groups.items())
+        ]
+
+        logger.info(
+            f"Calculated {self.indicator} statistics for {len(result)} countries"
+        )
+        return result
+
+
+class PivotCalculator(StreamingCalculator[PivotTable]):
+    """
+    Сводные таблицы показателей: страны x годы.
+
+    Странам и годам при первом появлении назначаются плотные индексы, а
+    суммы и счетчики ячеек накапливаются за один проход в строках
+    array('d') / array('q') (строка страны дополняется при появлении новых
+    лет). Повторяющиеся ячейки (одна страна и год в нескольких файлах)
+    усредняются, значения округляются до двух знаков. В конце строки и
+    колонки упорядочиваются по стране и году и переносятся в плотный массив
+    PivotTable; пустые ячейки - NaN.
+    """
+
+    def __init__(self, indicators: Sequence[str] = ("gdp",)):
+        """
+        Args:
+            indicators: Числовые колонки; по каждой строится своя таблица.
+
+        Raises:
+            ValueError: Если колонок нет или колонка не числовая.
+        """
+        if not indicators:
+            raise ValueError("At least one indicator is required")
+        unknown = [name for name in indicators if name not in NUMERIC_COLUMNS]
+        if unknown:
+            raise ValueError(
+                f"Unknown indicators: {unknown}. "
+                f"Numeric columns: {list(NUMERIC_COLUMNS)}"
+            )
+        self.indicators = tuple(dict.fromkeys(indicators))
+        self.required_columns = frozenset({"country", "year", *self.indicators})
+
+    def calculate(self, records: Iterable[EconomicRecord]) -> list[PivotTable]:
+        """
+        Строит сводные таблицы по всем показателям.
+
+        Args:
+            records: Экономические записи (список или поток).
+
+        Returns:
+            list[PivotTable]: По таблице на каждый показатель.
+        """
+        country_index: dict[str, int] = {}
+        year_index: dict[int, int] = {}
+        counts: list[array] = []
+        sums: list[list[array]] = [[] for _ in self.indicators]
+        getters = [attrgetter(name) for name in self.indicators]
+
+        for record in records:
+            row = country_index.get(record.country)
+            if row is None:
+                row = country_index[record.country] = len(counts)
+                counts.append(array("q"))
+                for rows in sums:
+                    rows.append(array("d"))
+            col = year_index.get(record.year)
+            if col is None:
+                col = year_index[record.year] = len(year_index)
+
+            row_counts = counts[row]
+            if col >= len(row_counts):
+                missing = len(year_index) - len(row_counts)
+                row_counts.extend(array("q", bytes(8 * missing)))
+                for rows in sums:
+                    rows[row].extend(array("d", bytes(8 * missing)))
+            row_counts[col] += 1
+            for rows, get_value in zip(sums, getters, strict=True):
+                rows[row][col] += get_value(record)
+
+        if not counts:
+            logger.warning("No records provided for calculation")
+            return []
+
+        countries = sorted(country_index)
+        years = sorted(year_index)
+        columns = [year_index[year] for year in years]
+        result = []
+        for indicator, rows in zip(self.indicators, sums, strict=True):
+            values = array("d")
+            for country in countries:
+                row = country_index[country]
+                row_counts, row_sums = counts[row], rows[row]
+                width = len(row_counts)
+                values.extend(
+                    (
+                        round(row_sums[col] / row_counts[col], 2)
+                        if col < width and row_counts[col]
+                        else math.nan
+                    )
+                    for col in columns
+                )
+            result.append(PivotTable(indicator, countries, years, values))
+
+        logger.info(
+            f"Built {len(result)} pivot tables: "
+            f"{len(countries)} countries x {len(years)} years"
+        )
+        return result
+
+
+# Показатели матрицы корреляций по умолчанию
+DEFAULT_CORRELATION_INDICATORS = ("gdp", "gdp_growth", "inflation", "unemployment")
+
+
+class CorrelationCalculator(StreamingCalculator[CorrelationMatrix]):
+    """
+    Матрицы ковариации и корреляции показателей по странам и в целом.
+
+    За один потоковый проход по записям в накопителях CoMoments каждой
+    страны обновляются средние и суммы произведений отклонений всех пар
+    показателей. Общая матрица получается слиянием накопителей стран
+    (формула Чана), без второго прохода. Накопители по файлам и рабочим
+    узлам объединяются так же (accumulate / merge / finalize).
+    """
+
+    def __init__(
+        self,
+        indicators: Sequence[str] = DEFAULT_CORRELATION_INDICATORS,
+        by_country: bool = True,
+    ):
+        """
+        Args:
+            indicators: Числовые колонки (не менее двух).
+            by_country: Строить матрицы по каждой стране, а не только общую.
+
+        Raises:
+            ValueError: Если колонок меньше двух или колонка не числовая.
+        """
+        indicators = tuple(dict.fromkeys(indicators))
+        if len(indicators) < 2:
+            raise ValueError("At least two indicators are required for correlation")
+        unknown = [name for name in indicators if name not in NUMERIC_COLUMNS]
+        if unknown:
+            raise ValueError(
+                f"Unknown indicators: {unknown}. "
+                f"Numeric columns: {list(NUMERIC_COLUMNS)}"
+            )
+        self.indicators = indicators
+        self.by_country = by_country
+        self.required_columns = frozenset({"country", *indicators})
+
+    def accumulate(self, records: Iterable[EconomicRecord]) -> dict[str, CoMoments]:
+        """
+        Накапливает совместные моменты показателей по странам.
+
+        Args:
+            records: Экономические записи (список или поток).
+
+        Returns:
+            dict[str, CoMoments]: Накопители по странам.
+        """
+        groups: dict[str, CoMoments] = {}
+        get_values = attrgetter(*self.indicators)
+        size = len(self.indicators)
+        for record in records:
+            moments = groups.get(record.country)
+            if moments is None:
+                moments = groups[record.country] = CoMoments(size)
+            moments.add(get_values(record))
+        return groups
+
+    @staticmethod
+    def merge(
+        target: dict[str, CoMoments], groups: Mapping[str, CoMoments]
+    ) -> dict[str, CoMoments]:
+        """
+        Добавляет накопители другого файла или узла.
+
+        Args:
+            target: Накопители, в которые сливаются группы (изменяются).
+            groups: Накопители по странам.
+
+        Returns:
+            dict[str, CoMoments]: target.
+        """
+        for country, moments in groups.items():
+            existing = target.get(country)
+            if existing is None:
+                target[country] = moments
+            else:
+                existing.merge(moments)
+        return target
+
+    def finalize(self, groups: Mapping[str, CoMoments]) -> list[CorrelationMatrix]:
+        """
+        Строит матрицы по накопителям стран.
+
+        Args:
+            groups: Накопители по странам.
+
+        Returns:
+            list[CorrelationMatrix]: Общая матрица (country=None), затем
+            матрицы стран по алфавиту (если by_country).
+        """
+        if not groups:
+            logger.warning("No records provided for calculation")
+            return []
+
+        total = CoMoments(len(self.indicators))
+        for moments in groups.values():
+            total.merge(moments)
+        result = [self._matrix(None, total)]
+        if self.by_country:
+            result.extend(
+                self._matrix(country, moments)
+                for country, moments in sorted(groups.items())
+            )
+        logger.info(
+            f"Calculated correlations of {len(self.indicators)} indicators "
+            f"over {total.count} records"
+        )
+        return result
+
+    def calculate(self, records: Iterable[EconomicRecord]) -> list[CorrelationMatrix]:
+        """
+        Вычисляет матрицы ковариации и корреляции.
+
+        Args:
+            records: Экономические записи (список или поток).
+
+        Returns:
+            list[CorrelationMatrix]: Общая матрица и матрицы стран.
+        """
+        return self.finalize(self.accumulate(records))
+
+    def _matrix(self, country: str | None, moments: CoMoments) -> CorrelationMatrix:
+        """Переносит моменты накопителя в DTO."""
+        pairs = range(len(self.indicators))
+        return CorrelationMatrix(
+            country=country,
+            indicators=list(self.indicators),
+            count=moments.count,
+            covariance=[[moments.covariance(i, j) for j in pairs] for i in pairs],
+            correlation=[[moments.correlation(i, j) for j in pairs] for i in pairs],
+        )
+
+
+class CoverageCalculator(StreamingCalculator[YearCoverage]):
+    """
+    Покрытие лет данными по странам.
+
+    За один потоковый проход годы каждой страны собираются в битовую
+    маску (YearSet): бит на год, поэтому память не зависит от числа
+    записей. По маске определяются первый и последний год, пропущенные
+    годы и серии пропусков.
+    """
+
+    required_columns = frozenset({"country", "year"})
+
+    def calculate(self, records: Iterable[EconomicRecord]) -> list[YearCoverage]:
+        """
+        Вычисляет покрытие лет для всех стран.
+
+        Args:
+            records: Экономические записи (список или поток).
+
+        Returns:
+            list[YearCoverage]: Покрытие, упорядоченное по стране.
+        """
+        years: dict[str, YearSet] = {}
+        for record in records:
+            country_years = years.get(record.country)
+            if country_years is None:
+                country_years = years[record.country] = YearSet()
+            country_years.add(record.year)
+
+        if not years:
+            logger.warning("No records provided for calculation")
+            return []
+
+        result = [
+            YearCoverage(
+                country=country,
+                first_year=country_years.base,
+                last_year=country_years.base + country_years.mask.bit_length() - 1,
+                years_count=len(country_years),
+                missing_years=country_years.missing(),
+                gaps=country_years.gaps(),
+            )
+            for country, country_years in sorted(years.items())
+        ]
+        logger.info(f"Calculated year coverage for {len(result)} countries")
+        return result
+
+
+# Методы обнаружения выбросов в порядке вывода
+OUTLIER_METHODS = ("zscore", "mad", "yoy")
+
+# Показатели уровня: скачки оцениваются отношением к прошлому году,
+# остальные (проценты) - изменением в процентных пунктах
+LEVEL_INDICATORS = frozenset({"gdp", "population"})
+
+# Множитель MAD для робастной z-оценки (Iglewicz, Hoaglin)
+MAD_SCALE = 0.6745
+
+
+def zscore_min_count(threshold: float) -> int:
+    """
+    Минимальное число наблюдений, при котором z-оценка может превысить порог.
+
+    С выборочным стандартным отклонением |z| <= (n - 1) / sqrt(n), поэтому
+    в ряду короче возвращаемой длины выброс по z-оценке невозможен
+    (для порога 3.0 - 11 наблюдений).
+
+    Args:
+        threshold: Порог модуля z-оценки.
+
+    Returns:
+        int: Наименьшее n, для которого (n - 1) / sqrt(n) > threshold.
+    """
+    count = 2
+    while (count - 1) / math.sqrt(count) <= threshold:
+        count += 1
+    return count
+
+
+class OutlierCalculator(StreamingCalculator[Outlier]):
+    """
+    Поиск выбросов показателей по странам.
+
+    За один потоковый проход для каждой страны и показателя обновляются
+    моменты (RunningStats), а значения и годы сохраняются компактными
+    рядами array. Затем ряд каждой страны проверяется тремя методами:
+    z-оценка относительно среднего, робастная z-оценка по медиане и MAD
+    (устойчива к самим выбросам в малых рядах) и скачок к предыдущему
+    наблюдаемому году: отношение для показателей уровня (ошибка единиц
+    измерения дает множитель 1000) или изменение в процентных пунктах
+    для остальных. MAD-оценка считается для стран с не менее чем
+    min_count наблюдениями, z-оценка - дополнительно не менее чем
+    zscore_min_count(z_threshold) (11 для порога 3.0): в более коротком
+    ряду |z| не может превысить порог.
+    """
+
+    def __init__(
+        self,
+        indicators: Sequence[str] | None = None,
+        z_threshold: float = 3.0,
+        mad_threshold: float = 3.5,
+        jump_ratio: float = 10.0,
+        jump_points: float = 25.0,
+        min_count: int = 5,
+    ):
+        """
+        Args:
+            indicators: Проверяемые числовые колонки (по умолчанию все,
+                кроме year).
+            z_threshold: Порог модуля z-оценки.
+            mad_threshold: Порог модуля робастной z-оценки.
+            jump_ratio: Порог отношения к прошлому году (и обратного ему)
+                для показателей уровня.
+            jump_points: Порог изменения к прошлому году в процентных
+                пунктах для остальных показателей.
+            min_count: Минимальное число наблюдений страны для z- и
+                MAD-оценок (для z-оценки - не меньше zscore_min_count).
+
+        Raises:
+            ValueError: Если колонка не числовая или порог не положителен.
+        """
+        indicators = tuple(
+            dict.fromkeys(
+                indicators or [name for name in NUMERIC_COLUMNS if name != "year"]
+            )
+        )
+        unknown = [
+            name for name in indicators if name not in NUMERIC_COLUMNS or name == "year"
+        ]
+        if unknown:
+            raise ValueError(
+                f"Unknown indicators: {unknown}. "
+                f"Numeric columns: {[n for n in NUMERIC_COLUMNS if n != 'year']}"
+            )
+        thresholds = {
+            "z_threshold": z_threshold,
+            "mad_threshold": mad_threshold,
+            "jump_points": jump_points,
+        }
+        for name, value in thresholds.items():
+            if value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+        if jump_ratio <= 1:
+            raise ValueError(f"jump_ratio must be greater than 1, got {jump_ratio}")
+        self.indicators = indicators
+        self.z_threshold = z_threshold
+        self.mad_threshold = mad_threshold
+        self.jump_ratio = jump_ratio
+        self.jump_points = jump_points
+        self.min_count = min_count
+        self.z_min_count = max(min_count, zscore_min_count(z_threshold))
+        self.required_columns = frozenset({"country", "year", *indicators})
+
+    def calculate(self, records: Iterable[EconomicRecord]) -> list[Outlier]:
+        """
+        Находит выбросы во всех странах.
+
+        Args:
+            records: Экономические записи (список или поток).
+
+        Returns:
+            list[Outlier]: Выбросы, упорядоченные по стране, году,
+            показателю и методу.
+        """
+        groups: dict[str, tuple[array, list[array], list[RunningStats]]] = {}
+        get_values = attrgetter(*self.indicators)
+        size = len(self.indicators)
+
+        for record in records:
+            group = groups.get(record.country)
+            if group is None:
+                group = groups[record.country] = (
+                    array("q"),
+                    [array("d") for _ in range(size)],
+                    [RunningStats() for _ in range(size)],
+                )
+            years, series, moments = group
+            years.append(record.year)
+            row = get_values(record) if size > 1 else (get_values(record),)
+            for column, stats, value in zip(series, moments, row, strict=True):
+                column.append(value)
+                stats.add(value)
+
+        if not groups:
+            logger.warning("No records provided for calculation")
+            return []
+
+        result: list[Outlier] = []
+        for country, (years, series, moments) in groups.items():
+            order = sorted(range(len(years)), key=years.__getitem__)
+            ordered_years = [years[i] for i in order]
+            for indicator, column, stats in zip(
+                self.indicators, series, moments, strict=True
+            ):
+                values = [column[i] for i in order]
+                result.extend(
+                    self._country_outliers(
+                        country, indicator, ordered_years, values, stats
+                    )
+                )
+
+        rank = {method: i for i, method in enumerate(OUTLIER_METHODS)}
+        result.sort(key=lambda o: (o.country, o.year, o.indicator, rank[o.method]))
+        logger.info(f"Found {len(result)} outliers in {len(groups)} countries")
+        return result
+
+    def _country_outliers(
+        self,
+        country: str,
+        indicator: str,
+        years: list[int],
+        values: list[float],
+        stats: RunningStats,
+    ) -> Iterator[Outlier]:
+        """
+        Проверяет ряд показателя страны, упорядоченный по году.
+
+        Args:
+            country: Страна.
+            indicator: Показатель.
+            years: Годы по возрастанию.
+            values: Значения в том же порядке.
+            stats: Моменты ряда.
+
+        Yields:
+            Outlier: Выбросы ряда.
+        """
+        median = mad = math.nan
+        if stats.count >= self.min_count:
+            ordered = sorted(values)
+            median = exact_quantile(ordered, 0.5)
+            mad = exact_quantile(sorted(abs(v - median) for v in values), 0.5)
+
+        for i, (year, value) in enumerate(zip(years, values, strict=True)):
+            if stats.count >= self.z_min_count and stats.stddev > 0:
+                z = (value - stats.mean) / stats.stddev
+                if abs(z) > self.z_threshold:
+                    yield Outlier(
+                        country, year, indicator, value, "zscore", z, stats.mean
+                    )
+            if mad > 0:
+                robust_z = MAD_SCALE * (value - median) / mad
+                if abs(robust_z) > self.mad_threshold:
+                    yield Outlier(
+                        country, year, indicator, value, "mad", robust_z, median
+                    )
+            # Скачок к предыдущему наблюдаемому году (повторы года пропускаются)
+            if i == 0 or years[i - 1] == year:
+                continue
+            previous = values[i - 1]
+            if indicator in LEVEL_INDICATORS:
+                if previous > 0 and value > 0:
+                    ratio = value / previous
+                    if max(ratio, 1 / ratio) >= self.jump_ratio:
+                        yield Outlier(
+                            country, year, indicator, value, "yoy", ratio, previous
+                        )
+            elif abs(value - previous) >= self.jump_points:
+                yield Outlier(
+                    country, year, indicator, value, "yoy", value - previous, previous
+                )
+
+
+def moving_averages(
+    years: Sequence[int], values: Sequence[float], window: int
+) -> list[tuple[int, float]]:
+    """
+    Скользящие средние за window лет за один проход (O(n)).
+
+    Окно для года y покрывает годы (y - window, y]. Сумма окна обновляется
+    инкрементально: значение добавляется при входе в окно и вычитается
+    при выходе, поэтому пропуски лет учитываются без повторного просмотра.
+    Значения выдаются начиная с года, для которого окно полностью
+    укладывается в наблюдаемый период.
+
+    Args:
+        years: Годы, отсортированные по возрастанию.
+        values: Значения показателя в том же порядке.
+        window: Ширина окна в годах.
+
+    Returns:
+        list[tuple[int, float]]: Пары (год, скользящее среднее).
+    """
+    result: list[tuple[int, float]] = []
+    if not years:
+        return result
+
+    first_year = years[0]
+    total = 0.0
+    left = 0
+    for right, year in enumerate(years):
+        total += values[right]
+        while years[left] <= year - window:
+            total -= values[left]
+            left += 1
+        # Несколько записей за один год: среднее выдается по последней
+        is_last_for_year = right + 1 == len(years) or years[right + 1] != year
+        if is_last_for_year and year - first_year >= window - 1:
+            result.append((year, total / (right - left + 1)))
+    return result
+
+
+class GrowthCalculator(StatisticsCalculator[CountryGrowth]):
+    """
+    Калькулятор динамики показателя по странам.
+
+    Записи каждой страны сортируются по году один раз, после чего за
+    линейный проход вычисляются скользящие средние за N лет, среднегодовой
+    темп роста (CAGR) между заданными годами и накопленный рост по gdp_growth.
+    """
+
+    def __init__(
+        self,
+        indicator: str = "gdp",
+        window: int = 3,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ):
+        """
+        Args:
+            indicator: Числовая колонка для скользящих средних и CAGR.
+            window: Ширина окна скользящего среднего в годах.
+            start_year: Начальный год CAGR (по умолчанию первый год страны).
+            end_year: Конечный год CAGR (по умолчанию последний год страны).
+
+        Raises:
+            ValueError: При неверном показателе, окне или диапазоне лет.
+        """
+        if indicator not in NUMERIC_COLUMNS:
+            raise ValueError(
+                f"Unknown indicator: '{indicator}'. "
+                f"Numeric columns: {list(NUMERIC_COLUMNS)}"
+            )
+        if window < 1:
+            raise ValueError(f"Window must be >= 1, got {window}")
+        if start_year is not None and end_year is not None and start_year >= end_year:
+            raise ValueError(f"Invalid CAGR range: {start_year} >= {end_year}")
+        self.indicator = indicator
+        self.window = window
+        self.start_year = start_year
+        self.end_year = end_year
+        self.required_columns = frozenset({"country", "year", "gdp_growth", indicator})
+
+    def calculate(self, records: list[EconomicRecord]) -> list[CountryGrowth]:
+        """
+        Вычисляет показатели роста для всех стран.
+
+        Args:
+            records: Список экономических записей.
+
+        Returns:
+            list[CountryGrowth]: Показатели, упорядоченные по убыванию CAGR
+            (страны без CAGR - в конце).
+        """
+        if not records:
+            logger.warning("No records provided for calculation")
+            return []
+
+        get_value = attrgetter(self.indicator)
+        series: dict[str, list[tuple[int, float, float]]] = {}
+        for record in records:
+            series.setdefault(record.country, []).append(
+                (record.year, get_value(record), record.gdp_growth)
+            )
+
+        result = [
+            self._country_growth(country, sorted(points, key=lambda p: p[0]))
+            for country, points in series.items()
+        ]
+        result.sort(key=lambda g: (g.cagr is None, -(g.cagr or 0.0), g.country))
+
+        logger.info(f"Calculated growth statistics for {len(result)} countries")
+        return result
+
+    def _country_growth(
+        self, country: str, points: list[tuple[int, float, float]]
+    ) -> CountryGrowth:
+        """Рассчитывает показатели для отсортированного по году ряда страны."""
+        years = [year for year, _value, _growth in points]
+        values = [value for _year, value, _growth in points]
+
+        start = self.start_year if self.start_year is not None else years[0]
+        end = self.end_year if self.end_year is not None else years[-1]
+
+        # Последнее значение за год (при дублировании записей)
+        by_year = dict(zip(years, values, strict=True))
+        # CAGR определен только для положительных значений на обоих концах:
+        # при смене знака корень из отрицательного отношения комплексный
+        cagr = None
+        start_value = by_year.get(start)
+        end_value = by_year.get(end)
+        if (
+            start_value is not None
+            and end_value is not None
+            and start_value > 0
+            and end_value > 0
+            and end > start
+        ):
+            cagr = ((end_value / start_value) ** (1 / (end - start)) - 1) * 100
+
+        # Рост за год y отражает изменение от y - 1 к y, поэтому период
+        # накопления - годы (start, end]
+        cumulative = None
+        if end > start and start in by_year and end in by_year:
+            product = 1.0
+            for year, _value, growth in points:
+                if start < year <= end:
+                    product *= 1 + growth / 100
+            cumulative = (product - 1) * 100
+
+        return CountryGrowth(
+            country=country,
+            indicator=self.indicator,
+            first_year=years[0],
+            last_year=years[-1],
+            window=self.window,
+            moving_averages=moving_averages(years, values, self.window),
+            cagr=cagr,
+            cumulative_growth=cumulative,
+        )
+
 
 # Заготовка для будущих отчетов (демонстрация расширяемости)
-class UnemploymentTrendCalculator(StatisticsCalculator):
+class UnemploymentTrendCalculator(StatisticsCalculator[CountryStatistics]):
     """
     Калькулятор трендов безработицы.
     Заготовка для демонстрации возможности добавления отчетов.
     """
 
+    required_columns = frozenset({"country", "year", "unemployment"})
+
     def calculate(self, records: list[EconomicRecord]) -> list[CountryStatistics]:
         """
         Заглушка для демонстрации расширяемости.
@@ -96,12 +1634,14 @@ class UnemploymentTrendCalculator(StatisticsCalculator):
         return []
 
 
-class PopulationByContinentCalculator(StatisticsCalculator):
+class PopulationByContinentCalculator(StatisticsCalculator[CountryStatistics]):
     """
     Калькулятор населения по континентам.
     Заготовка для демонстрации возможности добавления новых отчетов.
     """
 
+    required_columns = frozenset({"continent", "population"})
+
     def calculate(self, records: list[EconomicRecord]) -> list[CountryStatistics]:
         """
         Заглушка для демонстрации расширяемости.
@@ -0,0 +1,231 @@
+import dataclasses
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Sequence
+
+from src.models import EconomicRecord, GroupStatistics
+
+# Типы элементов array.array для числовых колонок
+INT_TYPECODE = "q"
+FLOAT_TYPECODE = "d"
+BOOL_TYPECODE = "b"
+
+# Соответствие типов array.array и dtype NumPy (одинаковое представление в памяти)
+_NUMPY_DTYPES = {
+    INT_TYPECODE: "int64",
+    FLOAT_TYPECODE: "float64",
+    BOOL_TYPECODE: "bool",
+}
+
+# Типы колонок EconomicRecord (строковые колонки хранятся списками)
+RECORD_TYPECODES: dict[str, str | None] = {
+    "country": None,
+    "year": INT_TYPECODE,
+    "gdp": FLOAT_TYPECODE,
+    "gdp_growth": FLOAT_TYPECODE,
+    "inflation": FLOAT_TYPECODE,
+    "unemployment": FLOAT_TYPECODE,
+    "population": INT_TYPECODE,
+    "continent": None,
+}
+
+Column = array | list[Any]
+
+
+def _infer_column(values: list[Any]) -> Column:
+    """
+    Преобразует значения колонки в array.array, если все они числовые.
+
+    Целые - в 'q', логические - в 'b', числа с None - в 'd' (None как NaN).
+    Остальные колонки (строки, списки) остаются списками.
+    """
+    if values and all(isinstance(v, bool) for v in values):
+        return array(BOOL_TYPECODE, values)
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        return array(INT_TYPECODE, values)
+    if all(
+        v is None or (isinstance(v, (int, float)) and not isinstance(v, bool))
+        for v in values
+    ):
+        return array(FLOAT_TYPECODE, (math.nan if v is None else v for v in values))
+    return values
+
+
+def _as_row(item: Any) -> Mapping[str, Any]:
+    """Представляет результат калькулятора в виде {колонка: значение}."""
+    if isinstance(item, GroupStatistics):
+        return {**item.key, **item.values}
+    if dataclasses.is_dataclass(item) and not isinstance(item, type):
+        return {f.name: getattr(item, f.name) for f in dataclasses.fields(item)}
+    raise TypeError(f"Cannot convert {type(item).__name__} to a table row")
+
+
+@dataclass
+class ColumnarTable:
+    """
+    Колоночная таблица для встраивания в Python сервисы.
+
+    Числовые колонки хранятся в array.array и поддерживают протокол буфера:
+    memoryview(table.columns["gdp"]) и to_numpy() не копируют данные.
+    Строковые и составные колонки хранятся списками.
+    """
+
+    columns: dict[str, Column] = field(default_factory=dict)
+    num_rows: int = 0
+
+    @classmethod
+    def from_results(cls, results: Sequence[Any]) -> "ColumnarTable":
+        """
+        Строит таблицу из результатов калькулятора.
+
+        Args:
+            results: Список DTO (CountryStatistics, GroupStatistics и др.).
+
+        Returns:
+            ColumnarTable: Таблица с колонкой на каждое поле DTO.
+
+        Raises:
+            TypeError: Если элемент не является dataclass.
+        """
+        rows = [_as_row(item) for item in results]
+        names: dict[str, None] = {}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+        return cls(
+            columns={
+                name: _infer_column([row.get(name) for row in rows]) for name in names
+            },
+            num_rows=len(rows),
+        )
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[EconomicRecord], columns: Iterable[str] | None = None
+    ) -> "ColumnarTable":
+        """
+        Строит таблицу из потока записей за один проход.
+
+        Числовые значения сразу добавляются в array.array, промежуточный
+        список записей не создается.
+
+        Args:
+            records: Экономические записи.
+            columns: Колонки таблицы (по умолчанию все поля EconomicRecord).
+
+        Returns:
+            ColumnarTable: Таблица записей.
+
+        Raises:
+            ValueError: Если указана неизвестная колонка.
+        """
+        names = list(RECORD_TYPECODES if columns is None else columns)
+        unknown = [name for name in names if name not in RECORD_TYPECODES]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+        data: dict[str, Column] = {}
+        for name in names:
+            typecode = RECORD_TYPECODES[name]
+            data[name] = array(typecode) if typecode is not None else []
+
+        appenders = [(data[name].append, name) for name in names]
+        num_rows = 0
+        for record in records:
+            for append, name in appenders:
+                append(getattr(record, name))
+            num_rows += 1
+        return cls(columns=data, num_rows=num_rows)
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @property
+    def column_names(self) -> list[str]:
+        """Имена колонок в порядке таблицы."""
+        return list(self.columns)
+
+    def buffer(self, name: str) -> memoryview:
+        """
+        Возвращает представление числовой колонки без копирования.
+
+        Args:
+            name: Имя колонки.
+
+        Raises:
+            KeyError: Если колонки нет.
+            TypeError: Если колонка не числовая.
+        """
+        column = self.columns[name]
+        if not isinstance(column, array):
+            raise TypeError(f"Column '{name}' does not support the buffer protocol")
+        return memoryview(column)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Экспортирует колонки в массивы NumPy.
+
+        Числовые колонки передаются без копирования (numpy.frombuffer)
+        и разделяют память с таблицей; остальные - массивами dtype=object.
+
+        Returns:
+            dict[str, numpy.ndarray]: Массив на каждую колонку.
+
+        Raises:
+            ImportError: Если NumPy не установлен.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                "NumPy is required for to_numpy(); install it with 'pip install numpy'"
+            ) from e
+
+        result: dict[str, Any] = {}
+        for name, column in self.columns.items():
+            if isinstance(column, array):
+                result[name] = np.frombuffer(
+                    column, dtype=_NUMPY_DTYPES[column.typecode]
+                )
+            else:
+                values = np.empty(len(column), dtype=object)
+                values[:] = column
+                result[name] = values
+        return result
+
+    def to_arrow(self) -> Any:
+        """
+        Экспортирует таблицу в pyarrow.Table.
+
+        Колонки int64 и float64 передаются без копирования
+        (pyarrow.py_buffer над array.array) и разделяют память с таблицей;
+        логические и строковые колонки преобразуются в массивы Arrow.
+
+        Returns:
+            pyarrow.Table: Таблица Arrow.
+
+        Raises:
+            ImportError: Если pyarrow не установлен.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required for to_arrow(); install it with "
+                "'pip install pyarrow'"
+            ) from e
+
+        arrow_types = {INT_TYPECODE: pa.int64(), FLOAT_TYPECODE: pa.float64()}
+        arrays: dict[str, Any] = {}
+        for name, column in self.columns.items():
+            if isinstance(column, array) and column.typecode in arrow_types:
+                arrays[name] = pa.Array.from_buffers(
+                    arrow_types[column.typecode],
+                    len(column),
+                    [None, pa.py_buffer(column)],
+                )
+            elif isinstance(column, array):
+                arrays[name] = pa.array(column.tolist(), pa.bool_())
+            else:
+                arrays[name] = pa.array(column)
+        return pa.table(arrays)
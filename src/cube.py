@@ -0,0 +1,628 @@
+import json
+import logging
+import math
+import os
+import sys
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+
+from src.calculator import NUMERIC_COLUMNS, Aggregate, AggregateSpec, HashAggregator
+from src.filters import RowFilter
+from src.models import EconomicRecord, GroupStatistics
+from src.reader import DataReader, iter_paths
+
+logger = logging.getLogger(__name__)
+
+# Сигнатура и версия файла куба
+CUBE_MAGIC = b"ECUBE\n"
+CUBE_VERSION = 1
+
+# Показатели, агрегируемые в кубе
+CUBE_INDICATORS = tuple(name for name in NUMERIC_COLUMNS if name != "year")
+
+# Функции, которые вычисляются по ячейкам куба
+CUBE_FUNCTIONS = frozenset({"sum", "mean", "min", "max", "count"})
+
+# Измерения плоскостей куба (годы - общее измерение всех плоскостей)
+COUNTRY_DIMENSIONS = ("country", "continent")
+CONTINENT_DIMENSIONS = ("continent",)
+
+# Агрегация, по которой строится куб: ячейка - страна, континент и год
+CUBE_SPEC = AggregateSpec(
+    group_by=(*COUNTRY_DIMENSIONS, "year"),
+    aggregates=(
+        Aggregate("count", "gdp"),
+        *(
+            Aggregate(func, name)
+            for name in CUBE_INDICATORS
+            for func in ("sum", "min", "max")
+        ),
+    ),
+)
+
+
+def _two_sum(a: float, b: float) -> tuple[float, float]:
+    """Сумма двух чисел и ее точная ошибка округления (алгоритм TwoSum)."""
+    total = a + b
+    b_part = total - a
+    return total, (a - (total - b_part)) + (b - b_part)
+
+
+@dataclass
+class _Totals:
+    """Накопленные значения группы результата запроса к кубу."""
+
+    count: int = 0
+    sums: dict[str, float] = field(default_factory=dict)
+    mins: dict[str, float] = field(default_factory=dict)
+    maxs: dict[str, float] = field(default_factory=dict)
+
+
+class CubePlane:
+    """
+    Плоскость куба: участники измерения (страна и континент или только
+    континент) x плотный диапазон лет.
+
+    Значения хранятся построчно в плоских массивах: строка - участник,
+    столбец - год. Количества и суммы хранятся префиксными суммами по
+    годам (строка длиной year_count + 1), поэтому сумма и количество за
+    любой диапазон лет вычисляются за O(1) на участника. Суммы показателей
+    накапливаются с компенсацией (старшая и младшая части), чтобы разность
+    префиксов не теряла точность после больших значений в начале строки.
+    Минимумы и максимумы хранятся по ячейкам (пустая ячейка: +inf и -inf).
+    """
+
+    def __init__(
+        self,
+        dimensions: tuple[str, ...],
+        keys: list[tuple[str, ...]],
+        first_year: int,
+        year_count: int,
+        counts: array,
+        sums: dict[str, tuple[array, array]],
+        mins: dict[str, array],
+        maxs: dict[str, array],
+    ):
+        """
+        Args:
+            dimensions: Имена измерений ключа участника.
+            keys: Ключи участников в порядке строк.
+            first_year: Первый год диапазона.
+            year_count: Число лет в диапазоне.
+            counts: Префиксные суммы количеств записей (array('q')).
+            sums: Префиксные суммы показателей: старшие и младшие части
+                (array('d')).
+            mins: Минимумы показателей по ячейкам (array('d')).
+            maxs: Максимумы показателей по ячейкам.
+        """
+        self.dimensions = dimensions
+        self.keys = keys
+        self.first_year = first_year
+        self.year_count = year_count
+        self.counts = counts
+        self.sums = sums
+        self.mins = mins
+        self.maxs = maxs
+
+    @classmethod
+    def from_cells(cls, cells: "_PlaneCells") -> "CubePlane":
+        """Строит плоскость по заполненным ячейкам, вычисляя префиксные суммы."""
+        width = cells.year_count
+        rows = len(cells.keys)
+        counts = array("q", [0]) * (rows * (width + 1))
+        sums = {}
+        for name in CUBE_INDICATORS:
+            values = cells.sums[name]
+            high = array("d", [0.0]) * len(counts)
+            low = array("d", [0.0]) * len(counts)
+            for row in range(rows):
+                start = row * (width + 1)
+                total = error = 0.0
+                for offset in range(width):
+                    total, rounding = _two_sum(total, values[row * width + offset])
+                    error += rounding
+                    high[start + offset + 1] = total
+                    low[start + offset + 1] = error
+            sums[name] = (high, low)
+        for row in range(rows):
+            start = row * (width + 1)
+            for offset in range(width):
+                counts[start + offset + 1] = (
+                    counts[start + offset] + cells.counts[row * width + offset]
+                )
+        return cls(
+            cells.dimensions,
+            cells.keys,
+            cells.first_year,
+            width,
+            counts,
+            sums,
+            cells.mins,
+            cells.maxs,
+        )
+
+    def accepts(self, key: tuple[str, ...], row_filter: RowFilter | None) -> bool:
+        """Проходит ли участник фильтр стран и континентов."""
+        if row_filter is None:
+            return True
+        values = dict(zip(self.dimensions, key, strict=True))
+        if row_filter.countries is not None and (
+            values.get("country") not in row_filter.countries
+        ):
+            return False
+        return row_filter.continents is None or (
+            values["continent"] in row_filter.continents
+        )
+
+    def add_range(
+        self,
+        totals: _Totals,
+        row: int,
+        lo: int,
+        hi: int,
+        columns: Mapping[str, Collection[str]],
+    ) -> None:
+        """
+        Добавляет к группе значения участника за годы [lo, hi) (индексы лет).
+
+        Сумма и количество берутся из префиксных сумм, экстремумы - проходом
+        по ячейкам диапазона.
+
+        Args:
+            totals: Накопленные значения группы.
+            row: Строка участника.
+            lo: Индекс первого года.
+            hi: Индекс года после последнего.
+            columns: Колонки, нужные запросу: {'sum'|'min'|'max': колонки}.
+        """
+        width = self.year_count
+        start = row * (width + 1)
+        count = self.counts[start + hi] - self.counts[start + lo]
+        if not count:
+            return
+        totals.count += count
+        for name in columns["sum"]:
+            high, low = self.sums[name]
+            total, rounding = _two_sum(high[start + hi], -high[start + lo])
+            total += rounding + (low[start + hi] - low[start + lo])
+            totals.sums[name] = totals.sums.get(name, 0.0) + total
+        cells = slice(row * width + lo, row * width + hi)
+        for name in columns["min"]:
+            totals.mins[name] = min(
+                totals.mins.get(name, math.inf), min(self.mins[name][cells])
+            )
+        for name in columns["max"]:
+            totals.maxs[name] = max(
+                totals.maxs.get(name, -math.inf), max(self.maxs[name][cells])
+            )
+
+    def arrays(self) -> Iterator[array]:
+        """Массивы плоскости в порядке записи в файл."""
+        yield self.counts
+        for name in CUBE_INDICATORS:
+            yield from self.sums[name]
+            yield self.mins[name]
+            yield self.maxs[name]
+
+
+class _PlaneCells:
+    """Ячейки плоскости, заполняемые при построении куба."""
+
+    def __init__(
+        self,
+        dimensions: tuple[str, ...],
+        keys: list[tuple[str, ...]],
+        first_year: int,
+        year_count: int,
+    ):
+        self.dimensions = dimensions
+        self.keys = keys
+        self.rows = {key: row for row, key in enumerate(keys)}
+        self.first_year = first_year
+        self.year_count = year_count
+        size = len(keys) * year_count
+        self.counts = array("q", [0]) * size
+        self.sums = {name: array("d", [0.0]) * size for name in CUBE_INDICATORS}
+        self.mins = {name: array("d", [math.inf]) * size for name in CUBE_INDICATORS}
+        self.maxs = {name: array("d", [-math.inf]) * size for name in CUBE_INDICATORS}
+
+    def add(self, group: GroupStatistics) -> None:
+        """Учитывает группу агрегации CUBE_SPEC в ячейке участника и года."""
+        key = tuple(group.key[name] for name in self.dimensions)
+        cell = self.rows[key] * self.year_count + group.key["year"] - self.first_year
+        values = group.values
+        self.counts[cell] += int(values["count_gdp"])
+        for name in CUBE_INDICATORS:
+            self.sums[name][cell] += values[f"sum_{name}"]
+            self.mins[name][cell] = min(self.mins[name][cell], values[f"min_{name}"])
+            self.maxs[name][cell] = max(self.maxs[name][cell], values[f"max_{name}"])
+
+
+class AggregateCube:
+    """
+    Куб агрегатов: сумма, количество, минимум и максимум каждого показателя
+    по стране и году и по континенту и году.
+
+    Строится один раз при загрузке данных (ingest --cube) и отвечает на
+    агрегации по странам, континентам и годам за любой диапазон лет без
+    чтения исходных записей.
+    """
+
+    def __init__(self, countries: CubePlane, continents: CubePlane):
+        """
+        Args:
+            countries: Плоскость стран (страна и континент x годы).
+            continents: Плоскость континентов (континент x годы).
+        """
+        self.countries = countries
+        self.continents = continents
+
+    @property
+    def first_year(self) -> int:
+        """Первый год куба."""
+        return self.countries.first_year
+
+    @property
+    def last_year(self) -> int:
+        """Последний год куба."""
+        return self.countries.first_year + self.countries.year_count - 1
+
+    @classmethod
+    def from_groups(cls, groups: list[GroupStatistics]) -> "AggregateCube":
+        """
+        Строит куб из результата агрегации CUBE_SPEC.
+
+        Args:
+            groups: Группы по стране, континенту и году.
+
+        Returns:
+            AggregateCube: Куб с плоскостями стран и континентов.
+
+        Raises:
+            ValueError: Если групп нет.
+        """
+        if not groups:
+            raise ValueError("No records to build the aggregate cube from")
+        years = [group.key["year"] for group in groups]
+        first_year = min(years)
+        width = max(years) - first_year + 1
+
+        planes = [
+            _PlaneCells(
+                dimensions,
+                sorted(
+                    {tuple(group.key[name] for name in dimensions) for group in groups}
+                ),
+                first_year,
+                width,
+            )
+            for dimensions in (COUNTRY_DIMENSIONS, CONTINENT_DIMENSIONS)
+        ]
+        for group in groups:
+            for plane in planes:
+                plane.add(group)
+        countries, continents = (CubePlane.from_cells(plane) for plane in planes)
+        return cls(countries, continents)
+
+    @staticmethod
+    def supports(spec: AggregateSpec) -> bool:
+        """
+        Можно ли выполнить агрегацию по кубу.
+
+        Ключи группировки (страна, континент, год) поддерживаются все;
+        функции - sum, mean, min, max и count по показателям куба.
+        """
+        return all(
+            agg.func in CUBE_FUNCTIONS
+            and (agg.func == "count" or agg.column in CUBE_INDICATORS)
+            for agg in spec.aggregates
+        )
+
+    def query(
+        self, spec: AggregateSpec, row_filter: RowFilter | None = None
+    ) -> list[GroupStatistics] | None:
+        """
+        Выполняет агрегацию по ячейкам куба.
+
+        Без группировки по стране и без фильтра стран используется
+        плоскость континентов, иначе - плоскость стран.
+
+        Args:
+            spec: Спецификация агрегации.
+            row_filter: Фильтр лет, стран и континентов.
+
+        Returns:
+            list[GroupStatistics] | None: Группы, упорядоченные по ключам,
+            или None, если агрегацию нельзя выполнить по кубу.
+        """
+        if not self.supports(spec):
+            return None
+        by_country = "country" in spec.group_by or (
+            row_filter is not None and row_filter.countries is not None
+        )
+        plane = self.countries if by_country else self.continents
+
+        year_from = self.first_year
+        year_to = self.last_year
+        if row_filter is not None:
+            if row_filter.year_from is not None:
+                year_from = max(year_from, row_filter.year_from)
+            if row_filter.year_to is not None:
+                year_to = min(year_to, row_filter.year_to)
+        lo = year_from - self.first_year
+        hi = year_to - self.first_year + 1
+        columns = {
+            "sum": {
+                agg.column for agg in spec.aggregates if agg.func in ("sum", "mean")
+            },
+            "min": {agg.column for agg in spec.aggregates if agg.func == "min"},
+            "max": {agg.column for agg in spec.aggregates if agg.func == "max"},
+        }
+
+        groups: dict[tuple[Any, ...], _Totals] = {}
+        for row, key in enumerate(plane.keys):
+            if not plane.accepts(key, row_filter):
+                continue
+            values: dict[str, Any] = dict(zip(plane.dimensions, key, strict=True))
+            if "year" in spec.group_by:
+                spans = [(year, year + 1) for year in range(lo, hi)]
+            else:
+                spans = [(lo, hi)] if lo < hi else []
+            for start, stop in spans:
+                values["year"] = self.first_year + start
+                group_key = tuple(values[name] for name in spec.group_by)
+                totals = groups.get(group_key)
+                if totals is None:
+                    totals = _Totals()
+                plane.add_range(totals, row, start, stop, columns)
+                if totals.count:
+                    groups[group_key] = totals
+
+        logger.debug(
+            f"Answered {len(groups)} groups from the cube for {year_from}-{year_to}"
+        )
+        return [
+            GroupStatistics(
+                key=dict(zip(spec.group_by, group_key, strict=True)),
+                values={agg.label: self._value(agg, totals) for agg in spec.aggregates},
+            )
+            for group_key, totals in sorted(groups.items())
+        ]
+
+    @staticmethod
+    def _value(agg: Aggregate, totals: _Totals) -> float:
+        """Значение агрегата по накопленным значениям группы."""
+        if agg.func == "count":
+            return totals.count
+        if agg.func == "mean":
+            return totals.sums[agg.column] / totals.count
+        if agg.func == "sum":
+            return totals.sums[agg.column]
+        if agg.func == "min":
+            return totals.mins[agg.column]
+        return totals.maxs[agg.column]
+
+
+def build_cube(reader: DataReader, file_paths: Sequence[str]) -> AggregateCube:
+    """
+    Строит куб по данным источника.
+
+    Агрегация выполняется на стороне источника, если он это умеет
+    (GROUP BY в SQLite), иначе записи агрегируются потоком в Python.
+
+    Args:
+        reader: Читатель данных.
+        file_paths: Пути к источникам.
+
+    Returns:
+        AggregateCube: Построенный куб.
+
+    Raises:
+        ValueError: Если данных нет.
+    """
+    groups = reader.aggregate(file_paths, CUBE_SPEC)
+    if groups is None:
+        aggregator = HashAggregator(CUBE_SPEC)
+        aggregator.consume(reader.iter_records(file_paths, CUBE_SPEC.columns))
+        groups = aggregator.results()
+    cube = AggregateCube.from_groups(groups)
+    logger.info(
+        f"Built aggregate cube: {len(cube.countries.keys)} countries, "
+        f"{cube.first_year}-{cube.last_year}"
+    )
+    return cube
+
+
+def save_cube(cube: AggregateCube, file_path: str | Path) -> None:
+    """
+    Сохраняет куб в файл: сигнатура, строка заголовка JSON и массивы
+    плоскостей (префиксные суммы и экстремумы) в машинном представлении.
+
+    Файл записывается во временный и переименовывается, поэтому читатели
+    не видят частично записанный куб.
+
+    Args:
+        cube: Куб.
+        file_path: Путь к файлу куба.
+    """
+    planes = (cube.countries, cube.continents)
+    header = {
+        "version": CUBE_VERSION,
+        "byteorder": sys.byteorder,
+        "first_year": cube.first_year,
+        "year_count": cube.countries.year_count,
+        "indicators": list(CUBE_INDICATORS),
+        "planes": [
+            {"dimensions": list(plane.dimensions), "keys": plane.keys}
+            for plane in planes
+        ],
+    }
+    path = Path(file_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(CUBE_MAGIC)
+        f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+        for plane in planes:
+            for cells in plane.arrays():
+                cells.tofile(f)
+    os.replace(tmp_path, path)
+    logger.debug(f"Saved aggregate cube {path}")
+
+
+def _read_array(f: BinaryIO, typecode: str, size: int, swap: bool) -> array:
+    """Читает массив ячеек заданного размера."""
+    cells = array(typecode)
+    try:
+        cells.fromfile(f, size)
+    except EOFError as e:
+        raise ValueError("Aggregate cube file is truncated") from e
+    if swap:
+        cells.byteswap()
+    return cells
+
+
+def load_cube(file_path: str | Path) -> AggregateCube:
+    """
+    Загружает куб из файла.
+
+    Args:
+        file_path: Путь к файлу куба.
+
+    Returns:
+        AggregateCube: Куб с построенными префиксными суммами.
+
+    Raises:
+        FileNotFoundError: Если файл не существует.
+        ValueError: Если файл не является кубом или поврежден.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Cube not found: {file_path}")
+    with open(path, "rb") as f:
+        if f.readline() != CUBE_MAGIC:
+            raise ValueError(f"Not an aggregate cube file: {file_path}")
+        header = json.loads(f.readline())
+        if header.get("version") != CUBE_VERSION:
+            raise ValueError(
+                f"Unsupported cube version {header.get('version')} in {file_path}"
+            )
+        if tuple(header["indicators"]) != CUBE_INDICATORS:
+            raise ValueError(f"Cube {file_path} was built for other indicators")
+        swap = header["byteorder"] != sys.byteorder
+        first_year = header["first_year"]
+        width = header["year_count"]
+
+        planes = []
+        for spec in header["planes"]:
+            keys = [tuple(key) for key in spec["keys"]]
+            size = len(keys) * width
+            prefix_size = len(keys) * (width + 1)
+            counts = _read_array(f, "q", prefix_size, swap)
+            sums, mins, maxs = {}, {}, {}
+            for name in CUBE_INDICATORS:
+                sums[name] = (
+                    _read_array(f, "d", prefix_size, swap),
+                    _read_array(f, "d", prefix_size, swap),
+                )
+                mins[name] = _read_array(f, "d", size, swap)
+                maxs[name] = _read_array(f, "d", size, swap)
+            planes.append(
+                CubePlane(
+                    tuple(spec["dimensions"]),
+                    keys,
+                    first_year,
+                    width,
+                    counts,
+                    sums,
+                    mins,
+                    maxs,
+                )
+            )
+    countries, continents = planes
+    return AggregateCube(countries, continents)
+
+
+class CubeReader(DataReader):
+    """
+    Читатель куба агрегатов, созданного командой 'ingest --cube'.
+
+    Отвечает только на агрегации (AggregateSpec) по странам, континентам
+    и годам; фильтр лет, стран и континентов применяется к ячейкам куба.
+    Исходные записи в кубе не хранятся, поэтому read и iter_records
+    недоступны.
+    """
+
+    def __init__(self, row_filter: RowFilter | None = None):
+        """
+        Args:
+            row_filter: Фильтр лет, стран и континентов.
+        """
+        self.row_filter = row_filter
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return {"row_filter": self.row_filter}
+
+    def read(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> list[EconomicRecord]:
+        """
+        Записи из куба не читаются.
+
+        Raises:
+            ValueError: Всегда.
+        """
+        raise ValueError(
+            "The aggregate cube only answers aggregate reports "
+            "(sum, mean, min, max and count of indicators); "
+            "use --files, --db or --dataset for this report"
+        )
+
+    def iter_records(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> Iterator[EconomicRecord]:
+        """
+        Записи из куба не читаются.
+
+        Raises:
+            ValueError: Всегда.
+        """
+        return iter(self.read(file_paths, columns))
+
+    def aggregate(
+        self,
+        file_paths: Sequence[str],
+        spec: AggregateSpec,
+        memory_limit: int | None = None,
+    ) -> list[GroupStatistics] | None:
+        """
+        Выполняет агрегацию по кубу.
+
+        Args:
+            file_paths: Путь к файлу куба (ровно один).
+            spec: Спецификация агрегации.
+            memory_limit: Не используется: группы уже посчитаны в кубе.
+
+        Returns:
+            list[GroupStatistics] | None: Результат или None, если агрегацию
+            нельзя выполнить по кубу.
+
+        Raises:
+            ValueError: Если передан не один файл или файл поврежден.
+            FileNotFoundError: Если файл не существует.
+        """
+        paths = list(iter_paths(file_paths))
+        if len(paths) != 1:
+            raise ValueError(f"Exactly one cube file is supported, got {len(paths)}")
+        return load_cube(paths[0]).query(spec, self.row_filter)
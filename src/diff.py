@@ -0,0 +1,260 @@
+import csv
+import logging
+import os
+from dataclasses import dataclass, fields
+from typing import Any, Iterable, Sequence, TextIO
+
+from tabulate import tabulate
+
+from src.models import EconomicRecord, RowDiff
+from src.reader import DataReader, is_stream
+
+logger = logging.getLogger(__name__)
+
+# Поля ключа строки снимка
+KEY_FIELDS = ("country", "year")
+
+# Сравниваемые поля записи
+VALUE_FIELDS = tuple(
+    field.name for field in fields(EconomicRecord) if field.name not in KEY_FIELDS
+)
+
+# Статусы строк
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+Key = tuple[str, int]
+
+
+@dataclass
+class SnapshotDiff:
+    """Результат сравнения двух снимков данных."""
+
+    # Различающиеся строки, упорядоченные по стране и году
+    rows: list[RowDiff]
+    # Число совпавших строк
+    unchanged: int
+
+    def count(self, status: str) -> int:
+        """Число строк с указанным статусом."""
+        return sum(1 for row in self.rows if row.status == status)
+
+    @property
+    def summary(self) -> str:
+        """Строка с числом добавленных, удаленных и измененных строк."""
+        return (
+            f"Added: {self.count(ADDED)}, removed: {self.count(REMOVED)}, "
+            f"changed: {self.count(CHANGED)}, unchanged: {self.unchanged}"
+        )
+
+
+def snapshot_size(file_paths: Iterable[str]) -> float:
+    """
+    Суммарный размер файлов снимка в байтах.
+
+    Returns:
+        float: Размер или бесконечность, если среди источников есть поток.
+    """
+    total = 0
+    for file_path in file_paths:
+        if is_stream(file_path):
+            return float("inf")
+        total += os.path.getsize(file_path)
+    return total
+
+
+def _differs(old: Any, new: Any, tolerance: float) -> bool:
+    """Проверяет различие значений; числа сравниваются с допуском."""
+    if isinstance(old, float) or isinstance(new, float):
+        return bool(abs(new - old) > tolerance)
+    return bool(old != new)
+
+
+def diff_snapshots(
+    old_paths: Sequence[str],
+    new_paths: Sequence[str],
+    reader: DataReader,
+    compare: Sequence[str] | None = None,
+    tolerance: float = 0.0,
+) -> SnapshotDiff:
+    """
+    Сравнивает два снимка данных по ключу (страна, год) хеш-соединением.
+
+    По меньшему снимку (по размеру файлов) строится хеш-индекс ключ ->
+    значения сравниваемых полей, а больший читается потоком и
+    сопоставляется с индексом. Память пропорциональна меньшему снимку
+    (плюс различающиеся строки). Строки индекса без пары в конце становятся
+    удаленными или добавленными. При повторе ключа внутри снимка
+    учитывается первая строка.
+
+    Args:
+        old_paths: Файлы прежнего снимка.
+        new_paths: Файлы нового снимка.
+        reader: Читатель файлов.
+        compare: Сравниваемые поля (по умолчанию все, кроме ключа).
+        tolerance: Допустимое абсолютное различие чисел с плавающей точкой.
+
+    Returns:
+        SnapshotDiff: Различающиеся строки и число совпавших.
+
+    Raises:
+        ValueError: Если поле неизвестно или допуск отрицателен.
+    """
+    names = tuple(compare or VALUE_FIELDS)
+    unknown = [name for name in names if name not in VALUE_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {unknown}. Comparable fields: {list(VALUE_FIELDS)}"
+        )
+    if tolerance < 0:
+        raise ValueError(f"tolerance must be non-negative, got {tolerance}")
+
+    columns = {*KEY_FIELDS, *names}
+    # Индексируется меньший снимок; поток (stdin) всегда читается потоком
+    index_old = snapshot_size(old_paths) <= snapshot_size(new_paths)
+    indexed_paths, streamed_paths = (
+        (old_paths, new_paths) if index_old else (new_paths, old_paths)
+    )
+
+    index: dict[Key, tuple[Any, ...]] = {}
+    duplicates = 0
+    for record in reader.iter_records(indexed_paths, columns):
+        values = tuple(getattr(record, name) for name in names)
+        if index.setdefault((record.country, record.year), values) is not values:
+            duplicates += 1
+    logger.info(
+        f"Indexed {len(index)} rows of the {'old' if index_old else 'new'} snapshot"
+    )
+
+    rows: list[RowDiff] = []
+    matched: set[Key] = set()
+    unmatched: set[Key] = set()
+    unchanged = 0
+    for record in reader.iter_records(streamed_paths, columns):
+        key = (record.country, record.year)
+        if key in matched or key in unmatched:
+            duplicates += 1
+            continue
+        values = tuple(getattr(record, name) for name in names)
+        indexed = index.get(key)
+        if indexed is None:
+            unmatched.add(key)
+            rows.append(_side_row(key, ADDED if index_old else REMOVED, names, values))
+            continue
+        matched.add(key)
+        old, new = (indexed, values) if index_old else (values, indexed)
+        changes = {
+            name: (o, n)
+            for name, o, n in zip(names, old, new, strict=True)
+            if _differs(o, n, tolerance)
+        }
+        if changes:
+            rows.append(RowDiff(*key, CHANGED, changes))
+        else:
+            unchanged += 1
+
+    for key, values in index.items():
+        if key not in matched:
+            rows.append(_side_row(key, REMOVED if index_old else ADDED, names, values))
+
+    if duplicates:
+        logger.warning(f"Skipped {duplicates} rows with repeated (country, year)")
+    rows.sort(key=lambda row: (row.country, row.year))
+    result = SnapshotDiff(rows, unchanged)
+    logger.info(f"Snapshot diff: {result.summary}")
+    return result
+
+
+def _side_row(
+    key: Key, status: str, names: Sequence[str], values: Sequence[Any]
+) -> RowDiff:
+    """Строка, которая есть только в одном снимке (added или removed)."""
+    changes = {
+        name: (None, value) if status == ADDED else (value, None)
+        for name, value in zip(names, values, strict=True)
+    }
+    return RowDiff(*key, status, changes)
+
+
+def _delta(old: Any, new: Any) -> Any:
+    """Разница новых и старых числовых значений (None для строк)."""
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+        return round(new - old, 6)
+    return None
+
+
+def render_diff(diff: SnapshotDiff) -> str:
+    """
+    Формирует сводку и таблицу различий для вывода в консоль.
+
+    Для измененных строк выводится строка на каждое поле с разницей,
+    добавленные и удаленные строки выводятся одной строкой.
+
+    Args:
+        diff: Результат сравнения.
+
+    Returns:
+        str: Отформатированный текст.
+    """
+    if not diff.rows:
+        return f"No differences. {diff.summary}"
+
+    table_data = []
+    for row in diff.rows:
+        if row.status != CHANGED:
+            table_data.append([row.status, row.country, row.year, "", "", "", ""])
+            continue
+        for name, (old, new) in row.changes.items():
+            delta = _delta(old, new)
+            table_data.append(
+                [
+                    row.status,
+                    row.country,
+                    row.year,
+                    name,
+                    old,
+                    new,
+                    f"{delta:+,}" if delta is not None else "",
+                ]
+            )
+    return (
+        diff.summary
+        + "\n"
+        + tabulate(
+            table_data,
+            headers=["Status", "Country", "Year", "Field", "Old", "New", "Delta"],
+            tablefmt="grid",
+            colalign=["left", "left", "right", "left", "right", "right", "right"],
+            disable_numparse=True,
+        )
+    )
+
+
+def write_diff_csv(diff: SnapshotDiff, file: TextIO) -> None:
+    """
+    Записывает различия в CSV: строка на каждое различающееся поле.
+
+    Для добавленных и удаленных строк выводятся все поля с пустым
+    значением на отсутствующей стороне.
+
+    Args:
+        diff: Результат сравнения.
+        file: Открытый текстовый файл (newline='').
+    """
+    writer = csv.writer(file)
+    writer.writerow(["status", "country", "year", "field", "old", "new", "delta"])
+    for row in diff.rows:
+        for name, (old, new) in row.changes.items():
+            delta = _delta(old, new)
+            writer.writerow(
+                [
+                    row.status,
+                    row.country,
+                    row.year,
+                    name,
+                    "" if old is None else old,
+                    "" if new is None else new,
+                    "" if delta is None else delta,
+                ]
+            )
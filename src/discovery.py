@@ -0,0 +1,120 @@
+import fnmatch
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Шаблон файлов по умолчанию
+DEFAULT_INCLUDE = ("*.csv",)
+
+# Символ комментария в файле-манифесте
+MANIFEST_COMMENT = "#"
+
+
+def _matches(name: str, relative: str, patterns: Sequence[str]) -> bool:
+    """Проверяет имя или относительный путь на соответствие шаблонам."""
+    return any(
+        fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative, pattern)
+        for pattern in patterns
+    )
+
+
+def discover_files(
+    root: str | Path,
+    include: Sequence[str] = DEFAULT_INCLUDE,
+    exclude: Sequence[str] = (),
+    recursive: bool = True,
+    accept_dir: Callable[[str], bool] | None = None,
+    sort: bool = False,
+) -> Iterator[str]:
+    """
+    Находит входные файлы в каталоге с помощью os.scandir.
+
+    Файлы выдаются по мере обхода, без построения полного списка, поэтому
+    чтение первых файлов начинается до завершения обхода - в том числе
+    до конца листинга большого плоского каталога. Записи выдаются в
+    порядке os.scandir (зависит от файловой системы); с sort=True листинг
+    каждого каталога читается целиком и упорядочивается по имени.
+    Вложенные каталоги обходятся в глубину после файлов текущего каталога.
+
+    Шаблоны (fnmatch) сравниваются с именем файла и с путем относительно
+    root (через '/'). Каталоги, подходящие под exclude, не обходятся.
+
+    Args:
+        root: Корневой каталог.
+        include: Шаблоны включаемых файлов.
+        exclude: Шаблоны исключаемых файлов и каталогов.
+        recursive: Обходить вложенные каталоги.
+        accept_dir: Предикат над именем вложенного каталога; каталоги,
+            для которых он возвращает False, не обходятся.
+        sort: Упорядочивать записи каждого каталога по имени.
+
+    Yields:
+        str: Путь к очередному файлу.
+
+    Raises:
+        FileNotFoundError: Если каталог не существует.
+    """
+    root_path = Path(root)
+    if not root_path.is_dir():
+        raise FileNotFoundError(f"Input directory not found: {root}")
+
+    found = 0
+    # Стек каталогов: (путь, путь относительно root)
+    stack: list[tuple[str, str]] = [(str(root_path), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        subdirectories = []
+        try:
+            with os.scandir(directory) as it:
+                entries: Iterable[os.DirEntry[str]] = (
+                    sorted(it, key=lambda entry: entry.name) if sort else it
+                )
+                for entry in entries:
+                    relative = f"{prefix}{entry.name}"
+                    if exclude and _matches(entry.name, relative, exclude):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and (accept_dir is None or accept_dir(entry.name)):
+                            subdirectories.append((entry.path, f"{relative}/"))
+                    elif entry.is_file() and _matches(entry.name, relative, include):
+                        found += 1
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+            continue
+
+        # Обратный порядок: первый найденный каталог извлекается первым
+        stack.extend(reversed(subdirectories))
+
+    logger.info(f"Discovered {found} file(s) in {root}")
+
+
+def read_manifest(manifest_path: str | Path) -> Iterator[str]:
+    """
+    Читает список входных файлов из манифеста.
+
+    Формат: один путь на строку, пустые строки и строки, начинающиеся
+    с '#', пропускаются. Относительные пути отсчитываются от каталога
+    манифеста.
+
+    Args:
+        manifest_path: Путь к файлу-манифесту.
+
+    Yields:
+        str: Путь к очередному файлу.
+
+    Raises:
+        FileNotFoundError: Если манифест не существует.
+    """
+    manifest = Path(manifest_path)
+    base = manifest.parent
+    with open(manifest, "r", encoding="utf-8") as f:
+        for line in f:
+            entry = line.strip()
+            if not entry or entry.startswith(MANIFEST_COMMENT):
+                continue
+            path = Path(entry)
+            yield str(path if path.is_absolute() else base / path)
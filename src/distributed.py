@@ -0,0 +1,512 @@
+import dataclasses
+import json
+import logging
+import socket
+import socketserver
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Collection, Iterable, Iterator, Mapping, Sequence
+
+from src.arrow import ArrowReader
+from src.calculator import (
+    AggregateSpec,
+    CorrelationCalculator,
+    HashAggregator,
+    create_aggregator,
+)
+from src.filters import RowFilter
+from src.formats import (
+    ARROW_FORMAT,
+    CSV_FORMAT,
+    FORMATS,
+    JSONL_FORMAT,
+    MultiFormatReader,
+)
+from src.jsonl import JSONLReader
+from src.models import EconomicRecord, GroupStatistics
+from src.reader import STDIN_PATH, CSVReader, DataReader, FileReader, iter_paths
+from src.utils.accumulators import CoMoments
+from src.utils.validators import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Адрес рабочего узла по умолчанию: протокол не аутентифицирован, поэтому
+# узел доступен другим машинам только при явном --host
+DEFAULT_HOST = "127.0.0.1"
+
+# Порт рабочего узла по умолчанию
+DEFAULT_PORT = 8765
+
+# Время ожидания ответа рабочего узла (секунды)
+DEFAULT_TIMEOUT = 300.0
+
+# Число повторных попыток задачи на других узлах
+DEFAULT_RETRIES = 2
+
+# Число задач, отправляемых заранее, на один рабочий узел
+PREFETCH_PER_WORKER = 2
+
+# Задачи рабочего узла
+AGGREGATE_TASK = "aggregate"
+COMOMENTS_TASK = "comoments"
+READ_TASK = "read"
+
+_RECORD_FIELDS = tuple(field.name for field in dataclasses.fields(EconomicRecord))
+
+# Ошибки данных, которые рабочий узел передает координатору; задача с такой
+# ошибкой не повторяется, так как другой узел прочитает тот же файл
+_REMOTE_ERRORS: dict[str, type[Exception]] = {
+    "ValidationError": ValidationError,
+    "FileNotFoundError": FileNotFoundError,
+    "ValueError": ValueError,
+}
+
+
+class WorkerError(Exception):
+    """Рабочий узел недоступен или не смог выполнить задачу."""
+
+    pass
+
+
+def parse_address(text: str) -> tuple[str, int]:
+    """
+    Разбирает адрес рабочего узла вида 'HOST:PORT' (порт необязателен).
+
+    Args:
+        text: Адрес, например 'node1:8765' или '127.0.0.1'.
+
+    Returns:
+        tuple[str, int]: Хост и порт.
+
+    Raises:
+        ValueError: Если порт не является числом от 1 до 65535.
+    """
+    host, sep, port = text.strip().rpartition(":")
+    if not sep:
+        return port, DEFAULT_PORT
+    if not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"Invalid worker address '{text}', expected HOST:PORT")
+    return host or "localhost", int(port)
+
+
+def encode_filter(row_filter: RowFilter | None) -> dict[str, Any] | None:
+    """Представляет фильтр строк словарем для передачи в JSON."""
+    if row_filter is None:
+        return None
+    return {
+        name: sorted(value) if isinstance(value, frozenset) else value
+        for name, value in dataclasses.asdict(row_filter).items()
+    }
+
+
+def decode_filter(data: Mapping[str, Any] | None) -> RowFilter | None:
+    """Восстанавливает фильтр строк из словаря encode_filter."""
+    return RowFilter.create(**data) if data is not None else None
+
+
+def build_worker_reader(options: Mapping[str, Any]) -> FileReader:
+    """
+    Создает читатель файлов по настройкам, полученным от координатора.
+
+    Args:
+        options: Настройки: row_filter (см. encode_filter), strict и format
+            ('auto' или имя формата).
+
+    Returns:
+        FileReader: Читатель формата или MultiFormatReader для 'auto'.
+
+    Raises:
+        ValueError: Если формат не поддерживается.
+    """
+    row_filter = decode_filter(options.get("row_filter"))
+    strict = bool(options.get("strict", False))
+    readers: dict[str, FileReader] = {
+        CSV_FORMAT: CSVReader(row_filter=row_filter, strict=strict),
+        JSONL_FORMAT: JSONLReader(row_filter=row_filter, strict=strict),
+        ARROW_FORMAT: ArrowReader(row_filter=row_filter, strict=strict),
+    }
+    file_format = options.get("format", "auto")
+    if file_format == "auto":
+        return MultiFormatReader(readers)
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown format: {file_format}")
+    return readers[file_format]
+
+
+def handle_request(request: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Выполняет задачу рабочего узла над одним файлом.
+
+    Задача 'aggregate' возвращает частичные состояния групп
+    (HashAggregator.partials), задача 'comoments' - состояния накопителей
+    CoMoments по странам, задача 'read' - значения полей записей.
+
+    Args:
+        request: Задача: task, file, options и spec, indicators или columns.
+
+    Returns:
+        dict: Ответ с полем status 'ok' и результатом задачи.
+
+    Raises:
+        ValueError: Если задача неизвестна.
+        FileNotFoundError: Если файл не существует.
+        ValidationError: При ошибках валидации.
+    """
+    task = request.get("task")
+    file_path = request["file"]
+    reader = build_worker_reader(request.get("options") or {})
+
+    if task == AGGREGATE_TASK:
+        spec = AggregateSpec.parse(
+            request["spec"]["group_by"], request["spec"]["aggregates"]
+        )
+        aggregator = HashAggregator(spec)
+        aggregator.consume(reader.read_file(file_path, spec.columns))
+        return {
+            "status": "ok",
+            "rows": aggregator.rows,
+            "partials": [list(partial) for partial in aggregator.partials()],
+        }
+    if task == COMOMENTS_TASK:
+        calculator = CorrelationCalculator(request["indicators"])
+        groups = calculator.accumulate(
+            reader.read_file(file_path, calculator.required_columns)
+        )
+        return {
+            "status": "ok",
+            "rows": sum(moments.count for moments in groups.values()),
+            "groups": {country: m.state() for country, m in groups.items()},
+        }
+    if task == READ_TASK:
+        columns = request.get("columns")
+        rows = [
+            [getattr(record, name) for name in _RECORD_FIELDS]
+            for record in reader.read_file(file_path, columns)
+        ]
+        return {"status": "ok", "rows": len(rows), "records": rows}
+    raise ValueError(f"Unknown task: {task}")
+
+
+class _WorkerHandler(socketserver.StreamRequestHandler):
+    """Обрабатывает одно соединение: строка JSON задачи - строка JSON ответа."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+            logger.info(f"Task {request.get('task')} for {request.get('file')}")
+            response = handle_request(request)
+        except tuple(_REMOTE_ERRORS.values()) as e:
+            logger.error(f"Task failed: {e}")
+            response = {
+                "status": "error",
+                "type": type(e).__name__,
+                "message": str(e),
+            }
+        except Exception as e:
+            logger.exception(f"Unexpected worker error: {e}")
+            response = {"status": "error", "type": "WorkerError", "message": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class WorkerServer(socketserver.ThreadingTCPServer):
+    """
+    Рабочий узел: выполняет задачи координатора над файлами,
+    доступными по тем же путям (например, в общей файловой системе).
+
+    Протокол не аутентифицирован: любой, кто может подключиться к узлу,
+    читает доступные узлу файлы. Узел слушает внешние интерфейсы только
+    при явно заданном адресе и должен быть закрыт от недоверенных сетей.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """
+        Args:
+            host: Адрес, на котором принимаются соединения (по умолчанию
+                только локальные).
+            port: Порт (0 - выбрать свободный порт).
+        """
+        super().__init__((host, port), _WorkerHandler)
+
+    @property
+    def address(self) -> str:
+        """Адрес узла в формате 'HOST:PORT'."""
+        host, port = self.socket.getsockname()[:2]
+        return f"{host}:{port}"
+
+
+class DistributedReader(DataReader):
+    """
+    Координатор распределенного чтения.
+
+    Файлы раздаются рабочим узлам по TCP (по одному файлу на задачу).
+    Для агрегирующих отчетов узлы возвращают частичные состояния групп,
+    которые сливаются координатором в порядке файлов; для остальных
+    отчетов - записи. Если узел недоступен, задача повторяется на другом
+    узле, а отказавший узел исключается из раздачи. Стандартный ввод
+    читается координатором.
+    """
+
+    def __init__(
+        self,
+        workers: Sequence[str],
+        row_filter: RowFilter | None = None,
+        strict: bool = False,
+        file_format: str = "auto",
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+    ):
+        """
+        Args:
+            workers: Адреса рабочих узлов 'HOST:PORT'.
+            row_filter: Фильтр строк (применяется на узлах).
+            strict: Проверять все колонки.
+            file_format: Формат входных файлов ('auto' - определять по файлу).
+            timeout: Время ожидания ответа узла (секунды).
+            retries: Число повторных попыток задачи на других узлах.
+
+        Raises:
+            ValueError: Если узлы не заданы или параметры некорректны.
+        """
+        if not workers:
+            raise ValueError("At least one worker address is required")
+        if retries < 0:
+            raise ValueError(f"retries must be non-negative, got {retries}")
+        self.addresses = [parse_address(address) for address in workers]
+        self.row_filter = row_filter
+        self.strict = strict
+        self.file_format = file_format
+        self.timeout = timeout
+        self.retries = retries
+        self._failed: set[tuple[str, int]] = set()
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return {
+            "row_filter": self.row_filter,
+            "strict": self.strict,
+            "format": self.file_format,
+        }
+
+    def _worker_options(self) -> dict[str, Any]:
+        """Настройки читателя рабочего узла."""
+        return {
+            "row_filter": encode_filter(self.row_filter),
+            "strict": self.strict,
+            "format": self.file_format,
+        }
+
+    def _pick_worker(self) -> tuple[str, int]:
+        """Выбирает следующий исправный узел по кругу."""
+        with self._lock:
+            for _ in range(len(self.addresses)):
+                address = self.addresses[self._next % len(self.addresses)]
+                self._next += 1
+                if address not in self._failed:
+                    return address
+        raise WorkerError("No workers available")
+
+    def _mark_failed(self, address: tuple[str, int]) -> None:
+        """Исключает узел из раздачи задач."""
+        with self._lock:
+            self._failed.add(address)
+
+    def _send(self, address: tuple[str, int], request: dict[str, Any]) -> Any:
+        """
+        Отправляет задачу узлу и возвращает ответ.
+
+        Raises:
+            WorkerError: Если узел недоступен, оборвал соединение или
+                завершил задачу непредвиденной ошибкой.
+        """
+        host, port = address
+        try:
+            with socket.create_connection(address, timeout=self.timeout) as sock:
+                with sock.makefile("rwb") as stream:
+                    stream.write(json.dumps(request).encode("utf-8") + b"\n")
+                    stream.flush()
+                    line = stream.readline()
+            response = json.loads(line)
+        except (OSError, ValueError) as e:
+            raise WorkerError(f"Worker {host}:{port} failed: {e}") from e
+
+        if response.get("status") != "ok":
+            message = response.get("message", "")
+            error = _REMOTE_ERRORS.get(response.get("type", ""))
+            if error is not None:
+                raise error(message)
+            raise WorkerError(f"Worker {host}:{port} failed: {message}")
+        return response
+
+    def _run(self, request: dict[str, Any]) -> Any:
+        """Выполняет задачу, повторяя ее на других узлах при отказе."""
+        last_error: WorkerError | None = None
+        for attempt in range(self.retries + 1):
+            try:
+                address = self._pick_worker()
+            except WorkerError as e:
+                raise WorkerError(f"{e}; last error: {last_error}") from last_error
+            try:
+                return self._send(address, request)
+            except WorkerError as e:
+                logger.warning(f"{e} (file {request['file']}, attempt {attempt + 1})")
+                self._mark_failed(address)
+                last_error = e
+        raise WorkerError(
+            f"Task for {request['file']} failed after {self.retries + 1} attempts: "
+            f"{last_error}"
+        )
+
+    def iter_responses(
+        self, file_paths: Iterable[str], request: Mapping[str, Any]
+    ) -> Iterator[Any]:
+        """
+        Выполняет задачу для каждого файла и выдает ответы в порядке файлов.
+
+        Одновременно выполняется не более PREFETCH_PER_WORKER задач на узел.
+
+        Args:
+            file_paths: Пути к файлам (список или поток путей).
+            request: Общие поля задачи (task и spec или columns).
+
+        Yields:
+            dict: Ответ узла для очередного файла.
+
+        Raises:
+            WorkerError: Если задача не выполнена ни на одном узле.
+        """
+        self._failed.clear()
+        max_pending = len(self.addresses) * PREFETCH_PER_WORKER
+        with ThreadPoolExecutor(len(self.addresses)) as executor:
+            pending: deque[Future[Any]] = deque()
+            try:
+                for file_path in iter_paths(file_paths):
+                    task = {
+                        **request,
+                        "file": file_path,
+                        "options": self._worker_options(),
+                    }
+                    if file_path == STDIN_PATH:
+                        # Стандартный ввод читается в текущем процессе
+                        future: Future[Any] = Future()
+                        try:
+                            future.set_result(handle_request(task))
+                        except Exception as e:
+                            future.set_exception(e)
+                        pending.append(future)
+                    else:
+                        pending.append(executor.submit(self._run, task))
+                    if len(pending) >= max_pending:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def read(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> list[EconomicRecord]:
+        """
+        Читает файлы на рабочих узлах.
+
+        Args:
+            file_paths: Пути к файлам.
+            columns: Проекция колонок.
+
+        Returns:
+            list[EconomicRecord]: Записи всех файлов в порядке файлов.
+        """
+        records = list(self.iter_records(file_paths, columns))
+        logger.info(f"Total records loaded: {len(records)}")
+        return records
+
+    def iter_records(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> Iterator[EconomicRecord]:
+        """
+        Читает файлы на рабочих узлах и выдает записи файл за файлом.
+
+        Args:
+            file_paths: Пути к файлам.
+            columns: Проекция колонок.
+
+        Yields:
+            EconomicRecord: Записи всех файлов.
+        """
+        request = {
+            "task": READ_TASK,
+            "columns": sorted(columns) if columns is not None else None,
+        }
+        for response in self.iter_responses(file_paths, request):
+            for values in response["records"]:
+                yield EconomicRecord(*values)
+
+    def aggregate(
+        self,
+        file_paths: Sequence[str],
+        spec: AggregateSpec,
+        memory_limit: int | None = None,
+    ) -> list[GroupStatistics] | None:
+        """
+        Агрегирует файлы на рабочих узлах и сливает частичные состояния.
+
+        Args:
+            file_paths: Пути к файлам.
+            spec: Спецификация агрегации.
+            memory_limit: Лимит памяти сливаемых групп в байтах; при
+                превышении группы выгружаются на диск (None - без лимита).
+
+        Returns:
+            list[GroupStatistics]: Результаты по группам.
+        """
+        request = {
+            "task": AGGREGATE_TASK,
+            "spec": {
+                "group_by": list(spec.group_by),
+                "aggregates": [f"{agg.func}:{agg.column}" for agg in spec.aggregates],
+            },
+        }
+        result = create_aggregator(spec, memory_limit)
+        for response in self.iter_responses(file_paths, request):
+            for key, count, values in response["partials"]:
+                result.merge_partial(tuple(key), count, values)
+        logger.info(
+            f"Aggregated {result.rows} records on {len(self.addresses)} workers"
+        )
+        return result.results()
+
+    def comoments(
+        self, file_paths: Sequence[str], indicators: Sequence[str]
+    ) -> dict[str, CoMoments] | None:
+        """
+        Накапливает совместные моменты на рабочих узлах и сливает их.
+
+        Args:
+            file_paths: Пути к файлам.
+            indicators: Числовые колонки.
+
+        Returns:
+            dict[str, CoMoments]: Накопители по странам.
+        """
+        request = {"task": COMOMENTS_TASK, "indicators": list(indicators)}
+        groups: dict[str, CoMoments] = {}
+        rows = 0
+        for response in self.iter_responses(file_paths, request):
+            rows += response["rows"]
+            CorrelationCalculator.merge(
+                groups,
+                {
+                    country: CoMoments.from_state(state)
+                    for country, state in response["groups"].items()
+                },
+            )
+        logger.info(f"Accumulated {rows} records on {len(self.addresses)} workers")
+        return groups
@@ -0,0 +1,185 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Mapping, Sequence
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    """
+    Фильтр строк, применяемый читателем до конвертации (predicate pushdown).
+
+    Строки отбрасываются по сырым строковым значениям, поэтому для них
+    не выполняются валидация, преобразование чисел и создание EconomicRecord.
+    Пустой фильтр пропускает все строки.
+    """
+
+    year_from: int | None = None
+    year_to: int | None = None
+    countries: frozenset[str] | None = None
+    continents: frozenset[str] | None = None
+
+    def __post_init__(self) -> None:
+        """Проверка согласованности диапазона лет."""
+        if (
+            self.year_from is not None
+            and self.year_to is not None
+            and self.year_from > self.year_to
+        ):
+            raise ValueError(f"Invalid year range: {self.year_from} > {self.year_to}")
+
+    @classmethod
+    def create(
+        cls,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        countries: Collection[str] | None = None,
+        continents: Collection[str] | None = None,
+    ) -> "RowFilter":
+        """
+        Создает фильтр из произвольных коллекций (например, из аргументов CLI).
+
+        Args:
+            year_from: Минимальный год (включительно).
+            year_to: Максимальный год (включительно).
+            countries: Допустимые страны.
+            continents: Допустимые континенты.
+
+        Returns:
+            RowFilter: Неизменяемый фильтр.
+        """
+        return cls(
+            year_from=year_from,
+            year_to=year_to,
+            countries=frozenset(c.strip() for c in countries) if countries else None,
+            continents=(
+                frozenset(c.strip() for c in continents) if continents else None
+            ),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """True, если фильтр не накладывает ограничений."""
+        return (
+            self.year_from is None
+            and self.year_to is None
+            and self.countries is None
+            and self.continents is None
+        )
+
+    @property
+    def columns(self) -> frozenset[str]:
+        """Колонки, которые нужны фильтру для принятия решения."""
+        columns = set()
+        if self.year_from is not None or self.year_to is not None:
+            columns.add("year")
+        if self.countries is not None:
+            columns.add("country")
+        if self.continents is not None:
+            columns.add("continent")
+        return frozenset(columns)
+
+    def without(self, columns: Collection[str]) -> "RowFilter":
+        """
+        Возвращает фильтр без ограничений на указанные колонки.
+
+        Args:
+            columns: Колонки, условия по которым снимаются.
+
+        Returns:
+            RowFilter: Новый фильтр.
+        """
+        return dataclasses.replace(
+            self,
+            year_from=None if "year" in columns else self.year_from,
+            year_to=None if "year" in columns else self.year_to,
+            countries=None if "country" in columns else self.countries,
+            continents=None if "continent" in columns else self.continents,
+        )
+
+    def accepts_partition(self, values: Mapping[str, Any]) -> bool:
+        """
+        Проверяет значения части колонок (например, раздела каталога).
+
+        Условия по колонкам, отсутствующим в values, не проверяются.
+
+        Args:
+            values: Словарь {колонка: значение}.
+
+        Returns:
+            bool: False, если ни одна строка с такими значениями
+                не проходит фильтр.
+        """
+        return self.without(self.columns - values.keys()).matches(values)
+
+    def accepts(self, country: Any, year: Any, continent: Any) -> bool:
+        """
+        Проверяет сырые значения полей строки.
+
+        Нечисловой год не отбрасывается: такую строку должна отклонить
+        валидация, а не фильтр.
+
+        Args:
+            country: Значение колонки country.
+            year: Значение колонки year (строка или число).
+            continent: Значение колонки continent.
+
+        Returns:
+            bool: True, если строка проходит фильтр.
+        """
+        if self.countries is not None and str(country).strip() not in self.countries:
+            return False
+        if self.continents is not None and (
+            str(continent).strip() not in self.continents
+        ):
+            return False
+        if self.year_from is not None or self.year_to is not None:
+            try:
+                year_value = int(year)
+            except (TypeError, ValueError):
+                return True
+            if self.year_from is not None and year_value < self.year_from:
+                return False
+            if self.year_to is not None and year_value > self.year_to:
+                return False
+        return True
+
+    def matches(self, row: Mapping[str, Any]) -> bool:
+        """
+        Проверяет строку, представленную словарем.
+
+        Args:
+            row: Словарь {колонка: значение}.
+
+        Returns:
+            bool: True, если строка проходит фильтр.
+        """
+        return self.accepts(
+            row.get("country", ""), row.get("year", ""), row.get("continent", "")
+        )
+
+    def compile(self, index: Mapping[str, int]) -> Callable[[Sequence[str]], bool]:
+        """
+        Строит предикат для строк CSV, представленных списком значений.
+
+        Позиции колонок вычисляются один раз по заголовку, поэтому
+        проверка строки не требует построения словаря.
+
+        Args:
+            index: Соответствие {колонка: позиция в строке CSV}.
+
+        Returns:
+            Callable: Предикат над списком сырых значений.
+        """
+        country_idx = index.get("country", -1)
+        year_idx = index.get("year", -1)
+        continent_idx = index.get("continent", -1)
+
+        def predicate(values: Sequence[str]) -> bool:
+            size = len(values)
+            return self.accepts(
+                values[country_idx] if 0 <= country_idx < size else "",
+                values[year_idx] if 0 <= year_idx < size else "",
+                values[continent_idx] if 0 <= continent_idx < size else "",
+            )
+
+        return predicate
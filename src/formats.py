@@ -0,0 +1,187 @@
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Collection, Iterator, Mapping, Sequence
+
+from src.arrow import ARROW_FILE_MAGIC, ARROW_STREAM_MAGIC, ArrowReader
+from src.calculator import AggregateSpec
+from src.jsonl import JSONLReader
+from src.models import EconomicRecord, GroupStatistics
+from src.reader import SNIFF_SIZE, STDIN_PATH, CSVReader, FileReader
+
+logger = logging.getLogger(__name__)
+
+CSV_FORMAT = "csv"
+JSONL_FORMAT = "jsonl"
+ARROW_FORMAT = "arrow"
+
+# Поддерживаемые форматы входных файлов
+FORMATS = (CSV_FORMAT, JSONL_FORMAT, ARROW_FORMAT)
+
+# Формат по расширению файла
+FORMAT_EXTENSIONS = {
+    ".csv": CSV_FORMAT,
+    ".tsv": CSV_FORMAT,
+    ".jsonl": JSONL_FORMAT,
+    ".ndjson": JSONL_FORMAT,
+    ".arrow": ARROW_FORMAT,
+    ".arrows": ARROW_FORMAT,
+    ".feather": ARROW_FORMAT,
+    ".ipc": ARROW_FORMAT,
+}
+
+# Метка порядка байтов UTF-8 в начале файла
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def detect_format_from_bytes(head: bytes) -> str:
+    """
+    Определяет формат по первым байтам содержимого.
+
+    Файл Arrow IPC начинается с сигнатуры ARROW1, поток Arrow - с
+    маркера сообщения; строка JSON Lines начинается с '{' (после BOM и
+    пробелов), строка CSV - с заголовка.
+
+    Args:
+        head: Начало файла.
+
+    Returns:
+        str: 'arrow', 'jsonl' или 'csv'.
+    """
+    if head.startswith((ARROW_FILE_MAGIC, ARROW_STREAM_MAGIC)):
+        return ARROW_FORMAT
+    text = head.removeprefix(_UTF8_BOM).lstrip()
+    return JSONL_FORMAT if text.startswith(b"{") else CSV_FORMAT
+
+
+def detect_format(file_path: str) -> str:
+    """
+    Определяет формат входного файла.
+
+    Известное расширение определяет формат без чтения файла. Иначе
+    проверяется начало содержимого: у обычного файла оно читается
+    отдельно, у стандартного ввода - просматривается в буфере без
+    извлечения (peek). Именованные каналы без расширения считаются CSV,
+    так как их начало нельзя прочитать повторно.
+
+    Args:
+        file_path: Путь к файлу ('-' - стандартный ввод).
+
+    Returns:
+        str: 'arrow', 'jsonl' или 'csv'.
+    """
+    if file_path == STDIN_PATH:
+        buffer = getattr(sys.stdin, "buffer", None)
+        peek = getattr(buffer, "peek", None)
+        return detect_format_from_bytes(peek(SNIFF_SIZE)) if peek else CSV_FORMAT
+
+    path = Path(file_path)
+    known = FORMAT_EXTENSIONS.get(path.suffix.lower())
+    if known is not None:
+        return known
+    if not path.is_file():
+        return CSV_FORMAT
+    with open(path, "rb") as f:
+        return detect_format_from_bytes(f.read(SNIFF_SIZE))
+
+
+class MultiFormatReader(FileReader):
+    """
+    Читатель, выбирающий формат каждого файла автоматически.
+
+    Файлы разных форматов можно передавать одним списком: каждый файл
+    читается читателем своего формата (по расширению или по содержимому).
+    Если читатели читают выборку строк, файл формата без выборки
+    отклоняется, а не читается целиком.
+    """
+
+    def __init__(self, readers: Mapping[str, FileReader] | None = None):
+        """
+        Args:
+            readers: Читатели по форматам (по умолчанию CSVReader,
+                JSONLReader и ArrowReader с настройками по умолчанию).
+
+        Raises:
+            ValueError: Если формат не поддерживается.
+        """
+        readers = dict(readers or {})
+        unknown = [name for name in readers if name not in FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown formats: {', '.join(unknown)}")
+        readers.setdefault(CSV_FORMAT, CSVReader())
+        readers.setdefault(JSONL_FORMAT, JSONLReader())
+        readers.setdefault(ARROW_FORMAT, ArrowReader())
+        self.readers = readers
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателей форматов (для ключей кеша)."""
+        return {name: reader.options for name, reader in self.readers.items()}
+
+    @property
+    def is_sampling(self) -> bool:
+        """True, если хотя бы один читатель формата читает выборку строк."""
+        return any(reader.is_sampling for reader in self.readers.values())
+
+    def _reader(self, file_format: str, file_path: str) -> FileReader:
+        """
+        Возвращает читатель формата.
+
+        Raises:
+            ValueError: Если читается выборка, а формат ее не поддерживает.
+        """
+        reader = self.readers[file_format]
+        if self.is_sampling and not reader.is_sampling:
+            raise ValueError(
+                f"Sampling is not supported for {file_format} input: {file_path}"
+            )
+        return reader
+
+    def read_file(
+        self,
+        file_path: str,
+        columns: Collection[str] | None = None,
+        partition: Mapping[str, str] | None = None,
+    ) -> Iterator[EconomicRecord]:
+        """Читает файл читателем его формата.
+
+        Args:
+            file_path: Путь к файлу ('-' - стандартный ввод).
+            columns: Проекция колонок.
+            partition: Значения колонок, общие для всех строк файла.
+
+        Returns:
+            Iterator[EconomicRecord]: Записи файла.
+        """
+        file_format = detect_format(file_path)
+        logger.debug(f"Detected {file_format} format for {file_path}")
+        return self._reader(file_format, file_path).read_file(
+            file_path, columns, partition
+        )
+
+    def aggregate(
+        self,
+        file_paths: Sequence[str],
+        spec: AggregateSpec,
+        memory_limit: int | None = None,
+    ) -> list[GroupStatistics] | None:
+        """
+        Передает агрегацию читателю формата, если все файлы одного формата.
+
+        Например, файлы Arrow агрегируются прямо над колонками; смешанный
+        список читается записями.
+
+        Args:
+            file_paths: Список путей к файлам.
+            spec: Спецификация агрегации.
+            memory_limit: Лимит памяти групп в байтах.
+
+        Returns:
+            list[GroupStatistics] | None: Группы или None.
+        """
+        file_formats = {detect_format(file_path) for file_path in file_paths}
+        if len(file_formats) != 1:
+            return None
+        return self._reader(file_formats.pop(), file_paths[0]).aggregate(
+            file_paths, spec, memory_limit
+        )
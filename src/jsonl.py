@@ -0,0 +1,165 @@
+import json
+import logging
+from typing import Any, Collection, Iterator, Mapping
+
+from src.filters import RowFilter
+from src.models import EconomicRecord
+from src.reader import (
+    FileReader,
+    check_sample_fraction,
+    open_source,
+    sample_lines,
+    sample_rng,
+)
+from src.utils.converters import EconomicDataConverter
+from src.utils.validators import EconomicDataValidator, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def _to_text(value: Any) -> str:
+    """
+    Представляет значение JSON так же, как оно выглядело бы в CSV.
+
+    null становится пустой строкой (отсутствующее значение), числа и
+    строки - своим текстом, поэтому проверки валидатора совпадают с CSV.
+
+    Raises:
+        TypeError: Если значение - объект или массив.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (dict, list)):
+        raise TypeError(f"expected a scalar, got {type(value).__name__}")
+    return json.dumps(value)
+
+
+class JSONLReader(FileReader):
+    """
+    Читатель файлов JSON Lines: один JSON объект с полями записи на строку.
+
+    Файл читается построчно. Значения приводятся к тексту и проверяются
+    тем же EconomicDataValidator, что и строки CSV; пустые строки
+    пропускаются. При выборке строки выбираются так же, как в CSVReader
+    (см. sample_lines).
+    """
+
+    def __init__(
+        self,
+        validator: EconomicDataValidator | None = None,
+        converter: EconomicDataConverter | None = None,
+        row_filter: RowFilter | None = None,
+        strict: bool = False,
+        sample_fraction: float | None = None,
+        sample_seed: int | None = None,
+    ):
+        """Инициализация читателя.
+
+        Args:
+            validator: Валидатор данных (создается по умолчанию).
+            converter: Конвертер данных (создается по умолчанию).
+            row_filter: Фильтр строк, применяемый до валидации и конвертации.
+            strict: Проверять и преобразовывать все колонки, даже если
+                запрошена только часть из них.
+            sample_fraction: Доля выбираемых строк (None - все строки).
+            sample_seed: Зерно выборки для воспроизводимых результатов.
+
+        Raises:
+            ValueError: Если доля выборки не в (0, 1].
+        """
+        check_sample_fraction(sample_fraction)
+        self.validator = validator or EconomicDataValidator()
+        self.converter = converter or EconomicDataConverter()
+        self.row_filter = row_filter
+        self.strict = strict
+        self.sample_fraction = sample_fraction
+        self.sample_seed = sample_seed
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return {
+            "row_filter": self.row_filter,
+            "strict": self.strict,
+            "sample_fraction": self.sample_fraction,
+            "sample_seed": self.sample_seed,
+        }
+
+    @property
+    def is_sampling(self) -> bool:
+        """True, если читается только выборка строк."""
+        return self.sample_fraction is not None and self.sample_fraction < 1
+
+    def read_file(
+        self,
+        file_path: str,
+        columns: Collection[str] | None = None,
+        partition: Mapping[str, str] | None = None,
+    ) -> Iterator[EconomicRecord]:
+        """Читает один файл JSON Lines и возвращает генератор записей.
+
+        Args:
+            file_path: Путь к файлу ('-' - стандартный ввод).
+            columns: Проекция - колонки, которые нужно проверить и
+                преобразовать (по умолчанию все). Игнорируется в строгом
+                режиме.
+            partition: Значения колонок, общие для всех строк файла.
+
+        Yields:
+            EconomicRecord: Объект с экономическими данными.
+
+        Raises:
+            FileNotFoundError: Если файл не существует.
+            ValidationError: При ошибках разбора JSON и валидации.
+        """
+        active_filter = (
+            self.row_filter
+            if self.row_filter is not None and not self.row_filter.is_empty
+            else None
+        )
+        projection = None if self.strict or columns is None else frozenset(columns)
+        checked = self.validator.REQUIRED_COLUMNS if projection is None else projection
+
+        logger.debug(f"Reading file: {file_path}")
+        skipped = 0
+        with open_source(file_path) as f:
+            lines: Iterator[tuple[int, str]] = enumerate(f, start=1)
+            if self.is_sampling and self.sample_fraction is not None:
+                rng = sample_rng(self.sample_seed, file_path)
+                lines = sample_lines(lines, self.sample_fraction, rng, header=False)
+            for line_num, line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    document = json.loads(line)
+                    if not isinstance(document, dict):
+                        raise TypeError(
+                            f"expected a JSON object, got {type(document).__name__}"
+                        )
+                    row = {
+                        str(key).strip().lower(): _to_text(value)
+                        for key, value in document.items()
+                    }
+                except (ValueError, TypeError) as e:
+                    logger.error(f"Invalid JSON in {file_path}:{line_num}: {e}")
+                    raise ValidationError(f"Line {line_num}: Invalid JSON - {e}") from e
+                if partition:
+                    row.update(partition)
+
+                if active_filter is not None and not active_filter.matches(row):
+                    skipped += 1
+                    continue
+
+                # Отсутствующие колонки - пустые значения, как в CSV
+                clean_row = {col: row.get(col, "") for col in checked}
+                try:
+                    self.validator.validate_row(clean_row, line_num, projection)
+                    yield self.converter.to_record(clean_row, projection)
+                except ValidationError as e:
+                    logger.error(f"Validation error in {file_path}:{line_num}: {e}")
+                    raise
+
+        if skipped:
+            logger.debug(f"Filtered out {skipped} rows from {file_path}")
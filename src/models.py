@@ -1,4 +1,8 @@
-from dataclasses import dataclass
+import math
+from array import array
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Iterable, Sequence
 
 
 @dataclass
@@ -25,7 +29,217 @@ class CountryStatistics:
     country: str
     average_gdp: float = 0.0
     years_count: int = 0
+    # Полуширина доверительного интервала среднего (None - точное значение)
+    margin: float | None = None
 
     def __post_init__(self) -> None:
         """Округление числовых значений."""
         self.average_gdp = round(self.average_gdp, 2)
+        if self.margin is not None:
+            self.margin = round(self.margin, 2)
+
+
+@dataclass
+class DescriptiveStatistics:
+    """DTO для описательной статистики показателя по стране."""
+
+    country: str
+    indicator: str
+    count: int
+    mean: float
+    stddev: float
+    min: float
+    max: float
+    median: float
+    p90: float
+    # True, если квантили оценены скетчем (большая группа)
+    approximate: bool = False
+
+    def __post_init__(self) -> None:
+        """Округление числовых значений."""
+        self.mean = round(self.mean, 2)
+        self.stddev = round(self.stddev, 2)
+        self.min = round(self.min, 2)
+        self.max = round(self.max, 2)
+        self.median = round(self.median, 2)
+        self.p90 = round(self.p90, 2)
+
+
+@dataclass
+class PivotTable:
+    """
+    DTO для сводной таблицы показателя: страны в строках, годы в колонках.
+
+    Значения хранятся плотным массивом array('d') по строкам
+    (values[i * len(years) + j] - страна i, год j); NaN - нет данных.
+    """
+
+    indicator: str
+    countries: list[str]
+    years: list[int]
+    values: array
+
+    def row(self, index: int) -> memoryview:
+        """Значения страны с номером index по годам (без копирования)."""
+        width = len(self.years)
+        return memoryview(self.values)[index * width : (index + 1) * width]
+
+    def cell(self, country: str, year: int) -> float | None:
+        """
+        Значение ячейки.
+
+        Returns:
+            float | None: Значение или None, если данных нет.
+        """
+        value = self.values[
+            self.countries.index(country) * len(self.years) + self.years.index(year)
+        ]
+        return None if math.isnan(value) else value
+
+
+@dataclass
+class CorrelationMatrix:
+    """
+    DTO для матриц ковариации и корреляции показателей.
+
+    Матрицы квадратные, строки и колонки в порядке indicators; NaN - пара
+    без достаточного числа наблюдений или с нулевой дисперсией.
+    """
+
+    # Страна или None для всех стран
+    country: str | None
+    indicators: list[str]
+    count: int
+    covariance: list[list[float]]
+    correlation: list[list[float]]
+
+    def __post_init__(self) -> None:
+        """Округление числовых значений."""
+        self.covariance = [[round(v, 4) for v in row] for row in self.covariance]
+        self.correlation = [[round(v, 4) for v in row] for row in self.correlation]
+
+
+@dataclass
+class Outlier:
+    """DTO для подозрительного значения показателя."""
+
+    country: str
+    year: int
+    indicator: str
+    value: float
+    # Метод обнаружения: zscore, mad или yoy
+    method: str
+    # z-оценка, робастная z-оценка, отношение или изменение к прошлому году
+    score: float
+    # Среднее, медиана или значение прошлого года
+    reference: float
+
+    def __post_init__(self) -> None:
+        """Округление числовых значений."""
+        self.value = round(self.value, 2)
+        # Четыре значащие цифры: отношение при падении на порядки меньше 0.01
+        self.score = float(f"{self.score:.4g}")
+        self.reference = round(self.reference, 2)
+
+
+@dataclass
+class RowDiff:
+    """DTO для строки (страна, год), различающейся в двух снимках данных."""
+
+    country: str
+    year: int
+    # Статус строки: added, removed или changed
+    status: str
+    # Различающиеся поля: {поле: (старое значение, новое значение)};
+    # для добавленных и удаленных строк - все поля с None на другой стороне
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class YearCoverage:
+    """DTO для покрытия лет данными по стране."""
+
+    country: str
+    first_year: int
+    last_year: int
+    # Число лет с данными
+    years_count: int
+    # Годы без данных между первым и последним
+    missing_years: list[int] = field(default_factory=list)
+    # Серии пропущенных лет: [(первый, последний), ...]
+    gaps: list[tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def span(self) -> int:
+        """Число лет от первого до последнего включительно."""
+        return self.last_year - self.first_year + 1
+
+    @property
+    def coverage(self) -> float:
+        """Доля лет с данными в периоде от первого до последнего года."""
+        return self.years_count / self.span
+
+    @property
+    def contiguous(self) -> bool:
+        """True, если в ряду нет пропущенных лет."""
+        return not self.missing_years
+
+
+@dataclass
+class CountryGrowth:
+    """DTO для показателей роста по стране."""
+
+    country: str
+    indicator: str
+    first_year: int
+    last_year: int
+    window: int
+    # Скользящие средние за window лет: [(год, значение), ...]
+    moving_averages: list[tuple[int, float]] = field(default_factory=list)
+    # Среднегодовой темп роста показателя, %
+    cagr: float | None = None
+    # Накопленный рост по gdp_growth за тот же период, %
+    cumulative_growth: float | None = None
+
+    @property
+    def latest_moving_average(self) -> float | None:
+        """Последнее значение скользящего среднего."""
+        return self.moving_averages[-1][1] if self.moving_averages else None
+
+
+@dataclass
+class GroupStatistics:
+    """DTO для результата агрегации по группе (например, по континенту)."""
+
+    key: dict[str, Any]
+    values: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class RecordBatch:
+    """
+    Колоночный пакет записей.
+    Значения каждой колонки хранятся отдельной последовательностью одной длины.
+    """
+
+    columns: dict[str, Sequence[Any]]
+    num_rows: int
+
+    @classmethod
+    def from_records(
+        cls, records: Sequence[EconomicRecord], columns: Iterable[str]
+    ) -> "RecordBatch":
+        """
+        Собирает пакет из записей, извлекая только указанные колонки.
+
+        Args:
+            records: Записи пакета.
+            columns: Извлекаемые колонки.
+
+        Returns:
+            RecordBatch: Колоночное представление записей.
+        """
+        return cls(
+            columns={col: list(map(attrgetter(col), records)) for col in columns},
+            num_rows=len(records),
+        )
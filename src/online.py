@@ -0,0 +1,172 @@
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+from src.calculator import (
+    DEFAULT_BATCH_SIZE,
+    AggregateCalculator,
+    HashAggregator,
+    iter_batches,
+)
+from src.models import EconomicRecord, RecordBatch
+
+logger = logging.getLogger(__name__)
+
+# Интервал промежуточных результатов по умолчанию (секунды)
+DEFAULT_PROGRESS_INTERVAL = 1.0
+
+StatsT = TypeVar("StatsT")
+
+
+@dataclass
+class OnlineSnapshot(Generic[StatsT]):
+    """Текущий результат онлайн-агрегации."""
+
+    statistics: list[StatsT]
+    # Число обработанных записей
+    rows: int
+    # Время с начала чтения (секунды)
+    elapsed: float
+    # Результат получен не по всем данным (промежуточный или по дедлайну)
+    partial: bool
+    # Чтение остановлено по дедлайну
+    deadline_reached: bool = False
+
+    @property
+    def summary(self) -> str:
+        """Строка состояния результата для вывода перед отчетом."""
+        if self.deadline_reached:
+            status = "PARTIAL RESULT (deadline reached)"
+        elif self.partial:
+            status = "PROGRESS"
+        else:
+            status = "COMPLETE"
+        return f"[{status}] {self.rows:,} rows processed in {self.elapsed:.1f} s"
+
+
+class OnlineAggregation(Generic[StatsT]):
+    """
+    Онлайн-агрегация: результат калькулятора доступен во время чтения.
+
+    Записи агрегируются колоночными пакетами. Между пакетами с заданным
+    интервалом вызывается on_progress с текущим результатом (finalize по
+    накопленным группам), а по истечении дедлайна чтение прекращается и
+    возвращается результат по уже прочитанным записям с признаком partial.
+    Время проверяется между пакетами, поэтому дедлайн может быть превышен
+    на время чтения одного пакета. Конец данных после дедлайна проверяется
+    чтением одной записи, которая учитывается в частичном результате.
+    """
+
+    def __init__(
+        self,
+        calculator: AggregateCalculator[StatsT],
+        deadline: float | None = None,
+        progress_interval: float | None = None,
+        on_progress: Callable[[OnlineSnapshot[StatsT]], None] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            calculator: Агрегирующий калькулятор отчета.
+            deadline: Бюджет времени на чтение (секунды, None - без ограничения).
+            progress_interval: Интервал промежуточных результатов (секунды,
+                по умолчанию DEFAULT_PROGRESS_INTERVAL).
+            on_progress: Получатель промежуточных результатов.
+            batch_size: Размер пакета записей.
+            clock: Источник времени (секунды).
+
+        Raises:
+            ValueError: Если интервалы не положительны или калькулятор
+                использует лимит памяти (выгрузка групп на диск не позволяет
+                получать промежуточные результаты).
+        """
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"deadline must be positive, got {deadline}")
+        if progress_interval is not None and progress_interval <= 0:
+            raise ValueError(
+                f"progress_interval must be positive, got {progress_interval}"
+            )
+        if calculator.memory_limit is not None:
+            raise ValueError("Online aggregation does not support a memory limit")
+        self.calculator = calculator
+        self.deadline = deadline
+        self.progress_interval = (
+            progress_interval or DEFAULT_PROGRESS_INTERVAL
+            if on_progress is not None
+            else None
+        )
+        self.on_progress = on_progress
+        self.batch_size = batch_size
+        self.clock = clock
+
+    def snapshot(
+        self,
+        aggregator: HashAggregator,
+        elapsed: float,
+        partial: bool,
+        deadline_reached: bool = False,
+    ) -> OnlineSnapshot[StatsT]:
+        """Формирует результат по накопленным группам."""
+        statistics = (
+            self.calculator.finalize(aggregator.results()) if aggregator.rows else []
+        )
+        return OnlineSnapshot(
+            statistics=statistics,
+            rows=aggregator.rows,
+            elapsed=elapsed,
+            partial=partial,
+            deadline_reached=deadline_reached,
+        )
+
+    def run(self, records: Iterable[EconomicRecord]) -> OnlineSnapshot[StatsT]:
+        """
+        Агрегирует записи до конца потока или до дедлайна.
+
+        Args:
+            records: Поток записей. Генератор закрывается при остановке по
+                дедлайну, чтобы читатель освободил файлы.
+
+        Returns:
+            OnlineSnapshot: Итоговый результат.
+        """
+        aggregator = HashAggregator(self.calculator.spec)
+        start = self.clock()
+        interval = self.progress_interval or math.inf
+        next_progress = start + interval
+        columns = self.calculator.spec.columns
+        # iter_batches читает source без упреждения: после пакета источник
+        # стоит на первой непрочитанной записи
+        source = iter(records)
+        batches = iter_batches(source, columns, self.batch_size)
+
+        try:
+            for batch in batches:
+                aggregator.update(batch)
+                now = self.clock()
+                elapsed = now - start
+                if self.deadline is not None and elapsed >= self.deadline:
+                    # Данные могли закончиться одновременно с дедлайном:
+                    # проверяется одна запись, а не следующий пакет
+                    record = next(source, None)
+                    if record is None:
+                        break
+                    aggregator.update(RecordBatch.from_records([record], columns))
+                    logger.warning(
+                        f"Deadline of {self.deadline:g} s reached after "
+                        f"{aggregator.rows} records"
+                    )
+                    return self.snapshot(aggregator, elapsed, True, True)
+                if now >= next_progress and self.on_progress is not None:
+                    self.on_progress(self.snapshot(aggregator, elapsed, True))
+                    next_progress = now + interval
+        finally:
+            close: Any = getattr(records, "close", None)
+            if close is not None:
+                close()
+
+        if aggregator.rows == 0:
+            logger.warning("No records provided for calculation")
+        return self.snapshot(aggregator, self.clock() - start, False)
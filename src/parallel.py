@@ -0,0 +1,491 @@
+import logging
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from itertools import repeat
+from multiprocessing import resource_tracker, shared_memory
+from types import TracebackType
+from typing import Any, Collection, Iterable, Iterator, Sequence
+
+from src.calculator import (
+    DEFAULT_BATCH_SIZE,
+    AggregateSpec,
+    HashAggregator,
+    create_aggregator,
+)
+from src.columnar import RECORD_TYPECODES
+from src.models import EconomicRecord, GroupStatistics, RecordBatch
+from src.reader import STDIN_PATH, CSVReader, DataReader, FileReader, iter_paths
+from src.utils.converters import FIELD_DEFAULTS
+
+logger = logging.getLogger(__name__)
+
+# Тип кодов строковых колонок (индекс значения в словаре колонки)
+DICTIONARY_TYPECODE = "i"
+
+# Выравнивание колонок внутри блока разделяемой памяти (байт)
+COLUMN_ALIGNMENT = 8
+
+# Число файлов, обрабатываемых заранее, на один рабочий процесс
+PREFETCH_PER_WORKER = 2
+
+_RECORD_FIELDS = tuple(field.name for field in fields(EconomicRecord))
+
+# Читатель рабочего процесса (задается инициализатором пула)
+_worker_reader: FileReader | None = None
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    """Описание колонки в блоке разделяемой памяти."""
+
+    name: str
+    typecode: str
+    offset: int
+    # Значения строковой колонки; в памяти хранятся их индексы
+    dictionary: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class SharedTableDescriptor:
+    """
+    Дескриптор таблицы, записанной рабочим процессом в разделяемую память.
+    Передается родителю вместо записей: содержит только имя блока и смещения.
+    """
+
+    source: str
+    shm_name: str
+    num_rows: int
+    columns: tuple[SharedColumn, ...]
+
+
+def _encode_columns(
+    records: Iterable[EconomicRecord], names: Sequence[str]
+) -> tuple[int, dict[str, array], dict[str, dict[str, int]]]:
+    """
+    Раскладывает записи по колонкам array.array за один проход.
+
+    Строковые колонки кодируются словарем: значение заменяется индексом
+    первого появления.
+
+    Returns:
+        tuple: Число строк, колонки и словари строковых колонок.
+    """
+    columns: dict[str, array] = {}
+    dictionaries: dict[str, dict[str, int]] = {}
+    for name in names:
+        typecode = RECORD_TYPECODES[name]
+        if typecode is None:
+            dictionaries[name] = {}
+            typecode = DICTIONARY_TYPECODE
+        columns[name] = array(typecode)
+
+    appenders = []
+    for name in names:
+        append = columns[name].append
+        dictionary = dictionaries.get(name)
+        appenders.append((name, append, dictionary))
+
+    num_rows = 0
+    for record in records:
+        for name, append, dictionary in appenders:
+            value = getattr(record, name)
+            if dictionary is not None:
+                code = dictionary.get(value)
+                if code is None:
+                    code = dictionary[value] = len(dictionary)
+                value = code
+            append(value)
+        num_rows += 1
+    return num_rows, columns, dictionaries
+
+
+def load_shared(
+    reader: FileReader, file_path: str, columns: Collection[str] | None = None
+) -> SharedTableDescriptor:
+    """
+    Читает файл и записывает его колонки в новый блок разделяемой памяти.
+
+    Блок не удаляется: его освобождает получатель (SharedTable.release).
+
+    Args:
+        reader: Читатель файлов.
+        file_path: Путь к файлу.
+        columns: Колонки таблицы (по умолчанию все поля EconomicRecord).
+
+    Returns:
+        SharedTableDescriptor: Дескриптор блока.
+
+    Raises:
+        FileNotFoundError: Если файл не существует.
+        ValidationError: При ошибках валидации.
+    """
+    wanted = None if columns is None else set(columns)
+    names = [name for name in _RECORD_FIELDS if wanted is None or name in wanted]
+    num_rows, data, dictionaries = _encode_columns(
+        reader.read_file(file_path, columns), names
+    )
+
+    layout = []
+    size = 0
+    for name in names:
+        layout.append((name, size))
+        nbytes = len(data[name]) * data[name].itemsize
+        size += -(-nbytes // COLUMN_ALIGNMENT) * COLUMN_ALIGNMENT
+
+    # Блок нулевого размера создать нельзя
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    buffer = shm.buf
+    assert buffer is not None
+    try:
+        for name, offset in layout:
+            view = memoryview(data[name]).cast("B")
+            buffer[offset : offset + len(view)] = view
+            view.release()
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+
+    return SharedTableDescriptor(
+        source=file_path,
+        shm_name=shm.name,
+        num_rows=num_rows,
+        columns=tuple(
+            SharedColumn(
+                name=name,
+                typecode=data[name].typecode,
+                offset=offset,
+                dictionary=(
+                    tuple(dictionaries[name]) if name in dictionaries else None
+                ),
+            )
+            for name, offset in layout
+        ),
+    )
+
+
+def _init_worker(reader: FileReader) -> None:
+    """Инициализатор рабочего процесса: сохраняет читатель."""
+    global _worker_reader
+    _worker_reader = reader
+
+
+def _worker_load(
+    file_path: str, columns: Collection[str] | None
+) -> SharedTableDescriptor:
+    """Задача рабочего процесса."""
+    assert _worker_reader is not None
+    return load_shared(_worker_reader, file_path, columns)
+
+
+class SharedTable:
+    """
+    Таблица в разделяемой памяти, присоединенная получателем.
+
+    Числовые колонки - memoryview над блоком (без копирования), строковые -
+    memoryview индексов и словарь значений. После release() представления
+    недействительны, а блок удаляется.
+    """
+
+    def __init__(self, descriptor: SharedTableDescriptor):
+        """
+        Args:
+            descriptor: Дескриптор, полученный от load_shared.
+        """
+        self.source = descriptor.source
+        self.num_rows = descriptor.num_rows
+        shm = shared_memory.SharedMemory(name=descriptor.shm_name)
+        self._shm: shared_memory.SharedMemory | None = shm
+        buffer = shm.buf
+        assert buffer is not None
+        self.columns: dict[str, memoryview] = {}
+        self.dictionaries: dict[str, tuple[str, ...]] = {}
+        for column in descriptor.columns:
+            nbytes = array(column.typecode).itemsize * self.num_rows
+            view = buffer[column.offset : column.offset + nbytes]
+            self.columns[column.name] = view.cast(
+                column.typecode  # type: ignore[call-overload]
+            )
+            if column.dictionary is not None:
+                self.dictionaries[column.name] = column.dictionary
+
+    def __enter__(self) -> "SharedTable":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def values(self, name: str) -> Iterable[Any]:
+        """
+        Возвращает значения колонки (строковые колонки декодируются).
+
+        Args:
+            name: Имя колонки.
+        """
+        dictionary = self.dictionaries.get(name)
+        if dictionary is None:
+            return self.columns[name]
+        return map(dictionary.__getitem__, self.columns[name])
+
+    def batches(
+        self, names: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[RecordBatch]:
+        """
+        Разбивает колонки на пакеты срезами memoryview (без копирования).
+
+        Строковые колонки передаются кодами словаря.
+
+        Args:
+            names: Колонки пакетов.
+            batch_size: Максимальное число строк в пакете.
+
+        Yields:
+            RecordBatch: Очередной пакет.
+        """
+        names = tuple(names)
+        for start in range(0, self.num_rows, batch_size):
+            stop = min(start + batch_size, self.num_rows)
+            yield RecordBatch(
+                columns={name: self.columns[name][start:stop] for name in names},
+                num_rows=stop - start,
+            )
+
+    def aggregate(self, spec: AggregateSpec) -> HashAggregator:
+        """
+        Выполняет агрегацию непосредственно над колонками блока.
+
+        Группы строятся по кодам строковых колонок; ключи декодируются
+        при слиянии (см. decode_key).
+
+        Args:
+            spec: Спецификация агрегации.
+
+        Returns:
+            HashAggregator: Агрегатор с группами этого файла.
+        """
+        aggregator = HashAggregator(spec)
+        for batch in self.batches(spec.columns):
+            aggregator.update(batch)
+        return aggregator
+
+    def decode_key(self, names: Sequence[str], key: Sequence[Any]) -> tuple[Any, ...]:
+        """Заменяет коды строковых колонок ключа группы их значениями."""
+        return tuple(
+            self.dictionaries[name][value] if name in self.dictionaries else value
+            for name, value in zip(names, key, strict=True)
+        )
+
+    def records(self) -> Iterator[EconomicRecord]:
+        """
+        Создает записи из колонок (отсутствующие поля - значения по умолчанию).
+
+        Yields:
+            EconomicRecord: Записи в порядке файла.
+        """
+        iterables = [
+            self.values(name) if name in self.columns else repeat(FIELD_DEFAULTS[name])
+            for name in _RECORD_FIELDS
+        ]
+        yield from map(EconomicRecord, *iterables)
+
+    def release(self) -> None:
+        """Освобождает представления, закрывает и удаляет блок."""
+        if self._shm is None:
+            return
+        for view in self.columns.values():
+            view.release()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+
+def discard_shared(descriptor: SharedTableDescriptor) -> None:
+    """Удаляет блок, который не будет прочитан."""
+    try:
+        shm = shared_memory.SharedMemory(name=descriptor.shm_name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+class ParallelCSVReader(DataReader):
+    """
+    Параллельный читатель CSV файлов.
+
+    Рабочие процессы разбирают файлы и записывают колонки в разделяемую
+    память (multiprocessing.shared_memory), строковые колонки кодируются
+    словарем. Родителю возвращаются только дескрипторы, поэтому записи
+    не сериализуются pickle. Агрегация (aggregate) выполняется прямо над
+    блоками разделяемой памяти.
+    """
+
+    def __init__(
+        self,
+        reader: FileReader | None = None,
+        workers: int | None = None,
+    ):
+        """
+        Args:
+            reader: Читатель отдельных файлов (передается рабочим процессам).
+            workers: Число рабочих процессов (по умолчанию - число CPU).
+
+        Raises:
+            ValueError: Если число процессов меньше 1.
+        """
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        self.reader = reader or CSVReader()
+        self.workers = workers
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return self.reader.options
+
+    def _submit(
+        self,
+        executor: ProcessPoolExecutor,
+        file_path: str,
+        columns: Collection[str] | None,
+    ) -> "Future[SharedTableDescriptor]":
+        """Ставит файл в очередь; стандартный ввод читается в текущем процессе."""
+        if file_path != STDIN_PATH:
+            return executor.submit(_worker_load, file_path, columns)
+        future: Future[SharedTableDescriptor] = Future()
+        try:
+            future.set_result(load_shared(self.reader, file_path, columns))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def iter_tables(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> Iterator[SharedTable]:
+        """
+        Читает файлы в рабочих процессах и выдает таблицы в порядке файлов.
+
+        Заранее обрабатывается не более PREFETCH_PER_WORKER файлов на
+        процесс, поэтому разделяемая память занята ограниченным числом
+        блоков. Получатель освобождает таблицу (release или with).
+
+        Args:
+            file_paths: Пути к CSV файлам.
+            columns: Колонки таблиц (см. load_shared).
+
+        Yields:
+            SharedTable: Таблица очередного файла.
+
+        Raises:
+            ValueError: Если список файлов пуст.
+            FileNotFoundError: Если файл не существует.
+            ValidationError: При ошибках валидации.
+        """
+        # Рабочие процессы должны использовать трекер ресурсов родителя,
+        # иначе при их завершении он удалит еще не прочитанные блоки
+        resource_tracker.ensure_running()
+        max_pending = self.workers * PREFETCH_PER_WORKER
+        with ProcessPoolExecutor(
+            self.workers, initializer=_init_worker, initargs=(self.reader,)
+        ) as executor:
+            pending: deque[Future[SharedTableDescriptor]] = deque()
+            try:
+                for file_path in iter_paths(file_paths):
+                    pending.append(self._submit(executor, file_path, columns))
+                    if len(pending) >= max_pending:
+                        yield SharedTable(pending.popleft().result())
+                while pending:
+                    yield SharedTable(pending.popleft().result())
+            finally:
+                # Блоки файлов, которые уже не будут прочитаны
+                for future in pending:
+                    if future.cancel():
+                        continue
+                    try:
+                        discard_shared(future.result())
+                    except Exception:
+                        pass
+
+    def read(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> list[EconomicRecord]:
+        """
+        Читает все CSV файлы параллельно.
+
+        Args:
+            file_paths: Пути к CSV файлам.
+            columns: Проекция колонок (см. CSVReader.read_file).
+
+        Returns:
+            list[EconomicRecord]: Записи всех файлов в порядке файлов.
+        """
+        all_records: list[EconomicRecord] = []
+        for table in self.iter_tables(file_paths, columns):
+            with table:
+                all_records.extend(table.records())
+            logger.info(f"Loaded {len(table)} records from {table.source}")
+
+        logger.info(f"Total records loaded: {len(all_records)}")
+        return all_records
+
+    def iter_records(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> Iterator[EconomicRecord]:
+        """
+        Читает CSV файлы параллельно и выдает записи файл за файлом.
+
+        Args:
+            file_paths: Пути к CSV файлам.
+            columns: Проекция колонок (см. CSVReader.read_file).
+
+        Yields:
+            EconomicRecord: Записи всех файлов.
+        """
+        for table in self.iter_tables(file_paths, columns):
+            with table:
+                yield from table.records()
+
+    def aggregate(
+        self,
+        file_paths: Sequence[str],
+        spec: AggregateSpec,
+        memory_limit: int | None = None,
+    ) -> list[GroupStatistics] | None:
+        """
+        Агрегирует файлы над разделяемой памятью.
+
+        Каждая таблица агрегируется по кодам словаря, затем частичные
+        группы с декодированными ключами сливаются в общий агрегатор
+        в порядке файлов.
+
+        Args:
+            file_paths: Пути к CSV файлам.
+            spec: Спецификация агрегации.
+            memory_limit: Лимит памяти сливаемых групп в байтах; при
+                превышении группы выгружаются на диск (None - без лимита).
+
+        Returns:
+            list[GroupStatistics]: Результаты по группам.
+        """
+        result = create_aggregator(spec, memory_limit)
+        for table in self.iter_tables(file_paths, spec.columns):
+            with table:
+                for key, count, values in table.aggregate(spec).partials():
+                    result.merge_partial(
+                        table.decode_key(spec.group_by, key), count, values
+                    )
+            logger.info(f"Aggregated {len(table)} records from {table.source}")
+        return result.results()
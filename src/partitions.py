@@ -0,0 +1,382 @@
+import csv
+import dataclasses
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from itertools import chain
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Collection, Iterable, Iterator, Sequence, TextIO
+from urllib.parse import quote, unquote
+
+from src.discovery import DEFAULT_INCLUDE, discover_files
+from src.filters import RowFilter
+from src.models import EconomicRecord
+from src.reader import CSVReader, DataReader, FileReader, iter_paths
+
+logger = logging.getLogger(__name__)
+
+# Колонки, по которым можно разбивать набор данных
+PARTITION_KEYS = tuple(field.name for field in dataclasses.fields(EconomicRecord))
+
+# Разбиение по умолчанию: root/year=2023/continent=Europe/*.csv
+DEFAULT_PARTITION_BY = ("year", "continent")
+
+# Разделитель ключа и значения в имени каталога раздела
+PARTITION_SEPARATOR = "="
+
+# Суффикс файла, который еще записывается (не подходит под шаблон *.csv)
+PENDING_SUFFIX = ".tmp"
+
+# Число одновременно открытых файлов разделов при записи
+DEFAULT_MAX_OPEN_FILES = 64
+
+
+def parse_partition(name: str) -> tuple[str, str] | None:
+    """
+    Разбирает имя каталога раздела вида 'ключ=значение'.
+
+    Args:
+        name: Имя каталога.
+
+    Returns:
+        tuple[str, str] | None: Колонка и значение или None, если каталог
+            не является разделом.
+    """
+    key, separator, value = name.partition(PARTITION_SEPARATOR)
+    if not separator or key not in PARTITION_KEYS:
+        return None
+    return key, unquote(value)
+
+
+def format_partition(key: str, value: Any) -> str:
+    """
+    Формирует имя каталога раздела.
+
+    Символы, недопустимые в имени каталога ('/', '=' и др.), кодируются
+    как в URL, пробелы сохраняются.
+
+    Args:
+        key: Колонка раздела.
+        value: Значение колонки.
+
+    Returns:
+        str: Имя каталога, например 'continent=North America'.
+    """
+    return f"{key}{PARTITION_SEPARATOR}{quote(str(value), safe=' ')}"
+
+
+def partition_values(relative_path: str | Path) -> dict[str, str]:
+    """
+    Извлекает значения колонок из каталогов относительного пути файла.
+
+    Args:
+        relative_path: Путь файла относительно корня набора данных.
+
+    Returns:
+        dict[str, str]: Значения колонок раздела.
+    """
+    values = {}
+    for part in Path(relative_path).parent.parts:
+        partition = parse_partition(part)
+        if partition is not None:
+            key, value = partition
+            values[key] = value
+    return values
+
+
+class PartitionedReader(DataReader):
+    """
+    Читатель набора данных, разбитого по каталогам (Hive-style).
+
+    Пути, передаваемые в read, - корни наборов данных вида
+    root/year=2023/continent=Europe/*.csv. Значения колонок раздела берутся
+    из имен каталогов, в самих файлах эти колонки могут отсутствовать.
+    Каталоги разделов, не проходящие фильтр строк, отбрасываются до
+    открытия файлов. Файлы читаются вложенным CSVReader.
+    """
+
+    def __init__(
+        self,
+        reader: CSVReader | None = None,
+        include: Sequence[str] = DEFAULT_INCLUDE,
+    ):
+        """
+        Args:
+            reader: Читатель файлов разделов (фильтр строк берется из него).
+            include: Шаблоны имен файлов данных.
+        """
+        self.reader = reader or CSVReader()
+        self.include = include
+
+    @property
+    def row_filter(self) -> RowFilter | None:
+        """Фильтр строк вложенного читателя."""
+        return self.reader.row_filter
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return {
+            **self.reader.options,
+            "partitioned": True,
+            "include": list(self.include),
+        }
+
+    def _accepts_dir(self, name: str) -> bool:
+        """Проверяет каталог раздела по фильтру строк."""
+        partition = parse_partition(name)
+        if partition is None or self.row_filter is None:
+            return True
+        key, value = partition
+        if self.row_filter.accepts_partition({key: value}):
+            return True
+        logger.debug(f"Pruned partition {name}")
+        return False
+
+    def iter_files(self, root: str) -> Iterator[tuple[str, dict[str, str]]]:
+        """
+        Находит файлы набора данных, не отброшенные фильтром.
+
+        Args:
+            root: Корневой каталог набора данных.
+
+        Yields:
+            tuple[str, dict[str, str]]: Путь к файлу и значения раздела.
+
+        Raises:
+            FileNotFoundError: Если каталог не существует.
+        """
+        # Каталоги разделов невелики: порядок имен делает порядок записей
+        # (и агрегат 'last') воспроизводимым
+        for path in discover_files(
+            root, self.include, accept_dir=self._accepts_dir, sort=True
+        ):
+            yield path, partition_values(os.path.relpath(path, root))
+
+    def source_files(self, file_paths: Iterable[str]) -> Iterator[str]:
+        """
+        Файлы данных наборов, не отброшенные фильтром.
+
+        Сводки-спутники, незавершенные файлы .tmp и другие файлы, не
+        подходящие под include, в ключ кеша не входят.
+
+        Args:
+            file_paths: Корневые каталоги наборов данных.
+
+        Yields:
+            str: Путь к файлу данных.
+        """
+        for root in iter_paths(file_paths):
+            for path, _ in self.iter_files(root):
+                yield path
+
+    def read(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> list[EconomicRecord]:
+        """
+        Читает все файлы наборов данных.
+
+        Args:
+            file_paths: Корневые каталоги наборов данных.
+            columns: Проекция колонок (см. CSVReader.read_file).
+
+        Returns:
+            list[EconomicRecord]: Записи всех разделов.
+
+        Raises:
+            ValueError: Если список каталогов пуст.
+            FileNotFoundError: Если каталог не существует.
+        """
+        all_records = []
+        for root in iter_paths(file_paths):
+            loaded = 0
+            for path, partition in self.iter_files(root):
+                records = list(self.reader.read_file(path, columns, partition))
+                all_records.extend(records)
+                loaded += len(records)
+            logger.info(f"Loaded {loaded} records from dataset {root}")
+
+        logger.info(f"Total records loaded: {len(all_records)}")
+        return all_records
+
+    def iter_records(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> Iterator[EconomicRecord]:
+        """
+        Читает наборы данных потоком, файл за файлом.
+
+        Args:
+            file_paths: Корневые каталоги наборов данных.
+            columns: Проекция колонок (см. CSVReader.read_file).
+
+        Returns:
+            Iterator[EconomicRecord]: Записи всех разделов.
+        """
+        return chain.from_iterable(
+            self.reader.read_file(path, columns, partition)
+            for root in iter_paths(file_paths)
+            for path, partition in self.iter_files(root)
+        )
+
+
+class PartitionedWriter:
+    """
+    Запись записей в набор данных, разбитый по каталогам (Hive-style).
+
+    Каждый раздел получает файл part-<id>.csv без колонок раздела.
+    Файлы пишутся с суффиксом .tmp и переименовываются при успешном
+    закрытии писателя; при ошибке они удаляются, поэтому читатели не
+    видят частично записанных данных. Повторная запись в тот же каталог
+    добавляет новые файлы, не изменяя существующие.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        partition_by: Sequence[str] = DEFAULT_PARTITION_BY,
+        max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+    ):
+        """
+        Args:
+            root: Корневой каталог набора данных (создается при записи).
+            partition_by: Колонки разбиения в порядке вложенности каталогов.
+            max_open_files: Предел одновременно открытых файлов; реже всего
+                используемые файлы закрываются и дописываются позже.
+
+        Raises:
+            ValueError: Если колонки разбиения не заданы, повторяются или
+                неизвестны.
+        """
+        unknown = [key for key in partition_by if key not in PARTITION_KEYS]
+        if unknown:
+            raise ValueError(f"Unknown partition columns: {', '.join(unknown)}")
+        if not partition_by or len(set(partition_by)) != len(partition_by):
+            raise ValueError("Partition columns must be unique and non-empty")
+        if max_open_files < 1:
+            raise ValueError(f"max_open_files must be positive, got {max_open_files}")
+
+        self.root = Path(root)
+        self.partition_by = tuple(partition_by)
+        self.columns = [key for key in PARTITION_KEYS if key not in self.partition_by]
+        self.max_open_files = max_open_files
+        self._file_name = f"part-{uuid.uuid4().hex[:12]}.csv"
+        self._open: OrderedDict[tuple[Any, ...], tuple[TextIO, Any]] = OrderedDict()
+        self._pending: dict[tuple[Any, ...], Path] = {}
+
+    def __enter__(self) -> "PartitionedWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _writer(self, key: tuple[Any, ...]) -> Any:
+        """Возвращает csv.writer файла раздела, открывая файл при необходимости."""
+        if key in self._open:
+            self._open.move_to_end(key)
+            return self._open[key][1]
+
+        if len(self._open) >= self.max_open_files:
+            _, (evicted, _) = self._open.popitem(last=False)
+            evicted.close()
+
+        path = self._pending.get(key)
+        is_new = path is None
+        if path is None:
+            directory = self.root.joinpath(
+                *(
+                    format_partition(column, value)
+                    for column, value in zip(self.partition_by, key, strict=True)
+                )
+            )
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"{self._file_name}{PENDING_SUFFIX}"
+            self._pending[key] = path
+
+        f = open(path, "a", newline="", encoding="utf-8")
+        writer = csv.writer(f)
+        if is_new:
+            writer.writerow(self.columns)
+        self._open[key] = (f, writer)
+        return writer
+
+    def write(self, records: Iterable[EconomicRecord]) -> int:
+        """
+        Раскладывает записи по файлам разделов.
+
+        Args:
+            records: Экономические записи.
+
+        Returns:
+            int: Число записанных записей.
+        """
+        count = 0
+        for record in records:
+            key = tuple(getattr(record, column) for column in self.partition_by)
+            self._writer(key).writerow(
+                [getattr(record, column) for column in self.columns]
+            )
+            count += 1
+        return count
+
+    def _close_files(self) -> None:
+        for f, _ in self._open.values():
+            f.close()
+        self._open.clear()
+
+    def close(self) -> None:
+        """Закрывает файлы и публикует их (снимает суффикс .tmp)."""
+        self._close_files()
+        for path in self._pending.values():
+            os.replace(path, path.with_name(path.name.removesuffix(PENDING_SUFFIX)))
+        logger.info(f"Wrote {len(self._pending)} partition file(s) to {self.root}")
+        self._pending.clear()
+
+    def abort(self) -> None:
+        """Закрывает и удаляет незавершенные файлы."""
+        self._close_files()
+        for path in self._pending.values():
+            path.unlink(missing_ok=True)
+        self._pending.clear()
+
+
+def write_dataset(
+    file_paths: Iterable[str],
+    root: str | Path,
+    partition_by: Sequence[str] = DEFAULT_PARTITION_BY,
+    reader: FileReader | None = None,
+) -> int:
+    """
+    Загружает CSV файлы в набор данных, разбитый по каталогам.
+
+    Args:
+        file_paths: Пути к CSV файлам.
+        root: Корневой каталог набора данных.
+        partition_by: Колонки разбиения.
+        reader: Читатель файлов (по умолчанию - CSVReader со строгой
+            валидацией).
+
+    Returns:
+        int: Общее число записанных записей.
+
+    Raises:
+        FileNotFoundError: Если один из файлов не существует.
+        ValidationError: При ошибках валидации данных (файлы не публикуются).
+    """
+    reader = reader or CSVReader(strict=True)
+    total = 0
+    with PartitionedWriter(root, partition_by) as writer:
+        for file_path in file_paths:
+            written = writer.write(reader.read_file(file_path))
+            logger.info(f"Partitioned {written} records from {file_path}")
+            total += written
+    return total
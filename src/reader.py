@@ -1,47 +1,478 @@
 import csv
+import io
 import logging
+import math
+import random
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from itertools import chain, islice
 from pathlib import Path
-from typing import Generator
+from stat import S_ISCHR, S_ISFIFO
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TextIO,
+    TypeVar,
+)
 
-from src.models import EconomicRecord
+from src.filters import RowFilter
+from src.models import EconomicRecord, GroupStatistics
+from src.utils.accumulators import CoMoments
 from src.utils.converters import EconomicDataConverter
 from src.utils.validators import EconomicDataValidator, ValidationError
+from src.zonemap import ZoneMapBuilder, load_zone_map, save_zone_map
+
+if TYPE_CHECKING:
+    from src.calculator import AggregateSpec
+
+# Путь, обозначающий стандартный ввод
+STDIN_PATH = "-"
+
+# Объем начала файла, по которому определяется разделитель
+SNIFF_SIZE = 1024
+
+# Число строк выборки, по которым определяется разделитель
+SNIFF_LINES = 16
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class DataReader(ABC):
     """Абстрактных базовый класс для чтения данных."""
 
     @abstractmethod
-    def read(self, file_paths: list[str]) -> list[EconomicRecord]:
-        """Читает данные из файлов."""
+    def read(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> list[EconomicRecord]:
+        """Читает данные из файлов.
+
+        Args:
+            file_paths: Список путей к файлам.
+            columns: Колонки, которые нужны вызывающему коду. Реализация
+                может не проверять и не преобразовывать остальные.
+        """
+        pass
+
+    def iter_records(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> Iterator[EconomicRecord]:
+        """Возвращает записи потоком, не накапливая их в списке.
+
+        По умолчанию использует read(); реализации, читающие данные
+        построчно, переопределяют метод.
+
+        Args:
+            file_paths: Список путей к файлам.
+            columns: Колонки, которые нужны вызывающему коду.
+        """
+        return iter(self.read(file_paths, columns))
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return {}
+
+    def source_files(self, file_paths: Iterable[str]) -> Iterator[str]:
+        """
+        Файлы данных, которые будут открыты при чтении (для ключей кеша).
+
+        Args:
+            file_paths: Входные пути.
+
+        Returns:
+            Iterator[str]: По умолчанию - сами входные пути.
+        """
+        return iter(file_paths)
+
+    def aggregate(
+        self,
+        file_paths: Sequence[str],
+        spec: "AggregateSpec",
+        memory_limit: int | None = None,
+    ) -> list[GroupStatistics] | None:
+        """
+        Выполняет агрегацию на стороне источника данных.
+
+        Args:
+            file_paths: Список путей к файлам.
+            spec: Спецификация агрегации.
+            memory_limit: Лимит памяти групп в байтах (None - без лимита).
+                Источники, сливающие частичные группы в Python, должны
+                выгружать их на диск при превышении (см. create_aggregator).
+
+        Returns:
+            list[GroupStatistics] | None: Группы или None, если источник
+            не умеет агрегировать (записи читаются и агрегируются в Python).
+        """
+        return None
+
+    def comoments(
+        self, file_paths: Sequence[str], indicators: Sequence[str]
+    ) -> dict[str, CoMoments] | None:
+        """
+        Накапливает совместные моменты показателей по странам на стороне
+        источника данных.
+
+        Args:
+            file_paths: Список путей к файлам.
+            indicators: Числовые колонки.
+
+        Returns:
+            dict[str, CoMoments] | None: Накопители по странам или None, если
+            источник не умеет их считать (записи читаются в Python).
+        """
+        return None
+
+
+class FileReader(DataReader):
+    """
+    Базовый класс читателей, обрабатывающих файлы по одному.
+
+    Наследник реализует read_file; чтение списка или потока путей
+    (read, iter_records) общее для всех форматов.
+    """
+
+    @abstractmethod
+    def read_file(
+        self,
+        file_path: str,
+        columns: Collection[str] | None = None,
+        partition: Mapping[str, str] | None = None,
+    ) -> Iterator[EconomicRecord]:
+        """Читает один файл и возвращает записи потоком.
+
+        Args:
+            file_path: Путь к файлу ('-' - стандартный ввод).
+            columns: Проекция колонок.
+            partition: Значения колонок, общие для всех строк файла.
+        """
         pass
 
+    @property
+    def is_sampling(self) -> bool:
+        """True, если читается только выборка строк (по умолчанию - нет)."""
+        return False
+
+    def read(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> list[EconomicRecord]:
+        """Читает все файлы и объединяет результаты.
+
+        Args:
+            file_paths: Пути к файлам (список или поток путей).
+            columns: Проекция колонок (см. read_file).
+
+        Returns:
+            list[EconomicRecord]: Список всех записей из всех файлов.
+
+        Raises:
+            ValueError: Если список файлов пуст или '-' указан дважды.
+            FileNotFoundError: Если один из файлов не существует.
+        """
+        all_records = []
+
+        for file_path in iter_paths(file_paths):
+            try:
+                records = list(self.read_file(file_path, columns))
+                all_records.extend(records)
+                logger.info(f"Loaded {len(records)} records from {file_path}")
+            except Exception as e:
+                logger.error(f"Failed to read {file_path}: {e}")
+                raise
+
+        logger.info(f"Total records loaded: {len(all_records)}")
+        return all_records
+
+    def iter_records(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> Iterator[EconomicRecord]:
+        """Читает файлы потоком, файл за файлом.
+
+        Args:
+            file_paths: Пути к файлам (список или поток путей).
+            columns: Проекция колонок (см. read_file).
+
+        Returns:
+            Iterator[EconomicRecord]: Записи всех файлов.
+
+        Raises:
+            ValueError: Если список файлов пуст или '-' указан дважды.
+        """
+        return chain.from_iterable(
+            self.read_file(file_path, columns) for file_path in iter_paths(file_paths)
+        )
+
+
+def iter_paths(file_paths: Iterable[str]) -> Iterator[str]:
+    """
+    Перебирает пути к входным файлам с проверкой.
+
+    Список проверяется сразу; поток путей (например, обход каталога)
+    проверяется по ходу перебора, без построения полного списка.
+
+    Raises:
+        ValueError: Если путей нет или стандартный ввод указан дважды.
+    """
+    if isinstance(file_paths, Sequence):
+        if not file_paths:
+            raise ValueError("No files provided for reading")
+        if file_paths.count(STDIN_PATH) > 1:
+            raise ValueError("Standard input ('-') can only be read once")
+    return _checked_paths(file_paths)
+
+
+def _checked_paths(file_paths: Iterable[str]) -> Iterator[str]:
+    """Выдает пути, проверяя поток путей по ходу перебора."""
+    count = 0
+    stdin_seen = False
+    for file_path in file_paths:
+        if file_path == STDIN_PATH:
+            if stdin_seen:
+                raise ValueError("Standard input ('-') can only be read once")
+            stdin_seen = True
+        count += 1
+        yield file_path
+    if count == 0:
+        raise ValueError("No files provided for reading")
+
+
+def is_stream(file_path: str) -> bool:
+    """
+    Проверяет, является ли источник потоком (stdin, именованный канал или
+    устройство, например /dev/stdin).
+
+    Потоки читаются один раз и не имеют стабильного отпечатка, поэтому
+    для них не используются сводки-спутники и кеш результатов. Каталоги
+    (наборы данных) и несуществующие пути потоками не считаются.
+    """
+    if file_path == STDIN_PATH:
+        return True
+    try:
+        mode = Path(file_path).stat().st_mode
+    except OSError:
+        return False
+    return S_ISFIFO(mode) or S_ISCHR(mode)
+
+
+@contextmanager
+def open_source(file_path: str) -> Iterator[TextIO]:
+    """
+    Открывает файл, именованный канал или стандартный ввод ('-') для чтения.
+
+    Стандартный ввод не закрывается при выходе из контекста.
+
+    Raises:
+        FileNotFoundError: Если файл не существует.
+    """
+    if file_path == STDIN_PATH:
+        buffer = getattr(sys.stdin, "buffer", None)
+        if buffer is None:
+            yield sys.stdin
+            return
+        stream = io.TextIOWrapper(buffer, encoding="utf-8")
+        try:
+            yield stream
+        finally:
+            stream.detach()
+        return
+
+    if not Path(file_path).exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    with open(file_path, "r", encoding="utf-8") as f:
+        yield f
+
+
+def sniff_dialect(sample: str) -> type[csv.Dialect]:
+    """
+    Определяет диалект CSV по образцу текста.
 
-class CSVReader(DataReader):
+    Returns:
+        type[csv.Dialect]: Найденный диалект или csv.excel (запятая).
+    """
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        # Если не удалось определить, используем запятую
+        return csv.excel
+
+
+def sniff_lines(stream: TextIO) -> tuple[type[csv.Dialect], Iterator[str]]:
+    """
+    Определяет разделитель по началу потока без перемотки.
+
+    Прочитанное начало (дополненное до конца строки) буферизуется
+    и возвращается вместе с остатком потока, поэтому функция работает
+    с каналами и стандартным вводом.
+
+    Args:
+        stream: Текстовый поток.
+
+    Returns:
+        tuple: Диалект CSV и итератор всех строк потока.
+    """
+    head = stream.read(SNIFF_SIZE)
+    if head and not head.endswith("\n"):
+        head += stream.readline()
+    return sniff_dialect(head), chain(io.StringIO(head), stream)
+
+
+def sample_lines(
+    lines: Iterable[T], fraction: float, rng: random.Random, header: bool = True
+) -> Iterator[T]:
+    """
+    Выбирает строки независимо друг от друга с вероятностью fraction
+    (выборка Бернулли); заголовок (если есть) выдается всегда.
+
+    Выбирается каждая строка, а не блоки подряд идущих строк: файлы обычно
+    упорядочены по стране и году, и строки одного блока коррелированы, что
+    сделало бы интервалы z * s / sqrt(n) слишком узкими, а оценку -
+    смещенной к попавшим в выборку годам. Число пропускаемых строк до
+    следующей выбранной имеет геометрическое распределение, поэтому
+    пропущенные строки не разбираются, не валидируются и не конвертируются.
+
+    Args:
+        lines: Строки источника, начиная с заголовка.
+        fraction: Вероятность выбора строки.
+        rng: Генератор случайных чисел.
+        header: Первая строка - заголовок (в JSON Lines его нет).
+
+    Yields:
+        Заголовок, затем выбранные строки.
+    """
+    iterator = iter(lines)
+    if header:
+        yield from islice(iterator, 1)
+    if fraction >= 1:
+        yield from iterator
+        return
+    log_skip = math.log(1 - fraction)
+    while True:
+        skip = int(math.log(1.0 - rng.random()) / log_skip)
+        line = next(islice(iterator, skip, None), None)
+        if line is None:
+            return
+        yield line
+
+
+def check_sample_fraction(sample_fraction: float | None) -> None:
+    """
+    Проверяет долю выборки строк.
+
+    Raises:
+        ValueError: Если доля не в (0, 1].
+    """
+    if sample_fraction is not None and not 0 < sample_fraction <= 1:
+        raise ValueError(f"Sample fraction must be in (0, 1], got {sample_fraction}")
+
+
+def sample_rng(sample_seed: int | None, file_path: str) -> random.Random:
+    """
+    Генератор выборки файла: с зерном выборка каждого файла воспроизводима
+    и не зависит от порядка файлов.
+    """
+    if sample_seed is None:
+        return random.Random()
+    return random.Random(f"{sample_seed}:{file_path}")
+
+
+class CSVReader(FileReader):
     """Читатель CSV файлов с экономическими данными."""
 
     def __init__(
         self,
         validator: EconomicDataValidator | None = None,
         converter: EconomicDataConverter | None = None,
+        row_filter: RowFilter | None = None,
+        zone_maps: bool = False,
+        strict: bool = False,
+        sample_fraction: float | None = None,
+        sample_seed: int | None = None,
     ):
         """Инициализация читателя.
 
         Args:
             validator: Валидатор данных (создается по умолчанию).
             converter: Конвертер данных (создается по умолчанию).
+            row_filter: Фильтр строк, применяемый до валидации и конвертации.
+            zone_maps: Использовать сводки-спутники (*.zonemap.json), чтобы
+                пропускать файлы без подходящих строк. Сводка строится
+                при первом полном чтении файла.
+            strict: Проверять и преобразовывать все колонки, даже если
+                запрошена только часть из них.
+            sample_fraction: Доля выбираемых строк (None - все строки).
+                Строки выбираются независимо (см. sample_lines).
+            sample_seed: Зерно выборки для воспроизводимых результатов.
+
+        Raises:
+            ValueError: Если доля выборки вне интервала (0, 1].
         """
+        check_sample_fraction(sample_fraction)
         self.validator = validator or EconomicDataValidator()
         self.converter = converter or EconomicDataConverter()
+        self.row_filter = row_filter
+        self.zone_maps = zone_maps
+        self.strict = strict
+        self.sample_fraction = sample_fraction
+        self.sample_seed = sample_seed
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return {
+            "row_filter": self.row_filter,
+            "strict": self.strict,
+            "sample_fraction": self.sample_fraction,
+            "sample_seed": self.sample_seed,
+        }
+
+    @property
+    def is_sampling(self) -> bool:
+        """True, если читается только выборка строк."""
+        return self.sample_fraction is not None and self.sample_fraction < 1
+
+    @contextmanager
+    def _open_lines(
+        self, file_path: str
+    ) -> Iterator[tuple[type[csv.Dialect], Iterator[str]]]:
+        """
+        Открывает источник и возвращает диалект и строки (с учетом выборки).
+        """
+        with open_source(file_path) as f:
+            dialect, lines = sniff_lines(f)
+            if not self.is_sampling or self.sample_fraction is None:
+                yield dialect, lines
+                return
+            rng = sample_rng(self.sample_seed, file_path)
+            yield dialect, sample_lines(lines, self.sample_fraction, rng)
 
-    def read_file(self, file_path: str) -> Generator[EconomicRecord, None, None]:
+    def read_file(
+        self,
+        file_path: str,
+        columns: Collection[str] | None = None,
+        partition: Mapping[str, str] | None = None,
+    ) -> Generator[EconomicRecord, None, None]:
         """Читает один CSV файл и возвращает генератор записей.
 
+        Путь '-' означает стандартный ввод; поддерживаются именованные каналы.
+
         Args:
             file_path: Путь к CSV файлу.
+            columns: Проекция - колонки, которые нужно проверить и
+                преобразовать (по умолчанию все). Остальные поля записи
+                заполняются значениями по умолчанию. Игнорируется в
+                строгом режиме.
+            partition: Значения колонок, общие для всех строк файла
+                (раздел каталога). Эти колонки могут отсутствовать в файле,
+                а значения из файла заменяются значениями раздела.
 
         Returns:
             EconomicRecord: Объект с экономическими данными.
@@ -52,72 +483,101 @@ class CSVReader(DataReader):
             csv.Error: При ошибках парсинга CSV.
         """
         path = Path(file_path)
-        if not path.exists():
+        if file_path != STDIN_PATH and not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        logger.debug(f"Reading file: {file_path}")
+        active_filter = self.row_filter
+        if active_filter is not None and partition:
+            # Значения раздела уже проверены при обходе каталогов
+            active_filter = active_filter.without(partition.keys())
+        if active_filter is not None and active_filter.is_empty:
+            active_filter = None
 
-        with open(path, "r", encoding="utf-8") as f:
-            # Пробуем определить разделитель
-            sample = f.read(1024)
-            f.seek(0)
+        # Сводка-спутник позволяет пропустить файл, не открывая его
+        stat = path.stat() if self.zone_maps and not is_stream(file_path) else None
+        zone_map = load_zone_map(path, stat) if stat is not None else None
+        if (
+            zone_map is not None
+            and active_filter is not None
+            and not zone_map.may_match(active_filter)
+        ):
+            logger.debug(f"Skipping {file_path}: excluded by zone map")
+            return
 
-            dialect: type[csv.Dialect]
-            try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
-            except csv.Error:
-                # Если не удалось определить, используем запятую
-                dialect = csv.excel
+        projection = None if self.strict or columns is None else frozenset(columns)
 
-            reader = csv.DictReader(f, delimiter=dialect.delimiter)
+        logger.debug(f"Reading file: {file_path}")
 
-            # Валидация заголовка
-            self.validator.validate_header(reader.fieldnames or [])
+        # Разделитель определяется по началу файла без перемотки
+        with self._open_lines(file_path) as (dialect, lines):
+            reader = csv.reader(lines, delimiter=dialect.delimiter)
+            header = next(reader, [])
 
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    # Очищаем пробелы в ключах и значениях
-                    # Защита от None значений
-                    clean_row = {}
-                    for k, v in row.items():
-                        clean_k = k.strip().lower() if k else ""
-                        clean_v = v.strip() if v is not None else ""
-                        clean_row[clean_k] = clean_v
-                        clean_row[clean_k] = clean_v
-
-                    self.validator.validate_row(clean_row, row_num)
-                    yield self.converter.to_record(clean_row)
+            # Валидация заголовка (колонки раздела в файле не обязательны)
+            header_projection = projection
+            if partition:
+                header_projection = (
+                    frozenset(
+                        self.validator.REQUIRED_COLUMNS
+                        if projection is None
+                        else projection
+                    )
+                    - partition.keys()
+                )
+            self.validator.validate_header(header, header_projection)
 
-                except ValidationError as e:
-                    logger.error(f"Validation error in {file_path}:{row_num}: {e}")
-                    raise
+            # Позиции колонок вычисляются один раз, строки читаются списками
+            header_columns = [col.strip().lower() for col in header]
+            index = {col: i for i, col in enumerate(header_columns)}
+            # Очищаются только значения колонок, попавших в проекцию
+            positions = [
+                (col, i)
+                for col, i in index.items()
+                if projection is None or col in projection
+            ]
+            accepts = active_filter.compile(index) if active_filter else None
+            # Сводка строится только по полному чтению файла
+            builder = (
+                ZoneMapBuilder(index)
+                if stat is not None and zone_map is None and not self.is_sampling
+                else None
+            )
+            skipped = 0
 
-    def read(self, file_paths: list[str]) -> list[EconomicRecord]:
-        """Читает все CSV файлы и объединяет результаты.
+            for values in reader:
+                if not values:
+                    continue
 
-        Args:
-            file_paths: Список путей к CSV файлам.
+                if builder is not None:
+                    builder.observe(values)
 
-        Returns:
-            list[EconomicRecord]: Список всех записей из всех файлов.
+                # Фильтр работает с сырыми строками: отброшенные строки
+                # не валидируются и не конвертируются
+                if accepts is not None and not accepts(values):
+                    skipped += 1
+                    continue
 
-        Raises:
-            ValueError: Если список файлов пуст.
-            FileNotFoundError: Если один из файлов не существует.
-        """
-        if not file_paths:
-            raise ValueError("No files provided for reading")
+                row_num = reader.line_num
+                try:
+                    # Очищаем пробелы в значениях, недостающие поля - пустые
+                    size = len(values)
+                    clean_row = {
+                        col: values[i].strip() if i < size else ""
+                        for col, i in positions
+                    }
+                    if partition:
+                        clean_row.update(partition)
 
-        all_records = []
+                    self.validator.validate_row(clean_row, row_num, projection)
+                    yield self.converter.to_record(clean_row, projection)
 
-        for file_path in file_paths:
-            try:
-                records = list(self.read_file(file_path))
-                all_records.extend(records)
-                logger.info(f"Loaded {len(records)} records from {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to read {file_path}: {e}")
-                raise
+                except ValidationError as e:
+                    logger.error(f"Validation error in {file_path}:{row_num}: {e}")
+                    raise
 
-        logger.info(f"Total records loaded: {len(all_records)}")
-        return all_records
+            if skipped:
+                logger.debug(f"Filtered out {skipped} rows from {file_path}")
+
+        # Сводка сохраняется только после успешного чтения всего файла
+        if builder is not None and stat is not None:
+            save_zone_map(path, builder.build(stat))
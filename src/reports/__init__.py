@@ -1,8 +1,22 @@
 # Регистрация отчетов
+from src.reports.aggregate import AggregateReport
 from src.reports.average_gdp import AverageGDPReport
 from src.reports.base import ReportFactory
+from src.reports.correlation import CorrelationReport
+from src.reports.coverage import CoverageReport
+from src.reports.descriptive import DescriptiveStatisticsReport
+from src.reports.growth import GrowthReport
+from src.reports.outliers import OutlierReport
+from src.reports.pivot import PivotReport
 
 ReportFactory.register("average-gdp", AverageGDPReport)
+ReportFactory.register("aggregate", AggregateReport)
+ReportFactory.register("descriptive-stats", DescriptiveStatisticsReport)
+ReportFactory.register("growth", GrowthReport)
+ReportFactory.register("pivot", PivotReport)
+ReportFactory.register("correlation", CorrelationReport)
+ReportFactory.register("outliers", OutlierReport)
+ReportFactory.register("coverage", CoverageReport)
 
 # Демонстрация расширяемости - регистрируем заготовки будущих отчетов
 # Раскомментируйте, когда добавите реальные реализации
@@ -11,5 +25,12 @@ ReportFactory.register("average-gdp", AverageGDPReport)
 
 __all__ = [
     "ReportFactory",
+    "AggregateReport",
     "AverageGDPReport",
+    "CorrelationReport",
+    "CoverageReport",
+    "DescriptiveStatisticsReport",
+    "GrowthReport",
+    "OutlierReport",
+    "PivotReport",
 ]
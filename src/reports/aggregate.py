@@ -0,0 +1,100 @@
+from typing import Any, Mapping
+
+from tabulate import tabulate
+
+from src.calculator import AggregateSpec, GroupByCalculator
+from src.models import GroupStatistics
+from src.reports.base import Report
+
+
+class AggregateReport(Report[GroupStatistics]):
+    """
+    Отчет по произвольной группировке.
+    Ключи группировки и агрегаты задаются параметрами group_by и aggregates
+    (в командной строке - --group-by и --agg).
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Уникальный идентификатор отчета.
+
+        Returns:
+            str: 'aggregate'.
+        """
+        return "aggregate"
+
+    @property
+    def description(self) -> str:
+        """
+        Описание отчета для --list-reports.
+
+        Returns:
+            str: Краткое описание.
+        """
+        return "Group-by aggregates (--group-by KEY... --agg FUNC:COLUMN,...)"
+
+    def create_calculator(self, params: Mapping[str, Any]) -> GroupByCalculator:
+        """
+        Создает калькулятор группировки по параметрам отчета.
+
+        Args:
+            params: Параметры group_by (список ключей) и aggregates
+                (строка 'mean:gdp,sum:population' или список), max_memory
+                (лимит памяти агрегации в байтах).
+
+        Returns:
+            GroupByCalculator: Калькулятор с заданной спецификацией.
+
+        Raises:
+            ValueError: При неверных ключах или агрегатах.
+        """
+        group_by = params.get("group_by")
+        aggregates = params.get("aggregates")
+        memory_limit = params.get("max_memory")
+        if not group_by and not aggregates:
+            return GroupByCalculator(memory_limit=memory_limit)
+        return GroupByCalculator(
+            AggregateSpec.parse(group_by or ["country"], aggregates or "mean:gdp"),
+            memory_limit=memory_limit,
+        )
+
+    def generate(self, data: list[GroupStatistics]) -> str:
+        """
+        Генерирует таблицу с результатами агрегации.
+
+        Args:
+            data: Результаты агрегации, упорядоченные по ключам.
+
+        Returns:
+            str: Отформатированная таблица для вывода в консоль.
+        """
+        if not data:
+            return "No data"
+
+        key_names = list(data[0].key)
+        value_names = list(data[0].values)
+
+        table_data = [
+            [*group.key.values(), *map(_format_value, group.values.values())]
+            for group in data
+        ]
+
+        headers = [name.capitalize() for name in key_names] + [
+            "{}({})".format(*name.split("_", 1)) for name in value_names
+        ]
+
+        return tabulate(
+            table_data,
+            headers=headers,
+            tablefmt="grid",
+            colalign=["left"] * len(key_names) + ["right"] * len(value_names),
+            disable_numparse=True,
+        )
+
+
+def _format_value(value: float) -> str:
+    """Форматирует значение агрегата: целые (годы, счетчики) - как есть."""
+    if isinstance(value, int):
+        return str(value)
+    return f"{value:,.2f}"
@@ -1,10 +1,24 @@
+import math
+from typing import Any, Mapping
+
 from tabulate import tabulate
 
+from src.calculator import (
+    ApproximateGDPCalculator,
+    GDPCalculator,
+    StatisticsCalculator,
+    UnemploymentTrendCalculator,
+)
 from src.models import CountryStatistics
 from src.reports.base import Report
 
 
-class AverageGDPReport(Report):
+def _format_margin(margin: float) -> str:
+    """Форматирует полуширину доверительного интервала."""
+    return "n/a" if math.isnan(margin) else f"± {margin:,.2f}"
+
+
+class AverageGDPReport(Report[CountryStatistics]):
     """
     Отчет по среднему ВВП стран.
     Формирует таблицу со странами и их средним ВВП за все годы.
@@ -31,6 +45,41 @@ class AverageGDPReport(Report):
         """
         return "Average GDP by country (arithmetic mean across all years)"
 
+    @property
+    def supports_sampling(self) -> bool:
+        """По выборке средние оцениваются с доверительными интервалами."""
+        return True
+
+    def create_calculator(
+        self, params: Mapping[str, Any]
+    ) -> StatisticsCalculator[CountryStatistics]:
+        """
+        Создает калькулятор среднего ВВП.
+
+        Args:
+            params: Параметры отчета: max_memory - лимит памяти агрегации
+                в байтах. При approx=True средние оцениваются
+                по выборке с 95% доверительными интервалами; при
+                common_years=True - только по годам, общим для всех стран.
+
+        Returns:
+            StatisticsCalculator[CountryStatistics]: Точный или приближенный
+            калькулятор.
+
+        Raises:
+            ValueError: Если заданы одновременно approx и common_years.
+        """
+        if params.get("approx"):
+            if params.get("common_years"):
+                raise ValueError(
+                    "Common years cannot be combined with sampled (approximate) input"
+                )
+            return ApproximateGDPCalculator(confidence=0.95)
+        return GDPCalculator(
+            memory_limit=params.get("max_memory"),
+            common_years=bool(params.get("common_years")),
+        )
+
     def generate(self, data: list[CountryStatistics]) -> str:
         """
         Генерирует таблицу со средним ВВП по странам.
@@ -40,22 +89,37 @@ class AverageGDPReport(Report):
 
         Returns:
             str: Отформатированная таблица для вывода в консоль.
+            Для оценок по выборке добавляется колонка доверительного интервала.
         """
+        approximate = any(stats.margin is not None for stats in data)
 
         table_data = []
         for idx, stats in enumerate(data, start=1):
-            table_data.append(
-                [
-                    idx,
-                    stats.country,
-                    f"{stats.average_gdp:,.2f}",  # Формат с разделителями тысяч
-                    stats.years_count,
-                ]
-            )
+            row: list[Any] = [
+                idx,
+                stats.country,
+                f"{stats.average_gdp:,.2f}",  # Формат с разделителями тысяч
+            ]
+            if approximate:
+                row.append(
+                    _format_margin(stats.margin) if stats.margin is not None else ""
+                )
+            row.append(stats.years_count)
+            table_data.append(row)
+
+        headers = ["#", "Country", "Average GDP (USD billions)", "Years"]
+        if approximate:
+            headers = [
+                "#",
+                "Country",
+                "Estimated average GDP (USD billions)",
+                "95% CI",
+                "Sampled rows",
+            ]
 
         return tabulate(
             table_data,
-            headers=["#", "Country", "Average GDP (USD billions)", "Years"],
+            headers=headers,
             tablefmt="grid",
             stralign="left",
             numalign="right",
@@ -64,7 +128,7 @@ class AverageGDPReport(Report):
 
 
 # Заготовка для будущего отчета (демонстрация расширяемости)
-class UnemploymentChangeReport(Report):
+class UnemploymentChangeReport(Report[CountryStatistics]):
     """
     Заготовка для отчета по изменению безработицы.
     Демонстрирует возможность легкого добавления отчетов.
@@ -78,6 +142,12 @@ class UnemploymentChangeReport(Report):
     def description(self) -> str:
         return "Unemployment rate changes over years (placeholder)"
 
+    def create_calculator(
+        self, params: Mapping[str, Any]
+    ) -> UnemploymentTrendCalculator:
+        """Заглушка: калькулятор трендов безработицы."""
+        return UnemploymentTrendCalculator()
+
     def generate(self, data: list[CountryStatistics]) -> str:
         """
         Заглушка для демонстрации расширяемости архитектуры.
@@ -1,13 +1,18 @@
+import csv
 import logging
+import math
 from abc import ABC, abstractmethod
-from typing import ClassVar
+from typing import Any, ClassVar, Generic, Mapping, TextIO, TypeVar
 
-from src.models import CountryStatistics
+from src.calculator import StatisticsCalculator
+from src.columnar import ColumnarTable
 
 logger = logging.getLogger(__name__)
 
+StatsT = TypeVar("StatsT")
 
-class Report(ABC):
+
+class Report(ABC, Generic[StatsT]):
 
     @property
     @abstractmethod
@@ -22,8 +27,35 @@ class Report(ABC):
 
     """Абстрактный базовый класс для всех отчетов."""
 
+    @property
+    def supports_sampling(self) -> bool:
+        """
+        Оценивает ли отчет результат по выборке строк (--sample/--approx).
+
+        Отчеты без оценщика по выборке вернули бы немасштабированные суммы
+        и ложные пропуски без пометки о выборке, поэтому по умолчанию
+        выборка для них запрещена.
+        """
+        return False
+
+    @abstractmethod
+    def create_calculator(
+        self, params: Mapping[str, Any]
+    ) -> StatisticsCalculator[StatsT]:
+        """
+        Создает калькулятор, формирующий данные для отчета.
+
+        Args:
+            params: Параметры отчета (например, из аргументов командной строки).
+                Параметр max_memory задает лимит памяти агрегации в байтах.
+
+        Returns:
+            StatisticsCalculator: Калькулятор для этого отчета.
+        """
+        pass
+
     @abstractmethod
-    def generate(self, data: list[CountryStatistics]) -> str:
+    def generate(self, data: list[StatsT]) -> str:
         """
         Генерирует отчет в виде строки.
 
@@ -35,6 +67,26 @@ class Report(ABC):
         """
         pass
 
+    def write_csv(self, data: list[StatsT], file: TextIO) -> None:
+        """
+        Записывает данные отчета в CSV.
+
+        По умолчанию - строка на каждый DTO, колонка на каждое поле
+        (как в ColumnarTable.from_results); отсутствующие значения - пустые.
+
+        Args:
+            data: Статистические данные для отчета.
+            file: Открытый текстовый файл (newline='').
+        """
+        table = ColumnarTable.from_results(data)
+        writer = csv.writer(file)
+        writer.writerow(table.column_names)
+        for row in zip(*table.columns.values(), strict=True):
+            writer.writerow(
+                "" if isinstance(value, float) and math.isnan(value) else value
+                for value in row
+            )
+
 
 class ReportFactory:
     """
@@ -42,10 +94,10 @@ class ReportFactory:
     Позволяет регистрировать новые типы отчетов без изменения существующего кода.
     """
 
-    _reports: ClassVar[dict[str, type[Report]]] = {}
+    _reports: ClassVar[dict[str, type[Report[Any]]]] = {}
 
     @classmethod
-    def register(cls, name: str, report_class: type[Report]) -> None:
+    def register(cls, name: str, report_class: type[Report[Any]]) -> None:
         """
         Регистрирует новый тип отчета.
 
@@ -57,7 +109,7 @@ class ReportFactory:
         logger.debug(f"Registered report: {name} -> {report_class.__name__}")
 
     @classmethod
-    def create(cls, name: str) -> Report | None:
+    def create(cls, name: str) -> Report[Any] | None:
         """
         Создает экземпляр отчета по имени.
 
@@ -69,9 +121,7 @@ class ReportFactory:
         """
         report_class = cls._reports.get(name)
         if report_class is None:
-            logger.error(
-                f"Report {name} not found. Available: {list(cls._reports.keys())}"
-            )
+            logger.error(f"Report {name} not found. Available: {sorted(cls._reports)}")
             return None
 
         logger.debug(f"Creating report: {name}")
@@ -0,0 +1,170 @@
+import csv
+import math
+from itertools import combinations
+from typing import Any, Mapping, TextIO
+
+from tabulate import tabulate
+
+from src.calculator import DEFAULT_CORRELATION_INDICATORS, CorrelationCalculator
+from src.models import CorrelationMatrix
+from src.reports.base import Report
+
+# Подпись общей матрицы по всем странам
+ALL_COUNTRIES = "All countries"
+
+
+def _format_value(value: float) -> str:
+    """Форматирует коэффициент; пара без данных - прочерк."""
+    return "-" if math.isnan(value) else f"{value:,.4f}"
+
+
+def _scope(matrix: CorrelationMatrix) -> str:
+    """Подпись матрицы: страна или все страны."""
+    return matrix.country if matrix.country is not None else ALL_COUNTRIES
+
+
+class CorrelationReport(Report[CorrelationMatrix]):
+    """
+    Отчет с матрицами корреляции и ковариации показателей.
+    Показатели задаются параметром indicators; by_country=False оставляет
+    только общую матрицу.
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Уникальный идентификатор отчета.
+
+        Returns:
+            str: 'correlation'.
+        """
+        return "correlation"
+
+    @property
+    def description(self) -> str:
+        """
+        Описание отчета для --list-reports.
+
+        Returns:
+            str: Краткое описание.
+        """
+        return "Correlation and covariance between indicators, overall and by country"
+
+    def create_calculator(self, params: Mapping[str, Any]) -> CorrelationCalculator:
+        """
+        Создает калькулятор корреляций.
+
+        Args:
+            params: Параметры отчета: indicators (список колонок) и
+                by_country.
+
+        Returns:
+            CorrelationCalculator: Калькулятор корреляций.
+        """
+        return CorrelationCalculator(
+            params.get("indicators") or DEFAULT_CORRELATION_INDICATORS,
+            by_country=params.get("by_country", True),
+        )
+
+    def generate(self, data: list[CorrelationMatrix]) -> str:
+        """
+        Генерирует общие матрицы корреляции и ковариации и таблицу
+        коэффициентов корреляции пар показателей по странам.
+
+        Args:
+            data: Общая матрица и матрицы стран.
+
+        Returns:
+            str: Отформатированные таблицы для вывода в консоль.
+        """
+        if not data:
+            return "No data"
+
+        overall, countries = data[0], data[1:]
+        indicators = overall.indicators
+        sections = [
+            f"{title} ({ALL_COUNTRIES.lower()}, {overall.count:,} records)\n"
+            + tabulate(
+                [
+                    [name, *map(_format_value, row)]
+                    for name, row in zip(indicators, matrix, strict=True)
+                ],
+                headers=["", *indicators],
+                tablefmt="grid",
+                colalign=["left"] + ["right"] * len(indicators),
+                disable_numparse=True,
+            )
+            for title, matrix in (
+                ("Correlation", overall.correlation),
+                ("Covariance", overall.covariance),
+            )
+        ]
+
+        if countries:
+            pairs = list(combinations(range(len(indicators)), 2))
+            sections.append(
+                "Correlation by country\n"
+                + tabulate(
+                    [
+                        [
+                            idx,
+                            matrix.country,
+                            matrix.count,
+                            *(
+                                _format_value(matrix.correlation[i][j])
+                                for i, j in pairs
+                            ),
+                        ]
+                        for idx, matrix in enumerate(countries, start=1)
+                    ],
+                    headers=[
+                        "#",
+                        "Country",
+                        "Count",
+                        *(f"{indicators[i]} ~ {indicators[j]}" for i, j in pairs),
+                    ],
+                    tablefmt="grid",
+                    colalign=["right", "left", "right"] + ["right"] * len(pairs),
+                    disable_numparse=True,
+                )
+            )
+        return "\n\n".join(sections)
+
+    def write_csv(self, data: list[CorrelationMatrix], file: TextIO) -> None:
+        """
+        Записывает матрицы в CSV в длинном формате: строка на пару
+        показателей каждой матрицы; пустые ячейки - пары без данных.
+
+        Args:
+            data: Общая матрица и матрицы стран.
+            file: Открытый текстовый файл (newline='').
+        """
+        writer = csv.writer(file)
+        writer.writerow(
+            [
+                "country",
+                "indicator_x",
+                "indicator_y",
+                "count",
+                "covariance",
+                "correlation",
+            ]
+        )
+        for matrix in data:
+            for i, x in enumerate(matrix.indicators):
+                for j, y in enumerate(matrix.indicators):
+                    writer.writerow(
+                        [
+                            _scope(matrix),
+                            x,
+                            y,
+                            matrix.count,
+                            *(
+                                "" if math.isnan(value) else value
+                                for value in (
+                                    matrix.covariance[i][j],
+                                    matrix.correlation[i][j],
+                                )
+                            ),
+                        ]
+                    )
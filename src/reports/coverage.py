@@ -0,0 +1,153 @@
+import csv
+from typing import Any, Mapping, TextIO
+
+from tabulate import tabulate
+
+from src.calculator import CoverageCalculator
+from src.models import YearCoverage
+from src.reports.base import Report
+from src.utils.accumulators import YearSet
+
+
+def _format_gaps(gaps: list[tuple[int, int]], separator: str = ", ") -> str:
+    """Серии пропусков: '1995-1997, 2001'."""
+    return separator.join(
+        str(first) if first == last else f"{first}-{last}" for first, last in gaps
+    )
+
+
+def common_years(data: list[YearCoverage]) -> YearSet:
+    """
+    Годы, для которых есть данные всех стран.
+
+    Args:
+        data: Покрытие лет по странам.
+
+    Returns:
+        YearSet: Пересечение лет всех стран.
+    """
+    result: YearSet | None = None
+    for coverage in data:
+        missing = set(coverage.missing_years)
+        years = YearSet(
+            year
+            for year in range(coverage.first_year, coverage.last_year + 1)
+            if year not in missing
+        )
+        result = years if result is None else result.intersection(years)
+    return result or YearSet()
+
+
+class CoverageReport(Report[YearCoverage]):
+    """
+    Отчет о покрытии лет данными: первый и последний год, доля лет
+    с данными и серии пропусков по странам.
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Уникальный идентификатор отчета.
+
+        Returns:
+            str: 'coverage'.
+        """
+        return "coverage"
+
+    @property
+    def description(self) -> str:
+        """
+        Описание отчета для --list-reports.
+
+        Returns:
+            str: Краткое описание.
+        """
+        return "Covered years, missing years and gap runs by country"
+
+    def create_calculator(self, params: Mapping[str, Any]) -> CoverageCalculator:
+        """
+        Создает калькулятор покрытия лет.
+
+        Args:
+            params: Параметры отчета (не используются).
+
+        Returns:
+            CoverageCalculator: Калькулятор покрытия.
+        """
+        return CoverageCalculator()
+
+    def generate(self, data: list[YearCoverage]) -> str:
+        """
+        Генерирует таблицу покрытия и строку с общими для всех стран годами.
+
+        Args:
+            data: Покрытие лет по странам.
+
+        Returns:
+            str: Отформатированная таблица для вывода в консоль.
+        """
+        if not data:
+            return "No data"
+
+        table_data = [
+            [
+                idx,
+                coverage.country,
+                coverage.first_year,
+                coverage.last_year,
+                coverage.years_count,
+                f"{coverage.coverage:.0%}",
+                _format_gaps(coverage.gaps) or "-",
+            ]
+            for idx, coverage in enumerate(data, start=1)
+        ]
+        common = common_years(data)
+        summary = (
+            f"Common years: {common.first}-{common.last} ({len(common)} years)"
+            if common
+            else "Common years: none"
+        )
+        return (
+            tabulate(
+                table_data,
+                headers=["#", "Country", "First", "Last", "Years", "Coverage", "Gaps"],
+                tablefmt="grid",
+                colalign=["right", "left", "right", "right", "right", "right", "left"],
+                disable_numparse=True,
+            )
+            + "\n"
+            + summary
+        )
+
+    def write_csv(self, data: list[YearCoverage], file: TextIO) -> None:
+        """
+        Записывает покрытие в CSV; серии пропусков разделяются ';'.
+
+        Args:
+            data: Покрытие лет по странам.
+            file: Открытый текстовый файл (newline='').
+        """
+        writer = csv.writer(file)
+        writer.writerow(
+            [
+                "country",
+                "first_year",
+                "last_year",
+                "years_count",
+                "missing_count",
+                "coverage",
+                "gaps",
+            ]
+        )
+        for coverage in data:
+            writer.writerow(
+                [
+                    coverage.country,
+                    coverage.first_year,
+                    coverage.last_year,
+                    coverage.years_count,
+                    len(coverage.missing_years),
+                    round(coverage.coverage, 4),
+                    _format_gaps(coverage.gaps, ";"),
+                ]
+            )
@@ -0,0 +1,98 @@
+from typing import Any, Mapping
+
+from tabulate import tabulate
+
+from src.calculator import DescriptiveStatisticsCalculator
+from src.models import DescriptiveStatistics
+from src.reports.base import Report
+
+
+class DescriptiveStatisticsReport(Report[DescriptiveStatistics]):
+    """
+    Отчет с описательной статистикой показателя по странам.
+    Показатель задается параметром indicator (по умолчанию gdp).
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Уникальный идентификатор отчета.
+
+        Returns:
+            str: 'descriptive_stats'.
+        """
+        return "descriptive_stats"
+
+    @property
+    def description(self) -> str:
+        """
+        Описание отчета для --list-reports.
+
+        Returns:
+            str: Краткое описание.
+        """
+        return "Min, max, mean, stddev, median and p90 of an indicator by country"
+
+    def create_calculator(
+        self, params: Mapping[str, Any]
+    ) -> DescriptiveStatisticsCalculator:
+        """
+        Создает калькулятор для показателя из параметра indicator.
+
+        Args:
+            params: Параметры отчета.
+
+        Returns:
+            DescriptiveStatisticsCalculator: Калькулятор статистики.
+        """
+        return DescriptiveStatisticsCalculator(params.get("indicator") or "gdp")
+
+    def generate(self, data: list[DescriptiveStatistics]) -> str:
+        """
+        Генерирует таблицу описательной статистики.
+
+        Приближенные квантили (рассчитанные скетчем) помечаются знаком '~'.
+
+        Args:
+            data: Статистика по странам.
+
+        Returns:
+            str: Отформатированная таблица для вывода в консоль.
+        """
+        if not data:
+            return "No data"
+
+        table_data = []
+        for idx, stats in enumerate(data, start=1):
+            mark = "~" if stats.approximate else ""
+            table_data.append(
+                [
+                    idx,
+                    stats.country,
+                    stats.count,
+                    f"{stats.mean:,.2f}",
+                    f"{stats.stddev:,.2f}",
+                    f"{stats.min:,.2f}",
+                    f"{stats.max:,.2f}",
+                    f"{mark}{stats.median:,.2f}",
+                    f"{mark}{stats.p90:,.2f}",
+                ]
+            )
+
+        return tabulate(
+            table_data,
+            headers=[
+                "#",
+                "Country",
+                "Count",
+                f"Mean {data[0].indicator}",
+                "Std dev",
+                "Min",
+                "Max",
+                "Median",
+                "P90",
+            ],
+            tablefmt="grid",
+            colalign=["right", "left", "right"] + ["right"] * 6,
+            disable_numparse=True,
+        )
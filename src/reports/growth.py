@@ -0,0 +1,99 @@
+from typing import Any, Mapping
+
+from tabulate import tabulate
+
+from src.calculator import GrowthCalculator
+from src.models import CountryGrowth
+from src.reports.base import Report
+
+
+class GrowthReport(Report[CountryGrowth]):
+    """
+    Отчет по динамике показателя: скользящее среднее за N лет,
+    среднегодовой темп роста (CAGR) и накопленный рост по gdp_growth.
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Уникальный идентификатор отчета.
+
+        Returns:
+            str: 'growth'.
+        """
+        return "growth"
+
+    @property
+    def description(self) -> str:
+        """
+        Описание отчета для --list-reports.
+
+        Returns:
+            str: Краткое описание.
+        """
+        return "Moving average, CAGR and cumulative growth by country"
+
+    def create_calculator(self, params: Mapping[str, Any]) -> GrowthCalculator:
+        """
+        Создает калькулятор по параметрам indicator, window,
+        start_year и end_year.
+
+        Args:
+            params: Параметры отчета.
+
+        Returns:
+            GrowthCalculator: Калькулятор динамики.
+        """
+        return GrowthCalculator(
+            indicator=params.get("indicator") or "gdp",
+            window=3 if params.get("window") is None else params["window"],
+            start_year=params.get("start_year"),
+            end_year=params.get("end_year"),
+        )
+
+    def generate(self, data: list[CountryGrowth]) -> str:
+        """
+        Генерирует таблицу показателей роста.
+
+        Args:
+            data: Показатели по странам, упорядоченные по убыванию CAGR.
+
+        Returns:
+            str: Отформатированная таблица для вывода в консоль.
+        """
+        if not data:
+            return "No data"
+
+        table_data = []
+        for idx, growth in enumerate(data, start=1):
+            table_data.append(
+                [
+                    idx,
+                    growth.country,
+                    f"{growth.first_year}-{growth.last_year}",
+                    _format_optional(growth.latest_moving_average, "{:,.2f}"),
+                    _format_optional(growth.cagr, "{:.2f}%"),
+                    _format_optional(growth.cumulative_growth, "{:.2f}%"),
+                ]
+            )
+
+        first = data[0]
+        return tabulate(
+            table_data,
+            headers=[
+                "#",
+                "Country",
+                "Years",
+                f"{first.window}-yr MA {first.indicator} (latest)",
+                "CAGR",
+                "Cumulative growth",
+            ],
+            tablefmt="grid",
+            colalign=["right", "left", "left", "right", "right", "right"],
+            disable_numparse=True,
+        )
+
+
+def _format_optional(value: float | None, template: str) -> str:
+    """Форматирует значение или возвращает '-' при его отсутствии."""
+    return "-" if value is None else template.format(value)
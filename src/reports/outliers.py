@@ -0,0 +1,119 @@
+from collections import Counter
+from typing import Any, Mapping
+
+from tabulate import tabulate
+
+from src.calculator import LEVEL_INDICATORS, OutlierCalculator
+from src.models import Outlier
+from src.reports.base import Report
+
+# Параметры отчета, передаваемые калькулятору как есть
+_THRESHOLD_PARAMS = ("z_threshold", "mad_threshold", "jump_ratio", "jump_points")
+
+
+def _format_score(outlier: Outlier) -> str:
+    """Оценка выброса: z-оценка, отношение (x) или изменение (п.п.)."""
+    if outlier.method != "yoy":
+        return f"{outlier.score:+,.2f}"
+    if outlier.indicator in LEVEL_INDICATORS:
+        return f"x{outlier.score:,.4g}"
+    return f"{outlier.score:+,.2f} pp"
+
+
+class OutlierReport(Report[Outlier]):
+    """
+    Отчет о подозрительных значениях показателей по странам: z-оценка,
+    робастная оценка по медиане и MAD и скачки к прошлому году.
+    Показатели задаются параметром indicators (по умолчанию все).
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Уникальный идентификатор отчета.
+
+        Returns:
+            str: 'outliers'.
+        """
+        return "outliers"
+
+    @property
+    def description(self) -> str:
+        """
+        Описание отчета для --list-reports.
+
+        Returns:
+            str: Краткое описание.
+        """
+        return "Z-score, MAD and year-over-year jump outliers by country"
+
+    def create_calculator(self, params: Mapping[str, Any]) -> OutlierCalculator:
+        """
+        Создает калькулятор выбросов.
+
+        Args:
+            params: Параметры отчета: indicators и пороги z_threshold,
+                mad_threshold, jump_ratio, jump_points.
+
+        Returns:
+            OutlierCalculator: Калькулятор выбросов.
+        """
+        thresholds = {
+            name: params[name] for name in _THRESHOLD_PARAMS if name in params
+        }
+        return OutlierCalculator(params.get("indicators"), **thresholds)
+
+    def generate(self, data: list[Outlier]) -> str:
+        """
+        Генерирует таблицу выбросов.
+
+        Args:
+            data: Выбросы по странам.
+
+        Returns:
+            str: Сводка и отформатированная таблица для вывода в консоль.
+        """
+        if not data:
+            return "No outliers found"
+
+        table_data = [
+            [
+                idx,
+                outlier.country,
+                outlier.year,
+                outlier.indicator,
+                f"{outlier.value:,.2f}",
+                outlier.method,
+                _format_score(outlier),
+                f"{outlier.reference:,.2f}",
+            ]
+            for idx, outlier in enumerate(data, start=1)
+        ]
+        methods = Counter(outlier.method for outlier in data)
+        countries = len({outlier.country for outlier in data})
+        summary = (
+            f"Outliers: {len(data)} in {countries} countries ("
+            + ", ".join(f"{method}: {count}" for method, count in methods.items())
+            + ")"
+        )
+        return (
+            summary
+            + "\n"
+            + tabulate(
+                table_data,
+                headers=[
+                    "#",
+                    "Country",
+                    "Year",
+                    "Indicator",
+                    "Value",
+                    "Method",
+                    "Score",
+                    "Reference",
+                ],
+                tablefmt="grid",
+                colalign=["right", "left", "right", "left", "right", "left"]
+                + ["right"] * 2,
+                disable_numparse=True,
+            )
+        )
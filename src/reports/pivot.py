@@ -0,0 +1,110 @@
+import csv
+import math
+from typing import Any, Mapping, TextIO
+
+from tabulate import tabulate
+
+from src.calculator import PivotCalculator
+from src.models import PivotTable
+from src.reports.base import Report
+
+
+def _format_cell(value: float) -> str:
+    """Форматирует ячейку сводной таблицы; пустая ячейка - пустая строка."""
+    return "" if math.isnan(value) else f"{value:,.2f}"
+
+
+class PivotReport(Report[PivotTable]):
+    """
+    Сводный отчет: страны в строках, годы в колонках.
+    Показатели задаются параметром indicators (по умолчанию indicator или gdp).
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Уникальный идентификатор отчета.
+
+        Returns:
+            str: 'pivot'.
+        """
+        return "pivot"
+
+    @property
+    def description(self) -> str:
+        """
+        Описание отчета для --list-reports.
+
+        Returns:
+            str: Краткое описание.
+        """
+        return "Country x year matrix of one or more indicators (--indicators)"
+
+    def create_calculator(self, params: Mapping[str, Any]) -> PivotCalculator:
+        """
+        Создает калькулятор сводных таблиц.
+
+        Args:
+            params: Параметры отчета: indicators (список колонок) или
+                indicator (одна колонка).
+
+        Returns:
+            PivotCalculator: Калькулятор сводных таблиц.
+        """
+        return PivotCalculator(
+            params.get("indicators") or [params.get("indicator") or "gdp"]
+        )
+
+    def generate(self, data: list[PivotTable]) -> str:
+        """
+        Генерирует по таблице на каждый показатель.
+
+        Args:
+            data: Сводные таблицы показателей.
+
+        Returns:
+            str: Отформатированные таблицы для вывода в консоль.
+        """
+        if not data:
+            return "No data"
+
+        sections = []
+        for table in data:
+            table_data = [
+                [country, *map(_format_cell, table.row(i))]
+                for i, country in enumerate(table.countries)
+            ]
+            sections.append(
+                f"Indicator: {table.indicator}\n"
+                + tabulate(
+                    table_data,
+                    headers=["Country", *map(str, table.years)],
+                    tablefmt="grid",
+                    colalign=["left"] + ["right"] * len(table.years),
+                    disable_numparse=True,
+                )
+            )
+        return "\n\n".join(sections)
+
+    def write_csv(self, data: list[PivotTable], file: TextIO) -> None:
+        """
+        Записывает сводные таблицы в CSV в широком формате.
+
+        Колонки: indicator, country и по колонке на год; пустые ячейки
+        остаются пустыми.
+
+        Args:
+            data: Сводные таблицы показателей.
+            file: Открытый текстовый файл (newline='').
+        """
+        writer = csv.writer(file)
+        years = sorted({year for table in data for year in table.years})
+        positions = {year: j for j, year in enumerate(years)}
+        writer.writerow(["indicator", "country", *years])
+        for table in data:
+            for i, country in enumerate(table.countries):
+                cells: list[Any] = [""] * len(years)
+                for year, value in zip(table.years, table.row(i), strict=True):
+                    if not math.isnan(value):
+                        cells[positions[year]] = value
+                writer.writerow([table.indicator, country, *cells])
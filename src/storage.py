@@ -0,0 +1,362 @@
+import logging
+import sqlite3
+from dataclasses import astuple
+from itertools import islice
+from pathlib import Path
+from typing import Any, Collection, Iterable, Iterator, Sequence
+
+from src.cache import fingerprint_file
+from src.calculator import AggregateSpec
+from src.filters import RowFilter
+from src.models import EconomicRecord, GroupStatistics
+from src.reader import CSVReader, DataReader, FileReader, is_stream, iter_paths
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAME = "economic_records"
+
+# Порядок колонок совпадает с полями EconomicRecord
+RECORD_COLUMNS = (
+    "country",
+    "year",
+    "gdp",
+    "gdp_growth",
+    "inflation",
+    "unemployment",
+    "population",
+    "continent",
+)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
+    country TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    gdp REAL NOT NULL,
+    gdp_growth REAL NOT NULL,
+    inflation REAL NOT NULL,
+    unemployment REAL NOT NULL,
+    population INTEGER NOT NULL,
+    continent TEXT NOT NULL
+)
+"""
+
+# Загруженные файлы: повторная загрузка того же содержимого пропускается
+INGESTED_TABLE = "ingested_files"
+
+INGESTED_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {INGESTED_TABLE} (
+    digest TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    records INTEGER NOT NULL
+)
+"""
+
+INDEXES = (
+    f"CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_country ON {TABLE_NAME} (country)",
+    f"CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_year ON {TABLE_NAME} (year)",
+    f"CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_continent "
+    f"ON {TABLE_NAME} (continent)",
+)
+
+# Агрегатные функции, которые переводятся в SQL ('last' не имеет аналога).
+# TOTAL вместо SUM: сумма INTEGER колонки (population) возвращается
+# числом с плавающей точкой, как у HashAggregator и куба
+SQL_AGGREGATES = {
+    "sum": "TOTAL({column})",
+    "mean": "AVG({column})",
+    "min": "MIN({column})",
+    "max": "MAX({column})",
+    "count": "COUNT(*)",
+}
+
+DEFAULT_INGEST_BATCH_SIZE = 10_000
+
+
+def build_where(row_filter: RowFilter | None) -> tuple[str, list[Any]]:
+    """
+    Переводит фильтр строк в условие WHERE с параметрами.
+
+    Args:
+        row_filter: Фильтр строк (None - без условий).
+
+    Returns:
+        tuple[str, list]: Текст условия (или пустая строка) и параметры.
+    """
+    if row_filter is None or row_filter.is_empty:
+        return "", []
+
+    clauses = []
+    params: list[Any] = []
+    if row_filter.year_from is not None:
+        clauses.append("year >= ?")
+        params.append(row_filter.year_from)
+    if row_filter.year_to is not None:
+        clauses.append("year <= ?")
+        params.append(row_filter.year_to)
+    for column, values in (
+        ("country", row_filter.countries),
+        ("continent", row_filter.continents),
+    ):
+        if values is not None:
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(sorted(values))
+    return " WHERE " + " AND ".join(clauses), params
+
+
+class SQLiteStorage:
+    """
+    Локальная база SQLite с экономическими данными.
+    Загружает CSV файлы пакетами через CSVReader (с полной валидацией).
+    """
+
+    def __init__(self, db_path: str | Path):
+        """
+        Args:
+            db_path: Путь к файлу базы данных (создается при загрузке).
+        """
+        self.db_path = Path(db_path)
+
+    def ingest(
+        self,
+        file_paths: Iterable[str],
+        reader: FileReader | None = None,
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+    ) -> int:
+        """
+        Загружает CSV файлы в базу.
+
+        Каждый файл загружается в отдельной транзакции пакетами executemany:
+        при ошибке валидации строки файла в базу не попадают.
+        Индексы по country, year и continent создаются после загрузки.
+
+        Строки новых файлов добавляются к уже загруженным. В той же
+        транзакции запоминается SHA-256 содержимого файла: файл, уже
+        загруженный (под любым путем), пропускается, а измененный после
+        загрузки файл отклоняется, так как его старые строки остались бы
+        в базе. Потоки (stdin, каналы) не имеют отпечатка и добавляются
+        всегда.
+
+        Args:
+            file_paths: Пути к CSV файлам.
+            reader: Читатель файлов (по умолчанию - CSVReader со строгой
+                валидацией).
+            batch_size: Число строк в одном executemany.
+
+        Returns:
+            int: Общее число загруженных записей.
+
+        Raises:
+            FileNotFoundError: Если один из файлов не существует.
+            ValidationError: При ошибках валидации данных.
+            ValueError: Если файл изменился после загрузки в базу.
+        """
+        reader = reader or CSVReader(strict=True)
+        insert = (
+            f"INSERT INTO {TABLE_NAME} ({', '.join(RECORD_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(RECORD_COLUMNS))})"
+        )
+        total = 0
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(SCHEMA)
+            conn.execute(INGESTED_SCHEMA)
+
+            for file_path in file_paths:
+                fingerprint = None
+                if not is_stream(file_path):
+                    fingerprint = fingerprint_file(file_path, hash_content=True)
+                    if self._already_ingested(conn, file_path, fingerprint.digest):
+                        continue
+                else:
+                    logger.info(f"Appending {file_path} without a fingerprint")
+                loaded = 0
+                records = reader.read_file(file_path)
+                with conn:
+                    while batch := list(islice(records, batch_size)):
+                        conn.executemany(insert, map(astuple, batch))
+                        loaded += len(batch)
+                    if fingerprint is not None:
+                        conn.execute(
+                            f"INSERT INTO {INGESTED_TABLE} VALUES (?, ?, ?, ?)",
+                            (
+                                fingerprint.digest,
+                                fingerprint.path,
+                                fingerprint.size,
+                                loaded,
+                            ),
+                        )
+                logger.info(f"Ingested {loaded} records from {file_path}")
+                total += loaded
+
+            with conn:
+                for statement in INDEXES:
+                    conn.execute(statement)
+                conn.execute("ANALYZE")
+        finally:
+            conn.close()
+
+        logger.info(f"Ingested {total} records into {self.db_path}")
+        return total
+
+    @staticmethod
+    def _already_ingested(
+        conn: sqlite3.Connection, file_path: str, digest: str | None
+    ) -> bool:
+        """
+        Проверяет, загружено ли уже содержимое файла.
+
+        Raises:
+            ValueError: Если файл по тому же пути загружен с другим содержимым.
+        """
+        previous = conn.execute(
+            f"SELECT path, records FROM {INGESTED_TABLE} WHERE digest = ?", (digest,)
+        ).fetchone()
+        if previous is not None:
+            logger.warning(
+                f"Skipping {file_path}: already ingested from {previous[0]} "
+                f"({previous[1]} records)"
+            )
+            return True
+        path = str(Path(file_path).resolve())
+        if conn.execute(
+            f"SELECT 1 FROM {INGESTED_TABLE} WHERE path = ?", (path,)
+        ).fetchone():
+            raise ValueError(
+                f"{file_path} has changed since it was ingested; its old rows are "
+                "still in the database, rebuild the database to load the new version"
+            )
+        return False
+
+
+class SQLiteReader(DataReader):
+    """
+    Читатель базы SQLite, созданной SQLiteStorage.
+
+    Фильтр строк переводится в WHERE и выполняется по индексам.
+    Агрегации, описанные AggregateSpec, выполняются запросом GROUP BY
+    без загрузки записей в Python.
+    """
+
+    def __init__(self, row_filter: RowFilter | None = None):
+        """
+        Args:
+            row_filter: Фильтр строк, передаваемый в условие WHERE.
+        """
+        self.row_filter = row_filter
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Настройки читателя, влияющие на результат (для ключей кеша)."""
+        return {"row_filter": self.row_filter}
+
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        """
+        Открывает базу только для чтения.
+
+        Raises:
+            FileNotFoundError: Если файл базы не существует.
+        """
+        path = Path(db_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Database not found: {db_path}")
+        return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+    def read(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> list[EconomicRecord]:
+        """
+        Читает записи из одной или нескольких баз.
+
+        Args:
+            file_paths: Пути к файлам баз SQLite.
+            columns: Не используется: значения в базе уже проверены.
+
+        Returns:
+            list[EconomicRecord]: Записи, прошедшие фильтр.
+
+        Raises:
+            ValueError: Если список баз пуст.
+            FileNotFoundError: Если база не существует.
+        """
+        records = list(self.iter_records(file_paths, columns))
+        logger.info(f"Total records loaded: {len(records)}")
+        return records
+
+    def iter_records(
+        self, file_paths: Iterable[str], columns: Collection[str] | None = None
+    ) -> Iterator[EconomicRecord]:
+        """
+        Читает записи потоком по курсору, не накапливая их в памяти.
+
+        Raises:
+            ValueError: Если список баз пуст.
+        """
+        return self._iter_databases(iter_paths(file_paths))
+
+    def _iter_databases(self, file_paths: Iterable[str]) -> Iterator[EconomicRecord]:
+        """Последовательно выбирает записи из каждой базы."""
+        where, params = build_where(self.row_filter)
+        query = f"SELECT {', '.join(RECORD_COLUMNS)} FROM {TABLE_NAME}{where}"
+
+        for db_path in file_paths:
+            conn = self._connect(db_path)
+            try:
+                for row in conn.execute(query, params):
+                    yield EconomicRecord(*row)
+            finally:
+                conn.close()
+
+    def aggregate(
+        self,
+        file_paths: Sequence[str],
+        spec: AggregateSpec,
+        memory_limit: int | None = None,
+    ) -> list[GroupStatistics] | None:
+        """
+        Выполняет агрегацию запросом GROUP BY.
+
+        Args:
+            file_paths: Пути к файлам баз (поддерживается одна база).
+            spec: Спецификация агрегации.
+            memory_limit: Не используется: группы строит SQLite.
+
+        Returns:
+            list[GroupStatistics] | None: Результат или None, если агрегацию
+            нельзя выполнить в SQL (несколько баз или функция 'last').
+        """
+        if len(file_paths) != 1 or any(
+            agg.func not in SQL_AGGREGATES for agg in spec.aggregates
+        ):
+            return None
+
+        keys = ", ".join(spec.group_by)
+        expressions = ", ".join(
+            SQL_AGGREGATES[agg.func].format(column=agg.column)
+            for agg in spec.aggregates
+        )
+        where, params = build_where(self.row_filter)
+        query = f"SELECT {keys}, {expressions} FROM {TABLE_NAME}{where} GROUP BY {keys}"
+        logger.debug(f"Pushing aggregation down to SQLite: {query}")
+
+        key_count = len(spec.group_by)
+        conn = self._connect(file_paths[0])
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+        return [
+            GroupStatistics(
+                key=dict(zip(spec.group_by, row[:key_count], strict=True)),
+                values={
+                    agg.label: value
+                    for agg, value in zip(spec.aggregates, row[key_count:], strict=True)
+                },
+            )
+            for row in rows
+        ]
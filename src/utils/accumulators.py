@@ -0,0 +1,454 @@
+import math
+import random
+from typing import Any, Iterable, Iterator, Sequence
+
+
+class RunningStats:
+    """
+    Потоковые моменты по алгоритму Уэлфорда.
+
+    Хранит количество, среднее, сумму квадратов отклонений, минимум и максимум.
+    Накопители объединяются без потери точности (формула Чана), поэтому
+    частичные результаты по файлам и процессам можно складывать.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Учитывает одно значение."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats") -> None:
+        """Добавляет значения другого накопителя."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Выборочная дисперсия (0 для менее чем двух значений)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Выборочное стандартное отклонение."""
+        return math.sqrt(self.variance)
+
+
+class CoMoments:
+    """
+    Потоковые совместные моменты нескольких показателей.
+
+    Многомерный вариант алгоритма Уэлфорда: хранит количество, средние
+    и матрицу сумм произведений отклонений (верхний треугольник; матрица
+    симметрична). Из нее за O(1) получаются ковариации и корреляции всех
+    пар показателей. Накопители объединяются
+    по формуле Чана, поэтому частичные результаты по файлам и узлам
+    можно складывать.
+    """
+
+    __slots__ = ("size", "count", "means", "m2")
+
+    def __init__(self, size: int) -> None:
+        """
+        Args:
+            size: Число показателей.
+        """
+        self.size = size
+        self.count = 0
+        self.means = [0.0] * size
+        # Суммы произведений отклонений по строкам: m2[i * size + j], i <= j
+        self.m2 = [0.0] * (size * size)
+
+    def add(self, values: Sequence[float]) -> None:
+        """Учитывает одно наблюдение (значения всех показателей)."""
+        self.count += 1
+        size, means, m2 = self.size, self.means, self.m2
+        deltas = [value - mean for value, mean in zip(values, means, strict=True)]
+        for i in range(size):
+            means[i] += deltas[i] / self.count
+        for i in range(size):
+            delta = deltas[i]
+            row = i * size
+            for j in range(i, size):
+                m2[row + j] += delta * (values[j] - means[j])
+
+    def merge(self, other: "CoMoments") -> None:
+        """Добавляет наблюдения другого накопителя."""
+        if other.size != self.size:
+            raise ValueError(
+                f"Cannot merge co-moments of {other.size} and {self.size} indicators"
+            )
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count = other.count
+            self.means = list(other.means)
+            self.m2 = list(other.m2)
+            return
+        total = self.count + other.count
+        weight = self.count * other.count / total
+        deltas = [b - a for a, b in zip(self.means, other.means, strict=True)]
+        for i in range(self.size):
+            self.means[i] += deltas[i] * other.count / total
+            row = i * self.size
+            for j in range(i, self.size):
+                self.m2[row + j] += other.m2[row + j] + deltas[i] * deltas[j] * weight
+        self.count = total
+
+    def covariance(self, i: int, j: int) -> float:
+        """Выборочная ковариация показателей i и j (NaN для менее чем двух)."""
+        if self.count < 2:
+            return math.nan
+        return self.m2[self._index(i, j)] / (self.count - 1)
+
+    def correlation(self, i: int, j: int) -> float:
+        """Коэффициент корреляции Пирсона (NaN, если дисперсия нулевая)."""
+        denominator = math.sqrt(self.m2[i * self.size + i] * self.m2[j * self.size + j])
+        if self.count < 2 or denominator == 0:
+            return math.nan
+        # Ограничение компенсирует ошибки округления на границах [-1, 1]
+        return max(-1.0, min(1.0, self.m2[self._index(i, j)] / denominator))
+
+    def _index(self, i: int, j: int) -> int:
+        """Позиция пары (i, j) в верхнем треугольнике m2."""
+        return min(i, j) * self.size + max(i, j)
+
+    def state(self) -> list[Any]:
+        """Состояние накопителя в виде списков (для передачи по сети)."""
+        return [self.count, self.means, self.m2]
+
+    @classmethod
+    def from_state(cls, state: Sequence[Any]) -> "CoMoments":
+        """Восстанавливает накопитель из state()."""
+        count, means, m2 = state
+        moments = cls(len(means))
+        if len(m2) != moments.size * moments.size:
+            raise ValueError("Invalid co-moments state")
+        moments.count = int(count)
+        moments.means = [float(value) for value in means]
+        moments.m2 = [float(value) for value in m2]
+        return moments
+
+
+class YearSet:
+    """
+    Множество лет в виде целочисленной битовой маски.
+
+    Бит i маски соответствует году base + i; base - наименьший
+    добавленный год (при добавлении более раннего года маска сдвигается).
+    Объединение и пересечение множеств - побитовые операции над int,
+    число лет - подсчет единичных битов.
+    """
+
+    __slots__ = ("base", "mask")
+
+    def __init__(self, years: Iterable[int] = ()) -> None:
+        """
+        Args:
+            years: Начальные годы.
+        """
+        self.base = 0
+        self.mask = 0
+        for year in years:
+            self.add(year)
+
+    def add(self, year: int) -> None:
+        """Добавляет год."""
+        if not self.mask:
+            self.base = year
+        elif year < self.base:
+            self.mask <<= self.base - year
+            self.base = year
+        self.mask |= 1 << (year - self.base)
+
+    def _aligned(self, other: "YearSet") -> tuple[int, int, int]:
+        """Маски двух множеств относительно общего base."""
+        base = min(self.base, other.base)
+        return base, self.mask << (self.base - base), other.mask << (other.base - base)
+
+    def merge(self, other: "YearSet") -> None:
+        """Добавляет годы другого множества."""
+        if not other.mask:
+            return
+        if not self.mask:
+            self.base, self.mask = other.base, other.mask
+            return
+        self.base, left, right = self._aligned(other)
+        self.mask = left | right
+
+    def intersection(self, other: "YearSet") -> "YearSet":
+        """Годы, входящие в оба множества."""
+        result = YearSet()
+        if self.mask and other.mask:
+            result.base, left, right = self._aligned(other)
+            result.mask = left & right
+            result._normalize()
+        return result
+
+    def _normalize(self) -> None:
+        """Сдвигает маску так, чтобы младший бит соответствовал base."""
+        if self.mask:
+            shift = (self.mask & -self.mask).bit_length() - 1
+            self.mask >>= shift
+            self.base += shift
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __contains__(self, year: object) -> bool:
+        if not isinstance(year, int) or year < self.base:
+            return False
+        return bool(self.mask >> (year - self.base) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        mask, year = self.mask, self.base
+        while mask:
+            # Пропуск нулевых битов до следующего года
+            shift = (mask & -mask).bit_length() - 1
+            mask >>= shift
+            year += shift
+            yield year
+            mask >>= 1
+            year += 1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, YearSet):
+            return NotImplemented
+        return (self.mask, self.base if self.mask else 0) == (
+            other.mask,
+            other.base if other.mask else 0,
+        )
+
+    @property
+    def first(self) -> int | None:
+        """Первый год (None для пустого множества)."""
+        return self.base if self.mask else None
+
+    @property
+    def last(self) -> int | None:
+        """Последний год (None для пустого множества)."""
+        return self.base + self.mask.bit_length() - 1 if self.mask else None
+
+    def missing(self) -> list[int]:
+        """Пропущенные годы между первым и последним."""
+        if not self.mask:
+            return []
+        holes = ~self.mask & ((1 << self.mask.bit_length()) - 1)
+        return [self.base + i for i in range(holes.bit_length()) if holes >> i & 1]
+
+    def gaps(self) -> list[tuple[int, int]]:
+        """Серии подряд идущих пропущенных лет: [(первый, последний), ...]."""
+        runs: list[tuple[int, int]] = []
+        for year in self.missing():
+            if runs and runs[-1][1] == year - 1:
+                runs[-1] = (runs[-1][0], year)
+            else:
+                runs.append((year, year))
+        return runs
+
+
+def exact_quantile(sorted_values: list[float], q: float) -> float:
+    """
+    Квантиль отсортированной выборки с линейной интерполяцией.
+
+    Args:
+        sorted_values: Непустой отсортированный список.
+        q: Уровень квантиля от 0 до 1.
+
+    Returns:
+        float: Значение квантиля.
+    """
+    position = (len(sorted_values) - 1) * q
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    fraction = position - lower
+    return sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+
+
+class QuantileSketch:
+    """
+    Приближенный квантильный скетч с ограниченной памятью (упрощенный KLL).
+
+    Значения копятся в уровнях-компакторах вместимостью k. Заполненный
+    уровень сортируется, и каждый второй элемент (со случайным сдвигом)
+    переносится на следующий уровень с удвоенным весом. Память растет как
+    O(k * log(n / k)), ошибка ранга - порядка 1 / k. Скетчи объединяются.
+    """
+
+    def __init__(self, k: int = 256, seed: int | None = None):
+        """
+        Args:
+            k: Вместимость уровня (точность скетча).
+            seed: Зерно генератора для воспроизводимости.
+        """
+        if k < 2:
+            raise ValueError(f"Sketch capacity must be >= 2, got {k}")
+        self.k = k
+        self.count = 0
+        self._levels: list[list[float]] = [[]]
+        self._rng = random.Random(seed)
+
+    def add(self, value: float) -> None:
+        """Учитывает одно значение."""
+        self._levels[0].append(value)
+        self.count += 1
+        if len(self._levels[0]) >= self.k:
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Учитывает несколько значений."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Добавляет значения другого скетча."""
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+        self.count += other.count
+        self._compress()
+
+    def _compress(self) -> None:
+        """Уплотняет переполненные уровни, начиная с нижнего."""
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) >= self.k:
+                items.sort()
+                # При нечетном размере последний элемент остается на уровне
+                kept = [items.pop()] if len(items) % 2 else []
+                promoted = items[self._rng.randint(0, 1) :: 2]
+                if level + 1 == len(self._levels):
+                    self._levels.append([])
+                self._levels[level + 1].extend(promoted)
+                self._levels[level] = kept
+            level += 1
+
+    @property
+    def size(self) -> int:
+        """Число хранимых значений."""
+        return sum(len(items) for items in self._levels)
+
+    def quantile(self, q: float) -> float:
+        """
+        Оценивает квантиль.
+
+        Args:
+            q: Уровень квантиля от 0 до 1.
+
+        Returns:
+            float: Оценка квантиля (NaN для пустого скетча).
+        """
+        weighted = sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self._levels)
+            for value in items
+        )
+        if not weighted:
+            return math.nan
+        total = sum(weight for _value, weight in weighted)
+        target = q * total
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+
+class QuantileAccumulator:
+    """
+    Квантили группы: точные для малых групп, по скетчу для больших.
+
+    Пока число значений не превышает exact_limit, значения хранятся целиком
+    и квантили вычисляются точно. При превышении значения переносятся
+    в QuantileSketch, и память группы перестает расти линейно.
+    """
+
+    def __init__(self, exact_limit: int = 1024, sketch_k: int = 256):
+        """
+        Args:
+            exact_limit: Максимальный размер группы для точного расчета.
+            sketch_k: Точность скетча для больших групп.
+        """
+        self.exact_limit = exact_limit
+        self.sketch_k = sketch_k
+        self._values: list[float] | None = []
+        self._sketch: QuantileSketch | None = None
+
+    @property
+    def is_exact(self) -> bool:
+        """True, если квантили вычисляются точно."""
+        return self._sketch is None
+
+    def add(self, value: float) -> None:
+        """Учитывает одно значение."""
+        if self._values is not None:
+            self._values.append(value)
+            if len(self._values) > self.exact_limit:
+                self._switch_to_sketch()
+        elif self._sketch is not None:
+            self._sketch.add(value)
+
+    def merge(self, other: "QuantileAccumulator") -> None:
+        """Добавляет значения другого накопителя."""
+        if other._values is not None:
+            for value in other._values:
+                self.add(value)
+            return
+        if self._sketch is None:
+            self._switch_to_sketch()
+        if self._sketch is not None and other._sketch is not None:
+            self._sketch.merge(other._sketch)
+
+    def _switch_to_sketch(self) -> None:
+        """Переносит накопленные значения в скетч."""
+        self._sketch = QuantileSketch(self.sketch_k)
+        self._sketch.extend(self._values or [])
+        self._values = None
+
+    def quantile(self, q: float) -> float:
+        """
+        Возвращает квантиль уровня q (NaN, если значений нет).
+
+        Args:
+            q: Уровень квантиля от 0 до 1.
+        """
+        if self._sketch is not None:
+            return self._sketch.quantile(q)
+        if not self._values:
+            return math.nan
+        # Точный расчет: группа мала, сортировка дешевле выборки по частям
+        self._values.sort()
+        return exact_quantile(self._values, q)
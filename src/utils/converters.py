@@ -1,5 +1,31 @@
+from typing import Any, Callable, Collection
+
 from src.models import EconomicRecord
 
+# Преобразователи значений для каждой колонки
+FIELD_PARSERS: dict[str, Callable[[Any], Any]] = {
+    "country": lambda value: value.strip(),
+    "year": int,
+    "gdp": float,
+    "gdp_growth": float,
+    "inflation": float,
+    "unemployment": float,
+    "population": int,
+    "continent": lambda value: value.strip(),
+}
+
+# Значения колонок, которые не были запрошены при проекции
+FIELD_DEFAULTS: dict[str, Any] = {
+    "country": "",
+    "year": 0,
+    "gdp": 0.0,
+    "gdp_growth": 0.0,
+    "inflation": 0.0,
+    "unemployment": 0.0,
+    "population": 0,
+    "continent": "",
+}
+
 
 class EconomicDataConverter:
     """
@@ -8,13 +34,23 @@ class EconomicDataConverter:
     """
 
     @staticmethod
-    def to_record(row: dict[str, str]) -> EconomicRecord:
+    def to_record(
+        row: dict[str, str], columns: Collection[str] | None = None
+    ) -> EconomicRecord:
         """
         Преобразует строку CSV в объект EconomicRecord.
 
         :param row: Словарь с данными из CSV (уже очищенный)
+        :param columns: Преобразуемые колонки (по умолчанию все). Остальные
+            поля записи получают значения из FIELD_DEFAULTS
         :return: EconomicRecord: Объект с экономическими данными
         """
+        if columns is not None:
+            values = dict(FIELD_DEFAULTS)
+            for col in columns:
+                values[col] = FIELD_PARSERS[col](row[col])
+            return EconomicRecord(**values)
+
         return EconomicRecord(
             country=row["country"].strip(),
             year=int(row["year"]),
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Sequence
+from typing import Any, Collection, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +27,15 @@ class EconomicDataValidator:
         "continent",
     }
 
-    def validate_header(self, header: Sequence[str]) -> bool:
+    def validate_header(
+        self, header: Sequence[str], columns: Collection[str] | None = None
+    ) -> bool:
         """
         Проверяет наличие всех необходимых колонок.
 
         Args:
             header: Заголовок CSV файла.
+            columns: Проверяемые колонки (по умолчанию все обязательные).
 
         Returns:
             True, если все колонки присутствуют.
@@ -42,19 +45,27 @@ class EconomicDataValidator:
         """
 
         header_set = {col.strip() for col in header}
-        missing = self.REQUIRED_COLUMNS - header_set
+        required = self.REQUIRED_COLUMNS if columns is None else set(columns)
+        missing = required - header_set
 
         if missing:
             raise ValidationError(f"Missing required columns: {', '.join(missing)}")
         return True
 
-    def validate_row(self, row: dict[str, str], row_num: int) -> bool:
+    def validate_row(
+        self,
+        row: dict[str, str],
+        row_num: int,
+        columns: Collection[str] | None = None,
+    ) -> bool:
         """
         Валидирует одну строку данных.
 
         Args:
             row: Словарь с данными строки.
             row_num: Номер строки для логирования.
+            columns: Проверяемые колонки (по умолчанию все обязательные).
+                Остальные значения строки не проверяются (проекция колонок).
 
         Returns:
             True, если данные валидны.
@@ -62,49 +73,62 @@ class EconomicDataValidator:
         Raises:
             ValidationError: При обнаружении невалидных данных.
         """
+        checked = self.REQUIRED_COLUMNS if columns is None else columns
         try:
             # Проверка наличия всех ключей
-            self._validate_required_fields_present(row, row_num)
+            self._validate_required_fields_present(row, row_num, checked)
 
             # Валидация года
-            self._validate_integer_field(
-                row.get("year"), "year", row_num, min_value=1900, max_value=2100
-            )
+            if "year" in checked:
+                self._validate_integer_field(
+                    row.get("year"), "year", row_num, min_value=1900, max_value=2100
+                )
 
             # Валидация GDP
-            self._validate_float_field(
-                row.get("gdp"), "gdp", row_num, can_be_negative=False
-            )
+            if "gdp" in checked:
+                self._validate_float_field(
+                    row.get("gdp"), "gdp", row_num, can_be_negative=False
+                )
 
             # Валидация роста GDP (может быть отрицательным)
-            self._validate_float_field(row.get("gdp_growth"), "gdp_growth", row_num)
+            if "gdp_growth" in checked:
+                self._validate_float_field(row.get("gdp_growth"), "gdp_growth", row_num)
 
             # Валидация инфляции
-            self._validate_float_field(row.get("inflation"), "inflation", row_num)
+            if "inflation" in checked:
+                self._validate_float_field(row.get("inflation"), "inflation", row_num)
 
             # Валидация безработицы
-            self._validate_float_field(
-                row.get("unemployment"), "unemployment", row_num, can_be_negative=False
-            )
+            if "unemployment" in checked:
+                self._validate_float_field(
+                    row.get("unemployment"),
+                    "unemployment",
+                    row_num,
+                    can_be_negative=False,
+                )
 
             # Валидация населения (положительное целое)
-            population = self._validate_integer_field(
-                row.get("population"), "population", row_num, min_value=1
-            )
-            if population <= 0:
-                raise ValidationError(
-                    f"Row {row_num}: Population mus be positive, got {population}"
+            if "population" in checked:
+                population = self._validate_integer_field(
+                    row.get("population"), "population", row_num, min_value=1
                 )
+                if population <= 0:
+                    raise ValidationError(
+                        f"Row {row_num}: Population mus be positive, got {population}"
+                    )
 
             # Валидация континента (не пустой)
-            continent = row.get("continent", "")
-            if isinstance(continent, str):
-                if not continent.strip():
-                    raise ValidationError(f"Row {row_num}: Continent cannot be empty")
-            else:
-                raise ValidationError(
-                    f"Row {row_num}: Continent must be a string, got {type(continent).__name__}"
-                )
+            if "continent" in checked:
+                continent = row.get("continent", "")
+                if isinstance(continent, str):
+                    if not continent.strip():
+                        raise ValidationError(
+                            f"Row {row_num}: Continent cannot be empty"
+                        )
+                else:
+                    raise ValidationError(
+                        f"Row {row_num}: Continent must be a string, got {type(continent).__name__}"
+                    )
 
             return True
 
@@ -117,10 +141,10 @@ class EconomicDataValidator:
             ) from e
 
     def _validate_required_fields_present(
-        self, row: dict[str, Any], row_num: int
+        self, row: dict[str, Any], row_num: int, columns: Collection[str]
     ) -> None:
-        """Проверяет наличие всех обязательных полей и что они не пусты."""
-        for col in self.REQUIRED_COLUMNS:
+        """Проверяет наличие обязательных полей и что они не пусты."""
+        for col in columns:
             value = row.get(col)
             if value is None or (isinstance(value, str) and not value.strip()):
                 raise ValueError(
@@ -0,0 +1,237 @@
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from src.filters import RowFilter
+
+logger = logging.getLogger(__name__)
+
+# Суффикс файла-спутника рядом с CSV: data.csv -> data.csv.zonemap.json
+ZONE_MAP_SUFFIX = ".zonemap.json"
+ZONE_MAP_VERSION = 1
+
+# При большем числе различных значений множество не сохраняется
+# и файл не может быть отброшен по этой колонке
+MAX_DISTINCT_VALUES = 4096
+
+
+@dataclass(frozen=True)
+class ZoneMap:
+    """
+    Сводка по содержимому CSV файла (zone map).
+
+    Позволяет решить, может ли файл содержать строки, проходящие фильтр,
+    не открывая сам файл. Отпечаток (размер и mtime) делает сводку
+    недействительной после изменения файла.
+    """
+
+    size: int
+    mtime_ns: int
+    row_count: int
+    min_year: int | None
+    max_year: int | None
+    countries: frozenset[str] | None
+    continents: frozenset[str] | None
+
+    def is_fresh(self, stat: os.stat_result) -> bool:
+        """
+        Проверяет, что сводка построена для текущей версии файла.
+
+        Args:
+            stat: Результат os.stat для CSV файла.
+
+        Returns:
+            bool: True, если размер и время изменения совпадают.
+        """
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+    def may_match(self, row_filter: RowFilter) -> bool:
+        """
+        Проверяет, может ли файл содержать строки, проходящие фильтр.
+
+        Args:
+            row_filter: Фильтр строк.
+
+        Returns:
+            bool: False, если файл гарантированно не содержит подходящих строк.
+        """
+        if self.row_count == 0:
+            return False
+        if self.min_year is not None and self.max_year is not None:
+            if (
+                row_filter.year_from is not None
+                and self.max_year < row_filter.year_from
+            ):
+                return False
+            if row_filter.year_to is not None and self.min_year > row_filter.year_to:
+                return False
+        if row_filter.countries is not None and self.countries is not None:
+            if self.countries.isdisjoint(row_filter.countries):
+                return False
+        if row_filter.continents is not None and self.continents is not None:
+            if self.continents.isdisjoint(row_filter.continents):
+                return False
+        return True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Сериализует сводку в словарь для JSON."""
+        return {
+            "version": ZONE_MAP_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "row_count": self.row_count,
+            "min_year": self.min_year,
+            "max_year": self.max_year,
+            "countries": sorted(self.countries) if self.countries is not None else None,
+            "continents": (
+                sorted(self.continents) if self.continents is not None else None
+            ),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ZoneMap":
+        """
+        Восстанавливает сводку из словаря.
+
+        Raises:
+            ValueError: Если версия формата не поддерживается.
+            KeyError: Если отсутствуют обязательные поля.
+        """
+        if data.get("version") != ZONE_MAP_VERSION:
+            raise ValueError(f"Unsupported zone map version: {data.get('version')}")
+        countries = data["countries"]
+        continents = data["continents"]
+        return cls(
+            size=int(data["size"]),
+            mtime_ns=int(data["mtime_ns"]),
+            row_count=int(data["row_count"]),
+            min_year=data["min_year"],
+            max_year=data["max_year"],
+            countries=frozenset(countries) if countries is not None else None,
+            continents=frozenset(continents) if continents is not None else None,
+        )
+
+
+class ZoneMapBuilder:
+    """
+    Накопитель сводки, заполняемый сырыми строками CSV во время чтения.
+    """
+
+    def __init__(self, index: Mapping[str, int]):
+        """
+        Args:
+            index: Соответствие {колонка: позиция в строке CSV}.
+        """
+        self._country_idx = index.get("country", -1)
+        self._year_idx = index.get("year", -1)
+        self._continent_idx = index.get("continent", -1)
+        self.row_count = 0
+        self.min_year: int | None = None
+        self.max_year: int | None = None
+        self.countries: set[str] | None = set()
+        self.continents: set[str] | None = set()
+
+    def observe(self, values: Sequence[str]) -> None:
+        """Учитывает одну строку CSV (список сырых значений)."""
+        self.row_count += 1
+        size = len(values)
+
+        if 0 <= self._year_idx < size:
+            try:
+                year = int(values[self._year_idx])
+            except ValueError:
+                pass
+            else:
+                if self.min_year is None or year < self.min_year:
+                    self.min_year = year
+                if self.max_year is None or year > self.max_year:
+                    self.max_year = year
+
+        if self.countries is not None and 0 <= self._country_idx < size:
+            self.countries.add(values[self._country_idx].strip())
+            if len(self.countries) > MAX_DISTINCT_VALUES:
+                self.countries = None
+
+        if self.continents is not None and 0 <= self._continent_idx < size:
+            self.continents.add(values[self._continent_idx].strip())
+            if len(self.continents) > MAX_DISTINCT_VALUES:
+                self.continents = None
+
+    def build(self, stat: os.stat_result) -> ZoneMap:
+        """
+        Формирует сводку для файла.
+
+        Args:
+            stat: Результат os.stat, снятый до начала чтения файла.
+
+        Returns:
+            ZoneMap: Готовая сводка.
+        """
+        return ZoneMap(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            row_count=self.row_count,
+            min_year=self.min_year,
+            max_year=self.max_year,
+            countries=frozenset(self.countries) if self.countries is not None else None,
+            continents=(
+                frozenset(self.continents) if self.continents is not None else None
+            ),
+        )
+
+
+def zone_map_path(file_path: str | Path) -> Path:
+    """Возвращает путь к файлу-спутнику для CSV файла."""
+    path = Path(file_path)
+    return path.with_name(path.name + ZONE_MAP_SUFFIX)
+
+
+def load_zone_map(file_path: str | Path, stat: os.stat_result) -> ZoneMap | None:
+    """
+    Загружает актуальную сводку для файла.
+
+    Args:
+        file_path: Путь к CSV файлу.
+        stat: Текущий результат os.stat для CSV файла.
+
+    Returns:
+        ZoneMap | None: Сводка или None, если ее нет, она повреждена или устарела.
+    """
+    sidecar = zone_map_path(file_path)
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            zone_map = ZoneMap.from_dict(json.load(f))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable zone map {sidecar}: {e}")
+        return None
+
+    if not zone_map.is_fresh(stat):
+        logger.debug(f"Zone map {sidecar} is stale")
+        return None
+    return zone_map
+
+
+def save_zone_map(file_path: str | Path, zone_map: ZoneMap) -> None:
+    """
+    Сохраняет сводку рядом с CSV файлом.
+
+    Ошибки записи (например, каталог только для чтения) не прерывают анализ.
+
+    Args:
+        file_path: Путь к CSV файлу.
+        zone_map: Сводка для сохранения.
+    """
+    sidecar = zone_map_path(file_path)
+    tmp_path = sidecar.with_name(sidecar.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(zone_map.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, sidecar)
+        logger.debug(f"Saved zone map {sidecar}")
+    except OSError as e:
+        logger.warning(f"Could not save zone map {sidecar}: {e}")
@@ -1,11 +1,15 @@
 import tempfile
+from dataclasses import astuple
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterable, Iterator
 
 import pytest
 
 from src.models import EconomicRecord
 
+# Заголовок CSV файла со всеми колонками EconomicRecord
+HEADER = "country,year,gdp,gdp_growth,inflation,unemployment,population,continent\n"
+
 
 @pytest.fixture
 def sample_record_dict() -> dict[str, Any]:
@@ -112,9 +116,7 @@ def temp_csv_file() -> Iterator[Path]:
     ) as tmp_file:
         file_path = tmp_file.name
         # Записываем стандартный заголовок
-        tmp_file.write(
-            "country,year,gdp,gdp_growth,inflation,unemployment,population,continent\n"
-        )
+        tmp_file.write(HEADER)
         tmp_file.flush()  # Важно! Сбрасываем буфер
         yield Path(file_path)
     # Удаляем файл после теста
@@ -133,3 +135,20 @@ def temp_csv_file_with_data(temp_csv_file, sample_record_dict) -> Path:
             f"{sample_record_dict['continent']}\n"
         )
     return file_path
+
+
+@pytest.fixture
+def write_csv(tmp_path) -> Callable[[str | Path, Iterable[EconomicRecord]], Path]:
+    """Фабрика CSV файлов: записывает заголовок и записи, возвращает путь.
+    Относительный путь отсчитывается от tmp_path.
+    """
+
+    def write(path: str | Path, records: Iterable[EconomicRecord]) -> Path:
+        path = tmp_path / path
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(HEADER)
+            for record in records:
+                f.write(",".join(map(str, astuple(record))) + "\n")
+        return path
+
+    return write
@@ -1,7 +1,14 @@
+import io
+import sys
 
 import pytest
 
 from src.analyzer import Analyzer
+from src.cache import ResultCache
+from src.parallel import ParallelCSVReader
+from src.partitions import PartitionedReader, write_dataset
+from src.reader import CSVReader
+from src.storage import SQLiteReader, SQLiteStorage
 
 
 class TestAnalyzer:
@@ -54,3 +61,248 @@ class TestAnalyzer:
 
         with pytest.raises(FileNotFoundError):
             analyzer.analyze(file_paths, "average-gdp")
+
+    def test_analyze_with_aggregate_report(self, analyzer, temp_csv_file_with_data):
+        """Тест отчета группировки с параметрами через фасад Analyzer."""
+        result = analyzer.analyze(
+            [str(temp_csv_file_with_data)],
+            "aggregate",
+            {"group_by": ["continent"], "aggregates": "sum:population"},
+        )
+
+        assert "Testinia" in result
+        assert "sum(population)" in result
+
+    @pytest.mark.parametrize(
+        "report_type,params",
+        [
+            ("aggregate", {"group_by": ["continent"], "aggregates": "sum:gdp"}),
+            ("coverage", {}),
+        ],
+    )
+    def test_sampled_input_requires_estimating_report(
+        self, analyzer, temp_csv_file_with_data, report_type, params
+    ):
+        """Отчеты без оценщика не строятся по выборке строк."""
+        with pytest.raises(ValueError, match="cannot be computed from a sample"):
+            analyzer.analyze(
+                [str(temp_csv_file_with_data)], report_type, {**params, "approx": True}
+            )
+
+    def test_sampled_average_gdp_is_estimated(self, analyzer, temp_csv_file_with_data):
+        """Средний ВВП по выборке выводится с доверительным интервалом."""
+        result = analyzer.analyze(
+            [str(temp_csv_file_with_data)], "average-gdp", {"approx": True}
+        )
+
+        assert "95% CI" in result
+
+    def test_analyze_with_correlation_report(self, analyzer, temp_csv_file_with_data):
+        """Тест отчета корреляций с записью в CSV."""
+        output = io.StringIO()
+
+        rows = analyzer.write_csv(
+            [str(temp_csv_file_with_data)],
+            "correlation",
+            {"indicators": ["gdp", "inflation"], "by_country": False},
+            output,
+        )
+
+        assert rows == 1
+        lines = output.getvalue().splitlines()
+        assert lines[0].startswith("country,indicator_x,indicator_y")
+        assert len(lines) == 1 + 2 * 2
+
+    @pytest.mark.parametrize(
+        "report_type,expected",
+        [("outliers", "No outliers found"), ("descriptive-stats", "Testland")],
+    )
+    def test_streaming_report_does_not_load_list(
+        self, analyzer, temp_csv_file_with_data, monkeypatch, report_type, expected
+    ):
+        """Тест: однопроходный калькулятор получает записи потоком."""
+
+        def fail_read(*args, **kwargs):
+            raise AssertionError("records must not be loaded into a list")
+
+        monkeypatch.setattr(analyzer.reader, "read", fail_read)
+
+        result = analyzer.analyze([str(temp_csv_file_with_data)], report_type)
+
+        assert expected in result
+
+    def test_analyze_uses_result_cache(self, temp_csv_file_with_data, monkeypatch):
+        """Тест: повторный запрос берется из кеша, изменение файла - пересчет."""
+        analyzer = Analyzer(cache=ResultCache())
+        file_paths = [str(temp_csv_file_with_data)]
+
+        first = analyzer.analyze(file_paths, "average-gdp")
+
+        def fail_read(*args, **kwargs):
+            raise AssertionError("cached result must be used")
+
+        monkeypatch.setattr(analyzer.reader, "read", fail_read)
+        assert analyzer.analyze(file_paths, "average-gdp") == first
+        assert (analyzer.cache.hits, analyzer.cache.misses) == (1, 1)
+
+        monkeypatch.undo()
+        with open(temp_csv_file_with_data, "a", encoding="utf-8") as f:
+            f.write("Atlantis,2023,2000.0,3.0,2.0,5.0,10,Mythica\n")
+
+        assert "Atlantis" in analyzer.analyze(file_paths, "average-gdp")
+        assert analyzer.cache.misses == 2
+
+    def test_stdin_is_not_cached(self, temp_csv_file_with_data, monkeypatch):
+        """Тест: стандартный ввод читается без обращения к кешу."""
+        analyzer = Analyzer(cache=ResultCache())
+        content = temp_csv_file_with_data.read_text(encoding="utf-8")
+        monkeypatch.setattr(sys, "stdin", io.StringIO(content))
+
+        result = analyzer.analyze(["-"], "average-gdp")
+
+        assert "Testland" in result
+        assert (analyzer.cache.hits, analyzer.cache.misses) == (0, 0)
+
+    def test_dataset_directory_is_cached(self, tmp_path, temp_csv_file_with_data):
+        """Тест: каталог набора данных кешируется по отпечаткам своих файлов."""
+        root = tmp_path / "dataset"
+        write_dataset([str(temp_csv_file_with_data)], root)
+        # Сводки-спутники, записанные первым чтением, не меняют ключ
+        analyzer = Analyzer(
+            reader=PartitionedReader(CSVReader(zone_maps=True)), cache=ResultCache()
+        )
+
+        first = analyzer.analyze([str(root)], "average-gdp")
+        assert analyzer.analyze([str(root)], "average-gdp") == first
+        assert (analyzer.cache.hits, analyzer.cache.misses) == (1, 1)
+
+        partition = root / "year=2023" / "continent=Mythica"
+        partition.mkdir(parents=True)
+        (partition / "extra.csv").write_text(
+            "country,gdp,gdp_growth,inflation,unemployment,population\n"
+            "Atlantis,2000.0,3.0,2.0,5.0,10\n",
+            encoding="utf-8",
+        )
+
+        assert "Atlantis" in analyzer.analyze([str(root)], "average-gdp")
+        assert analyzer.cache.misses == 2
+
+
+class TestAnalyzerWithSQLite:
+    """Интеграционные тесты Analyzer с базой SQLite."""
+
+    def test_average_gdp_from_database(self, tmp_path, temp_csv_file_with_data):
+        """Отчет по базе совпадает с отчетом по исходному CSV."""
+        db_path = tmp_path / "economy.sqlite"
+        SQLiteStorage(db_path).ingest([str(temp_csv_file_with_data)])
+
+        from_db = Analyzer(reader=SQLiteReader()).analyze([str(db_path)], "average-gdp")
+        from_csv = Analyzer().analyze([str(temp_csv_file_with_data)], "average-gdp")
+
+        assert from_db == from_csv
+
+    def test_aggregation_is_pushed_down(self, tmp_path, temp_csv_file_with_data):
+        """Агрегирующие отчеты не загружают записи из базы."""
+        db_path = tmp_path / "economy.sqlite"
+        SQLiteStorage(db_path).ingest([str(temp_csv_file_with_data)])
+        reader = SQLiteReader()
+        reader.read = None  # type: ignore[method-assign]
+
+        result = Analyzer(reader=reader).analyze(
+            [str(db_path)],
+            "aggregate",
+            {"group_by": ["continent"], "aggregates": "sum:population"},
+        )
+
+        assert "Testinia" in result
+
+
+class TestAnalyzerWithWorkers:
+    """Интеграционные тесты Analyzer с параллельным читателем."""
+
+    def test_reports_match_sequential(self, temp_csv_file_with_data):
+        """Отчеты с рабочими процессами совпадают с последовательными."""
+        paths = [str(temp_csv_file_with_data)] * 3
+        parallel = Analyzer(reader=ParallelCSVReader(workers=2))
+
+        for report in ("average-gdp", "growth"):
+            assert parallel.analyze(paths, report) == Analyzer().analyze(paths, report)
+
+    def test_aggregation_runs_on_shared_memory(self, temp_csv_file_with_data):
+        """Агрегирующие отчеты не восстанавливают записи в родителе."""
+        reader = ParallelCSVReader(workers=2)
+        reader.iter_records = None  # type: ignore[method-assign]
+        reader.read = None  # type: ignore[method-assign]
+
+        result = Analyzer(reader=reader).analyze(
+            [str(temp_csv_file_with_data)], "average-gdp"
+        )
+
+        assert "Testland" in result
+
+
+class TestAnalyzerOnline:
+    """Интеграционные тесты онлайн-агрегации."""
+
+    def test_complete_report(self, temp_csv_file_with_data):
+        """Без дедлайна выводится полный отчет со строкой состояния."""
+        paths = [str(temp_csv_file_with_data)]
+
+        result = Analyzer().analyze_online(paths, "average-gdp", deadline=60)
+
+        status, report = result.split("\n", 1)
+        assert status.startswith("[COMPLETE] 1 rows")
+        assert report == Analyzer().analyze(paths, "average-gdp")
+
+    def test_progress_reports(self, temp_csv_file_with_data):
+        """Промежуточные отчеты передаются получателю."""
+        reports = []
+
+        Analyzer().analyze_online(
+            [str(temp_csv_file_with_data)] * 2,
+            "aggregate",
+            {"group_by": ["continent"], "aggregates": "sum:population"},
+            progress_interval=1e-9,
+            on_progress=reports.append,
+        )
+
+        assert reports and all(r.startswith("[PROGRESS]") for r in reports)
+
+    def test_unsupported_report(self, temp_csv_file_with_data):
+        """Отчеты без агрегирующего калькулятора не поддерживаются."""
+        with pytest.raises(ValueError, match="does not support online"):
+            Analyzer().analyze_online([str(temp_csv_file_with_data)], "growth")
+
+
+class TestAnalyzerStructuredAPI:
+    """Тесты структурированного API без форматирования отчетов."""
+
+    def test_compute_returns_statistics(self, temp_csv_file_with_data):
+        """compute возвращает DTO калькулятора отчета."""
+        statistics = Analyzer().compute([str(temp_csv_file_with_data)], "average-gdp")
+
+        assert [s.country for s in statistics] == ["Testland"]
+        assert statistics[0].years_count == 1
+
+    def test_compute_table(self, temp_csv_file_with_data):
+        """compute_table возвращает колонки результатов."""
+        table = Analyzer().compute_table(
+            [str(temp_csv_file_with_data)],
+            "aggregate",
+            {"group_by": ["continent"], "aggregates": "sum:population"},
+        )
+
+        assert table.columns["continent"] == ["Testinia"]
+        assert len(table.buffer("sum_population")) == 1
+
+    def test_load_table(self, temp_csv_file_with_data, sample_record_dict):
+        """load_table загружает набор данных в колонки."""
+        table = Analyzer().load_table([str(temp_csv_file_with_data)], ["gdp"])
+
+        assert table.column_names == ["gdp"]
+        assert table.buffer("gdp").tolist() == [sample_record_dict["gdp"]]
+
+    def test_compute_unknown_report(self, temp_csv_file_with_data):
+        """Неизвестный отчет отклоняется."""
+        with pytest.raises(ValueError, match="Unknown report type"):
+            Analyzer().compute([str(temp_csv_file_with_data)], "missing")
@@ -0,0 +1,53 @@
+import csv
+import io
+
+import pytest
+
+from src.calculator import GroupByCalculator
+from src.reports.aggregate import AggregateReport
+
+
+class TestAggregateReport:
+    """Тесты для AggregateReport."""
+
+    @pytest.fixture
+    def report(self):
+        """Фикстура, возвращающая экземпляр отчета группировки."""
+        return AggregateReport()
+
+    def test_create_calculator_from_params(self, report):
+        """Тест создания калькулятора по параметрам отчета."""
+        calculator = report.create_calculator(
+            {"group_by": ["continent"], "aggregates": "mean:gdp,sum:population"}
+        )
+
+        assert isinstance(calculator, GroupByCalculator)
+        assert calculator.spec.group_by == ("continent",)
+        assert len(calculator.spec.aggregates) == 2
+
+    def test_generate_report(self, report, sample_records_list):
+        """Тест генерации таблицы по группам."""
+        calculator = report.create_calculator(
+            {"group_by": ["continent"], "aggregates": "mean:gdp,count:gdp"}
+        )
+
+        result = report.generate(calculator.calculate(sample_records_list))
+
+        assert "Continent" in result
+        assert "mean(gdp)" in result
+        assert "4,053.15" in result
+        assert report.name == "aggregate"
+
+    def test_write_csv(self, report, sample_records_list):
+        """Тест записи результатов в CSV с заголовком из полей DTO."""
+        calculator = report.create_calculator(
+            {"group_by": ["continent"], "aggregates": "sum:population"}
+        )
+        output = io.StringIO()
+
+        report.write_csv(calculator.calculate(sample_records_list), output)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0] == ["continent", "sum_population"]
+        assert ["Asia", "126.0"] in rows
+        assert len(rows) == 4
@@ -1,6 +1,6 @@
 import pytest
 
-from src.calculator import GDPCalculator
+from src.calculator import ApproximateGDPCalculator, GDPCalculator
 from src.reports.average_gdp import AverageGDPReport
 
 
@@ -28,3 +28,31 @@ class TestAverageGDPReport:
         assert "Japan" in result
         assert "22,374.15" in result or "22374.15" in result
         assert report.name == "average_gdp"
+
+    def test_approx_params_select_sampling_calculator(self, report):
+        """Тест выбора приближенного калькулятора параметром approx."""
+        assert isinstance(report.create_calculator({}), GDPCalculator)
+        assert isinstance(
+            report.create_calculator({"approx": True}), ApproximateGDPCalculator
+        )
+
+    def test_common_years_param(self, report):
+        """Тест калькулятора средних по общим годам."""
+        calculator = report.create_calculator({"common_years": True})
+
+        assert isinstance(calculator, GDPCalculator)
+        assert calculator.common_years
+        with pytest.raises(ValueError, match="Common years cannot be combined"):
+            report.create_calculator({"common_years": True, "approx": True})
+
+    def test_generate_approximate_report(self, report, sample_records_list):
+        """Тест колонки доверительного интервала для оценок по выборке."""
+        statistics = ApproximateGDPCalculator().calculate(sample_records_list)
+
+        result = report.generate(statistics)
+
+        assert "95% CI" in result
+        assert "Sampled rows" in result
+        assert "± " in result
+        # У Японии одна запись - интервал не определен
+        assert "n/a" in result
@@ -1,6 +1,8 @@
 
+import pytest
+
 from src.reports.average_gdp import AverageGDPReport
-from src.reports.base import ReportFactory
+from src.reports.base import Report, ReportFactory
 
 
 class TestReportFactory:
@@ -21,3 +23,21 @@ class TestReportFactory:
         assert len(caplog.records) > 0
         assert f"Report {report_name} not found" in caplog.text
         assert f"Available: {list(ReportFactory.list_reports().keys())}" in caplog.text
+
+
+class TestReport:
+    """Тесты базового класса отчетов."""
+
+    def test_calculator_must_be_defined(self):
+        """Отчет без create_calculator нельзя создать."""
+
+        class NoCalculatorReport(Report):
+            @property
+            def name(self):
+                return "no-calculator"
+
+            def generate(self, data):
+                return ""
+
+        with pytest.raises(TypeError, match="create_calculator"):
+            NoCalculatorReport()
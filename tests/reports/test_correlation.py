@@ -0,0 +1,70 @@
+import csv
+import io
+
+import pytest
+
+from src.calculator import DEFAULT_CORRELATION_INDICATORS, CorrelationCalculator
+from src.reports.correlation import CorrelationReport
+
+
+class TestCorrelationReport:
+    """Тесты для CorrelationReport."""
+
+    @pytest.fixture
+    def report(self):
+        """Фикстура, возвращающая экземпляр отчета корреляций."""
+        return CorrelationReport()
+
+    @pytest.fixture
+    def matrices(self, report, sample_records_list):
+        """Матрицы прироста ВВП и инфляции по тестовым записям."""
+        calculator = report.create_calculator(
+            {"indicators": ["gdp_growth", "inflation"]}
+        )
+        return calculator.calculate(sample_records_list)
+
+    def test_create_calculator_from_params(self, report):
+        """Тест выбора показателей и режима только общей матрицы."""
+        calculator = report.create_calculator({})
+        assert isinstance(calculator, CorrelationCalculator)
+        assert calculator.indicators == DEFAULT_CORRELATION_INDICATORS
+        assert calculator.by_country
+
+        calculator = report.create_calculator(
+            {"indicators": ["gdp", "population"], "by_country": False}
+        )
+        assert calculator.indicators == ("gdp", "population")
+        assert not calculator.by_country
+
+    def test_generate_report(self, report, matrices):
+        """Тест генерации общих матриц и таблицы по странам."""
+        result = report.generate(matrices)
+
+        assert report.name == "correlation"
+        assert "Correlation (all countries, 5 records)" in result
+        assert "Covariance (all countries, 5 records)" in result
+        assert "gdp_growth ~ inflation" in result
+        assert "Germany" in result
+        assert "1.0000" in result
+
+    def test_generate_empty(self, report):
+        """Тест отчета без данных."""
+        assert report.generate([]) == "No data"
+
+    def test_write_csv_long_format(self, report, matrices):
+        """Тест CSV: строка на пару показателей каждой матрицы."""
+        output = io.StringIO()
+
+        report.write_csv(matrices, output)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0][:3] == ["country", "indicator_x", "indicator_y"]
+        assert len(rows) == 1 + 4 * 4
+        assert rows[1][:5] == [
+            "All countries",
+            "gdp_growth",
+            "gdp_growth",
+            "5",
+            "19.817",
+        ]
+        assert ["Japan", "gdp_growth", "inflation", "1", "", ""] in rows
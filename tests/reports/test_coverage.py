@@ -0,0 +1,54 @@
+import csv
+import io
+
+import pytest
+
+from src.calculator import CoverageCalculator
+from src.models import EconomicRecord
+from src.reports.coverage import CoverageReport, common_years
+
+
+class TestCoverageReport:
+    """Тесты для CoverageReport."""
+
+    @pytest.fixture
+    def report(self):
+        """Фикстура, возвращающая экземпляр отчета о покрытии лет."""
+        return CoverageReport()
+
+    @pytest.fixture
+    def coverage(self, sample_records_list):
+        """Покрытие лет с пропусками у Японии."""
+        records = sample_records_list + [
+            EconomicRecord("Japan", year, 5000.0, 0.0, 0.0, 2.0, 126, "Asia")
+            for year in (2016, 2017, 2021)
+        ]
+        return CoverageCalculator().calculate(records)
+
+    def test_common_years(self, coverage):
+        """Тест пересечения лет всех стран."""
+        assert list(common_years(coverage)) == [2020, 2021]
+        assert not common_years([])
+
+    def test_generate_report(self, report, coverage):
+        """Тест таблицы покрытия и строки с общими годами."""
+        result = report.generate(coverage)
+
+        assert report.name == "coverage"
+        assert "2018-2019" in result
+        assert "67%" in result
+        assert result.endswith("Common years: 2020-2021 (2 years)")
+
+    def test_generate_empty(self, report):
+        """Тест отчета без данных."""
+        assert report.generate([]) == "No data"
+
+    def test_write_csv(self, report, coverage):
+        """Тест CSV: серии пропусков через ';'."""
+        output = io.StringIO()
+
+        report.write_csv(coverage, output)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0][0] == "country"
+        assert rows[2] == ["Japan", "2016", "2021", "4", "2", "0.6667", "2018-2019"]
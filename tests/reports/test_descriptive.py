@@ -0,0 +1,23 @@
+import pytest
+
+from src.reports.descriptive import DescriptiveStatisticsReport
+
+
+class TestDescriptiveStatisticsReport:
+    """Тесты для DescriptiveStatisticsReport."""
+
+    @pytest.fixture
+    def report(self):
+        """Фикстура, возвращающая экземпляр отчета описательной статистики."""
+        return DescriptiveStatisticsReport()
+
+    def test_generate_report(self, report, sample_records_list):
+        """Тест генерации отчета по выбранному показателю."""
+        calculator = report.create_calculator({"indicator": "unemployment"})
+
+        result = report.generate(calculator.calculate(sample_records_list))
+
+        assert calculator.indicator == "unemployment"
+        assert "Mean unemployment" in result
+        assert "Germany" in result
+        assert "6.75" in result  # (8.1 + 5.4) / 2 для USA
@@ -0,0 +1,33 @@
+import pytest
+
+from src.reports.growth import GrowthReport
+
+
+class TestGrowthReport:
+    """Тесты для GrowthReport."""
+
+    @pytest.fixture
+    def report(self):
+        """Фикстура, возвращающая экземпляр отчета динамики."""
+        return GrowthReport()
+
+    def test_generate_report(self, report, sample_records_list):
+        """Тест генерации отчета со скользящим средним за 2 года."""
+        calculator = report.create_calculator({"window": 2})
+
+        result = report.generate(calculator.calculate(sample_records_list))
+
+        assert "2-yr MA gdp (latest)" in result
+        assert "22,374.15" in result  # (21433.2 + 23315.1) / 2 для USA
+        assert "8.78%" in result  # 23315.1 / 21433.2 - 1
+        # Для страны с одним годом показатели не определены
+        assert "2020-2020" in result
+
+    def test_zero_window_is_rejected(self, report):
+        """Тест: окно 0 не заменяется значением по умолчанию."""
+        with pytest.raises(ValueError, match="Window must be >= 1"):
+            report.create_calculator({"window": 0})
+
+    def test_default_window(self, report):
+        """Тест: без параметра окно - 3 года."""
+        assert report.create_calculator({"window": None}).window == 3
@@ -0,0 +1,63 @@
+import pytest
+
+from src.calculator import OutlierCalculator
+from src.models import EconomicRecord
+from src.reports.outliers import OutlierReport
+
+
+class TestOutlierReport:
+    """Тесты для OutlierReport."""
+
+    @pytest.fixture
+    def report(self):
+        """Фикстура, возвращающая экземпляр отчета о выбросах."""
+        return OutlierReport()
+
+    @pytest.fixture
+    def records(self, sample_records_list):
+        """Тестовые записи и ВВП Японии, записанный в другой единице."""
+        return sample_records_list + [
+            EconomicRecord(
+                country="Japan",
+                year=2021,
+                gdp=4_940_900.0,
+                gdp_growth=1.7,
+                inflation=-0.2,
+                unemployment=2.8,
+                population=125,
+                continent="Asia",
+            )
+        ]
+
+    def test_create_calculator_from_params(self, report):
+        """Тест передачи показателей и порогов калькулятору."""
+        calculator = report.create_calculator(
+            {"indicators": ["gdp"], "jump_ratio": 5.0, "window": 3}
+        )
+
+        assert isinstance(calculator, OutlierCalculator)
+        assert calculator.indicators == ("gdp",)
+        assert calculator.jump_ratio == 5.0
+        assert report.create_calculator({}).indicators == (
+            "gdp",
+            "gdp_growth",
+            "inflation",
+            "unemployment",
+            "population",
+        )
+
+    def test_generate_report(self, report, records):
+        """Тест генерации сводки и таблицы выбросов."""
+        result = report.generate(report.create_calculator({}).calculate(records))
+
+        assert report.name == "outliers"
+        assert result.startswith("Outliers: 1 in 1 countries (yoy: 1)")
+        assert "Japan" in result
+        assert "x976.9" in result
+        assert "5,057.80" in result
+
+    def test_generate_empty(self, report, sample_records_list):
+        """Тест отчета без выбросов."""
+        data = report.create_calculator({}).calculate(sample_records_list)
+
+        assert report.generate(data) == "No outliers found"
@@ -0,0 +1,61 @@
+import csv
+import io
+
+import pytest
+
+from src.calculator import PivotCalculator
+from src.reports.pivot import PivotReport
+
+
+class TestPivotReport:
+    """Тесты для PivotReport."""
+
+    @pytest.fixture
+    def report(self):
+        """Фикстура, возвращающая экземпляр сводного отчета."""
+        return PivotReport()
+
+    @pytest.fixture
+    def tables(self, report, sample_records_list):
+        """Сводные таблицы ВВП и инфляции по тестовым записям."""
+        calculator = report.create_calculator({"indicators": ["gdp", "inflation"]})
+        return calculator.calculate(sample_records_list)
+
+    def test_create_calculator_from_params(self, report):
+        """Тест выбора показателей: indicators, indicator или gdp."""
+        assert report.create_calculator({}).indicators == ("gdp",)
+        assert report.create_calculator({"indicator": "inflation"}).indicators == (
+            "inflation",
+        )
+        calculator = report.create_calculator(
+            {"indicators": ["gdp", "unemployment"], "indicator": "inflation"}
+        )
+
+        assert isinstance(calculator, PivotCalculator)
+        assert calculator.indicators == ("gdp", "unemployment")
+
+    def test_generate_report(self, report, tables):
+        """Тест генерации таблицы на каждый показатель."""
+        result = report.generate(tables)
+
+        assert report.name == "pivot"
+        assert "Indicator: gdp" in result
+        assert "Indicator: inflation" in result
+        assert "2020" in result and "2021" in result
+        assert "23,315.10" in result
+
+    def test_generate_empty(self, report):
+        """Тест отчета без данных."""
+        assert report.generate([]) == "No data"
+
+    def test_write_csv_wide_format(self, report, tables):
+        """Тест CSV: колонка на год, пустые ячейки для отсутствующих лет."""
+        output = io.StringIO()
+
+        report.write_csv(tables, output)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0] == ["indicator", "country", "2020", "2021"]
+        assert ["gdp", "Japan", "5057.8", ""] in rows
+        assert ["inflation", "USA", "1.2", "4.7"] in rows
+        assert len(rows) == 7
@@ -0,0 +1,207 @@
+import math
+import random
+import statistics
+
+import pytest
+
+from src.utils.accumulators import (
+    CoMoments,
+    QuantileAccumulator,
+    QuantileSketch,
+    RunningStats,
+    YearSet,
+    exact_quantile,
+)
+
+
+class TestRunningStats:
+    """Тесты для RunningStats."""
+
+    def test_matches_statistics_module(self):
+        """Тест: моменты совпадают с модулем statistics."""
+        values = [3.5, 1.0, 4.0, 1.5, 5.9, 2.6]
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+
+        assert stats.count == 6
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.stddev == pytest.approx(statistics.stdev(values))
+        assert (stats.min, stats.max) == (1.0, 5.9)
+
+    def test_merge(self):
+        """Тест объединения двух накопителей."""
+        values = [float(v) for v in range(1, 21)]
+        left, right = RunningStats(), RunningStats()
+        for value in values[:7]:
+            left.add(value)
+        for value in values[7:]:
+            right.add(value)
+
+        left.merge(right)
+
+        assert left.count == 20
+        assert left.mean == pytest.approx(statistics.mean(values))
+        assert left.variance == pytest.approx(statistics.variance(values))
+        assert (left.min, left.max) == (1.0, 20.0)
+
+    def test_single_value_has_zero_stddev(self):
+        """Тест: для одного значения отклонение равно нулю."""
+        stats = RunningStats()
+        stats.add(42.0)
+
+        assert stats.stddev == 0.0
+
+
+class TestCoMoments:
+    """Тесты для CoMoments."""
+
+    @pytest.fixture
+    def rows(self):
+        """Наблюдения трех показателей."""
+        rng = random.Random(7)
+        return [
+            (x, 2 * x + rng.gauss(0, 1), rng.uniform(0, 10))
+            for x in (rng.uniform(0, 100) for _ in range(200))
+        ]
+
+    def test_matches_statistics_module(self, rows):
+        """Тест: ковариации и корреляции совпадают с модулем statistics."""
+        moments = CoMoments(3)
+        for row in rows:
+            moments.add(row)
+        xs, ys, zs = zip(*rows, strict=True)
+
+        assert moments.count == 200
+        assert moments.covariance(0, 1) == pytest.approx(statistics.covariance(xs, ys))
+        assert moments.covariance(1, 1) == pytest.approx(statistics.variance(ys))
+        assert moments.correlation(0, 2) == pytest.approx(
+            statistics.correlation(xs, zs)
+        )
+        assert moments.correlation(1, 0) == moments.correlation(0, 1)
+
+    def test_merge(self, rows):
+        """Тест: слияние частей совпадает с накоплением за один проход."""
+        whole, left, right = CoMoments(3), CoMoments(3), CoMoments(3)
+        for row in rows:
+            whole.add(row)
+        for row in rows[:37]:
+            left.add(row)
+        for row in rows[37:]:
+            right.add(row)
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.means == pytest.approx(whole.means)
+        assert left.m2 == pytest.approx(whole.m2)
+
+    def test_state_round_trip(self, rows):
+        """Тест передачи состояния накопителя."""
+        moments = CoMoments(3)
+        for row in rows[:10]:
+            moments.add(row)
+
+        restored = CoMoments.from_state(moments.state())
+
+        assert restored.state() == moments.state()
+
+    def test_undefined_correlation(self):
+        """Тест: для постоянного показателя и одного значения - NaN."""
+        moments = CoMoments(2)
+        moments.add((1.0, 5.0))
+        assert math.isnan(moments.covariance(0, 1))
+
+        moments.add((2.0, 5.0))
+        assert math.isnan(moments.correlation(0, 1))
+        assert moments.covariance(0, 1) == 0.0
+
+    def test_merge_different_sizes(self):
+        """Тест: накопители разного числа показателей не сливаются."""
+        with pytest.raises(ValueError, match="Cannot merge"):
+            CoMoments(2).merge(CoMoments(3))
+
+
+class TestQuantiles:
+    """Тесты точных и приближенных квантилей."""
+
+    @pytest.mark.parametrize(
+        "q,expected",
+        [(0.0, 1.0), (0.5, 2.5), (0.9, 3.7), (1.0, 4.0)],
+    )
+    def test_exact_quantile(self, q, expected):
+        """Тест квантиля с линейной интерполяцией."""
+        assert exact_quantile([1.0, 2.0, 3.0, 4.0], q) == pytest.approx(expected)
+
+    def test_sketch_rank_error_is_small(self):
+        """Тест: ошибка ранга скетча мала, а память ограничена."""
+        rng = random.Random(0)
+        values = [rng.random() for _ in range(50_000)]
+        sketch = QuantileSketch(k=128, seed=1)
+        sketch.extend(values)
+
+        for q in (0.1, 0.5, 0.9):
+            estimate = sketch.quantile(q)
+            rank = sum(v <= estimate for v in values) / len(values)
+            assert rank == pytest.approx(q, abs=0.02)
+        assert sketch.size < 2_000
+
+    def test_sketch_merge(self):
+        """Тест объединения скетчей."""
+        left, right = QuantileSketch(k=64, seed=1), QuantileSketch(k=64, seed=2)
+        left.extend(float(v) for v in range(5_000))
+        right.extend(float(v) for v in range(5_000, 10_000))
+
+        left.merge(right)
+
+        assert left.count == 10_000
+        assert left.quantile(0.5) == pytest.approx(5_000, rel=0.05)
+
+    def test_accumulator_switches_to_sketch(self):
+        """Тест: большая группа переводится на скетч."""
+        accumulator = QuantileAccumulator(exact_limit=100)
+        for value in range(100):
+            accumulator.add(float(value))
+        assert accumulator.is_exact
+        assert accumulator.quantile(0.5) == pytest.approx(49.5)
+
+        for value in range(100, 1_000):
+            accumulator.add(float(value))
+
+        assert not accumulator.is_exact
+        assert accumulator.quantile(0.5) == pytest.approx(500, rel=0.05)
+
+
+class TestYearSet:
+    """Тесты для YearSet."""
+
+    def test_years_and_gaps(self):
+        """Тест: годы в порядке возрастания, пропуски и их серии."""
+        years = YearSet([2005, 2001, 2003, 2004, 2010])
+
+        assert list(years) == [2001, 2003, 2004, 2005, 2010]
+        assert (years.first, years.last, len(years)) == (2001, 2010, 5)
+        assert years.missing() == [2002, 2006, 2007, 2008, 2009]
+        assert years.gaps() == [(2002, 2002), (2006, 2009)]
+        assert 2003 in years and 2002 not in years and 1990 not in years
+
+    def test_merge_and_intersection(self):
+        """Тест объединения и пересечения множеств с разными base."""
+        left = YearSet([2001, 2003, 2010])
+        right = YearSet([1999, 2003, 2010, 2011])
+
+        common = left.intersection(right)
+        left.merge(right)
+
+        assert list(common) == [2003, 2010]
+        assert common == YearSet([2010, 2003])
+        assert list(left) == [1999, 2001, 2003, 2010, 2011]
+
+    def test_empty(self):
+        """Тест пустого множества."""
+        years = YearSet()
+
+        assert not years
+        assert (years.first, years.last) == (None, None)
+        assert years.missing() == []
+        assert not YearSet([2000]).intersection(YearSet([2001]))
@@ -0,0 +1,195 @@
+import io
+import sys
+
+import pytest
+
+from src.arrow import ArrowReader, buffer_view, import_pyarrow, write_arrow
+from src.calculator import AggregateSpec, GDPCalculator, HashAggregator
+from src.columnar import ColumnarTable
+from src.filters import RowFilter
+from src.models import CountryStatistics
+from src.utils.validators import ValidationError
+
+pa = pytest.importorskip("pyarrow")
+
+
+def write_feather(path, columns, stream=False):
+    """Записывает колонки в файл Arrow IPC (файловый или потоковый формат)."""
+    table = pa.table(columns)
+    with pa.OSFile(str(path), "wb") as sink:
+        new_writer = pa.ipc.new_stream if stream else pa.ipc.new_file
+        with new_writer(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=2)
+    return path
+
+
+def record_columns(records):
+    """Колонки записей в виде {поле: список значений}."""
+    return {name: [getattr(r, name) for r in records] for name in records[0].__dict__}
+
+
+@pytest.fixture
+def arrow_file(tmp_path, sample_records_list):
+    """Файл Arrow IPC с записями sample_records_list (пакеты по 2 строки)."""
+    return write_feather(tmp_path / "data.arrow", record_columns(sample_records_list))
+
+
+class TestArrowReader:
+    """Тесты для ArrowReader."""
+
+    def test_read_records(self, arrow_file, sample_records_list):
+        """Колонки файла преобразуются в записи."""
+        assert ArrowReader().read([str(arrow_file)]) == sample_records_list
+
+    def test_stream_format(self, tmp_path, sample_records_list):
+        """Потоковый формат Arrow читается так же, как файловый."""
+        path = write_feather(
+            tmp_path / "data.arrows", record_columns(sample_records_list), stream=True
+        )
+
+        assert ArrowReader().read([str(path)]) == sample_records_list
+
+    def test_stdin(self, monkeypatch, arrow_file, sample_records_list):
+        """Файл Arrow читается со стандартного ввода."""
+        buffer = io.BufferedReader(io.BytesIO(arrow_file.read_bytes()))
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(buffer))
+
+        assert ArrowReader().read(["-"]) == sample_records_list
+
+    def test_types_are_normalized(self, tmp_path):
+        """Словарные строки декодируются и очищаются, числа приводятся к типу поля."""
+        path = write_feather(
+            tmp_path / "data.arrow",
+            {
+                "Country": pa.array([" USA "]).dictionary_encode(),
+                "year": pa.array([2020], pa.int32()),
+                "gdp": pa.array([21433], pa.int64()),
+            },
+        )
+
+        (record,) = ArrowReader().read([str(path)], columns={"country", "year", "gdp"})
+
+        assert (record.country, record.year, record.gdp) == ("USA", 2020, 21433.0)
+        assert isinstance(record.gdp, float)
+
+    @pytest.mark.parametrize(
+        "columns,message",
+        [
+            ({"country": ["USA"]}, "Missing required columns: gdp"),
+            ({"country": ["USA"], "gdp": [None]}, "Missing or empty value"),
+            ({"country": [" "], "gdp": [1.0]}, "Missing or empty value"),
+            ({"country": ["USA"], "gdp": [-1.0]}, "Gdp must be >= 0"),
+            ({"country": ["USA"], "gdp": ["n/a"]}, "Invalid gdp format"),
+            ({"country": [1], "gdp": [1.0]}, "must be a string"),
+        ],
+    )
+    def test_invalid_columns(self, tmp_path, columns, message):
+        """Колонки проверяются по правилам EconomicDataValidator."""
+        path = write_feather(tmp_path / "data.arrow", columns)
+
+        with pytest.raises(ValidationError, match=message):
+            ArrowReader().read([str(path)], columns={"country", "gdp"})
+
+    def test_year_range(self, tmp_path):
+        """Год вне диапазона валидатора отклоняется."""
+        path = write_feather(tmp_path / "data.arrow", {"year": [1800]})
+
+        with pytest.raises(ValidationError, match="Year must be >= 1900"):
+            ArrowReader().read([str(path)], columns={"year"})
+
+    def test_row_filter_before_validation(self, tmp_path):
+        """Отфильтрованные строки не проверяются."""
+        path = write_feather(
+            tmp_path / "data.arrow",
+            {"country": ["USA", "Bad"], "year": [2020, 2020], "gdp": [1.0, -5.0]},
+        )
+        reader = ArrowReader(row_filter=RowFilter.create(countries=["USA"]))
+
+        records = reader.read([str(path)], columns={"country", "gdp"})
+
+        assert [(r.country, r.gdp) for r in records] == [("USA", 1.0)]
+
+    def test_partition_values(self, arrow_file, sample_records_list):
+        """Значения раздела заменяют колонку и не фильтруются повторно."""
+        reader = ArrowReader(row_filter=RowFilter.create(continents=["Asia"]))
+
+        records = list(
+            reader.read_file(
+                str(arrow_file), {"country", "continent"}, {"continent": "Asia"}
+            )
+        )
+
+        assert len(records) == len(sample_records_list)
+        assert {r.continent for r in records} == {"Asia"}
+
+    def test_missing_file(self, tmp_path):
+        """Отсутствующий файл - FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            ArrowReader().read([str(tmp_path / "missing.arrow")])
+
+    def test_aggregate_matches_records(self, arrow_file):
+        """Агрегация над буферами совпадает с агрегацией записей."""
+        spec = AggregateSpec.parse(["continent"], "mean:gdp,sum:population,count:gdp")
+        reader = ArrowReader()
+        expected = HashAggregator(spec)
+        expected.consume(reader.iter_records([str(arrow_file)], spec.columns))
+
+        result = reader.aggregate([str(arrow_file)], spec)
+
+        assert sorted(result, key=lambda g: g.key["continent"]) == sorted(
+            expected.results(), key=lambda g: g.key["continent"]
+        )
+
+    def test_without_pyarrow(self, monkeypatch):
+        """Без pyarrow сообщается, что пакет нужно установить."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            import_pyarrow()
+
+
+class TestBufferView:
+    """Тесты для buffer_view."""
+
+    def test_zero_copy_with_offset(self):
+        """Срез массива читается из буфера с учетом смещения."""
+        array = pa.array([1.5, 2.5, 3.5, 4.5]).slice(1, 2)
+
+        view = buffer_view(array)
+
+        assert isinstance(view, memoryview)
+        assert list(view) == [2.5, 3.5]
+
+    def test_nulls_fall_back_to_list(self):
+        """Колонка с пропусками возвращается списком."""
+        assert buffer_view(pa.array([1, None])) == [1, None]
+
+
+class TestWriteArrow:
+    """Тесты для write_arrow."""
+
+    def test_round_trip(self, tmp_path):
+        """Результаты калькулятора записываются в файл Arrow IPC."""
+        stats = [
+            CountryStatistics(country="USA", average_gdp=21433.2, years_count=2),
+            CountryStatistics(country="China", average_gdp=14342.9, years_count=1),
+        ]
+        path = tmp_path / "report.arrow"
+
+        write_arrow(ColumnarTable.from_results(stats), path)
+        table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+        assert table.column("country").to_pylist() == ["USA", "China"]
+        assert table.column("average_gdp").to_pylist() == [21433.2, 14342.9]
+        assert table.schema.field("years_count").type == pa.int64()
+
+    def test_report_from_arrow_input(self, arrow_file):
+        """Отчет по файлу Arrow совпадает с отчетом по записям."""
+        reader = ArrowReader()
+        calculator = GDPCalculator()
+        expected = calculator.calculate(reader.read([str(arrow_file)]))
+
+        groups = reader.aggregate([str(arrow_file)], calculator.spec)
+
+        assert groups is not None
+        assert calculator.finalize(groups) == expected
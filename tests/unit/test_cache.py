@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from src.cache import ResultCache, fingerprint_file, make_cache_key
+from src.filters import RowFilter
+
+
+class TestCacheKey:
+    """Тесты построения ключей кеша."""
+
+    def test_key_is_deterministic(self):
+        """Тест: порядок элементов множеств и словарей не влияет на ключ."""
+        first = make_cache_key(
+            params={"a": 1, "b": 2},
+            row_filter=RowFilter.create(countries=["USA", "Germany", "Japan"]),
+        )
+        second = make_cache_key(
+            params={"b": 2, "a": 1},
+            row_filter=RowFilter.create(countries=["Japan", "USA", "Germany"]),
+        )
+
+        assert first == second
+        assert first != make_cache_key(params={"a": 1, "b": 3})
+
+    def test_fingerprint_changes_with_file(self, temp_csv_file_with_data):
+        """Тест: изменение файла меняет отпечаток."""
+        before = fingerprint_file(str(temp_csv_file_with_data), hash_content=True)
+
+        with open(temp_csv_file_with_data, "a", encoding="utf-8") as f:
+            f.write("Atlantis,2023,2000.0,3.0,2.0,5.0,10,Mythica\n")
+
+        after = fingerprint_file(str(temp_csv_file_with_data), hash_content=True)
+        assert before.size != after.size
+        assert before.digest != after.digest
+
+
+class TestResultCache:
+    """Тесты для ResultCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Тест счетчиков попаданий и промахов."""
+        cache = ResultCache()
+
+        assert cache.get("key") is None
+        cache.put("key", [1, 2, 3])
+
+        assert cache.get("key") == [1, 2, 3]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованной записи."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_ttl_expiration(self, monkeypatch):
+        """Тест истечения времени жизни записи."""
+        now = [1000.0]
+        monkeypatch.setattr("src.cache.time.time", lambda: now[0])
+        cache = ResultCache(ttl=10)
+        cache.put("key", "value")
+
+        now[0] += 5
+        assert cache.get("key") == "value"
+        now[0] += 10
+        assert cache.get("key") is None
+
+    def test_disk_cache_shared_between_instances(self, tmp_path):
+        """Тест: дисковый кеш доступен новому экземпляру (новому процессу)."""
+        ResultCache(cache_dir=tmp_path).put("key", {"answer": 42})
+
+        cache = ResultCache(cache_dir=tmp_path)
+
+        assert cache.get("key") == {"answer": 42}
+        assert cache.hits == 1
+
+    def test_disk_size_eviction(self, tmp_path):
+        """Тест ограничения числа файлов дискового кеша."""
+        cache = ResultCache(cache_dir=tmp_path, max_disk_entries=2)
+        for idx, key in enumerate(["a", "b", "c"]):
+            cache.put(key, idx)
+            os.utime(tmp_path / f"{key}.pkl", (idx, idx))
+
+        cache.put("d", 3)
+
+        assert sorted(p.stem for p in tmp_path.glob("*.pkl")) == ["c", "d"]
+
+    def test_invalid_max_entries(self):
+        """Тест проверки размера кеша."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ResultCache(max_entries=0)
@@ -1,7 +1,26 @@
+import math
+
 import pytest
 
-from src.calculator import GDPCalculator
-from src.models import CountryStatistics
+from src.calculator import (
+    Aggregate,
+    AggregateSpec,
+    ApproximateGDPCalculator,
+    CorrelationCalculator,
+    CoverageCalculator,
+    DescriptiveStatisticsCalculator,
+    GDPCalculator,
+    GroupByCalculator,
+    GrowthCalculator,
+    HashAggregator,
+    OutlierCalculator,
+    PivotCalculator,
+    SpillingAggregator,
+    estimate_group_bytes,
+    moving_averages,
+    zscore_min_count,
+)
+from src.models import CountryStatistics, EconomicRecord
 
 
 class TestGDPCalculator:
@@ -47,3 +66,637 @@ class TestGDPCalculator:
         assert len(caplog.records) > 0
         assert "No records provided" in caplog.text
         assert caplog.records[0].levelname == "WARNING"
+
+    def test_common_years(self, sample_records_list):
+        """Тест: средние только по годам, общим для всех стран."""
+        calculator = GDPCalculator(common_years=True)
+
+        stats_dict = {s.country: s for s in calculator.calculate(sample_records_list)}
+
+        # У Японии есть только 2020 год
+        assert stats_dict["USA"].average_gdp == pytest.approx(21433.2)
+        assert stats_dict["Germany"].average_gdp == pytest.approx(3846.4)
+        assert {s.years_count for s in stats_dict.values()} == {1}
+        assert calculator.spec.group_by == ("country", "year")
+
+    def test_no_common_years(self, sample_records_list, caplog):
+        """Тест: без общих лет результат пуст."""
+        records = [
+            r for r in sample_records_list if r.country != "Japan" or r.year != 2020
+        ]
+        records += [
+            EconomicRecord("Japan", 2019, 5100.0, 0.0, 0.0, 2.0, 126, "Asia"),
+        ]
+
+        assert GDPCalculator(common_years=True).calculate(records) == []
+        assert "No years are covered by all countries" in caplog.text
+
+
+class TestApproximateGDPCalculator:
+    """Тесты для ApproximateGDPCalculator."""
+
+    def test_estimates_match_exact_means(self, sample_records_list):
+        """На полных данных оценки совпадают с точными средними."""
+        approx = ApproximateGDPCalculator().calculate(iter(sample_records_list))
+        exact = GDPCalculator().calculate(sample_records_list)
+
+        assert [(s.country, s.average_gdp, s.years_count) for s in approx] == [
+            (s.country, s.average_gdp, s.years_count) for s in exact
+        ]
+
+    def test_confidence_interval(self, sample_records_list):
+        """Полуширина интервала равна z * s / sqrt(n)."""
+        result = {
+            s.country: s
+            for s in ApproximateGDPCalculator().calculate(sample_records_list)
+        }
+
+        # USA: 21433.2 и 23315.1, s = 1330.7
+        assert result["USA"].margin == pytest.approx(
+            1.959964 * 1330.72 / 2**0.5, abs=0.05
+        )
+        assert math.isnan(result["Japan"].margin)
+
+    def test_wider_interval_for_higher_confidence(self, sample_records_list):
+        """Более высокая доверительная вероятность дает более широкий интервал."""
+        narrow = ApproximateGDPCalculator(0.8).calculate(sample_records_list)
+        wide = ApproximateGDPCalculator(0.99).calculate(sample_records_list)
+
+        assert wide[0].margin > narrow[0].margin
+
+    def test_invalid_confidence(self):
+        """Доверительная вероятность должна быть в (0, 1)."""
+        with pytest.raises(ValueError, match="Confidence"):
+            ApproximateGDPCalculator(1.0)
+
+    def test_empty_records(self):
+        """Пустой вход дает пустой результат."""
+        assert ApproximateGDPCalculator().calculate([]) == []
+
+
+class TestAggregateSpec:
+    """Тесты для AggregateSpec."""
+
+    def test_parse(self):
+        """Тест разбора спецификации из аргументов командной строки."""
+        spec = AggregateSpec.parse(["Continent"], "mean:gdp, sum:population")
+
+        assert spec.group_by == ("continent",)
+        assert spec.aggregates == (
+            Aggregate("mean", "gdp"),
+            Aggregate("sum", "population"),
+        )
+        assert spec.columns == {"continent", "gdp", "population"}
+
+    @pytest.mark.parametrize(
+        "group_by,aggregates,message",
+        [
+            (["continent"], "median:gdp", "Unknown aggregate function"),
+            (["continent"], "mean:country", "Cannot aggregate column"),
+            (["continent"], "mean", "expected FUNC:COLUMN"),
+            (["gdp"], "mean:gdp", "Cannot group by"),
+            ([], "mean:gdp", "At least one group key"),
+            (["continent"], "", "At least one aggregate"),
+        ],
+    )
+    def test_invalid_spec(self, group_by, aggregates, message):
+        """Тест ошибок в спецификации."""
+        with pytest.raises(ValueError, match=message):
+            AggregateSpec.parse(group_by, aggregates)
+
+
+class TestHashAggregator:
+    """Тесты для движка HashAggregator."""
+
+    def test_all_aggregates_in_one_pass(self, sample_records_list):
+        """Тест всех агрегатных функций при группировке по континенту."""
+        spec = AggregateSpec.parse(
+            ["continent"],
+            "sum:population,mean:gdp,min:gdp,max:gdp,count:gdp,last:year",
+        )
+        aggregator = HashAggregator(spec)
+
+        aggregator.consume(sample_records_list, batch_size=2)
+
+        results = {g.key["continent"]: g.values for g in aggregator.results()}
+        assert aggregator.rows == 5
+        assert results["Europe"] == {
+            "sum_population": 166,
+            "mean_gdp": pytest.approx(4053.15),
+            "min_gdp": 3846.4,
+            "max_gdp": 4259.9,
+            "count_gdp": 2,
+            "last_year": 2021,
+        }
+        assert results["Asia"]["count_gdp"] == 1
+
+    def test_composite_key(self, sample_records_list):
+        """Тест группировки по нескольким ключам."""
+        aggregator = HashAggregator(
+            AggregateSpec.parse(["continent", "year"], "count:gdp")
+        )
+
+        aggregator.consume(sample_records_list)
+
+        keys = [tuple(g.key.values()) for g in aggregator.results()]
+        assert ("Europe", 2020) in keys
+        assert len(keys) == 5
+
+    def test_merge_partial_states(self, sample_records_list):
+        """Слияние частичных состояний дает тот же результат, что один проход."""
+        spec = AggregateSpec.parse(
+            ["continent"], "sum:population,mean:gdp,min:gdp,max:gdp,last:year"
+        )
+        whole = HashAggregator(spec)
+        whole.consume(sample_records_list)
+        left, right = HashAggregator(spec), HashAggregator(spec)
+        left.consume(sample_records_list[:2])
+        right.consume(sample_records_list[2:])
+
+        left.merge(right)
+
+        assert left.rows == whole.rows
+        assert left.results() == whole.results()
+
+
+def _firm_records(count: int, groups: int) -> list[EconomicRecord]:
+    """Записи с большим числом различных ключей country."""
+    return [
+        EconomicRecord(
+            country=f"firm-{i % groups}",
+            year=2000 + i % 7,
+            gdp=float(i % 101),
+            gdp_growth=0.0,
+            inflation=0.0,
+            unemployment=0.0,
+            population=1,
+            continent="X",
+        )
+        for i in range(count)
+    ]
+
+
+class TestSpillingAggregator:
+    """Тесты агрегации с выгрузкой групп на диск."""
+
+    SPEC = AggregateSpec.parse(
+        ["country"], "sum:gdp,mean:gdp,min:gdp,max:gdp,count:gdp,last:year"
+    )
+
+    def _expected(self, records):
+        aggregator = HashAggregator(self.SPEC)
+        aggregator.consume(records)
+        return {tuple(g.key.values()): g.values for g in aggregator.results()}
+
+    def test_spills_and_matches_in_memory_result(self, tmp_path):
+        """Результат с выгрузкой совпадает с агрегацией в памяти."""
+        records = _firm_records(5000, 700)
+        aggregator = SpillingAggregator(self.SPEC, max_groups=50, spill_dir=tmp_path)
+
+        aggregator.consume(records, batch_size=100)
+        results = aggregator.results()
+
+        assert aggregator.spills > 0
+        assert aggregator.rows == 5000
+        actual = {tuple(g.key.values()): g.values for g in results}
+        expected = self._expected(records)
+        assert actual.keys() == expected.keys()
+        for key, values in expected.items():
+            assert actual[key] == pytest.approx(values)
+
+    def test_group_count_is_bounded(self):
+        """В памяти не остается больше групп, чем разрешено."""
+        aggregator = SpillingAggregator(self.SPEC, max_groups=30)
+
+        for batch_start in range(0, 2000, 10):
+            aggregator.consume(_firm_records(2000, 500)[batch_start : batch_start + 10])
+            assert aggregator.group_count <= 30
+
+        assert len(aggregator.results()) == 500
+
+    def test_no_spill_below_limit(self, sample_records_list):
+        """Без превышения лимита временные файлы не создаются."""
+        aggregator = SpillingAggregator(self.SPEC, max_groups=100)
+
+        aggregator.consume(sample_records_list)
+
+        assert aggregator.spills == 0
+        assert len(aggregator.results()) == 3
+
+    def test_invalid_limit(self):
+        """Неположительный лимит групп недопустим."""
+        with pytest.raises(ValueError, match="max_groups"):
+            SpillingAggregator(self.SPEC, max_groups=0)
+
+    def test_calculator_memory_limit(self, sample_records_list):
+        """Лимит памяти калькулятора не меняет результат."""
+        limit = 2 * estimate_group_bytes(GDPCalculator.spec)
+        records = _firm_records(3000, 400) + sample_records_list
+
+        limited = GDPCalculator(memory_limit=limit).calculate(iter(records))
+        unlimited = GDPCalculator().calculate(records)
+
+        # Порядок стран с равным средним может отличаться
+        assert sorted(limited, key=lambda s: s.country) == sorted(
+            unlimited, key=lambda s: s.country
+        )
+
+    def test_calculator_invalid_memory_limit(self):
+        """Неположительный лимит памяти калькулятора недопустим."""
+        with pytest.raises(ValueError, match="memory_limit"):
+            GDPCalculator(memory_limit=0)
+
+
+class TestGroupByCalculator:
+    """Тесты для GroupByCalculator."""
+
+    def test_results_sorted_by_key(self, sample_records_list):
+        """Тест: группы упорядочены по ключам, проекция - по спецификации."""
+        calculator = GroupByCalculator(AggregateSpec.parse(["country"], "max:gdp"))
+
+        groups = calculator.calculate(sample_records_list)
+
+        assert calculator.required_columns == {"country", "gdp"}
+        assert [g.key["country"] for g in groups] == ["Germany", "Japan", "USA"]
+        assert groups[2].values["max_gdp"] == 23315.1
+
+
+class TestDescriptiveStatisticsCalculator:
+    """Тесты для DescriptiveStatisticsCalculator."""
+
+    def test_statistics_by_country(self, sample_records_list):
+        """Тест описательной статистики ВВП по странам."""
+        stats = DescriptiveStatisticsCalculator("gdp").calculate(sample_records_list)
+
+        by_country = {s.country: s for s in stats}
+        usa = by_country["USA"]
+        assert [s.country for s in stats] == ["Germany", "Japan", "USA"]
+        assert usa.count == 2
+        assert usa.mean == pytest.approx(22374.15)
+        assert usa.stddev == pytest.approx(1330.71, abs=0.01)
+        assert (usa.min, usa.max) == (21433.2, 23315.1)
+        assert usa.median == pytest.approx(22374.15)
+        assert not usa.approximate
+        assert by_country["Japan"].stddev == 0.0
+
+    def test_large_group_uses_sketch(self, sample_records_list):
+        """Тест: группа больше порога получает приближенные квантили."""
+        calculator = DescriptiveStatisticsCalculator("inflation", exact_limit=1)
+
+        stats = calculator.calculate(sample_records_list)
+
+        assert calculator.required_columns == {"country", "inflation"}
+        assert {s.country: s.approximate for s in stats}["USA"] is True
+
+    def test_unknown_indicator(self):
+        """Тест: нечисловой показатель отклоняется."""
+        with pytest.raises(ValueError, match="Unknown indicator"):
+            DescriptiveStatisticsCalculator("continent")
+
+
+class TestGrowthCalculator:
+    """Тесты для GrowthCalculator и скользящих средних."""
+
+    @pytest.fixture
+    def records(self):
+        """Ряд ВВП страны с пропуском 2013 года, записи в случайном порядке."""
+        points = [
+            (2012, 120.0, 20.0),
+            (2010, 100.0, 0.0),
+            (2014, 144.0, 10.0),
+            (2011, 100.0, 0.0),
+        ]
+        return [
+            EconomicRecord(
+                country="Testland",
+                year=year,
+                gdp=gdp,
+                gdp_growth=growth,
+                inflation=0.0,
+                unemployment=0.0,
+                population=1,
+                continent="Testinia",
+            )
+            for year, gdp, growth in points
+        ]
+
+    def test_moving_averages_with_gap(self):
+        """Тест: окно покрывает годы, а не записи, пропуски учитываются."""
+        result = moving_averages([2010, 2011, 2012, 2014], [1.0, 2.0, 3.0, 5.0], 2)
+
+        assert result == [(2011, 1.5), (2012, 2.5), (2014, 5.0)]
+
+    def test_growth_statistics(self, records):
+        """Тест CAGR, накопленного роста и скользящих средних."""
+        calculator = GrowthCalculator(window=3)
+
+        (growth,) = calculator.calculate(records)
+
+        assert (growth.first_year, growth.last_year) == (2010, 2014)
+        assert growth.moving_averages[0] == (2012, pytest.approx(320 / 3))
+        assert growth.latest_moving_average == pytest.approx(132.0)
+        # (144 / 100) ^ (1 / 4) - 1
+        assert growth.cagr == pytest.approx(9.5445, abs=1e-4)
+        # 1.0 * 1.0 * 1.2 * 1.1 - 1
+        assert growth.cumulative_growth == pytest.approx(32.0)
+
+    def test_cagr_between_given_years(self, records):
+        """Тест CAGR между заданными годами и отсутствия года в ряду."""
+        (growth,) = GrowthCalculator(start_year=2010, end_year=2012).calculate(records)
+        assert growth.cagr == pytest.approx(9.5445, abs=1e-4)
+
+        (growth,) = GrowthCalculator(start_year=2010, end_year=2013).calculate(records)
+        assert growth.cagr is None
+        assert growth.cumulative_growth is None
+
+    @pytest.mark.parametrize("end_value", [-1.0, 0.0])
+    def test_cagr_is_undefined_without_positive_end(self, end_value):
+        """CAGR не считается при смене знака или нулевом конечном значении."""
+        records = [
+            EconomicRecord(
+                country=country,
+                year=year,
+                gdp=1.0,
+                gdp_growth=0.0,
+                inflation=inflation,
+                unemployment=0.0,
+                population=1,
+                continent="Testinia",
+            )
+            for country, points in (
+                ("Flipland", [(2000, 2.0), (2001, 0.5), (2002, end_value)]),
+                ("Steadyland", [(2000, 1.0), (2002, 4.0)]),
+            )
+            for year, inflation in points
+        ]
+
+        result = GrowthCalculator(indicator="inflation").calculate(records)
+
+        assert [(g.country, g.cagr) for g in result] == [
+            ("Steadyland", pytest.approx(100.0)),
+            ("Flipland", None),
+        ]
+
+    @pytest.mark.parametrize(
+        "kwargs,message",
+        [
+            ({"window": 0}, "Window must be"),
+            ({"start_year": 2020, "end_year": 2010}, "Invalid CAGR range"),
+            ({"indicator": "country"}, "Unknown indicator"),
+        ],
+    )
+    def test_invalid_parameters(self, kwargs, message):
+        """Тест проверки параметров калькулятора."""
+        with pytest.raises(ValueError, match=message):
+            GrowthCalculator(**kwargs)
+
+
+class TestPivotCalculator:
+    """Тесты для PivotCalculator."""
+
+    def test_pivot_with_missing_cells(self, sample_records_list):
+        """Тест плотной таблицы: строки по странам, колонки по годам."""
+        sample_records_list.append(
+            EconomicRecord(
+                country="Brazil",
+                year=2019,
+                gdp=1877.8,
+                gdp_growth=1.2,
+                inflation=3.7,
+                unemployment=11.9,
+                population=211,
+                continent="South America",
+            )
+        )
+
+        (table,) = PivotCalculator(["gdp"]).calculate(sample_records_list)
+
+        assert table.countries == ["Brazil", "Germany", "Japan", "USA"]
+        assert table.years == [2019, 2020, 2021]
+        assert len(table.values) == 12
+        assert table.cell("USA", 2021) == 23315.1
+        assert table.cell("Japan", 2021) is None
+        assert table.cell("Brazil", 2020) is None
+        assert list(table.row(0))[0] == 1877.8
+
+    def test_duplicate_cells_are_averaged(self, sample_records_list):
+        """Тест: одна страна и год из нескольких файлов усредняются."""
+        records = sample_records_list + [
+            EconomicRecord(
+                country="USA",
+                year=2020,
+                gdp=21433.2,
+                gdp_growth=-2.8,
+                inflation=2.2,
+                unemployment=8.1,
+                population=331,
+                continent="North America",
+            )
+        ]
+
+        gdp, inflation = PivotCalculator(["gdp", "inflation"]).calculate(records)
+
+        assert (gdp.indicator, inflation.indicator) == ("gdp", "inflation")
+        assert gdp.cell("USA", 2020) == 21433.2
+        assert inflation.cell("USA", 2020) == 1.7
+
+    def test_empty_records(self):
+        """Тест: без записей таблицы не строятся."""
+        assert PivotCalculator().calculate([]) == []
+
+    @pytest.mark.parametrize(
+        "indicators,message",
+        [([], "At least one indicator"), (["country"], "Unknown indicators")],
+    )
+    def test_invalid_indicators(self, indicators, message):
+        """Тест проверки списка показателей."""
+        with pytest.raises(ValueError, match=message):
+            PivotCalculator(indicators)
+
+
+class TestCorrelationCalculator:
+    """Тесты для CorrelationCalculator."""
+
+    def test_overall_and_country_matrices(self, sample_records_list):
+        """Тест: первая матрица общая, далее страны по алфавиту."""
+        calculator = CorrelationCalculator(["gdp_growth", "inflation"])
+
+        overall, *countries = calculator.calculate(sample_records_list)
+
+        assert overall.country is None
+        assert overall.count == 5
+        assert overall.correlation[0][0] == 1.0
+        assert overall.correlation[0][1] == overall.correlation[1][0]
+        assert [m.country for m in countries] == ["Germany", "Japan", "USA"]
+        # Две точки лежат на одной прямой
+        assert countries[0].correlation[0][1] == 1.0
+        # Одна запись - корреляция не определена
+        assert math.isnan(countries[1].correlation[0][1])
+
+    def test_merge_matches_single_pass(self, sample_records_list):
+        """Тест: слияние накопителей по частям равно одному проходу."""
+        calculator = CorrelationCalculator(by_country=False)
+        groups = calculator.accumulate(sample_records_list[:2])
+
+        calculator.merge(groups, calculator.accumulate(sample_records_list[2:]))
+
+        assert calculator.finalize(groups) == calculator.calculate(sample_records_list)
+        assert len(calculator.finalize(groups)) == 1
+
+    def test_empty_records(self):
+        """Тест: без записей матрицы не строятся."""
+        assert CorrelationCalculator().calculate([]) == []
+
+    @pytest.mark.parametrize(
+        "indicators,message",
+        [
+            (["gdp"], "At least two indicators"),
+            (["gdp", "gdp"], "At least two indicators"),
+            (["gdp", "country"], "Unknown indicators"),
+        ],
+    )
+    def test_invalid_indicators(self, indicators, message):
+        """Тест проверки списка показателей."""
+        with pytest.raises(ValueError, match=message):
+            CorrelationCalculator(indicators)
+
+
+class TestOutlierCalculator:
+    """Тесты для OutlierCalculator."""
+
+    @staticmethod
+    def series(country, gdps, inflations=None):
+        """Ряд записей страны с 2000 года."""
+        inflations = inflations or [2.0] * len(gdps)
+        return [
+            EconomicRecord(
+                country=country,
+                year=2000 + i,
+                gdp=gdp,
+                gdp_growth=1.0,
+                inflation=inflation,
+                unemployment=5.0,
+                population=100,
+                continent="Testinia",
+            )
+            for i, (gdp, inflation) in enumerate(zip(gdps, inflations, strict=True))
+        ]
+
+    def test_unit_mistake_is_flagged_by_all_methods(self):
+        """Тест: ВВП в 1000 раз больше соседних лет."""
+        gdps = [100.0 + i for i in range(12)]
+        gdps[6] *= 1000
+        records = self.series("Testland", gdps)
+        # Порядок записей не важен: ряд упорядочивается по году
+        records.reverse()
+
+        outliers = OutlierCalculator(["gdp"]).calculate(records)
+
+        assert [(o.year, o.method) for o in outliers] == [
+            (2006, "zscore"),
+            (2006, "mad"),
+            (2006, "yoy"),
+            (2007, "yoy"),
+        ]
+        assert outliers[2].score == pytest.approx(1000.0, rel=0.01)
+        assert outliers[2].reference == 105.0
+        assert outliers[3].score == pytest.approx(0.001, rel=0.01)
+
+    def test_rate_jump_in_percentage_points(self):
+        """Тест: скачок инфляции оценивается в процентных пунктах."""
+        records = self.series("Testland", [100.0] * 3, [2.0, 40.0, 3.0])
+
+        outliers = OutlierCalculator(["inflation"]).calculate(records)
+
+        # В коротком ряду z- и MAD-оценки не считаются
+        assert [(o.year, o.method, o.score) for o in outliers] == [
+            (2001, "yoy", 38.0),
+            (2002, "yoy", -37.0),
+        ]
+
+    def test_short_series_is_checked_by_mad_only(self):
+        """Тест: в ряду из 10 наблюдений z-оценка не может превысить 3."""
+        gdps = [100.0 + i for i in range(10)]
+        gdps[5] *= 1000
+        calculator = OutlierCalculator(["gdp"])
+
+        outliers = calculator.calculate(self.series("Testland", gdps))
+
+        assert calculator.z_min_count == 11
+        assert [(o.year, o.method) for o in outliers] == [
+            (2005, "mad"),
+            (2005, "yoy"),
+            (2006, "yoy"),
+        ]
+
+    @pytest.mark.parametrize("threshold,count", [(1.5, 5), (2.0, 6), (3.0, 11)])
+    def test_zscore_min_count(self, threshold, count):
+        """Тест: наименьшая длина ряда, в которой |z| может превысить порог."""
+        assert zscore_min_count(threshold) == count
+        assert (count - 1) / math.sqrt(count) > threshold
+        assert (count - 2) / math.sqrt(count - 1) <= threshold
+
+    def test_stable_series_has_no_outliers(self, sample_records_list):
+        """Тест: без резких изменений выбросов нет."""
+        records = self.series("Stable", [100.0 + i for i in range(10)])
+
+        assert OutlierCalculator().calculate(records + sample_records_list) == []
+
+    def test_thresholds(self):
+        """Тест: порог скачка задается параметром."""
+        records = self.series("Testland", [100.0, 300.0])
+
+        assert OutlierCalculator(["gdp"]).calculate(records) == []
+        (outlier,) = OutlierCalculator(["gdp"], jump_ratio=2).calculate(records)
+        assert (outlier.year, outlier.score) == (2001, 3.0)
+
+    def test_empty_records(self):
+        """Тест: без записей выбросов нет."""
+        assert OutlierCalculator().calculate([]) == []
+
+    @pytest.mark.parametrize(
+        "kwargs,message",
+        [
+            ({"indicators": ["year"]}, "Unknown indicators"),
+            ({"z_threshold": 0}, "z_threshold must be positive"),
+            ({"jump_ratio": 1}, "jump_ratio must be greater than 1"),
+        ],
+    )
+    def test_invalid_parameters(self, kwargs, message):
+        """Тест проверки параметров калькулятора."""
+        with pytest.raises(ValueError, match=message):
+            OutlierCalculator(**kwargs)
+
+
+class TestCoverageCalculator:
+    """Тесты для CoverageCalculator."""
+
+    def test_gaps(self, sample_records_list):
+        """Тест первого и последнего года, пропусков и их серий."""
+        records = sample_records_list + [
+            EconomicRecord("Japan", year, 5000.0, 0.0, 0.0, 2.0, 126, "Asia")
+            for year in (2016, 2024, 2015)
+        ]
+
+        germany, japan, usa = CoverageCalculator().calculate(records)
+
+        assert (japan.first_year, japan.last_year, japan.years_count) == (
+            2015,
+            2024,
+            4,
+        )
+        assert japan.missing_years == [2017, 2018, 2019, 2021, 2022, 2023]
+        assert japan.gaps == [(2017, 2019), (2021, 2023)]
+        assert japan.coverage == pytest.approx(0.4)
+        assert germany.contiguous and germany.span == 2
+        assert usa.country == "USA"
+
+    def test_repeated_years_are_counted_once(self, sample_records_list):
+        """Тест: повтор года (из нескольких файлов) - один год."""
+        coverage = CoverageCalculator().calculate(sample_records_list * 2)
+
+        assert [c.years_count for c in coverage] == [2, 1, 2]
+
+    def test_empty_records(self):
+        """Тест: без записей покрытие не строится."""
+        assert CoverageCalculator().calculate([]) == []
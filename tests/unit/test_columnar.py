@@ -0,0 +1,133 @@
+import math
+import sys
+from array import array
+
+import pytest
+
+from src.columnar import ColumnarTable
+from src.models import CountryGrowth, CountryStatistics, GroupStatistics
+
+
+class TestColumnarTable:
+    """Тесты для ColumnarTable."""
+
+    def test_from_records(self, sample_records_list):
+        """Числовые колонки записей хранятся в array.array."""
+        table = ColumnarTable.from_records(iter(sample_records_list))
+
+        assert len(table) == 5
+        assert table.column_names[0] == "country"
+        assert table.columns["year"] == array("q", [2020, 2021, 2020, 2021, 2020])
+        assert table.columns["gdp"].typecode == "d"
+        assert table.columns["country"] == [r.country for r in sample_records_list]
+
+    def test_from_records_projection(self, sample_records_list):
+        """Таблица содержит только запрошенные колонки."""
+        table = ColumnarTable.from_records(sample_records_list, ["country", "gdp"])
+
+        assert table.column_names == ["country", "gdp"]
+
+    def test_from_records_unknown_column(self):
+        """Неизвестная колонка отклоняется."""
+        with pytest.raises(ValueError, match="Unknown columns"):
+            ColumnarTable.from_records([], ["gdp", "debt"])
+
+    def test_from_results(self):
+        """Поля DTO становятся колонками с выводом типов."""
+        table = ColumnarTable.from_results(
+            [
+                CountryStatistics("A", 10.0, 2),
+                CountryStatistics("B", 5.5, 1),
+            ]
+        )
+
+        assert table.columns["country"] == ["A", "B"]
+        assert table.columns["average_gdp"] == array("d", [10.0, 5.5])
+        assert table.columns["years_count"] == array("q", [2, 1])
+
+    def test_optional_values_become_nan(self):
+        """None в числовой колонке хранится как NaN."""
+        table = ColumnarTable.from_results(
+            [
+                CountryGrowth("A", "gdp", 2000, 2001, 3, [], 1.5, None),
+                CountryGrowth("B", "gdp", 2000, 2000, 3, [], None, 2.0),
+            ]
+        )
+
+        cagr = table.columns["cagr"]
+        assert cagr.typecode == "d"
+        assert cagr[0] == 1.5 and math.isnan(cagr[1])
+        assert isinstance(table.columns["moving_averages"], list)
+
+    def test_group_statistics_are_flattened(self):
+        """Ключи и значения групп становятся отдельными колонками."""
+        table = ColumnarTable.from_results(
+            [GroupStatistics({"continent": "Europe"}, {"sum_gdp": 1.0, "count": 2})]
+        )
+
+        assert table.column_names == ["continent", "sum_gdp", "count"]
+
+    def test_buffer_is_zero_copy(self, sample_records_list):
+        """memoryview колонки разделяет память с таблицей."""
+        table = ColumnarTable.from_records(sample_records_list)
+
+        view = table.buffer("gdp")
+        table.columns["gdp"][0] = -1.0
+
+        assert view.format == "d"
+        assert view[0] == -1.0
+
+    def test_buffer_rejects_string_column(self, sample_records_list):
+        """Строковые колонки не поддерживают протокол буфера."""
+        table = ColumnarTable.from_records(sample_records_list)
+
+        with pytest.raises(TypeError, match="buffer protocol"):
+            table.buffer("country")
+
+    def test_unsupported_result(self):
+        """Результаты, не являющиеся dataclass, отклоняются."""
+        with pytest.raises(TypeError):
+            ColumnarTable.from_results([("A", 1.0)])
+
+    def test_to_numpy_without_numpy(self, monkeypatch, sample_records_list):
+        """Без NumPy экспорт сообщает, что пакет нужно установить."""
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        table = ColumnarTable.from_records(sample_records_list)
+
+        with pytest.raises(ImportError, match="pip install numpy"):
+            table.to_numpy()
+
+    def test_to_numpy_is_zero_copy(self, sample_records_list):
+        """Числовые колонки экспортируются в NumPy без копирования."""
+        np = pytest.importorskip("numpy")
+        table = ColumnarTable.from_records(sample_records_list)
+
+        arrays = table.to_numpy()
+        table.columns["gdp"][0] = -1.0
+
+        assert arrays["gdp"].dtype == np.float64
+        assert arrays["gdp"][0] == -1.0
+        assert arrays["year"].dtype == np.int64
+        assert arrays["country"].dtype == object
+
+    def test_to_arrow_without_pyarrow(self, monkeypatch, sample_records_list):
+        """Без pyarrow экспорт сообщает, что пакет нужно установить."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        table = ColumnarTable.from_records(sample_records_list)
+
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            table.to_arrow()
+
+    def test_to_arrow_is_zero_copy(self, sample_records_list):
+        """Числовые колонки экспортируются в Arrow без копирования."""
+        pa = pytest.importorskip("pyarrow")
+        table = ColumnarTable.from_records(sample_records_list)
+
+        arrow_table = table.to_arrow()
+        table.columns["gdp"][0] = -1.0
+
+        assert arrow_table.column("gdp")[0].as_py() == -1.0
+        assert arrow_table.schema.field("year").type == pa.int64()
+        assert arrow_table.column("country").to_pylist() == [
+            r.country for r in sample_records_list
+        ]
@@ -84,3 +84,19 @@ class TestEconomicDataConverter:
 
             with pytest.raises(KeyError, match=missing_field):
                 converter.to_record(row)
+
+    class TestConverterProjection:
+        """Тесты преобразования с проекцией колонок."""
+
+        def test_only_requested_columns_are_converted(
+            self, converter, sample_valid_record
+        ):
+            """Тест: непрошенные колонки получают значения по умолчанию."""
+            row = {"country": " Testland ", "gdp": "1000.5", "year": "not-a-year"}
+
+            record = converter.to_record(row, columns={"country", "gdp"})
+
+            assert record.country == "Testland"
+            assert record.gdp == 1000.5
+            assert record.year == 0
+            assert record.continent == ""
@@ -0,0 +1,257 @@
+import pytest
+
+from src.analyzer import Analyzer
+from src.calculator import Aggregate, AggregateSpec, GDPCalculator, HashAggregator
+from src.cube import (
+    CUBE_INDICATORS,
+    CUBE_MAGIC,
+    AggregateCube,
+    CubeReader,
+    build_cube,
+    load_cube,
+    save_cube,
+)
+from src.filters import RowFilter
+from src.models import EconomicRecord, GroupStatistics
+from src.reader import CSVReader
+from src.storage import SQLiteReader, SQLiteStorage
+
+CONTINENTS = {"A": "Europe", "B": "Europe", "C": "Asia", "D": "Asia", "E": "Africa"}
+
+
+def make_records():
+    """Записи пяти стран за 2000-2009 с пропусками лет и повторами ячеек."""
+    records = []
+    for i, (country, continent) in enumerate(CONTINENTS.items()):
+        for year in range(2000, 2010):
+            if (year + i) % 4 == 0:
+                continue
+            copies = 2 if year == 2005 else 1
+            for copy in range(copies):
+                records.append(
+                    EconomicRecord(
+                        country=country,
+                        year=year,
+                        gdp=100.0 * (i + 1) + year - 2000 + copy * 0.5,
+                        gdp_growth=(year - 2004) * 0.7 - i,
+                        inflation=1.5 + i + copy,
+                        unemployment=3.0 + (year % 3),
+                        population=10 + i,
+                        continent=continent,
+                    )
+                )
+    return records
+
+
+def expected(records, spec, row_filter=None):
+    """Результат агрегации записей, прошедших фильтр, движком HashAggregator."""
+    if row_filter is not None:
+        records = [
+            r for r in records if row_filter.accepts(r.country, r.year, r.continent)
+        ]
+    aggregator = HashAggregator(spec)
+    aggregator.consume(records)
+    return {tuple(group.key.values()): group.values for group in aggregator.results()}
+
+
+def as_dict(groups):
+    """Группы результата в виде словаря ключ -> значения."""
+    return {tuple(group.key.values()): group.values for group in groups}
+
+
+@pytest.fixture
+def records():
+    """Записи для построения куба."""
+    return make_records()
+
+
+@pytest.fixture
+def csv_file(write_csv, records):
+    """CSV файл с записями."""
+    return write_csv("data.csv", records)
+
+
+@pytest.fixture
+def cube(csv_file):
+    """Куб, построенный по CSV файлу."""
+    return build_cube(CSVReader(), [str(csv_file)])
+
+
+@pytest.fixture
+def cube_file(tmp_path, cube):
+    """Сохраненный куб."""
+    path = tmp_path / "data.cube"
+    save_cube(cube, path)
+    return path
+
+
+SPECS = [
+    AggregateSpec.parse(["country"], "mean:gdp,count:gdp"),
+    AggregateSpec.parse(["continent"], "sum:population,min:inflation,max:gdp"),
+    AggregateSpec.parse(["country", "year"], "sum:gdp,count:gdp"),
+    AggregateSpec.parse(["continent", "year"], "mean:unemployment,max:gdp_growth"),
+    AggregateSpec.parse(["year"], "mean:gdp,min:gdp"),
+    AggregateSpec.parse(["continent", "country"], "mean:inflation"),
+]
+
+FILTERS = [
+    None,
+    RowFilter(year_from=2003, year_to=2007),
+    RowFilter(year_from=2005),
+    RowFilter(year_to=2001, continents=frozenset({"Asia"})),
+    RowFilter(countries=frozenset({"A", "C"}), year_from=2002, year_to=2008),
+]
+
+
+class TestAggregateCube:
+    """Тесты построения куба и запросов к нему."""
+
+    def test_dimensions(self, cube):
+        """Куб покрывает страны с континентами и плотный диапазон лет."""
+        assert cube.countries.keys == sorted(CONTINENTS.items())
+        assert cube.continents.keys == [("Africa",), ("Asia",), ("Europe",)]
+        assert (cube.first_year, cube.last_year) == (2000, 2009)
+
+    @pytest.mark.parametrize("spec", SPECS)
+    @pytest.mark.parametrize("row_filter", FILTERS)
+    def test_query_matches_hash_aggregation(self, cube, records, spec, row_filter):
+        """Результат по кубу совпадает с агрегацией исходных записей."""
+        result = as_dict(cube.query(spec, row_filter))
+        reference = expected(records, spec, row_filter)
+
+        assert result.keys() == reference.keys()
+        for key, values in reference.items():
+            assert result[key] == pytest.approx(values)
+
+    def test_range_sum_is_exact_after_large_values(self):
+        """Разность префиксов не теряет малые значения после больших."""
+        cube = AggregateCube.from_groups(
+            [
+                GroupStatistics(
+                    key={"country": "A", "continent": "X", "year": year},
+                    values={
+                        "count_gdp": 1,
+                        **{
+                            f"{func}_{name}": value
+                            for name in CUBE_INDICATORS
+                            for func in ("sum", "min", "max")
+                        },
+                    },
+                )
+                for year, value in ((2000, 1e16), (2001, 1.5), (2002, 2.25))
+            ]
+        )
+        spec = AggregateSpec.parse(["country"], "sum:gdp")
+
+        (group,) = cube.query(spec, RowFilter(year_from=2001))
+
+        assert group.values == {"sum_gdp": 3.75}
+
+    def test_groups_are_sorted(self, cube):
+        """Группы упорядочены по ключам."""
+        spec = AggregateSpec.parse(["continent", "year"], "count:gdp")
+
+        keys = [tuple(g.key.values()) for g in cube.query(spec)]
+
+        assert keys == sorted(keys)
+
+    def test_year_range_outside_cube(self, cube):
+        """Диапазон лет вне куба дает пустой результат."""
+        spec = AggregateSpec.parse(["country"], "mean:gdp")
+
+        assert cube.query(spec, RowFilter(year_from=2020)) == []
+
+    @pytest.mark.parametrize("aggregate", ["last:gdp", "mean:year"])
+    def test_unsupported_spec(self, cube, aggregate):
+        """Функции и колонки, которых нет в кубе, не выполняются по нему."""
+        assert cube.query(AggregateSpec.parse(["country"], aggregate)) is None
+
+    def test_empty_input(self):
+        """Куб без данных не строится."""
+        with pytest.raises(ValueError, match="No records"):
+            AggregateCube.from_groups([])
+
+    def test_sqlite_pushdown_builds_same_cube(self, tmp_path, csv_file, cube):
+        """Куб по базе SQLite (GROUP BY) совпадает с кубом по CSV."""
+        db_path = tmp_path / "economy.sqlite"
+        SQLiteStorage(db_path).ingest([str(csv_file)])
+
+        from_db = build_cube(SQLiteReader(), [str(db_path)])
+
+        spec = AggregateSpec.parse(["country", "year"], "sum:gdp,min:inflation")
+        reference = as_dict(cube.query(spec))
+        result = as_dict(from_db.query(spec))
+        assert from_db.countries.keys == cube.countries.keys
+        assert result.keys() == reference.keys()
+        for key, values in reference.items():
+            assert result[key] == pytest.approx(values)
+
+
+class TestCubeFile:
+    """Тесты сохранения и загрузки куба."""
+
+    def test_round_trip(self, cube, cube_file):
+        """Загруженный куб отвечает так же, как исходный."""
+        loaded = load_cube(cube_file)
+
+        assert loaded.countries.keys == cube.countries.keys
+        assert loaded.continents.keys == cube.continents.keys
+        for spec in SPECS:
+            assert loaded.query(spec, FILTERS[1]) == cube.query(spec, FILTERS[1])
+
+    def test_missing_file(self, tmp_path):
+        """Отсутствующий файл куба - FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Cube not found"):
+            load_cube(tmp_path / "missing.cube")
+
+    def test_not_a_cube(self, csv_file):
+        """Файл другого формата отклоняется."""
+        with pytest.raises(ValueError, match="Not an aggregate cube"):
+            load_cube(csv_file)
+
+    def test_truncated_file(self, cube_file):
+        """Обрезанный файл отклоняется."""
+        data = cube_file.read_bytes()
+        assert data.startswith(CUBE_MAGIC)
+        cube_file.write_bytes(data[:-8])
+
+        with pytest.raises(ValueError, match="truncated"):
+            load_cube(cube_file)
+
+
+class TestCubeReader:
+    """Тесты ответов на отчеты по кубу."""
+
+    def test_average_gdp_for_year_range(self, cube_file, csv_file):
+        """Средний ВВП по кубу совпадает с расчетом по CSV за тот же период."""
+        row_filter = RowFilter(year_from=2002, year_to=2006)
+        by_cube = Analyzer(reader=CubeReader(row_filter)).compute(
+            [str(cube_file)], "average-gdp"
+        )
+        by_csv = Analyzer(reader=CSVReader(row_filter=row_filter)).compute(
+            [str(csv_file)], "average-gdp"
+        )
+
+        assert by_cube == by_csv
+
+    def test_common_years(self, cube_file, records):
+        """Средние по общим годам считаются по ячейкам страна x год."""
+        calculator = GDPCalculator(common_years=True)
+
+        groups = CubeReader().aggregate([str(cube_file)], calculator.spec)
+
+        assert calculator.finalize(groups) == calculator.calculate(records)
+
+    def test_records_are_not_available(self, cube_file):
+        """Отчеты, которым нужны записи, по кубу не строятся."""
+        analyzer = Analyzer(reader=CubeReader())
+
+        with pytest.raises(ValueError, match="only answers aggregate reports"):
+            analyzer.compute([str(cube_file)], "pivot")
+
+    def test_single_cube_file(self, cube_file):
+        """Поддерживается ровно один файл куба."""
+        spec = AggregateSpec(("country",), (Aggregate("mean", "gdp"),))
+
+        with pytest.raises(ValueError, match="Exactly one cube file"):
+            CubeReader().aggregate([str(cube_file), str(cube_file)], spec)
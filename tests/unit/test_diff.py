@@ -0,0 +1,151 @@
+import csv
+import io
+
+import pytest
+
+from src.diff import (
+    ADDED,
+    CHANGED,
+    REMOVED,
+    diff_snapshots,
+    render_diff,
+    snapshot_size,
+    write_diff_csv,
+)
+from src.reader import CSVReader
+from tests.conftest import HEADER
+
+
+@pytest.fixture
+def write_snapshot(tmp_path):
+    """Записывает строки снимка в CSV файл и возвращает путь."""
+
+    def write(name, rows):
+        path = tmp_path / name
+        path.write_text(HEADER + "".join(f"{row}\n" for row in rows), "utf-8")
+        return str(path)
+
+    return write
+
+
+@pytest.fixture
+def snapshots(write_snapshot):
+    """Прежний и новый снимки с добавленной, удаленной и измененной строкой."""
+    old = write_snapshot(
+        "old.csv",
+        [
+            "A,2020,100.0,1.0,2.0,3.0,10,X",
+            "A,2021,110.0,1.0,2.0,3.0,10,X",
+            "B,2020,200.0,1.0,2.0,3.0,20,Y",
+        ],
+    )
+    new = write_snapshot(
+        "new.csv",
+        [
+            "B,2020,200.0,1.0,2.5,3.0,21,Y",
+            "A,2020,100.0,1.0,2.0,3.0,10,X",
+            "C,2021,50.0,1.0,2.0,3.0,5,Z",
+            "C,2022,55.0,1.0,2.0,3.0,5,Z",
+        ],
+    )
+    return [old], [new]
+
+
+class TestDiffSnapshots:
+    """Тесты для diff_snapshots."""
+
+    def test_added_removed_changed(self, snapshots):
+        """Различия по ключу (страна, год) с изменениями полей."""
+        diff = diff_snapshots(*snapshots, CSVReader())
+
+        assert [(r.country, r.year, r.status) for r in diff.rows] == [
+            ("A", 2021, REMOVED),
+            ("B", 2020, CHANGED),
+            ("C", 2021, ADDED),
+            ("C", 2022, ADDED),
+        ]
+        assert diff.rows[1].changes == {"inflation": (2.0, 2.5), "population": (20, 21)}
+        assert diff.rows[0].changes["gdp"] == (110.0, None)
+        assert diff.rows[2].changes["continent"] == (None, "Z")
+        assert diff.unchanged == 1
+        assert diff.summary == "Added: 2, removed: 1, changed: 1, unchanged: 1"
+
+    def test_result_does_not_depend_on_indexed_side(self, snapshots):
+        """Индексируется меньший снимок; результат симметричен."""
+        old, new = snapshots
+        assert snapshot_size(old) < snapshot_size(new)
+
+        forward = diff_snapshots(old, new, CSVReader())
+        backward = diff_snapshots(new, old, CSVReader())
+
+        assert [r.status for r in backward.rows] == [ADDED, CHANGED, REMOVED, REMOVED]
+        assert backward.rows[1].changes == {
+            name: (n, o) for name, (o, n) in forward.rows[1].changes.items()
+        }
+
+    def test_fields_and_tolerance(self, snapshots):
+        """Сравниваются выбранные поля; малые различия чисел игнорируются."""
+        diff = diff_snapshots(
+            *snapshots, CSVReader(), compare=["gdp", "inflation"], tolerance=0.5
+        )
+
+        assert diff.count(CHANGED) == 0
+        assert diff.unchanged == 2
+        assert set(diff.rows[0].changes) == {"gdp", "inflation"}
+
+    def test_repeated_keys_use_first_row(self, write_snapshot):
+        """При повторе ключа внутри снимка учитывается первая строка."""
+        old = write_snapshot("old.csv", ["A,2020,1.0,1.0,2.0,3.0,1,X"])
+        new = write_snapshot(
+            "new.csv",
+            ["A,2020,1.0,1.0,2.0,3.0,1,X", "A,2020,9.0,1.0,2.0,3.0,1,X"],
+        )
+
+        diff = diff_snapshots([old], [new], CSVReader())
+
+        assert (diff.rows, diff.unchanged) == ([], 1)
+
+    @pytest.mark.parametrize(
+        "kwargs,message",
+        [
+            ({"compare": ["year"]}, "Unknown fields"),
+            ({"tolerance": -1}, "tolerance must be non-negative"),
+        ],
+    )
+    def test_invalid_arguments(self, snapshots, kwargs, message):
+        """Ключевые поля не сравниваются; допуск неотрицателен."""
+        with pytest.raises(ValueError, match=message):
+            diff_snapshots(*snapshots, CSVReader(), **kwargs)
+
+
+class TestDiffOutput:
+    """Тесты вывода различий."""
+
+    def test_render(self, snapshots):
+        """Таблица: строка на измененное поле, одна строка на добавленную."""
+        result = render_diff(diff_snapshots(*snapshots, CSVReader()))
+
+        assert result.startswith("Added: 2, removed: 1")
+        assert "inflation" in result
+        assert "+0.5" in result
+        assert result.count("added") == 2
+
+    def test_render_without_differences(self, snapshots):
+        """Одинаковые снимки."""
+        old, _new = snapshots
+
+        assert render_diff(diff_snapshots(old, old, CSVReader())).startswith(
+            "No differences"
+        )
+
+    def test_write_csv(self, snapshots):
+        """CSV: строка на каждое различающееся поле."""
+        output = io.StringIO()
+
+        write_diff_csv(diff_snapshots(*snapshots, CSVReader()), output)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0] == ["status", "country", "year", "field", "old", "new", "delta"]
+        assert ["changed", "B", "2020", "population", "20", "21", "1"] in rows
+        assert ["removed", "A", "2021", "continent", "X", "", ""] in rows
+        assert len(rows) == 1 + 2 + 3 * 6
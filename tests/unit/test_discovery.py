@@ -0,0 +1,126 @@
+import os
+
+import pytest
+
+from src.discovery import discover_files, read_manifest
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Дерево каталогов с CSV и посторонними файлами."""
+    for relative in [
+        "b.csv",
+        "a.csv",
+        "notes.txt",
+        "a.csv.zonemap.json",
+        "2020/europe.csv",
+        "2020/asia.csv",
+        "2021/europe.csv",
+        "tmp/partial.csv",
+    ]:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+    return tmp_path
+
+
+def _relative(paths, root):
+    return [str(p).removeprefix(str(root) + "/") for p in paths]
+
+
+class TestDiscoverFiles:
+    """Тесты для discover_files."""
+
+    def test_recursive_sorted_discovery(self, data_dir):
+        """С sort=True файлы находятся рекурсивно в порядке имен."""
+        paths = _relative(discover_files(data_dir, sort=True), data_dir)
+
+        assert paths == [
+            "a.csv",
+            "b.csv",
+            "2020/asia.csv",
+            "2020/europe.csv",
+            "2021/europe.csv",
+            "tmp/partial.csv",
+        ]
+
+    def test_streams_results(self, data_dir):
+        """Обход выдает файлы по одному (генератор)."""
+        paths = discover_files(data_dir, sort=True)
+
+        assert next(paths).endswith("a.csv")
+
+    def test_first_file_before_listing_ends(self, tmp_path, monkeypatch):
+        """Без сортировки первый файл выдается до конца листинга каталога."""
+        for i in range(100):
+            (tmp_path / f"{i:03d}.csv").write_text("", encoding="utf-8")
+        listed = []
+        scandir = os.scandir
+
+        class Listing:
+            def __init__(self, path):
+                self.it = scandir(path)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                self.it.close()
+
+            def __iter__(self):
+                for entry in self.it:
+                    listed.append(entry.name)
+                    yield entry
+
+        monkeypatch.setattr(os, "scandir", Listing)
+
+        paths = discover_files(tmp_path)
+        next(paths)
+
+        assert len(listed) == 1
+        assert len(list(paths)) == 99
+
+    def test_exclude_prunes_directories(self, data_dir):
+        """Исключенные каталоги не обходятся."""
+        paths = _relative(discover_files(data_dir, exclude=["tmp", "b.csv"]), data_dir)
+
+        assert "tmp/partial.csv" not in paths
+        assert "b.csv" not in paths
+
+    def test_include_relative_pattern(self, data_dir):
+        """Шаблон сравнивается и с относительным путем."""
+        paths = _relative(discover_files(data_dir, include=["2020/*.csv"]), data_dir)
+
+        assert sorted(paths) == ["2020/asia.csv", "2020/europe.csv"]
+
+    def test_non_recursive(self, data_dir):
+        """Без рекурсии читается только корневой каталог."""
+        paths = _relative(discover_files(data_dir, recursive=False), data_dir)
+
+        assert sorted(paths) == ["a.csv", "b.csv"]
+
+    def test_missing_directory(self, tmp_path):
+        """Отсутствующий каталог приводит к FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Input directory"):
+            list(discover_files(tmp_path / "missing"))
+
+
+class TestReadManifest:
+    """Тесты для read_manifest."""
+
+    def test_paths_comments_and_blank_lines(self, tmp_path):
+        """Комментарии и пустые строки пропускаются, пути относительны манифесту."""
+        manifest = tmp_path / "inputs.txt"
+        manifest.write_text(
+            "# входные файлы\n\ndata/a.csv\n  /abs/b.csv  \n", encoding="utf-8"
+        )
+
+        assert list(read_manifest(manifest)) == [
+            str(tmp_path / "data" / "a.csv"),
+            "/abs/b.csv",
+        ]
+
+    def test_missing_manifest(self, tmp_path):
+        """Отсутствующий манифест приводит к FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            list(read_manifest(tmp_path / "missing.txt"))
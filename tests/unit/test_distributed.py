@@ -0,0 +1,217 @@
+import io
+import socket
+import sys
+import threading
+
+import pytest
+
+from src.calculator import AggregateSpec, CorrelationCalculator, HashAggregator
+from src.distributed import (
+    DEFAULT_PORT,
+    DistributedReader,
+    WorkerError,
+    WorkerServer,
+    decode_filter,
+    encode_filter,
+    handle_request,
+    parse_address,
+)
+from src.filters import RowFilter
+from src.models import EconomicRecord
+from src.reader import CSVReader
+from src.utils.validators import ValidationError
+from tests.conftest import HEADER
+
+
+@pytest.fixture
+def csv_files(write_csv):
+    """Несколько CSV файлов с повторяющимися странами."""
+    return [
+        str(
+            write_csv(
+                f"data{i}.csv",
+                (
+                    EconomicRecord(
+                        f"Country {j % 3}",
+                        2000 + i,
+                        100.0 * (i + 1) + j,
+                        1.0,
+                        2.0,
+                        3.0,
+                        j + 1,
+                        f"Continent {j % 2}",
+                    )
+                    for j in range(6)
+                ),
+            )
+        )
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def workers():
+    """Два локальных рабочих узла в потоках текущего процесса."""
+    servers = [WorkerServer("127.0.0.1", 0) for _ in range(2)]
+    threads = [
+        threading.Thread(target=s.serve_forever, args=(0.05,), daemon=True)
+        for s in servers
+    ]
+    for thread in threads:
+        thread.start()
+    yield [server.address for server in servers]
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def dead_worker():
+    """Адрес, на котором никто не принимает соединения."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"127.0.0.1:{port}"
+
+
+def sorted_groups(groups):
+    """Группы в порядке ключей (для сравнения результатов)."""
+    return sorted(groups, key=lambda g: tuple(g.key.values()))
+
+
+class TestProtocolHelpers:
+    """Тесты адресов, фильтров и задач рабочего узла."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("node1:9000", ("node1", 9000)),
+            ("10.0.0.5", ("10.0.0.5", DEFAULT_PORT)),
+            (":9000", ("localhost", 9000)),
+        ],
+    )
+    def test_parse_address(self, text, expected):
+        """Адрес разбирается на хост и порт."""
+        assert parse_address(text) == expected
+
+    @pytest.mark.parametrize("text", ["node1:http", "node1:0", "node1:70000"])
+    def test_parse_invalid_address(self, text):
+        """Некорректный порт отклоняется."""
+        with pytest.raises(ValueError, match="Invalid worker address"):
+            parse_address(text)
+
+    def test_filter_round_trip(self):
+        """Фильтр строк передается через JSON без потерь."""
+        row_filter = RowFilter.create(year_from=2000, countries=["B", "A"])
+
+        assert decode_filter(encode_filter(row_filter)) == row_filter
+        assert decode_filter(encode_filter(None)) is None
+
+    def test_aggregate_task_returns_partials(self, csv_files):
+        """Задача aggregate возвращает частичные состояния групп файла."""
+        response = handle_request(
+            {
+                "task": "aggregate",
+                "file": csv_files[0],
+                "spec": {"group_by": ["continent"], "aggregates": ["sum:population"]},
+            }
+        )
+
+        assert response["rows"] == 6
+        assert sorted(response["partials"]) == [
+            [("Continent 0",), 3, (9.0,)],
+            [("Continent 1",), 3, (12.0,)],
+        ]
+
+    def test_unknown_task(self, csv_files):
+        """Неизвестная задача отклоняется."""
+        with pytest.raises(ValueError, match="Unknown task"):
+            handle_request({"task": "drop", "file": csv_files[0]})
+
+
+class TestWorkerServer:
+    """Тесты рабочего узла."""
+
+    def test_listens_on_loopback_by_default(self):
+        """Без явного адреса узел недоступен с других машин."""
+        with WorkerServer(port=0) as server:
+            assert server.address.startswith("127.0.0.1:")
+
+
+class TestDistributedReader:
+    """Тесты для DistributedReader с локальными рабочими узлами."""
+
+    def test_aggregate_matches_local(self, workers, csv_files):
+        """Слияние частичных результатов совпадает с локальной агрегацией."""
+        spec = AggregateSpec.parse(["country"], "mean:gdp,min:gdp,last:gdp,count:gdp")
+        expected = HashAggregator(spec)
+        expected.consume(CSVReader().iter_records(csv_files, spec.columns))
+
+        groups = DistributedReader(workers).aggregate(csv_files, spec)
+
+        assert sorted_groups(groups) == sorted_groups(expected.results())
+
+    def test_comoments_match_local(self, workers, csv_files):
+        """Слияние накопителей моментов узлов совпадает с одним проходом."""
+        calculator = CorrelationCalculator(["gdp", "population"])
+        expected = calculator.calculate(
+            CSVReader().iter_records(csv_files, calculator.required_columns)
+        )
+
+        groups = DistributedReader(workers).comoments(csv_files, calculator.indicators)
+
+        assert calculator.finalize(groups) == expected
+
+    def test_records_in_file_order(self, workers, csv_files):
+        """Записи возвращаются в порядке файлов; фильтр применяется на узлах."""
+        row_filter = RowFilter.create(countries=["Country 1"])
+        reader = DistributedReader(workers, row_filter=row_filter)
+
+        records = reader.read(csv_files, {"country", "year", "gdp"})
+
+        assert records == CSVReader(row_filter=row_filter).read(
+            csv_files, {"country", "year", "gdp"}
+        )
+
+    def test_failed_worker_is_retried(self, workers, dead_worker, csv_files):
+        """Задачи недоступного узла выполняются другими узлами."""
+        spec = AggregateSpec.parse(["continent"], "sum:population")
+        reader = DistributedReader([dead_worker, *workers])
+
+        groups = reader.aggregate(csv_files, spec)
+
+        assert sum(g.values["sum_population"] for g in groups) == 4 * 21
+
+    def test_all_workers_failed(self, dead_worker, csv_files):
+        """Если все узлы недоступны, сообщается ошибка узла."""
+        reader = DistributedReader([dead_worker], retries=3)
+
+        with pytest.raises(WorkerError, match="Connection refused|No workers"):
+            reader.read(csv_files)
+
+    def test_data_errors_are_not_retried(self, workers, tmp_path):
+        """Ошибки валидации передаются координатору без повторов."""
+        path = tmp_path / "bad.csv"
+        path.write_text(HEADER + "X,1800,1.0,1.0,2.0,3.0,1,Y\n", encoding="utf-8")
+
+        with pytest.raises(ValidationError, match="Year must be"):
+            DistributedReader(workers).read([str(path)])
+        with pytest.raises(FileNotFoundError):
+            DistributedReader(workers).read([str(tmp_path / "missing.csv")])
+
+    def test_stdin_is_read_locally(self, monkeypatch, dead_worker, csv_files):
+        """Стандартный ввод читается координатором, без рабочих узлов."""
+        with open(csv_files[0], "rb") as f:
+            content = f.read()
+        monkeypatch.setattr(
+            sys, "stdin", io.TextIOWrapper(io.BytesIO(content), encoding="utf-8")
+        )
+
+        records = DistributedReader([dead_worker], file_format="csv").read(["-"])
+
+        assert records == CSVReader().read(csv_files[:1])
+
+    def test_requires_workers(self):
+        """Без адресов узлов координатор не создается."""
+        with pytest.raises(ValueError, match="At least one worker"):
+            DistributedReader([])
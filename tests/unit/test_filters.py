@@ -0,0 +1,87 @@
+import pytest
+
+from src.filters import RowFilter
+
+
+class TestRowFilter:
+    """Тесты для RowFilter."""
+
+    def test_empty_filter_accepts_everything(self):
+        """Тест: пустой фильтр пропускает любые строки."""
+        row_filter = RowFilter.create()
+
+        assert row_filter.is_empty
+        assert row_filter.columns == frozenset()
+        assert row_filter.accepts("USA", "2020", "North America")
+
+    @pytest.mark.parametrize(
+        "year,expected",
+        [
+            ("2009", False),
+            ("2010", True),
+            (" 2015 ", True),
+            ("2020", True),
+            ("2021", False),
+            (2015, True),
+        ],
+    )
+    def test_year_range(self, year, expected):
+        """Тест границ диапазона лет (включительно)."""
+        row_filter = RowFilter.create(year_from=2010, year_to=2020)
+
+        assert row_filter.accepts("USA", year, "North America") is expected
+
+    def test_invalid_year_is_left_for_validation(self):
+        """Тест: нечисловой год не отбрасывается фильтром."""
+        row_filter = RowFilter.create(year_from=2010)
+
+        assert row_filter.accepts("USA", "not-a-year", "North America")
+
+    def test_countries_and_continents(self):
+        """Тест фильтрации по странам и континентам."""
+        row_filter = RowFilter.create(
+            countries=["USA", " Germany "], continents=["Europe"]
+        )
+
+        assert row_filter.columns == frozenset({"country", "continent"})
+        assert row_filter.accepts(" Germany", "2020", "Europe ")
+        assert not row_filter.accepts("USA", "2020", "North America")
+        assert not row_filter.accepts("France", "2020", "Europe")
+
+    def test_compile_uses_column_positions(self):
+        """Тест предиката для строк CSV, включая короткие строки."""
+        row_filter = RowFilter.create(year_from=2020, countries=["USA"])
+        predicate = row_filter.compile({"year": 0, "country": 1})
+
+        assert predicate(["2021", "USA"])
+        assert not predicate(["2019", "USA"])
+        assert not predicate(["2021"])
+
+    def test_matches_dict_row(self, sample_valid_record):
+        """Тест проверки строки-словаря."""
+        assert RowFilter.create(continents=["Testinia"]).matches(sample_valid_record)
+        assert not RowFilter.create(year_to=2000).matches(sample_valid_record)
+
+    def test_invalid_year_range(self):
+        """Тест: начало диапазона больше конца."""
+        with pytest.raises(ValueError, match="Invalid year range"):
+            RowFilter.create(year_from=2020, year_to=2010)
+
+    def test_without_columns(self):
+        """Тест снятия условий по колонкам."""
+        row_filter = RowFilter.create(year_from=2020, continents=["Europe"])
+
+        reduced = row_filter.without({"year"})
+
+        assert reduced.columns == frozenset({"continent"})
+        assert row_filter.without({"year", "continent"}).is_empty
+
+    def test_accepts_partition(self):
+        """Тест проверки значений раздела: остальные колонки не проверяются."""
+        row_filter = RowFilter.create(year_from=2020, continents=["Europe"])
+
+        assert row_filter.accepts_partition({"year": "2021"})
+        assert not row_filter.accepts_partition({"year": "2019"})
+        assert row_filter.accepts_partition({"continent": "Europe"})
+        assert not row_filter.accepts_partition({"continent": "Asia"})
+        assert row_filter.accepts_partition({"country": "USA"})
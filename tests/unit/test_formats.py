@@ -0,0 +1,124 @@
+import io
+import json
+import sys
+
+import pytest
+
+from src.arrow import ArrowReader
+from src.calculator import AggregateSpec
+from src.formats import (
+    MultiFormatReader,
+    detect_format,
+    detect_format_from_bytes,
+)
+from src.jsonl import JSONLReader
+from src.reader import CSVReader
+
+
+class TestDetectFormat:
+    """Тесты определения формата."""
+
+    @pytest.mark.parametrize(
+        "head,expected",
+        [
+            (b'{"country": "USA"}\n', "jsonl"),
+            (b'\xef\xbb\xbf  \n{"a": 1}', "jsonl"),
+            (b"country,year,gdp\n", "csv"),
+            (b"", "csv"),
+            (b"ARROW1\x00\x00", "arrow"),
+            (b"\xff\xff\xff\xff\x10\x00", "arrow"),
+        ],
+    )
+    def test_from_bytes(self, head, expected):
+        """Формат по началу содержимого."""
+        assert detect_format_from_bytes(head) == expected
+
+    def test_extension_wins(self, tmp_path):
+        """Известное расширение определяет формат без чтения файла."""
+        path = tmp_path / "data.csv"
+        path.write_text('{"looks": "like json"}\n', encoding="utf-8")
+
+        assert detect_format(str(path)) == "csv"
+        assert detect_format(str(tmp_path / "feed.NDJSON")) == "jsonl"
+        assert detect_format(str(tmp_path / "table.feather")) == "arrow"
+
+    def test_content_for_unknown_extension(self, tmp_path):
+        """Для неизвестного расширения проверяется содержимое."""
+        path = tmp_path / "export.dat"
+        path.write_text('{"country": "USA"}\n', encoding="utf-8")
+
+        assert detect_format(str(path)) == "jsonl"
+
+    def test_stdin_is_peeked(self, monkeypatch):
+        """Начало стандартного ввода просматривается без извлечения."""
+        buffer = io.BufferedReader(io.BytesIO(b'{"country": "USA"}\n'))
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(buffer))
+
+        assert detect_format("-") == "jsonl"
+        assert buffer.read() == b'{"country": "USA"}\n'
+
+
+class TestMultiFormatReader:
+    """Тесты для MultiFormatReader."""
+
+    def test_mixed_inputs(self, tmp_path, temp_csv_file_with_data, sample_records_list):
+        """CSV и JSON Lines читаются одним списком файлов."""
+        jsonl = tmp_path / "feed"
+        jsonl.write_text(
+            "".join(json.dumps(r.__dict__) + "\n" for r in sample_records_list),
+            encoding="utf-8",
+        )
+        paths = [str(temp_csv_file_with_data), str(jsonl)]
+
+        records = MultiFormatReader().read(paths)
+
+        assert records[0] == CSVReader().read(paths[:1])[0]
+        assert records[1:] == sample_records_list
+
+    def test_stdin_jsonl(self, monkeypatch, sample_records_list):
+        """Формат стандартного ввода определяется по содержимому."""
+        content = "".join(json.dumps(r.__dict__) + "\n" for r in sample_records_list)
+        buffer = io.BufferedReader(io.BytesIO(content.encode("utf-8")))
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(buffer))
+
+        assert MultiFormatReader().read(["-"]) == sample_records_list
+
+    def test_options_per_format(self):
+        """Настройки включают читатели всех форматов."""
+        reader = MultiFormatReader({"jsonl": JSONLReader(strict=True)})
+
+        assert reader.options["jsonl"]["strict"] is True
+        assert "csv" in reader.options
+
+    def test_aggregate_single_format(self, monkeypatch, temp_csv_file_with_data):
+        """Агрегация передается читателю, если все файлы одного формата."""
+        spec = AggregateSpec.parse(["country"], "mean:gdp")
+        arrow_reader = ArrowReader()
+        monkeypatch.setattr(
+            arrow_reader, "aggregate", lambda paths, spec, memory_limit=None: []
+        )
+        reader = MultiFormatReader({"arrow": arrow_reader})
+
+        assert reader.aggregate(["a.arrow", "b.feather"], spec) == []
+        assert reader.aggregate(["a.arrow", str(temp_csv_file_with_data)], spec) is None
+
+    def test_sampling_rejects_arrow_files(self, tmp_path):
+        """При выборке файл Arrow не читается целиком, а отклоняется."""
+        reader = MultiFormatReader(
+            {
+                "csv": CSVReader(sample_fraction=0.5),
+                "jsonl": JSONLReader(sample_fraction=0.5),
+            }
+        )
+        spec = AggregateSpec.parse(["country"], "mean:gdp")
+
+        assert reader.is_sampling
+        with pytest.raises(ValueError, match="not supported for arrow"):
+            reader.read([str(tmp_path / "a.arrow")])
+        with pytest.raises(ValueError, match="not supported for arrow"):
+            reader.aggregate([str(tmp_path / "a.arrow")], spec)
+
+    def test_unknown_format(self):
+        """Неизвестный формат отклоняется."""
+        with pytest.raises(ValueError, match="Unknown formats"):
+            MultiFormatReader({"parquet": CSVReader()})
@@ -0,0 +1,140 @@
+import io
+import json
+import sys
+
+import pytest
+
+from src.filters import RowFilter
+from src.jsonl import JSONLReader
+from src.reader import CSVReader
+from src.utils.validators import ValidationError
+
+
+@pytest.fixture
+def jsonl_file(tmp_path, sample_records_list):
+    """Файл JSON Lines с записями sample_records_list."""
+    path = tmp_path / "data.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for record in sample_records_list:
+            f.write(json.dumps(record.__dict__) + "\n")
+        f.write("\n")
+    return path
+
+
+class TestJSONLReader:
+    """Тесты для JSONLReader."""
+
+    def test_read_records(self, jsonl_file, sample_records_list):
+        """Объекты строк преобразуются в записи, пустые строки пропускаются."""
+        records = JSONLReader().read([str(jsonl_file)])
+
+        assert records == sample_records_list
+
+    def test_same_result_as_csv(self, tmp_path, temp_csv_file_with_data):
+        """Те же данные в JSON Lines и CSV дают одинаковые записи."""
+        expected = CSVReader().read([str(temp_csv_file_with_data)])
+        path = tmp_path / "data.jsonl"
+        path.write_text(
+            "\n".join(json.dumps(r.__dict__) for r in expected), encoding="utf-8"
+        )
+
+        assert JSONLReader().read([str(path)]) == expected
+
+    def test_keys_are_normalized(self, tmp_path):
+        """Имена полей сравниваются без учета регистра и пробелов."""
+        path = tmp_path / "data.jsonl"
+        path.write_text(
+            '{"Country": " USA ", "YEAR": 2020, "gdp": "21433.2", "gdp_growth": -2.8,'
+            ' "inflation": 1.2, "unemployment": 8.1, "population": 331,'
+            ' "continent": "North America"}\n',
+            encoding="utf-8",
+        )
+
+        (record,) = JSONLReader().read([str(path)])
+
+        assert (record.country, record.year, record.gdp) == ("USA", 2020, 21433.2)
+
+    def test_projection_skips_other_fields(self, tmp_path):
+        """Проекция проверяет только запрошенные поля."""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"country": "USA", "gdp": 10.5}\n', encoding="utf-8")
+
+        records = JSONLReader().read([str(path)], columns={"country", "gdp"})
+
+        assert [(r.country, r.gdp) for r in records] == [("USA", 10.5)]
+        with pytest.raises(ValidationError, match="Missing or empty"):
+            JSONLReader(strict=True).read([str(path)], columns={"country", "gdp"})
+
+    @pytest.mark.parametrize(
+        "line,message",
+        [
+            ("{not json", "Invalid JSON"),
+            ("[1, 2]", "expected a JSON object"),
+            ('{"country": ["USA"]}', "expected a scalar"),
+            ('{"country": "USA", "year": 2020.5}', "expected integer"),
+            ('{"country": "USA", "year": null}', "Missing or empty"),
+        ],
+    )
+    def test_invalid_lines(self, tmp_path, line, message):
+        """Ошибки разбора и валидации сообщают номер строки."""
+        path = tmp_path / "data.jsonl"
+        path.write_text("\n" + line + "\n", encoding="utf-8")
+
+        with pytest.raises(ValidationError, match=message) as exc_info:
+            JSONLReader().read([str(path)], columns={"country", "year"})
+        assert "2" in str(exc_info.value)
+
+    def test_row_filter(self, jsonl_file):
+        """Фильтр строк применяется до валидации."""
+        reader = JSONLReader(row_filter=RowFilter.create(continents=["Europe"]))
+
+        records = reader.read([str(jsonl_file)])
+
+        assert {r.country for r in records} == {"Germany"}
+
+    def test_read_stdin(self, monkeypatch, jsonl_file, sample_records_list):
+        """Путь '-' читает стандартный ввод."""
+        stdin = io.TextIOWrapper(io.BytesIO(jsonl_file.read_bytes()))
+        monkeypatch.setattr(sys, "stdin", stdin)
+
+        assert JSONLReader().read(["-"]) == sample_records_list
+
+    def test_missing_file(self, tmp_path):
+        """Отсутствующий файл приводит к FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            JSONLReader().read([str(tmp_path / "missing.jsonl")])
+
+    def test_sample_is_reproducible(self, tmp_path, monkeypatch):
+        """С зерном выборка строк воспроизводима, порядок строк сохраняется."""
+        monkeypatch.chdir(tmp_path)
+        with open("data.jsonl", "w", encoding="utf-8") as f:
+            for i in range(2000):
+                f.write(
+                    json.dumps(
+                        {
+                            "country": f"C{i % 10}",
+                            "year": 1900 + i % 100,
+                            "gdp": 1000 + i,
+                            "gdp_growth": 1.0,
+                            "inflation": 1.0,
+                            "unemployment": 1.0,
+                            "population": 1,
+                            "continent": "X",
+                        }
+                    )
+                    + "\n"
+                )
+
+        first = JSONLReader(sample_fraction=0.2, sample_seed=5).read(["data.jsonl"])
+        second = JSONLReader(sample_fraction=0.2, sample_seed=5).read(["data.jsonl"])
+
+        assert first == second
+        assert 300 < len(first) < 500
+        gdps = [r.gdp for r in first]
+        assert gdps == sorted(gdps)
+
+    @pytest.mark.parametrize("fraction", [0, 1.5])
+    def test_invalid_fraction(self, fraction):
+        """Доля выборки должна быть в (0, 1]."""
+        with pytest.raises(ValueError, match="Sample fraction"):
+            JSONLReader(sample_fraction=fraction)
@@ -0,0 +1,128 @@
+import pytest
+
+from src.calculator import GDPCalculator
+from src.models import EconomicRecord
+from src.online import OnlineAggregation
+
+
+def make_records(count):
+    """Записи двух стран с ВВП, равным номеру записи."""
+    return [
+        EconomicRecord(
+            country=f"Country {i % 2}",
+            year=2000 + i,
+            gdp=float(i),
+            gdp_growth=0.0,
+            inflation=0.0,
+            unemployment=0.0,
+            population=1,
+            continent="Europe",
+        )
+        for i in range(count)
+    ]
+
+
+class FakeClock:
+    """Часы, которые сдвигаются на шаг при каждом обращении."""
+
+    def __init__(self, step):
+        self.step = step
+        self.now = 0.0
+
+    def __call__(self):
+        value = self.now
+        self.now += self.step
+        return value
+
+
+class TestOnlineAggregation:
+    """Тесты для OnlineAggregation."""
+
+    def test_complete_result_matches_calculator(self):
+        """Без дедлайна результат совпадает с обычным расчетом."""
+        records = make_records(10)
+
+        snapshot = OnlineAggregation(GDPCalculator(), batch_size=3).run(records)
+
+        assert snapshot.statistics == GDPCalculator().calculate(records)
+        assert (snapshot.rows, snapshot.partial) == (10, False)
+        assert snapshot.summary.startswith("[COMPLETE] 10 rows")
+
+    def test_deadline_returns_partial_result(self):
+        """По дедлайну возвращается результат по прочитанным пакетам."""
+        records = iter(make_records(10))
+        online = OnlineAggregation(
+            GDPCalculator(), deadline=2.5, batch_size=2, clock=FakeClock(1.0)
+        )
+
+        snapshot = online.run(records)
+
+        assert snapshot.partial and snapshot.deadline_reached
+        # Три пакета и одна запись, прочитанная для проверки конца данных
+        assert snapshot.rows == 7
+        assert [s.years_count for s in snapshot.statistics] == [4, 3]
+        assert len(list(records)) == 3
+        assert snapshot.summary.startswith("[PARTIAL RESULT (deadline reached)]")
+
+    def test_deadline_at_end_of_data_is_complete(self):
+        """Если данные закончились к дедлайну, результат полный."""
+        online = OnlineAggregation(
+            GDPCalculator(), deadline=0.5, batch_size=10, clock=FakeClock(1.0)
+        )
+
+        snapshot = online.run(make_records(10))
+
+        assert not snapshot.partial
+        assert snapshot.rows == 10
+
+    def test_progress_snapshots(self):
+        """Промежуточные результаты выдаются с заданным интервалом."""
+        snapshots = []
+        online = OnlineAggregation(
+            GDPCalculator(),
+            progress_interval=2.0,
+            on_progress=snapshots.append,
+            batch_size=2,
+            clock=FakeClock(1.0),
+        )
+
+        final = online.run(make_records(10))
+
+        assert [s.rows for s in snapshots] == [4, 8]
+        assert all(s.partial for s in snapshots)
+        assert snapshots[0].summary.startswith("[PROGRESS] 4 rows")
+        assert final.rows == 10
+
+    def test_reader_is_closed_at_deadline(self):
+        """Генератор записей закрывается при остановке по дедлайну."""
+        closed = []
+
+        def records():
+            try:
+                yield from make_records(10)
+            finally:
+                closed.append(True)
+
+        online = OnlineAggregation(
+            GDPCalculator(), deadline=1.0, batch_size=2, clock=FakeClock(1.0)
+        )
+        online.run(records())
+
+        assert closed == [True]
+
+    @pytest.mark.parametrize(
+        "kwargs,message",
+        [
+            ({"deadline": 0}, "deadline must be positive"),
+            ({"progress_interval": -1}, "progress_interval must be positive"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, message):
+        """Неположительные интервалы отклоняются."""
+        with pytest.raises(ValueError, match=message):
+            OnlineAggregation(GDPCalculator(), **kwargs)
+
+    def test_memory_limit_is_rejected(self):
+        """Калькулятор с лимитом памяти не поддерживается."""
+        with pytest.raises(ValueError, match="memory limit"):
+            OnlineAggregation(GDPCalculator(memory_limit=1024))
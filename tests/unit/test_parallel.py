@@ -0,0 +1,199 @@
+import io
+import os
+import sys
+from array import array
+
+import pytest
+
+from src.calculator import (
+    Aggregate,
+    AggregateSpec,
+    HashAggregator,
+    SpillingAggregator,
+    create_aggregator,
+)
+from src.models import EconomicRecord
+from src.parallel import ParallelCSVReader, SharedTable, load_shared
+from src.reader import CSVReader
+from src.utils.validators import ValidationError
+from tests.conftest import HEADER
+
+
+def _shm_segments():
+    """Блоки разделяемой памяти в системе (None, если список недоступен)."""
+    if not os.path.isdir("/dev/shm"):
+        return None
+    return set(os.listdir("/dev/shm"))
+
+
+@pytest.fixture
+def csv_files(write_csv):
+    """Несколько CSV файлов с повторяющимися странами."""
+    return [
+        str(
+            write_csv(
+                f"data{i}.csv",
+                (
+                    EconomicRecord(
+                        f"Country {j % 4}",
+                        2000 + i,
+                        100.0 * (i + 1) + j,
+                        1.0,
+                        2.0,
+                        3.0,
+                        j + 1,
+                        f"Continent {j % 2}",
+                    )
+                    for j in range(10)
+                ),
+            )
+        )
+        for i in range(3)
+    ]
+
+
+class TestSharedTable:
+    """Тесты для load_shared и SharedTable."""
+
+    def test_columns_are_shared_buffers(self, csv_files):
+        """Числовые колонки - memoryview, строковые кодируются словарем."""
+        descriptor = load_shared(CSVReader(), csv_files[0], {"country", "gdp"})
+
+        with SharedTable(descriptor) as table:
+            assert len(table) == 10
+            assert set(table.columns) == {"country", "gdp"}
+            assert table.columns["gdp"].format == "d"
+            assert table.columns["country"].format == "i"
+            assert table.dictionaries["country"] == tuple(
+                f"Country {j}" for j in range(4)
+            )
+            assert list(table.columns["country"][:5]) == [0, 1, 2, 3, 0]
+            assert list(table.values("country"))[1] == "Country 1"
+
+    def test_records_round_trip(self, csv_files):
+        """Записи, восстановленные из блока, совпадают с прочитанными."""
+        with SharedTable(load_shared(CSVReader(), csv_files[1])) as table:
+            records = list(table.records())
+
+        assert records == list(CSVReader().read_file(csv_files[1]))
+
+    def test_release_unlinks_block(self, csv_files):
+        """После release блок удаляется, представления недействительны."""
+        before = _shm_segments()
+        table = SharedTable(load_shared(CSVReader(), csv_files[0]))
+        view = table.columns["gdp"]
+
+        table.release()
+        table.release()
+
+        with pytest.raises(ValueError):
+            view[0]
+        if before is not None:
+            assert _shm_segments() == before
+
+    def test_empty_file(self, tmp_path):
+        """Файл без строк дает пустую таблицу."""
+        path = tmp_path / "empty.csv"
+        path.write_text(HEADER, encoding="utf-8")
+
+        with SharedTable(load_shared(CSVReader(), str(path))) as table:
+            assert len(table) == 0
+            assert list(table.records()) == []
+
+
+class TestParallelCSVReader:
+    """Тесты для ParallelCSVReader."""
+
+    def test_read_matches_sequential(self, csv_files):
+        """Параллельное чтение сохраняет порядок файлов и строк."""
+        expected = CSVReader().read(csv_files)
+
+        assert ParallelCSVReader(workers=2).read(csv_files) == expected
+
+    def test_iter_records_with_projection(self, csv_files):
+        """Потоковое чтение с проекцией колонок."""
+        records = list(
+            ParallelCSVReader(workers=2).iter_records(csv_files, {"year", "gdp"})
+        )
+
+        assert len(records) == 30
+        assert {r.year for r in records} == {2000, 2001, 2002}
+        assert all(r.country == "" for r in records)
+
+    def test_aggregate_matches_hash_aggregator(self, csv_files):
+        """Агрегация над разделяемой памятью совпадает с обычной."""
+        spec = AggregateSpec(
+            group_by=("continent", "year"),
+            aggregates=(
+                Aggregate("mean", "gdp"),
+                Aggregate("sum", "population"),
+                Aggregate("max", "gdp"),
+                Aggregate("count", "gdp"),
+                Aggregate("last", "gdp"),
+            ),
+        )
+        expected = HashAggregator(spec)
+        expected.consume(CSVReader().iter_records(csv_files))
+
+        result = ParallelCSVReader(workers=2).aggregate(csv_files, spec)
+
+        assert result == expected.results()
+
+    def test_aggregate_respects_memory_limit(self, csv_files, monkeypatch):
+        """При лимите памяти слияние частичных групп выгружается на диск."""
+        spec = AggregateSpec(
+            group_by=("country", "year"),
+            aggregates=(Aggregate("mean", "gdp"), Aggregate("count", "gdp")),
+        )
+        expected = HashAggregator(spec)
+        expected.consume(CSVReader().iter_records(csv_files))
+        aggregators = []
+
+        def spy(*args):
+            aggregators.append(create_aggregator(*args))
+            return aggregators[-1]
+
+        monkeypatch.setattr("src.parallel.create_aggregator", spy)
+
+        result = ParallelCSVReader(workers=2).aggregate(csv_files, spec, 1)
+
+        (aggregator,) = aggregators
+        assert isinstance(aggregator, SpillingAggregator)
+        assert aggregator.spills > 0
+        assert sorted(result, key=lambda g: tuple(g.key.values())) == sorted(
+            expected.results(), key=lambda g: tuple(g.key.values())
+        )
+
+    def test_validation_error_propagates(self, csv_files, tmp_path):
+        """Ошибка рабочего процесса передается вызывающему коду без утечек."""
+        bad = tmp_path / "bad.csv"
+        bad.write_text(HEADER + "A,20x0,1,1,1,1,1,X\n", encoding="utf-8")
+        before = _shm_segments()
+
+        with pytest.raises(ValidationError):
+            ParallelCSVReader(workers=2).read([csv_files[0], str(bad), csv_files[1]])
+
+        if before is not None:
+            assert _shm_segments() == before
+
+    def test_stdin_read_in_parent(self, csv_files, monkeypatch):
+        """Стандартный ввод читается в родительском процессе."""
+        content = HEADER + "Stdinland,2020,5.0,1.0,1.0,1.0,7,X\n"
+        stdin = io.TextIOWrapper(io.BytesIO(content.encode("utf-8")))
+        monkeypatch.setattr(sys, "stdin", stdin)
+
+        records = ParallelCSVReader(workers=2).read([csv_files[0], "-"])
+
+        assert records[-1].country == "Stdinland"
+        assert len(records) == 11
+
+    def test_invalid_workers(self):
+        """Число процессов должно быть положительным."""
+        with pytest.raises(ValueError, match="workers"):
+            ParallelCSVReader(workers=0)
+
+    def test_shared_buffers_match_arrays(self, csv_files):
+        """Байты колонки совпадают с array.array тех же значений."""
+        with SharedTable(load_shared(CSVReader(), csv_files[0], {"gdp"})) as table:
+            expected = array("d", (r.gdp for r in CSVReader().read([csv_files[0]])))
+            assert table.columns["gdp"].tobytes() == expected.tobytes()
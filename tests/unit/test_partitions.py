@@ -0,0 +1,192 @@
+import pytest
+
+from src.filters import RowFilter
+from src.partitions import (
+    PartitionedReader,
+    PartitionedWriter,
+    format_partition,
+    parse_partition,
+    partition_values,
+    write_dataset,
+)
+from src.reader import CSVReader
+from src.utils.validators import ValidationError
+
+
+@pytest.fixture
+def dataset(tmp_path, sample_records_list):
+    """Набор данных, разбитый по годам и континентам."""
+    root = tmp_path / "dataset"
+    with PartitionedWriter(root) as writer:
+        writer.write(sample_records_list)
+    return root
+
+
+class TestPartitionNames:
+    """Тесты имен каталогов разделов."""
+
+    def test_round_trip_with_special_characters(self):
+        """Символы '/' и '=' кодируются, пробелы сохраняются."""
+        name = format_partition("continent", "North America/East=1")
+
+        assert "/" not in name
+        assert name.startswith("continent=North America")
+        assert parse_partition(name) == ("continent", "North America/East=1")
+
+    def test_non_partition_directory(self):
+        """Каталоги без '=' и с неизвестным ключом не являются разделами."""
+        assert parse_partition("archive") is None
+        assert parse_partition("source=imf") is None
+
+    def test_partition_values_from_relative_path(self):
+        """Значения берутся из всех каталогов пути, кроме имени файла."""
+        values = partition_values("raw/year=2020/continent=Europe/year=1.csv")
+
+        assert values == {"year": "2020", "continent": "Europe"}
+
+
+class TestPartitionedWriter:
+    """Тесты для PartitionedWriter."""
+
+    def test_layout(self, dataset):
+        """Файлы раскладываются по каталогам без колонок раздела."""
+        files = sorted(
+            str(p.relative_to(dataset).parent) for p in dataset.rglob("*.csv")
+        )
+
+        assert files == [
+            "year=2020/continent=Asia",
+            "year=2020/continent=Europe",
+            "year=2020/continent=North America",
+            "year=2021/continent=Europe",
+            "year=2021/continent=North America",
+        ]
+        header = next(dataset.rglob("*.csv")).read_text().splitlines()[0]
+        assert header == "country,gdp,gdp_growth,inflation,unemployment,population"
+
+    def test_eviction_appends_to_same_file(self, tmp_path, sample_records_list):
+        """Закрытый из-за предела файл дописывается при следующей записи."""
+        root = tmp_path / "dataset"
+        with PartitionedWriter(root, ["continent"], max_open_files=1) as writer:
+            writer.write(sample_records_list)
+            writer.write(sample_records_list)
+
+        europe = list((root / "continent=Europe").glob("*.csv"))
+        assert len(europe) == 1
+        assert len(europe[0].read_text().splitlines()) == 5
+
+    def test_error_discards_files(self, tmp_path, sample_records_list):
+        """При ошибке незавершенные файлы удаляются."""
+        root = tmp_path / "dataset"
+        with pytest.raises(RuntimeError):
+            with PartitionedWriter(root) as writer:
+                writer.write(sample_records_list)
+                raise RuntimeError("boom")
+
+        assert [p for p in root.rglob("*") if p.is_file()] == []
+
+    def test_invalid_partition_columns(self, tmp_path):
+        """Неизвестные и повторяющиеся колонки разбиения отклоняются."""
+        with pytest.raises(ValueError, match="Unknown partition"):
+            PartitionedWriter(tmp_path, ["region"])
+        with pytest.raises(ValueError, match="unique"):
+            PartitionedWriter(tmp_path, ["year", "year"])
+
+    def test_write_dataset_from_csv(self, tmp_path, temp_csv_file_with_data):
+        """Загрузка CSV файлов в набор данных."""
+        root = tmp_path / "dataset"
+
+        total = write_dataset([str(temp_csv_file_with_data)], root)
+
+        assert total == len(PartitionedReader().read([str(root)]))
+
+    def test_write_dataset_invalid_file(self, tmp_path):
+        """Ошибка валидации не оставляет опубликованных файлов."""
+        bad = tmp_path / "bad.csv"
+        bad.write_text(
+            "country,year,gdp,gdp_growth,inflation,unemployment,population,continent\n"
+            "USA,2020,100,1,1,1,330,North America\n"
+            "USA,20x0,100,1,1,1,330,North America\n"
+        )
+        root = tmp_path / "dataset"
+
+        with pytest.raises(ValidationError):
+            write_dataset([str(bad)], root)
+
+        assert list(root.rglob("*.csv")) == []
+
+
+class TestPartitionedReader:
+    """Тесты для PartitionedReader."""
+
+    def test_restores_partition_columns(self, dataset, sample_records_list):
+        """Колонки раздела восстанавливаются из имен каталогов."""
+        records = PartitionedReader().read([str(dataset)])
+
+        key = lambda r: (r.country, r.year)  # noqa: E731
+        assert sorted(records, key=key) == sorted(sample_records_list, key=key)
+
+    def test_prunes_partitions_before_opening(self, dataset, monkeypatch):
+        """Разделы вне фильтра не открываются."""
+        reader = CSVReader(row_filter=RowFilter.create(year_from=2021))
+        opened = []
+        original = reader.read_file
+
+        def read_file(path, columns=None, partition=None):
+            opened.append(partition)
+            return original(path, columns, partition)
+
+        monkeypatch.setattr(reader, "read_file", read_file)
+
+        records = PartitionedReader(reader).read([str(dataset)])
+
+        assert {r.year for r in records} == {2021}
+        assert all(p["year"] == "2021" for p in opened)
+        assert len(opened) == 2
+
+    def test_source_files_are_data_files(self, dataset):
+        """Ключ кеша строится только по файлам данных, которые будут открыты."""
+        reader = PartitionedReader(CSVReader(zone_maps=True))
+        reader.read([str(dataset)])
+        partition = next(dataset.glob("year=2021/*"))
+        (partition / "part-9.csv.tmp").write_text("pending", encoding="utf-8")
+
+        files = list(reader.source_files([str(dataset)]))
+        pruned = PartitionedReader(
+            CSVReader(row_filter=RowFilter.create(year_from=2021))
+        ).source_files([str(dataset)])
+
+        assert files == sorted(str(p) for p in dataset.rglob("*.csv"))
+        assert all("year=2021" in path for path in pruned)
+
+    def test_filter_on_partition_and_file_columns(self, dataset):
+        """Фильтр по колонкам раздела и по колонкам файла одновременно."""
+        reader = CSVReader(
+            row_filter=RowFilter.create(continents=["Europe"], countries=["Germany"])
+        )
+
+        records = list(PartitionedReader(reader).iter_records([str(dataset)]))
+
+        assert [(r.country, r.year) for r in records] == [
+            ("Germany", 2020),
+            ("Germany", 2021),
+        ]
+
+    def test_projection(self, dataset):
+        """Проекция колонок работает с колонками раздела."""
+        records = PartitionedReader().read([str(dataset)], columns={"year", "gdp"})
+
+        assert {r.year for r in records} == {2020, 2021}
+        assert all(r.country == "" for r in records)
+
+    def test_missing_dataset(self, tmp_path):
+        """Отсутствующий каталог набора данных."""
+        with pytest.raises(FileNotFoundError):
+            PartitionedReader().read([str(tmp_path / "missing")])
+
+    def test_options_include_reader_options(self):
+        """Настройки читателя для ключей кеша."""
+        options = PartitionedReader(CSVReader(strict=True)).options
+
+        assert options["strict"] is True
+        assert options["partitioned"] is True
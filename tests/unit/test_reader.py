@@ -1,7 +1,24 @@
+import io
+import os
+import random
+import sys
+import threading
+from itertools import pairwise
+
 import pytest
 
-from src.reader import CSVReader
+from src.filters import RowFilter
+from src.models import EconomicRecord
+from src.reader import (
+    CSVReader,
+    is_stream,
+    iter_paths,
+    sample_lines,
+    sniff_lines,
+)
 from src.utils.validators import ValidationError
+from src.zonemap import zone_map_path
+from tests.conftest import HEADER
 
 
 class TestCSVReader:
@@ -93,3 +110,237 @@ class TestCSVReader:
         """Тест на отсутствие файла."""
         with pytest.raises(FileNotFoundError):
             next(reader.read_file("non_existent_file.csv"))
+
+    def test_read_with_row_filter(self, temp_csv_file):
+        """Тест: строки, не прошедшие фильтр, не попадают в результат."""
+        with open(temp_csv_file, "a", encoding="utf-8") as f:
+            f.write("USA,2019,21433.2,-2.8,1.2,8.1,331,North America\n")
+            f.write("USA,2021,23315.1,5.8,4.7,5.4,332,North America\n")
+            f.write("Germany,2021,4259.9,2.6,3.1,3.6,83,Europe\n")
+
+        reader = CSVReader(
+            row_filter=RowFilter.create(year_from=2020, countries=["USA"])
+        )
+        records = list(reader.read_file(str(temp_csv_file)))
+
+        assert [(r.country, r.year) for r in records] == [("USA", 2021)]
+
+    def test_filtered_rows_are_not_validated(self, temp_csv_file):
+        """Тест: отброшенная фильтром строка не вызывает ошибку валидации."""
+        with open(temp_csv_file, "a", encoding="utf-8") as f:
+            f.write("Atlantis,2021,gdp,0,0,0,1,Mythica\n")
+            f.write("Germany,2021,4259.9,2.6,3.1,3.6,83,Europe\n")
+
+        reader = CSVReader(row_filter=RowFilter.create(continents=["Europe"]))
+        records = list(reader.read_file(str(temp_csv_file)))
+
+        assert len(records) == 1
+        assert records[0].country == "Germany"
+
+    def test_read_with_projection(self, reader, temp_csv_file):
+        """Тест: при проекции ошибки в непрошенных колонках не мешают чтению."""
+        with open(temp_csv_file, "a", encoding="utf-8") as f:
+            f.write("USA,2020,21433.2,-2.8,1.2,8.1,not-a-number,North America\n")
+
+        records = list(reader.read_file(str(temp_csv_file), columns={"country", "gdp"}))
+
+        assert len(records) == 1
+        assert records[0].country == "USA"
+        assert records[0].gdp == 21433.2
+        assert records[0].population == 0
+
+    def test_strict_mode_validates_all_columns(self, temp_csv_file):
+        """Тест: строгий режим игнорирует проекцию."""
+        with open(temp_csv_file, "a", encoding="utf-8") as f:
+            f.write("USA,2020,21433.2,-2.8,1.2,8.1,not-a-number,North America\n")
+
+        reader = CSVReader(strict=True)
+
+        with pytest.raises(ValidationError, match="Invalid population format"):
+            list(reader.read_file(str(temp_csv_file), columns={"country", "gdp"}))
+
+    def test_iter_records_streams_files(self, reader, temp_csv_file_with_data):
+        """Тест потокового чтения нескольких файлов."""
+        path = str(temp_csv_file_with_data)
+
+        records = reader.iter_records([path, path])
+
+        assert not isinstance(records, list)
+        assert len(list(records)) == 2 * len(reader.read([path]))
+
+    def test_iter_records_empty_list(self, reader):
+        """Тест: пустой список файлов отклоняется сразу."""
+        with pytest.raises(ValueError, match="No files provided"):
+            reader.iter_records([])
+
+
+class TestStreamingSources:
+    """Тесты чтения из стандартного ввода и каналов."""
+
+    CONTENT = (
+        "country;year;gdp;gdp_growth;inflation;unemployment;population;continent\n"
+        "A;2020;10.0;1.0;1.0;1.0;5;X\n"
+        "B;2021;20.0;1.0;1.0;1.0;6;Y\n"
+    )
+
+    def test_read_stdin(self, monkeypatch):
+        """Путь '-' читает стандартный ввод, разделитель определяется без seek."""
+        stdin = io.TextIOWrapper(_Unseekable(self.CONTENT.encode("utf-8")))
+        monkeypatch.setattr(sys, "stdin", stdin)
+
+        records = CSVReader().read(["-"])
+
+        assert [(r.country, r.year) for r in records] == [("A", 2020), ("B", 2021)]
+
+    def test_stdin_only_once(self):
+        """Стандартный ввод нельзя указать дважды."""
+        with pytest.raises(ValueError, match="only be read once"):
+            CSVReader().read(["-", "-"])
+
+    def test_sniff_lines_keeps_header(self):
+        """Начало потока, прочитанное для определения разделителя, не теряется."""
+        content = self.CONTENT + "C;2022;30.0;1.0;1.0;1.0;7;Z\n" * 100
+
+        dialect, lines = sniff_lines(io.StringIO(content))
+
+        assert dialect.delimiter == ";"
+        assert "".join(lines) == content
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+    def test_read_named_pipe(self, tmp_path):
+        """Именованный канал читается без сводок-спутников."""
+        fifo = tmp_path / "data.pipe"
+        os.mkfifo(fifo)
+
+        def produce():
+            with open(fifo, "w", encoding="utf-8") as f:
+                f.write(self.CONTENT)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        try:
+            records = CSVReader(zone_maps=True).read([str(fifo)])
+        finally:
+            producer.join()
+
+        assert len(records) == 2
+        assert not zone_map_path(fifo).exists()
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+    def test_is_stream(self, tmp_path, temp_csv_file_with_data):
+        """Потоки - только '-' и каналы; каталоги и файлы имеют отпечаток."""
+        fifo = tmp_path / "data.pipe"
+        os.mkfifo(fifo)
+
+        assert is_stream("-")
+        assert is_stream(str(fifo))
+        assert not is_stream(str(tmp_path))
+        assert not is_stream(str(temp_csv_file_with_data))
+
+
+class _Unseekable(io.BytesIO):
+    """Байтовый поток без перемотки (как канал)."""
+
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+
+class TestSampling:
+    """Тесты выборочного чтения."""
+
+    @staticmethod
+    def _records(rows):
+        """Записи с возрастающим ВВП для выборки."""
+        return (
+            EconomicRecord(
+                f"C{i % 10}", 1900 + i % 150, 1000.0 + i, 1.0, 1.0, 1.0, 1, "X"
+            )
+            for i in range(rows)
+        )
+
+    def test_full_fraction_keeps_every_line(self, write_csv):
+        """При доле 1 каждая строка попадает в выборку ровно один раз."""
+        path = write_csv("data.csv", self._records(500))
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+
+        assert list(sample_lines(lines, 1.0, random.Random(0))) == lines
+
+    def test_rows_are_sampled_independently(self, write_csv):
+        """Строки выбираются по одной, а не блоками подряд идущих строк."""
+        path = write_csv("data.csv", self._records(20000))
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        position = {line: i for i, line in enumerate(lines)}
+
+        sampled = list(sample_lines(lines, 0.2, random.Random(1)))
+
+        assert sampled[0] == HEADER
+        indexes = [position[line] for line in sampled[1:]]
+        assert indexes == sorted(set(indexes))
+        assert 3600 < len(indexes) < 4400
+        # Доля соседних выбранных строк близка к доле выборки
+        adjacent = sum(b - a == 1 for a, b in pairwise(indexes))
+        assert adjacent / len(indexes) == pytest.approx(0.2, abs=0.03)
+
+    def test_stream_lines(self):
+        """Выборка строк потока сохраняет заголовок и порядок строк."""
+        lines = ["header\n"] + [f"{i}\n" for i in range(100)]
+
+        sampled = list(sample_lines(iter(lines), 0.5, random.Random(3)))
+
+        assert sampled[0] == "header\n"
+        body = [int(line) for line in sampled[1:]]
+        assert body == sorted(body)
+        assert 25 < len(body) < 75
+
+    def test_reader_sample_is_reproducible(self, tmp_path, monkeypatch, write_csv):
+        """С зерном выборка воспроизводима и меньше полного файла."""
+        # Зерно смешивается с путем: относительный путь делает выборку
+        # одинаковой при любом tmp_path
+        monkeypatch.chdir(tmp_path)
+        write_csv("data.csv", self._records(20000))
+        path = "data.csv"
+
+        first = CSVReader(sample_fraction=0.1, sample_seed=3).read([path])
+        second = CSVReader(sample_fraction=0.1, sample_seed=3).read([path])
+
+        assert first == second
+        assert 0 < len(first) < 20000
+
+    def test_sampling_does_not_build_zone_map(self, write_csv):
+        """Сводка-спутник не строится по выборке."""
+        path = write_csv("data.csv", self._records(100))
+
+        CSVReader(zone_maps=True, sample_fraction=0.5, sample_seed=1).read([str(path)])
+
+        assert not zone_map_path(path).exists()
+
+    @pytest.mark.parametrize("fraction", [0, -0.5, 1.5])
+    def test_invalid_fraction(self, fraction):
+        """Доля выборки должна быть в (0, 1]."""
+        with pytest.raises(ValueError, match="Sample fraction"):
+            CSVReader(sample_fraction=fraction)
+
+
+class TestPathStreams:
+    """Тесты чтения потока путей."""
+
+    def test_read_from_generator(self, temp_csv_file_with_data):
+        """Пути принимаются потоком без построения списка."""
+        paths = (str(temp_csv_file_with_data) for _ in range(3))
+
+        records = CSVReader().read(paths)
+
+        assert len(records) == 3
+
+    def test_empty_generator(self):
+        """Пустой поток путей обнаруживается после перебора."""
+        with pytest.raises(ValueError, match="No files provided"):
+            list(CSVReader().iter_records(iter([])))
+
+    def test_stdin_twice_in_generator(self):
+        """Повторный '-' в потоке путей отклоняется."""
+        with pytest.raises(ValueError, match="only be read once"):
+            list(iter_paths(iter(["-", "-"])))
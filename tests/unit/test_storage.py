@@ -0,0 +1,210 @@
+import sqlite3
+
+import pytest
+
+from src.calculator import Aggregate, AggregateSpec, GDPCalculator, HashAggregator
+from src.filters import RowFilter
+from src.reader import CSVReader
+from src.storage import (
+    SQL_AGGREGATES,
+    TABLE_NAME,
+    SQLiteReader,
+    SQLiteStorage,
+    build_where,
+)
+from src.utils.validators import ValidationError
+from tests.conftest import HEADER
+
+
+@pytest.fixture
+def csv_file(write_csv, sample_records_list):
+    """CSV файл с записями из sample_records_list."""
+    return write_csv("data.csv", sample_records_list)
+
+
+@pytest.fixture
+def db_path(tmp_path, csv_file):
+    """База SQLite, загруженная из csv_file."""
+    path = tmp_path / "economy.sqlite"
+    SQLiteStorage(path).ingest([str(csv_file)], batch_size=2)
+    return path
+
+
+class TestBuildWhere:
+    """Тесты перевода RowFilter в WHERE."""
+
+    def test_empty_filter(self):
+        """Пустой фильтр не добавляет условий."""
+        assert build_where(None) == ("", [])
+        assert build_where(RowFilter()) == ("", [])
+
+    def test_all_conditions(self):
+        """Все ограничения фильтра переводятся в параметризованные условия."""
+        where, params = build_where(
+            RowFilter.create(
+                year_from=2000, year_to=2010, countries=["B", "A"], continents=["X"]
+            )
+        )
+
+        assert where == (
+            " WHERE year >= ? AND year <= ? AND country IN (?, ?) AND continent IN (?)"
+        )
+        assert params == [2000, 2010, "A", "B", "X"]
+
+
+class TestSQLiteStorage:
+    """Тесты загрузки CSV в SQLite."""
+
+    def test_ingest_loads_all_rows(self, db_path, sample_records_list):
+        """Все строки загружаются, создаются индексы."""
+        conn = sqlite3.connect(db_path)
+        try:
+            count = conn.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}").fetchone()[0]
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+        finally:
+            conn.close()
+
+        assert count == len(sample_records_list)
+        assert {
+            f"idx_{TABLE_NAME}_country",
+            f"idx_{TABLE_NAME}_year",
+            f"idx_{TABLE_NAME}_continent",
+        } <= indexes
+
+    def test_ingest_appends_new_files(self, tmp_path, db_path, sample_records_list):
+        """Новый файл добавляет строки в существующую базу."""
+        other = tmp_path / "other.csv"
+        other.write_text(HEADER + "A,2020,1.0,1.0,1.0,1.0,1,X\n", encoding="utf-8")
+
+        total = SQLiteStorage(db_path).ingest([str(other)])
+
+        assert total == 1
+        assert len(SQLiteReader().read([str(db_path)])) == len(sample_records_list) + 1
+
+    def test_reingest_skips_loaded_files(
+        self, tmp_path, db_path, csv_file, sample_records_list
+    ):
+        """Уже загруженное содержимое (под любым путем) не дублируется."""
+        copy = tmp_path / "copy.csv"
+        copy.write_bytes(csv_file.read_bytes())
+
+        total = SQLiteStorage(db_path).ingest([str(csv_file), str(copy)])
+
+        assert total == 0
+        assert len(SQLiteReader().read([str(db_path)])) == len(sample_records_list)
+
+    def test_changed_file_is_rejected(self, db_path, csv_file, sample_records_list):
+        """Файл, измененный после загрузки, отклоняется без изменения базы."""
+        with open(csv_file, "a", encoding="utf-8") as f:
+            f.write("Atlantis,2023,2000.0,3.0,2.0,5.0,10,Mythica\n")
+
+        with pytest.raises(ValueError, match="has changed since it was ingested"):
+            SQLiteStorage(db_path).ingest([str(csv_file)])
+
+        assert len(SQLiteReader().read([str(db_path)])) == len(sample_records_list)
+
+    def test_invalid_file_is_rolled_back(self, tmp_path, csv_file):
+        """Файл с ошибкой валидации не оставляет строк в базе."""
+        bad = tmp_path / "bad.csv"
+        bad.write_text(
+            HEADER + "A,2020,1.0,1.0,1.0,1.0,1,X\n" + "B,2020,-5.0,1.0,1.0,1.0,1,X\n",
+            encoding="utf-8",
+        )
+        db = tmp_path / "db.sqlite"
+        storage = SQLiteStorage(db)
+        storage.ingest([str(csv_file)])
+
+        with pytest.raises(ValidationError):
+            storage.ingest([str(bad)])
+
+        countries = {r.country for r in SQLiteReader().read([str(db)])}
+        assert "A" not in countries
+
+    def test_missing_file(self, tmp_path):
+        """Отсутствующий CSV файл приводит к FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            SQLiteStorage(tmp_path / "db.sqlite").ingest(["missing.csv"])
+
+
+class TestSQLiteReader:
+    """Тесты чтения и агрегации в SQLite."""
+
+    def test_read_records(self, db_path, sample_records_list):
+        """Записи читаются без потерь."""
+        records = SQLiteReader().read([str(db_path)])
+
+        assert sorted(records, key=lambda r: (r.country, r.year)) == sorted(
+            sample_records_list, key=lambda r: (r.country, r.year)
+        )
+
+    def test_read_with_filter(self, db_path):
+        """Фильтр выполняется в SQL."""
+        reader = SQLiteReader(RowFilter.create(year_from=2021, continents=["Europe"]))
+
+        records = reader.read([str(db_path)])
+
+        assert [(r.country, r.year) for r in records] == [("Germany", 2021)]
+
+    def test_missing_database(self, tmp_path):
+        """Отсутствующая база не создается, а приводит к ошибке."""
+        path = tmp_path / "missing.sqlite"
+
+        with pytest.raises(FileNotFoundError):
+            SQLiteReader().read([str(path)])
+        assert not path.exists()
+
+    def test_empty_file_list(self):
+        """Пустой список баз приводит к ValueError."""
+        with pytest.raises(ValueError, match="No files provided"):
+            SQLiteReader().read([])
+
+    def test_aggregate_matches_python_engine(self, db_path, sample_records_list):
+        """GROUP BY в SQLite дает тот же результат, что HashAggregator."""
+        calculator = GDPCalculator()
+
+        groups = SQLiteReader().aggregate([str(db_path)], calculator.spec)
+
+        assert groups is not None
+        assert calculator.finalize(groups) == calculator.calculate(sample_records_list)
+
+    @pytest.mark.parametrize("func", sorted(SQL_AGGREGATES))
+    @pytest.mark.parametrize("column", ["gdp", "population", "year"])
+    def test_aggregate_parity_with_hash_aggregator(
+        self, db_path, csv_file, func, column
+    ):
+        """Каждая функция SQL дает те же значения и типы, что HashAggregator."""
+        spec = AggregateSpec(("continent",), (Aggregate(func, column),))
+        expected = HashAggregator(spec)
+        expected.consume(CSVReader().iter_records([str(csv_file)]))
+
+        groups = SQLiteReader().aggregate([str(db_path)], spec)
+
+        assert groups is not None
+        result = {
+            g.key["continent"]: g.values[spec.aggregates[0].label] for g in groups
+        }
+        reference = {
+            g.key["continent"]: g.values[spec.aggregates[0].label]
+            for g in expected.results()
+        }
+        assert result == pytest.approx(reference)
+        assert {k: type(v) for k, v in result.items()} == {
+            k: type(v) for k, v in reference.items()
+        }
+
+    def test_aggregate_unsupported_function(self, db_path):
+        """Функция 'last' не переводится в SQL."""
+        spec = AggregateSpec(("country",), (Aggregate("last", "gdp"),))
+
+        assert SQLiteReader().aggregate([str(db_path)], spec) is None
+
+    def test_aggregate_several_databases(self, db_path):
+        """Агрегация нескольких баз выполняется в Python."""
+        spec = GDPCalculator.spec
+
+        assert SQLiteReader().aggregate([str(db_path), str(db_path)], spec) is None
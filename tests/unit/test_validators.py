@@ -208,3 +208,24 @@ class TestEconomicDataValidator:
             else:
                 with pytest.raises(ValidationError, match="Year must be"):
                     validator.validate_row(test_row, row_num=2)
+
+    class TestProjection:
+        """Тесты валидации только части колонок."""
+
+        def test_header_with_projection(self, validator):
+            """Тест: заголовок проверяется только на запрошенные колонки."""
+            assert validator.validate_header(["country", "gdp"], {"country", "gdp"})
+
+            with pytest.raises(ValidationError, match="gdp"):
+                validator.validate_header(["country", "year"], {"country", "gdp"})
+
+        def test_row_with_projection(self, validator, sample_valid_record):
+            """Тест: ошибки в колонках вне проекции не проверяются."""
+            row = sample_valid_record.copy()
+            row["population"] = "not-a-number"
+            del row["inflation"]
+
+            assert validator.validate_row(row, row_num=2, columns={"country", "gdp"})
+
+            with pytest.raises(ValidationError, match="Invalid population format"):
+                validator.validate_row(row, row_num=2, columns={"population"})
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from src.filters import RowFilter
+from src.reader import CSVReader
+from src.zonemap import ZoneMap, load_zone_map, zone_map_path
+
+
+class TestZoneMap:
+    """Тесты для ZoneMap."""
+
+    @pytest.fixture
+    def zone_map(self):
+        """Фикстура со сводкой файла за 2010-2015 годы."""
+        return ZoneMap(
+            size=100,
+            mtime_ns=1,
+            row_count=3,
+            min_year=2010,
+            max_year=2015,
+            countries=frozenset({"USA", "Germany"}),
+            continents=frozenset({"North America", "Europe"}),
+        )
+
+    @pytest.mark.parametrize(
+        "row_filter,expected",
+        [
+            (RowFilter.create(), True),
+            (RowFilter.create(year_from=2015), True),
+            (RowFilter.create(year_from=2016), False),
+            (RowFilter.create(year_to=2009), False),
+            (RowFilter.create(countries=["Germany", "Japan"]), True),
+            (RowFilter.create(countries=["Japan"]), False),
+            (RowFilter.create(continents=["Asia"]), False),
+        ],
+    )
+    def test_may_match(self, zone_map, row_filter, expected):
+        """Тест отсечения файла по сводке."""
+        assert zone_map.may_match(row_filter) is expected
+
+    def test_roundtrip(self, zone_map):
+        """Тест сериализации и восстановления сводки."""
+        assert ZoneMap.from_dict(zone_map.to_dict()) == zone_map
+
+
+class TestCSVReaderZoneMaps:
+    """Тесты использования сводок читателем CSV."""
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        """CSV файл с двумя записями за 2020-2021 годы."""
+        path = tmp_path / "data.csv"
+        path.write_text(
+            "country,year,gdp,gdp_growth,inflation,unemployment,population,continent\n"
+            "USA,2020,21433.2,-2.8,1.2,8.1,331,North America\n"
+            "Germany,2021,4259.9,2.6,3.1,3.6,83,Europe\n",
+            encoding="utf-8",
+        )
+        return path
+
+    def test_zone_map_built_on_first_read(self, csv_file):
+        """Тест: сводка создается после первого чтения файла."""
+        reader = CSVReader(zone_maps=True)
+
+        records = list(reader.read_file(str(csv_file)))
+
+        zone_map = load_zone_map(csv_file, os.stat(csv_file))
+        assert len(records) == 2
+        assert zone_map is not None
+        assert zone_map.row_count == 2
+        assert (zone_map.min_year, zone_map.max_year) == (2020, 2021)
+        assert zone_map.countries == {"USA", "Germany"}
+
+    def test_file_skipped_without_opening(self, csv_file, monkeypatch):
+        """Тест: файл, не содержащий подходящих строк, не открывается."""
+        list(CSVReader(zone_maps=True).read_file(str(csv_file)))
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("file must not be opened")
+
+        monkeypatch.setattr("src.reader.open", fail_open, raising=False)
+        reader = CSVReader(row_filter=RowFilter.create(year_from=2022), zone_maps=True)
+
+        assert list(reader.read_file(str(csv_file))) == []
+
+    def test_stale_zone_map_is_rebuilt(self, csv_file):
+        """Тест: после изменения файла сводка перестраивается."""
+        reader = CSVReader(row_filter=RowFilter.create(year_from=2022), zone_maps=True)
+        list(reader.read_file(str(csv_file)))
+
+        with open(csv_file, "a", encoding="utf-8") as f:
+            f.write("Japan,2023,4231.1,1.9,3.2,2.6,125,Asia\n")
+
+        records = list(reader.read_file(str(csv_file)))
+
+        assert [r.country for r in records] == ["Japan"]
+        assert load_zone_map(csv_file, os.stat(csv_file)).max_year == 2023
+
+    def test_zone_maps_disabled_by_default(self, csv_file):
+        """Тест: без флага сводка не создается."""
+        list(CSVReader().read_file(str(csv_file)))
+
+        assert not zone_map_path(csv_file).exists()